@@ -9,6 +9,7 @@ This module provides:
 - run_followup_planner: Follow-up planner for completed specs
 - Memory management (Graphiti + file-based fallback)
 - Session management and post-processing
+- Concurrent execution of independent subtasks (SubtaskScheduler)
 - Utility functions for git and plan management
 
 Uses lazy imports to avoid circular dependencies.
@@ -30,6 +31,8 @@ __all__ = [
     # Session
     "run_agent_session",
     "post_session_processing",
+    # Scheduling
+    "SubtaskScheduler",
     # Utils
     "get_latest_commit",
     "get_commit_count",
@@ -75,6 +78,10 @@ def __getattr__(name):
         from .session import post_session_processing, run_agent_session
 
         return locals()[name]
+    elif name == "SubtaskScheduler":
+        from .scheduler import SubtaskScheduler
+
+        return SubtaskScheduler
     elif name in (
         "find_phase_for_subtask",
         "find_subtask_in_plan",
@@ -58,6 +58,7 @@ from ui import (
 
 from .base import AUTO_CONTINUE_DELAY_SECONDS, HUMAN_INTERVENTION_FILE
 from .memory_manager import debug_memory_system_status, get_graphiti_context
+from .scheduler import ChildWorktree, SubtaskScheduler
 from .session import post_session_processing, run_agent_session
 from .utils import (
     find_phase_for_subtask,
@@ -70,6 +71,49 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+async def _build_subtask_prompt(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask: dict,
+    recovery_manager: RecoveryManager,
+) -> str:
+    """Coder prompt for a subtask, with file context and memory appended."""
+    subtask_id = subtask.get("id")
+
+    # Get attempt count for recovery context
+    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+    recovery_hints = (
+        recovery_manager.get_recovery_hints(subtask_id) if attempt_count > 0 else None
+    )
+
+    # Find the phase for this subtask
+    plan = load_implementation_plan(spec_dir)
+    phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
+
+    # Generate focused, minimal prompt for this subtask
+    prompt = generate_subtask_prompt(
+        spec_dir=spec_dir,
+        project_dir=project_dir,
+        subtask=subtask,
+        phase=phase or {},
+        attempt_count=attempt_count,
+        recovery_hints=recovery_hints,
+    )
+
+    # Load and append relevant file context
+    context = load_subtask_context(spec_dir, project_dir, subtask)
+    if context.get("patterns") or context.get("files_to_modify"):
+        prompt += "\n\n" + format_context_for_prompt(context)
+
+    # Retrieve and append Graphiti memory context (if enabled)
+    graphiti_context = await get_graphiti_context(spec_dir, project_dir, subtask)
+    if graphiti_context:
+        prompt += "\n\n" + graphiti_context
+        print_status("Graphiti memory context loaded", "success")
+
+    return prompt
+
+
 async def run_autonomous_agent(
     project_dir: Path,
     spec_dir: Path,
@@ -82,7 +126,9 @@ async def run_autonomous_agent(
     Run the autonomous agent loop with automatic memory management.
 
     The agent can use subagents (via Task tool) for parallel execution if needed.
-    This is decided by the agent itself based on the task complexity.
+    This is decided by the agent itself based on the task complexity. When
+    AUTO_CLAUDE_SUBTASK_WORKERS > 1, independent subtasks of parallel_safe
+    phases also run as concurrent sessions (see agents.scheduler).
 
     Args:
         project_dir: Root directory for the project
@@ -213,6 +259,66 @@ async def run_autonomous_agent(
     print(box(content, width=70, style="light"))
     print()
 
+    async def _finish_build() -> None:
+        # Don't emit COMPLETE here - subtasks are done but QA hasn't run yet
+        # QA loop will emit COMPLETE after actual approval
+        print_build_complete_banner(spec_dir)
+        status_manager.update(state=BuildState.COMPLETE)
+
+        if task_logger:
+            task_logger.end_phase(
+                LogPhase.CODING,
+                success=True,
+                message="All subtasks completed successfully",
+            )
+
+        if linear_task and linear_task.task_id:
+            await linear_build_complete(spec_dir)
+            print_status("Linear notified: build complete, ready for QA", "success")
+
+    async def _run_child_session(subtask: dict, workdir: Path, session_num: int) -> str:
+        phase_model = get_phase_model(spec_dir, "coding", model)
+        client = create_client(
+            workdir,
+            spec_dir,
+            phase_model,
+            agent_type="coder",
+            max_thinking_tokens=get_phase_thinking_budget(spec_dir, "coding"),
+        )
+        prompt = await _build_subtask_prompt(
+            spec_dir, workdir, subtask, recovery_manager
+        )
+        async with client:
+            status, _response = await run_agent_session(
+                client, prompt, spec_dir, verbose, phase=LogPhase.CODING
+            )
+        return status
+
+    async def _post_process_child(
+        subtask_id: str, child: ChildWorktree, session_num: int
+    ) -> bool:
+        return await post_session_processing(
+            spec_dir=spec_dir,
+            project_dir=child.path,
+            subtask_id=subtask_id,
+            session_num=session_num,
+            commit_before=child.base_commit,
+            commit_count_before=child.base_commit_count,
+            recovery_manager=recovery_manager,
+            linear_enabled=linear_task is not None and linear_task.task_id is not None,
+            status_manager=status_manager,
+            source_spec_dir=source_spec_dir,
+        )
+
+    # Independent subtasks run concurrently when AUTO_CLAUDE_SUBTASK_WORKERS > 1
+    scheduler = SubtaskScheduler(
+        project_dir,
+        spec_dir,
+        run_session=_run_child_session,
+        post_process=_post_process_child,
+        status_manager=status_manager,
+    )
+
     # Main loop
     iteration = 0
 
@@ -242,6 +348,18 @@ async def run_autonomous_agent(
             print("To continue, run the script again without --max-iterations")
             break
 
+        # Run ready parallel-safe subtasks concurrently (once coding has started)
+        if not first_run and not is_planning_phase and scheduler.has_parallel_work():
+            status_manager.update_session(iteration)
+            sessions = await scheduler.run(first_session=iteration)
+            if sessions:
+                iteration += sessions - 1
+                print_progress_summary(spec_dir)
+                if is_build_complete(spec_dir):
+                    await _finish_build()
+                    break
+                continue
+
         # Get the next subtask to work on (planner sessions shouldn't bind to a subtask)
         next_subtask = None if first_run else get_next_subtask(spec_dir)
         subtask_id = next_subtask.get("id") if next_subtask else None
@@ -370,41 +488,11 @@ async def run_autonomous_agent(
                     print("No pending subtasks found - build may be complete!")
                     break
 
-            # Get attempt count for recovery context
             attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            recovery_hints = (
-                recovery_manager.get_recovery_hints(subtask_id)
-                if attempt_count > 0
-                else None
+            prompt = await _build_subtask_prompt(
+                spec_dir, project_dir, next_subtask, recovery_manager
             )
 
-            # Find the phase for this subtask
-            plan = load_implementation_plan(spec_dir)
-            phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
-
-            # Generate focused, minimal prompt for this subtask
-            prompt = generate_subtask_prompt(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask=next_subtask,
-                phase=phase or {},
-                attempt_count=attempt_count,
-                recovery_hints=recovery_hints,
-            )
-
-            # Load and append relevant file context
-            context = load_subtask_context(spec_dir, project_dir, next_subtask)
-            if context.get("patterns") or context.get("files_to_modify"):
-                prompt += "\n\n" + format_context_for_prompt(context)
-
-            # Retrieve and append Graphiti memory context (if enabled)
-            graphiti_context = await get_graphiti_context(
-                spec_dir, project_dir, next_subtask
-            )
-            if graphiti_context:
-                prompt += "\n\n" + graphiti_context
-                print_status("Graphiti memory context loaded", "success")
-
             # Show what we're working on
             print(f"Working on: {highlight(subtask_id)}")
             print(f"Description: {next_subtask.get('description', 'No description')}")
@@ -507,22 +595,7 @@ async def run_autonomous_agent(
 
         # Handle session status
         if status == "complete":
-            # Don't emit COMPLETE here - subtasks are done but QA hasn't run yet
-            # QA loop will emit COMPLETE after actual approval
-            print_build_complete_banner(spec_dir)
-            status_manager.update(state=BuildState.COMPLETE)
-
-            if task_logger:
-                task_logger.end_phase(
-                    LogPhase.CODING,
-                    success=True,
-                    message="All subtasks completed successfully",
-                )
-
-            if linear_task and linear_task.task_id:
-                await linear_build_complete(spec_dir)
-                print_status("Linear notified: build complete, ready for QA", "success")
-
+            await _finish_build()
             break
 
         elif status == "continue":
@@ -0,0 +1,466 @@
+"""
+Subtask Scheduler
+=================
+
+Runs independent subtasks of one spec build concurrently.
+
+The coder loop runs one session per subtask. When more than one worker is
+configured and the plan has several ready subtasks in parallel_safe phases,
+the scheduler takes over until that parallel work is done:
+
+- The subtask DAG comes from the plan (core.plan_store.build_subtask_graph)
+- Up to ``workers`` ready parallel-safe subtasks run at once, each in a
+  child worktree on its own branch off the spec worktree's HEAD
+- Sessions update the plan through the shared PlanStore, the single
+  in-process writer of implementation_plan.json
+- Finished children are merged back into the spec worktree one at a time.
+  A subtask only starts once everything it depends on has been merged, so
+  merges always happen in dependency order
+- A child that conflicts on merge, or whose subtask did not complete, is
+  discarded; the subtask goes back to pending and is left to the serial loop
+
+Configuration:
+    AUTO_CLAUDE_SUBTASK_WORKERS - concurrent coder sessions per spec build
+                                  (default 1: serial, no child worktrees)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+import shutil
+import threading
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from core.git_executable import run_git
+from core.plan_normalization import normalize_subtask_aliases
+from core.plan_store import PENDING_STATUSES, PlanStore, build_subtask_graph
+from core.sparse_worktree import apply_sparse_checkout, get_cone_directories
+from ui import print_status
+
+from .base import HUMAN_INTERVENTION_FILE
+from .utils import get_commit_count
+
+logger = logging.getLogger(__name__)
+
+SUBTASK_WORKERS_ENV_VAR = "AUTO_CLAUDE_SUBTASK_WORKERS"
+DEFAULT_SUBTASK_WORKERS = 1
+
+# Child worktrees live in .auto-claude/worktrees/subtasks/{spec-name}/{subtask}/,
+# outside tasks/ so they are never listed as spec worktrees
+CHILD_WORKTREES_DIR = "subtasks"
+
+
+def get_subtask_workers() -> int:
+    """Get the configured worker count, read at runtime for testability."""
+    try:
+        value = int(
+            os.environ.get(SUBTASK_WORKERS_ENV_VAR, str(DEFAULT_SUBTASK_WORKERS))
+        )
+        return value if value > 0 else DEFAULT_SUBTASK_WORKERS
+    except (ValueError, TypeError):
+        return DEFAULT_SUBTASK_WORKERS
+
+
+@dataclass
+class ChildWorktree:
+    """A subtask's private worktree, branched off the spec worktree."""
+
+    subtask_id: str
+    path: Path
+    branch: str
+    base_commit: str
+    base_commit_count: int
+
+
+# (subtask, child worktree path, session number) -> session status
+SessionRunner = Callable[[dict, Path, int], Awaitable[Any]]
+# (subtask ID, child worktree, session number) -> success
+PostProcessor = Callable[[str, ChildWorktree, int], Awaitable[Any]]
+
+
+class SubtaskScheduler:
+    """
+    Runs ready parallel-safe subtasks concurrently in child worktrees.
+
+    One scheduler is used for a whole build: subtasks that could not be
+    merged are remembered and never scheduled in parallel again.
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        spec_dir: Path,
+        run_session: SessionRunner,
+        workers: int | None = None,
+        post_process: PostProcessor | None = None,
+        status_manager: Any = None,
+    ):
+        """
+        Args:
+            project_dir: The spec worktree (children branch off its HEAD)
+            spec_dir: Spec directory containing implementation_plan.json
+            run_session: Runs a coder session for a subtask in a directory
+            workers: Maximum concurrent sessions (default: from environment)
+            post_process: Called after a session whose result is kept (merged
+                or not completed); skipped for merge conflicts, which are
+                re-run serially
+            status_manager: Optional StatusManager for worker counts
+        """
+        self.project_dir = Path(project_dir)
+        self.spec_dir = Path(spec_dir)
+        self.run_session = run_session
+        self.workers = max(1, workers if workers is not None else get_subtask_workers())
+        self.post_process = post_process
+        self.status_manager = status_manager
+        self.store = PlanStore.for_spec(spec_dir)
+
+        self.serial_only: set[str] = set()
+        self.merged: list[str] = []  # Subtask IDs in merge order
+        self._active: set[str] = set()  # Started and not yet merged/discarded
+        self._tasks: set[asyncio.Task] = set()
+        self._merge_lock = asyncio.Lock()
+        # git worktree add/remove/prune share .git/worktrees and race each
+        # other; they run in worker threads, so this is a thread lock
+        self._worktree_lock = threading.RLock()
+        self._wakeup = asyncio.Event()
+
+    # -------------------------------------------------------------------------
+    # Scheduling
+    # -------------------------------------------------------------------------
+
+    def ready_subtasks(self) -> list[dict]:
+        """
+        Pending parallel-safe subtasks whose dependencies are all merged.
+
+        Returns:
+            Subtask copies with phase_id, phase_name and phase_num added
+            (like get_next_subtask), in plan order
+        """
+        plan = self.store.plan()
+        if plan is None:
+            return []
+
+        views: dict[str, dict] = {}
+        statuses: dict[str, Any] = {}
+        for phase in plan.get("phases", []):
+            for subtask in phase.get("subtasks", phase.get("chunks", [])):
+                subtask_id = subtask.get("id")
+                if subtask_id is None or subtask_id in views:
+                    continue
+                statuses[subtask_id] = subtask.get("status", "pending")
+                view, _changed = normalize_subtask_aliases(subtask)
+                phase_id = phase.get("id")
+                if phase_id is None:
+                    phase_id = phase.get("phase")
+                views[subtask_id] = {
+                    **view,
+                    "status": "pending",
+                    "phase_id": phase_id,
+                    "phase_name": phase.get("name"),
+                    "phase_num": phase.get("phase"),
+                }
+
+        ready = []
+        for subtask_id, node in build_subtask_graph(plan).items():
+            if (
+                not node.parallel_safe
+                or node.blocked
+                or subtask_id in self._active
+                or subtask_id in self.serial_only
+                or statuses.get(subtask_id) not in PENDING_STATUSES
+            ):
+                continue
+            if all(
+                statuses.get(dep) == "completed" and dep not in self._active
+                for dep in node.depends_on
+            ):
+                ready.append(views[subtask_id])
+        return ready
+
+    def has_parallel_work(self) -> bool:
+        """Whether at least two subtasks could run concurrently right now."""
+        return self.workers > 1 and len(self.ready_subtasks()) >= 2
+
+    async def run(self, first_session: int = 1) -> int:
+        """
+        Run ready parallel-safe subtasks until fewer than two can run at once.
+
+        Args:
+            first_session: Session number for the first child session
+
+        Returns:
+            Number of sessions started (0 if nothing ran in parallel)
+        """
+        if not self.has_parallel_work():
+            return 0
+        if not await asyncio.to_thread(self._is_clean):
+            print_status(
+                "Spec worktree has uncommitted changes - running subtasks serially",
+                "warning",
+            )
+            return 0
+        await asyncio.to_thread(self._remove_stale_children)
+
+        session_num = first_session
+        try:
+            while True:
+                self._wakeup.clear()
+                ready = self.ready_subtasks()
+                if not self._active and len(ready) < 2:
+                    break
+                if not (self.spec_dir / HUMAN_INTERVENTION_FILE).exists():
+                    for subtask in ready[: self.workers - len(self._active)]:
+                        self._start(subtask, session_num)
+                        session_num += 1
+                self._report_workers()
+                if not self._tasks:
+                    break
+
+                wakeup = asyncio.ensure_future(self._wakeup.wait())
+                await asyncio.wait(
+                    [*self._tasks, wakeup], return_when=asyncio.FIRST_COMPLETED
+                )
+                wakeup.cancel()
+            # Let remaining post-processing finish
+            if self._tasks:
+                await asyncio.gather(*self._tasks)
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._report_workers()
+
+        return session_num - first_session
+
+    def _start(self, subtask: dict, session_num: int) -> None:
+        subtask_id = subtask["id"]
+        self._active.add(subtask_id)
+        task = asyncio.create_task(self._run_child(subtask, session_num))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _report_workers(self) -> None:
+        if self.status_manager is None:
+            return
+        self.status_manager.update_workers(len(self._active), self.workers)
+        self.status_manager.update_subtasks(in_progress=len(self._active))
+
+    async def _run_child(self, subtask: dict, session_num: int) -> None:
+        """Run one subtask in a child worktree and merge the result."""
+        subtask_id = subtask["id"]
+        child: ChildWorktree | None = None
+        merged = False
+        try:
+            child = await asyncio.to_thread(self._create_child, subtask_id)
+            print_status(f"Started {subtask_id} in {child.path}", "progress")
+            await self.run_session(subtask, child.path, session_num)
+
+            completed = self._status(subtask_id) == "completed"
+            if completed:
+                async with self._merge_lock:
+                    merged = await asyncio.to_thread(self._merge_child, child)
+                if merged:
+                    self.merged.append(subtask_id)
+                    print_status(f"Merged {subtask_id} into spec worktree", "success")
+                else:
+                    print_status(
+                        f"{subtask_id} conflicts with merged work - will re-run serially",
+                        "warning",
+                    )
+            else:
+                print_status(
+                    f"{subtask_id} did not complete in parallel run", "warning"
+                )
+
+            # Dependents may start as soon as this subtask is merged
+            self._release(subtask_id, merged)
+
+            if self.post_process is not None and (merged or not completed):
+                await self.post_process(subtask_id, child, session_num)
+        except Exception as e:
+            logger.warning(f"Parallel subtask {subtask_id} failed: {e}")
+            print_status(f"{subtask_id} failed in parallel run: {e}", "error")
+        finally:
+            self._release(subtask_id, merged)
+            if child is not None:
+                await asyncio.to_thread(self._remove_child, child)
+
+    def _release(self, subtask_id: str, merged: bool) -> None:
+        """Free the worker slot; unmerged subtasks go back to pending."""
+        if subtask_id not in self._active:
+            return
+        self._active.discard(subtask_id)
+        if not merged:
+            self.serial_only.add(subtask_id)
+            if self._status(subtask_id) in ("completed", "in_progress"):
+                self.store.set_subtask_status(
+                    subtask_id,
+                    "pending",
+                    notes="Not merged from parallel run; will re-run serially",
+                )
+        self._report_workers()
+        self._wakeup.set()
+
+    def _status(self, subtask_id: str) -> Any:
+        plan = self.store.plan() or {}
+        for phase in plan.get("phases", []):
+            for subtask in phase.get("subtasks", phase.get("chunks", [])):
+                if subtask.get("id") == subtask_id:
+                    return subtask.get("status", "pending")
+        return None
+
+    # -------------------------------------------------------------------------
+    # Child worktrees
+    # -------------------------------------------------------------------------
+
+    def _git(self, args: list[str], cwd: Path, timeout: int = 120):
+        return run_git(args, cwd=cwd, timeout=timeout)
+
+    def _is_clean(self) -> bool:
+        result = self._git(
+            ["status", "--porcelain", "--untracked-files=no"], self.project_dir
+        )
+        return result.returncode == 0 and not result.stdout.strip()
+
+    def _children_root(self) -> Path:
+        """.auto-claude/worktrees/subtasks/{spec-name} in the main repository."""
+        result = self._git(["rev-parse", "--git-common-dir"], self.project_dir)
+        repo_root = self.project_dir
+        if result.returncode == 0 and result.stdout.strip():
+            common_dir = Path(result.stdout.strip())
+            if not common_dir.is_absolute():
+                common_dir = self.project_dir / common_dir
+            if common_dir.name == ".git":
+                repo_root = common_dir.resolve().parent
+        return (
+            repo_root
+            / ".auto-claude"
+            / "worktrees"
+            / CHILD_WORKTREES_DIR
+            / self.spec_dir.name
+        )
+
+    def _branch_prefix(self) -> str:
+        result = self._git(["symbolic-ref", "--short", "-q", "HEAD"], self.project_dir)
+        branch = result.stdout.strip() if result.returncode == 0 else ""
+        return branch or f"auto-claude/{self.spec_dir.name}"
+
+    def _create_child(self, subtask_id: str) -> ChildWorktree:
+        """
+        Add a worktree for the subtask on a new branch at the spec HEAD.
+
+        Sparse spec worktrees get sparse children with the same cone.
+
+        Raises:
+            RuntimeError: If the worktree cannot be created
+        """
+        safe_id = re.sub(r"[^A-Za-z0-9._-]", "-", subtask_id)
+        path = self._children_root() / safe_id
+        branch = f"{self._branch_prefix()}--{safe_id}"
+
+        head = self._git(["rev-parse", "HEAD"], self.project_dir)
+        if head.returncode != 0:
+            raise RuntimeError(f"git rev-parse failed: {head.stderr.strip()}")
+        base_commit = head.stdout.strip()
+
+        cone = get_cone_directories(self.project_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        args = ["worktree", "add", "-B", branch, str(path), base_commit]
+        if cone is not None:
+            args.insert(2, "--no-checkout")
+        with self._worktree_lock:
+            if path.exists():
+                self._remove_worktree(path)
+            result = self._git(args, self.project_dir, timeout=300)
+            if result.returncode != 0:
+                raise RuntimeError(f"git worktree add failed: {result.stderr.strip()}")
+            if cone is not None:
+                apply_sparse_checkout(path, sorted(cone))
+
+        return ChildWorktree(
+            subtask_id=subtask_id,
+            path=path,
+            branch=branch,
+            base_commit=base_commit,
+            base_commit_count=get_commit_count(path),
+        )
+
+    def _merge_child(self, child: ChildWorktree) -> bool:
+        """
+        Merge a child branch into the spec worktree.
+
+        Work the session left uncommitted is committed first, since the child
+        worktree is removed afterwards. A conflicting merge is aborted.
+
+        Returns:
+            True if merged (or nothing to merge), False on conflict
+        """
+        status = self._git(["status", "--porcelain"], child.path)
+        if status.returncode == 0 and status.stdout.strip():
+            self._git(["add", "-A"], child.path)
+            self._git(
+                [
+                    "commit",
+                    "-q",
+                    "-m",
+                    f"auto-claude: {child.subtask_id} (uncommitted changes)",
+                ],
+                child.path,
+            )
+
+        result = self._git(
+            [
+                "merge",
+                "--no-edit",
+                "-m",
+                f"auto-claude: merge parallel subtask {child.subtask_id}",
+                child.branch,
+            ],
+            self.project_dir,
+            timeout=300,
+        )
+        if result.returncode == 0:
+            return True
+
+        logger.info(
+            f"Merge of {child.branch} failed: {result.stdout.strip()} "
+            f"{result.stderr.strip()}"
+        )
+        self._git(["merge", "--abort"], self.project_dir)
+        return False
+
+    def _remove_child(self, child: ChildWorktree) -> None:
+        with self._worktree_lock:
+            self._remove_worktree(child.path)
+            self._git(["branch", "-D", child.branch], self.project_dir)
+
+    def _remove_worktree(self, path: Path) -> None:
+        with self._worktree_lock:
+            self._git(["worktree", "remove", "--force", str(path)], self.project_dir)
+            if path.exists():
+                shutil.rmtree(path, ignore_errors=True)
+            self._git(["worktree", "prune"], self.project_dir)
+
+    def _remove_stale_children(self) -> None:
+        """Remove child worktrees and branches left behind by an interrupted run."""
+        root = self._children_root()
+        if root.exists():
+            for path in root.iterdir():
+                if path.is_dir():
+                    self._remove_worktree(path)
+
+        prefix = self._branch_prefix()
+        result = self._git(
+            ["for-each-ref", "--format=%(refname:short)", f"refs/heads/{prefix}--*"],
+            self.project_dir,
+        )
+        if result.returncode == 0:
+            for branch in result.stdout.split():
+                self._git(["branch", "-D", branch], self.project_dir)
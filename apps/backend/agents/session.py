@@ -10,6 +10,7 @@ import logging
 from pathlib import Path
 
 from claude_agent_sdk import ClaudeSDKClient
+from core.telemetry import get_recorder
 from debug import debug, debug_detailed, debug_error, debug_section, debug_success
 from insight_extractor import extract_session_insights
 from linear_updater import (
@@ -351,6 +352,13 @@ async def run_agent_session(
     message_count = 0
     tool_count = 0
 
+    # Telemetry: phase > session > tool spans, buffered until the session ends
+    recorder = get_recorder(spec_dir)
+    recorder.enter_phase(phase.value)
+    session_span = recorder.push_span("session", "session", phase=phase.value)
+    tool_spans = {}
+    first_token_ms = None
+
     try:
         # Send the query
         debug("session", "Sending query to Claude SDK...")
@@ -358,7 +366,7 @@ async def run_agent_session(
         debug_success("session", "Query sent successfully")
 
         # Collect response text and show tool use
-        response_text = ""
+        response_parts: list[str] = []
         debug("session", "Starting to receive response stream...")
         async for msg in client.receive_response():
             msg_type = type(msg).__name__
@@ -371,24 +379,25 @@ async def run_agent_session(
 
             # Handle AssistantMessage (text and tool use)
             if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+                if first_token_ms is None:
+                    first_token_ms = recorder.elapsed_ms(session_span)
+                message_text: list[str] = []
                 for block in msg.content:
                     block_type = type(block).__name__
 
                     if block_type == "TextBlock" and hasattr(block, "text"):
-                        response_text += block.text
+                        response_parts.append(block.text)
+                        message_text.append(block.text)
                         print(block.text, end="", flush=True)
-                        # Log text to task logger (persist without double-printing)
-                        if task_logger and block.text.strip():
-                            task_logger.log(
-                                block.text,
-                                LogEntryType.TEXT,
-                                phase,
-                                print_to_console=False,
-                            )
                     elif block_type == "ToolUseBlock" and hasattr(block, "name"):
+                        # Text before a tool call is logged ahead of it
+                        _log_text(task_logger, message_text, phase)
                         tool_name = block.name
                         tool_input_display = None
                         tool_count += 1
+                        tool_spans[getattr(block, "id", None)] = recorder.start_span(
+                            tool_name, "tool"
+                        )
 
                         # Safely extract tool input (handles None, non-dict, etc.)
                         inp = get_safe_tool_input(block)
@@ -436,6 +445,10 @@ async def run_agent_session(
                                 print(f"   Input: {input_str}", flush=True)
                         current_tool = tool_name
 
+                # Log text to task logger once per message (persist without
+                # double-printing)
+                _log_text(task_logger, message_text, phase)
+
             # Handle UserMessage (tool results)
             elif msg_type == "UserMessage" and hasattr(msg, "content"):
                 for block in msg.content:
@@ -445,6 +458,18 @@ async def run_agent_session(
                         result_content = getattr(block, "content", "")
                         is_error = getattr(block, "is_error", False)
 
+                        tool_span = tool_spans.pop(
+                            getattr(block, "tool_use_id", None), None
+                        )
+                        if tool_span is None and len(tool_spans) == 1:
+                            # Result without a matching id: close the only open call
+                            tool_span = tool_spans.popitem()[1]
+                        if tool_span is not None:
+                            recorder.end_span(tool_span, error=bool(is_error))
+                            recorder.count(f"tools.{tool_span.name}")
+                            if is_error:
+                                recorder.count("tools.errors")
+
                         # Check if this is an error (not just content containing "blocked")
                         if is_error and "blocked" in str(result_content).lower():
                             # Actual blocked command by security hook
@@ -518,6 +543,11 @@ async def run_agent_session(
 
                         current_tool = None
 
+            # Handle ResultMessage (usage and cost for the whole session)
+            elif msg_type == "ResultMessage":
+                _record_usage(recorder, session_span, msg)
+
+        response_text = "".join(response_parts)
         print("\n" + "-" * 70 + "\n")
 
         # Check if build is complete
@@ -551,4 +581,55 @@ async def run_agent_session(
         print(f"Error during agent session: {e}")
         if task_logger:
             task_logger.log_error(f"Session error: {e}", phase)
+        session_span.attrs["error"] = type(e).__name__
         return "error", str(e)
+
+    finally:
+        # Tools still open when the stream ended never produced a result
+        for tool_span in tool_spans.values():
+            recorder.end_span(tool_span, error=True, unfinished=True)
+        recorder.pop_span(
+            session_span,
+            messages=message_count,
+            tools=tool_count,
+            first_token_ms=(
+                round(first_token_ms, 3) if first_token_ms is not None else None
+            ),
+        )
+        recorder.count("sessions")
+        recorder.flush()
+
+
+def _log_text(task_logger, parts: list[str], phase: LogPhase) -> None:
+    """Log and clear accumulated assistant text as a single task log entry."""
+    if not parts:
+        return
+    text = "".join(parts)
+    parts.clear()
+    if task_logger and text.strip():
+        task_logger.log(text, LogEntryType.TEXT, phase, print_to_console=False)
+
+
+def _record_usage(recorder, session_span, msg) -> None:
+    """Record token usage and cost from a ResultMessage."""
+    usage = getattr(msg, "usage", None) or {}
+    if not isinstance(usage, dict):
+        usage = vars(usage) if hasattr(usage, "__dict__") else {}
+    for key in (
+        "input_tokens",
+        "output_tokens",
+        "cache_read_input_tokens",
+        "cache_creation_input_tokens",
+    ):
+        value = usage.get(key)
+        if isinstance(value, int | float):
+            recorder.count(f"tokens.{key.removesuffix('_tokens')}", value)
+            session_span.attrs[key] = value
+    cost = getattr(msg, "total_cost_usd", None)
+    if isinstance(cost, int | float):
+        recorder.count("cost_usd", cost)
+        session_span.attrs["cost_usd"] = cost
+    for attr in ("num_turns", "duration_api_ms"):
+        value = getattr(msg, attr, None)
+        if isinstance(value, int | float):
+            session_span.attrs[attr] = value
@@ -5,10 +5,11 @@ Build Progress Tools
 Tools for tracking and reporting build progress.
 """
 
-import json
 from pathlib import Path
 from typing import Any
 
+from core.plan_store import PlanStore
+
 try:
     from claude_agent_sdk import tool
 
@@ -56,53 +57,23 @@ def create_progress_tools(spec_dir: Path, project_dir: Path) -> list:
                 ]
             }
 
+        store = PlanStore.for_spec(spec_dir)
         try:
-            with open(plan_file, encoding="utf-8") as f:
-                plan = json.load(f)
-
-            stats = {
-                "total": 0,
-                "completed": 0,
-                "in_progress": 0,
-                "pending": 0,
-                "failed": 0,
-            }
+            # Cached plan and precomputed counts from the shared plan store
+            plan = store.plan(strict=True)
+            aggregates = store.aggregates()
+            stats = {**aggregates.counts, "total": aggregates.total}
 
             phases_summary = []
-            next_subtask = None
-
-            for phase in plan.get("phases", []):
+            for i, phase in enumerate(plan.get("phases", [])):
                 phase_id = phase.get("id") or phase.get("phase")
                 phase_name = phase.get("name", phase_id)
-                phase_subtasks = phase.get("subtasks", [])
-
-                phase_stats = {"completed": 0, "total": len(phase_subtasks)}
-
-                for subtask in phase_subtasks:
-                    stats["total"] += 1
-                    status = subtask.get("status", "pending")
-
-                    if status == "completed":
-                        stats["completed"] += 1
-                        phase_stats["completed"] += 1
-                    elif status == "in_progress":
-                        stats["in_progress"] += 1
-                    elif status == "failed":
-                        stats["failed"] += 1
-                    else:
-                        stats["pending"] += 1
-                        # Track next subtask to work on
-                        if next_subtask is None:
-                            next_subtask = {
-                                "id": subtask.get("id"),
-                                "description": subtask.get("description"),
-                                "phase": phase_name,
-                            }
-
                 phases_summary.append(
-                    f"  {phase_name}: {phase_stats['completed']}/{phase_stats['total']}"
+                    f"  {phase_name}: {aggregates.phase_completed[i]}/{aggregates.phase_total[i]}"
                 )
 
+            next_subtask = store.next_subtask()
+
             progress_pct = (
                 (stats["completed"] / stats["total"] * 100) if stats["total"] > 0 else 0
             )
@@ -123,8 +94,8 @@ Phases:
 
 Next subtask to work on:
   ID: {next_subtask["id"]}
-  Phase: {next_subtask["phase"]}
-  Description: {next_subtask["description"]}"""
+  Phase: {next_subtask.get("phase_name") or next_subtask.get("phase_id")}
+  Description: {next_subtask.get("description")}"""
             elif stats["completed"] == stats["total"]:
                 result += "\n\nAll subtasks completed! Build is ready for QA."
 
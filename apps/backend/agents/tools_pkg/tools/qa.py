@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from core.file_utils import write_json_atomic
+from core.plan_store import PlanStore
 from spec.validate_pkg.auto_fix import auto_fix_plan
 
 try:
@@ -140,13 +140,11 @@ def create_qa_tools(spec_dir: Path, project_dir: Path) -> list:
             except json.JSONDecodeError:
                 tests_passed = {}
 
-            with open(plan_file, encoding="utf-8") as f:
-                plan = json.load(f)
-
-            qa_session = _apply_qa_update(plan, status, issues, tests_passed)
-
-            # Use atomic write to prevent file corruption
-            write_json_atomic(plan_file, plan, indent=2)
+            # Atomic write through the shared plan store
+            qa_session = PlanStore.for_spec(spec_dir).update(
+                lambda plan: _apply_qa_update(plan, status, issues, tests_passed),
+                strict=True,
+            )
 
             return {
                 "content": [
@@ -162,11 +160,12 @@ def create_qa_tools(spec_dir: Path, project_dir: Path) -> list:
             if auto_fix_plan(spec_dir):
                 # Retry after fix
                 try:
-                    with open(plan_file, encoding="utf-8") as f:
-                        plan = json.load(f)
-
-                    qa_session = _apply_qa_update(plan, status, issues, tests_passed)
-                    write_json_atomic(plan_file, plan, indent=2)
+                    qa_session = PlanStore.for_spec(spec_dir).update(
+                        lambda plan: _apply_qa_update(
+                            plan, status, issues, tests_passed
+                        ),
+                        strict=True,
+                    )
 
                     return {
                         "content": [
@@ -5,12 +5,12 @@ Utility Functions for Agent System
 Helper functions for git operations, plan management, and file syncing.
 """
 
-import json
 import logging
-import shutil
 from pathlib import Path
 
 from core.git_executable import run_git
+from core.plan_store import PlanStore
+from core.spec_sync import sync_tree
 
 logger = logging.getLogger(__name__)
 
@@ -43,15 +43,8 @@ def get_commit_count(project_dir: Path) -> int:
 
 
 def load_implementation_plan(spec_dir: Path) -> dict | None:
-    """Load the implementation plan JSON."""
-    plan_file = spec_dir / "implementation_plan.json"
-    if not plan_file.exists():
-        return None
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return None
+    """Load the implementation plan JSON (a private copy, safe to modify)."""
+    return PlanStore.for_spec(spec_dir).snapshot()
 
 
 def find_subtask_in_plan(plan: dict, subtask_id: str) -> dict | None:
@@ -96,12 +89,17 @@ def sync_spec_to_source(spec_dir: Path, source_spec_dir: Path | None) -> bool:
     - spec.md, context.json, etc. - Original spec files (for completeness)
     - memory/ directory - Codebase map, patterns, gotchas, session insights
 
+    The sync is incremental (see core.spec_sync): unchanged files are
+    skipped, grown files get only their new tail appended, and files are
+    only deleted from the source spec directory if an earlier sync created
+    them.
+
     Args:
         spec_dir: Current spec directory (inside worktree)
         source_spec_dir: Original spec directory in main project (outside worktree)
 
     Returns:
-        True if sync was performed, False if not needed or failed
+        True if any file was synced, False if nothing changed, not needed or failed
     """
     # Skip if no source specified or same path (not in worktree mode)
     if not source_spec_dir:
@@ -114,65 +112,15 @@ def sync_spec_to_source(spec_dir: Path, source_spec_dir: Path | None) -> bool:
     if spec_dir_resolved == source_spec_dir_resolved:
         return False  # Same directory, no sync needed
 
-    synced_any = False
-
-    # Ensure source directory exists
-    source_spec_dir.mkdir(parents=True, exist_ok=True)
-
     try:
-        # Sync all files and directories from worktree spec to source spec
-        for item in spec_dir.iterdir():
-            # Skip symlinks to prevent path traversal attacks
-            if item.is_symlink():
-                logger.warning(f"Skipping symlink during sync: {item.name}")
-                continue
-
-            source_item = source_spec_dir / item.name
-
-            if item.is_file():
-                # Copy file (preserves timestamps)
-                shutil.copy2(item, source_item)
-                logger.debug(f"Synced {item.name} to source")
-                synced_any = True
-
-            elif item.is_dir():
-                # Recursively sync directory
-                _sync_directory(item, source_item)
-                synced_any = True
-
+        result = sync_tree(spec_dir, source_spec_dir)
     except Exception as e:
         logger.warning(f"Failed to sync spec directory to source: {e}")
+        return False
 
-    return synced_any
-
-
-def _sync_directory(source_dir: Path, target_dir: Path) -> None:
-    """
-    Recursively sync a directory from source to target.
-
-    Args:
-        source_dir: Source directory (in worktree)
-        target_dir: Target directory (in main project)
-    """
-    # Create target directory if needed
-    target_dir.mkdir(parents=True, exist_ok=True)
-
-    for item in source_dir.iterdir():
-        # Skip symlinks to prevent path traversal attacks
-        if item.is_symlink():
-            logger.warning(
-                f"Skipping symlink during sync: {source_dir.name}/{item.name}"
-            )
-            continue
-
-        target_item = target_dir / item.name
-
-        if item.is_file():
-            shutil.copy2(item, target_item)
-            logger.debug(f"Synced {source_dir.name}/{item.name} to source")
-        elif item.is_dir():
-            # Recurse into subdirectories
-            _sync_directory(item, target_item)
+    for name in result.copied + result.appended:
+        logger.debug(f"Synced {name} to source")
+    return result.changed
 
 
 # Keep the old name as an alias for backward compatibility
@@ -30,6 +30,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .discovery_cache import DiscoveryCache, cache_disabled, fingerprint
+
 # Try to import yaml, fall back gracefully
 try:
     import yaml
@@ -38,6 +40,9 @@ try:
 except ImportError:
     HAS_YAML = False
 
+# Version of the cached result layout in .auto-claude/cache/ci_discovery.json
+SCHEMA_VERSION = 1
+
 
 # =============================================================================
 # DATA CLASSES
@@ -98,11 +103,21 @@ class CIDiscovery:
     - GitLab CI (.gitlab-ci.yml)
     - CircleCI (.circleci/config.yml)
     - Jenkins (Jenkinsfile)
+
+    Results are cached per instance and, across processes, in the
+    project's .auto-claude/cache/ (see analysis.discovery_cache).
     """
 
-    def __init__(self) -> None:
-        """Initialize CI discovery."""
+    def __init__(self, use_cache: bool = True) -> None:
+        """
+        Initialize CI discovery.
+
+        Args:
+            use_cache: Read and write the on-disk cache (also disabled by
+                AUTO_CLAUDE_NO_DISCOVERY_CACHE)
+        """
         self._cache: dict[str, CIConfig | None] = {}
+        self.use_cache = use_cache and not cache_disabled()
 
     def discover(self, project_dir: Path) -> CIConfig | None:
         """
@@ -120,6 +135,17 @@ class CIDiscovery:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
+        disk_cache = None
+        if self.use_cache:
+            disk_cache = DiscoveryCache(project_dir, "ci_discovery", SCHEMA_VERSION)
+            fp = self._fingerprint(project_dir)
+            cached = disk_cache.load(fp)
+            if cached is not None:
+                config = cached.get("config")
+                result = self.from_dict(config) if config is not None else None
+                self._cache[cache_key] = result
+                return result
+
         # Try each CI system
         result = None
 
@@ -146,9 +172,34 @@ class CIDiscovery:
             if jenkinsfile.exists():
                 result = self._parse_jenkinsfile(jenkinsfile)
 
+        if disk_cache is not None:
+            config = self.to_dict(result) if result is not None else None
+            disk_cache.store(fp, {"config": config})
+
         self._cache[cache_key] = result
         return result
 
+    def _fingerprint(self, project_dir: Path) -> str:
+        """Fingerprint of the CI config files (see DiscoveryCache)."""
+        workflows = project_dir / ".github" / "workflows"
+        workflow_files = [
+            f".github/workflows/{f.name}"
+            for pattern in ("*.yml", "*.yaml")
+            for f in workflows.glob(pattern)
+        ]
+        return fingerprint(
+            project_dir,
+            manifests=[
+                *workflow_files,
+                ".gitlab-ci.yml",
+                ".circleci/config.yml",
+                "Jenkinsfile",
+            ],
+            markers=[".github/workflows"],
+            # Without PyYAML only Jenkinsfiles can be parsed
+            extra={"yaml": HAS_YAML},
+        )
+
     def _parse_github_actions(self, workflows_dir: Path) -> CIConfig:
         """Parse GitHub Actions workflow files."""
         result = CIConfig(ci_system="github_actions")
@@ -485,8 +536,19 @@ class CIDiscovery:
             "environment_variables": result.environment_variables,
         }
 
+    def from_dict(self, data: dict[str, Any]) -> CIConfig:
+        """Rebuild a result from to_dict() output."""
+        return CIConfig(
+            ci_system=data["ci_system"],
+            config_files=list(data.get("config_files", [])),
+            test_commands=dict(data.get("test_commands", {})),
+            coverage_command=data.get("coverage_command"),
+            workflows=[CIWorkflow(**w) for w in data.get("workflows", [])],
+            environment_variables=list(data.get("environment_variables", [])),
+        )
+
     def clear_cache(self) -> None:
-        """Clear the internal cache."""
+        """Clear the internal cache (the on-disk cache is kept)."""
         self._cache.clear()
 
 
@@ -555,10 +617,13 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Discover CI configuration")
     parser.add_argument("project_dir", type=Path, help="Path to project root")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Ignore the on-disk cache"
+    )
 
     args = parser.parse_args()
 
-    discovery = CIDiscovery()
+    discovery = CIDiscovery(use_cache=not args.no_cache)
     result = discovery.discover(args.project_dir)
 
     if not result:
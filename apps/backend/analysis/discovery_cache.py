@@ -0,0 +1,150 @@
+"""
+Discovery Cache
+===============
+
+Disk-backed cache for test and CI discovery results.
+
+TestDiscovery and CIDiscovery run in the QA loop, spec validation, risk
+classification and PR review tools - usually in separate processes, each of
+which used to re-detect frameworks, scan the project for test files and
+parse the CI YAML. Results are now stored in .auto-claude/cache/ together
+with a fingerprint of everything discovery reads:
+
+- Manifests and configs (package.json, pyproject.toml, pytest.ini, jest and
+  vitest configs, CI workflow files, ...), by content
+- Marker files such as lockfiles, by existence only
+- The file listing of the test directories
+
+SecurityScanner keeps its per-tool results the same way. A cached result
+is used only while the fingerprint and the schema version match. Pass
+use_cache=False (the CLIs' --no-cache) or set
+AUTO_CLAUDE_NO_DISCOVERY_CACHE=true to bypass the cache.
+
+Usage:
+    cache = DiscoveryCache(project_dir, "test_discovery", SCHEMA_VERSION)
+    fp = fingerprint(project_dir, manifests=["package.json"])
+    payload = cache.load(fp)
+    if payload is None:
+        payload = compute()
+        cache.store(fp, payload)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from core.file_utils import atomic_write
+
+CACHE_DIR = Path(".auto-claude") / "cache"
+NO_CACHE_ENV_VAR = "AUTO_CLAUDE_NO_DISCOVERY_CACHE"
+
+# Bump when the layout of cache files changes; each discovery also has its
+# own schema version for the layout of its results
+CACHE_FORMAT = 1
+
+# Directories that never affect discovery but change whenever tests run
+_IGNORED_DIRS = frozenset({"__pycache__", "node_modules"})
+
+
+def cache_disabled() -> bool:
+    """Whether the disk cache is turned off through the environment."""
+    return os.environ.get(NO_CACHE_ENV_VAR, "").lower() in ("true", "1", "yes")
+
+
+def _listing(directory: Path) -> list[str]:
+    """Relative paths of the files under a directory, sorted."""
+    files = []
+    for root, dirs, names in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in _IGNORED_DIRS and d[0] != "."]
+        rel = os.path.relpath(root, directory)
+        files.extend(os.path.join(rel, n) for n in names if not n.endswith(".pyc"))
+    return sorted(files)
+
+
+def fingerprint(
+    project_dir: Path,
+    manifests: Iterable[str] = (),
+    markers: Iterable[str] = (),
+    listed_dirs: Iterable[str] = (),
+    extra: Any = None,
+) -> str:
+    """
+    Fingerprint of the project files a discovery depends on.
+
+    Args:
+        project_dir: Project root
+        manifests: Files whose content matters (relative to project_dir)
+        markers: Files whose existence matters
+        listed_dirs: Directories whose file listing matters
+        extra: Any other JSON-serializable input to the discovery
+
+    Returns:
+        Hex digest that changes when any of the inputs change
+    """
+    project_dir = Path(project_dir)
+    h = hashlib.blake2b(digest_size=16)
+    for name in sorted(set(manifests)):
+        try:
+            content = (project_dir / name).read_bytes()
+        except OSError:
+            h.update(f"-{name}\0".encode())
+            continue
+        h.update(f"+{name}\0".encode())
+        h.update(hashlib.blake2b(content, digest_size=16).digest())
+    for name in sorted(set(markers)):
+        h.update(f"{'+' if (project_dir / name).exists() else '-'}{name}\0".encode())
+    for name in sorted(set(listed_dirs)):
+        h.update(f"#{name}\0".encode())
+        for path in _listing(project_dir / name):
+            h.update(f"{path}\0".encode())
+    h.update(json.dumps(extra, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+class DiscoveryCache:
+    """One discovery's cached result for a project."""
+
+    def __init__(self, project_dir: Path, name: str, schema_version: int):
+        """
+        Args:
+            project_dir: Project root
+            name: Cache file name (without extension)
+            schema_version: Version of the cached payload's layout
+        """
+        self.path = Path(project_dir) / CACHE_DIR / f"{name}.json"
+        self.schema = [CACHE_FORMAT, schema_version]
+
+    def load(self, fingerprint: str) -> dict | None:
+        """The cached payload, or None if missing, stale or from another schema."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError, UnicodeDecodeError):
+            return None
+        if not isinstance(entry, dict):
+            return None
+        if entry.get("schema") != self.schema:
+            return None
+        if entry.get("fingerprint") != fingerprint:
+            return None
+        payload = entry.get("payload")
+        return payload if isinstance(payload, dict) else None
+
+    def store(self, fingerprint: str, payload: dict) -> None:
+        """Store a JSON-serializable payload under a fingerprint."""
+        entry = {
+            "schema": self.schema,
+            "fingerprint": fingerprint,
+            "payload": payload,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(self.path) as f:
+                json.dump(entry, f)
+        except OSError:
+            pass  # The cache is an optimization only
@@ -217,6 +217,7 @@ def gather_extraction_inputs(
 
     # Get attempt history
     attempt_history = _get_attempt_history(recovery_manager, subtask_id)
+    attempt_count = _get_attempt_count(recovery_manager, subtask_id)
 
     return {
         "subtask_id": subtask_id,
@@ -227,6 +228,7 @@ def gather_extraction_inputs(
         "changed_files": changed_files,
         "commit_messages": commit_messages,
         "attempt_history": attempt_history,
+        "attempt_count": attempt_count,
     }
 
 
@@ -310,7 +312,7 @@ Output ONLY valid JSON with: file_insights, patterns_discovered, gotchas_discove
 ```
 
 ### Previous Attempts
-{_format_attempt_history(inputs["attempt_history"])}
+{_format_attempt_history(inputs["attempt_history"], inputs.get("attempt_count", 0))}
 
 ---
 
@@ -320,13 +322,33 @@ Now analyze this session and output ONLY the JSON object.
     return base_prompt + session_context
 
 
-def _format_attempt_history(attempts: list[dict]) -> str:
-    """Format attempt history for the prompt."""
+def _get_attempt_count(recovery_manager: Any, subtask_id: str) -> int:
+    """
+    Total attempts for this subtask.
+
+    attempt_history.json only keeps the most recent attempts, so the total is
+    read from attempt_count (older files without it fall back to the list).
+    """
+    if not recovery_manager:
+        return 0
+
+    try:
+        history = recovery_manager.get_subtask_history(subtask_id)
+        return history.get("attempt_count", len(history.get("attempts", [])))
+
+    except Exception as e:
+        logger.warning(f"Failed to get attempt count: {e}")
+        return 0
+
+
+def _format_attempt_history(attempts: list[dict], attempt_count: int = 0) -> str:
+    """Format attempt history for the prompt, numbered by the total count."""
     if not attempts:
         return "(First attempt - no previous history)"
 
     lines = []
-    for i, attempt in enumerate(attempts, 1):
+    first = max(attempt_count - len(attempts), 0) + 1
+    for i, attempt in enumerate(attempts, first):
         success = "SUCCESS" if attempt.get("success") else "FAILED"
         approach = attempt.get("approach", "Unknown approach")
         error = attempt.get("error", "")
@@ -24,11 +24,21 @@ Usage:
 from __future__ import annotations
 
 import json
+import os
+import shutil
 import subprocess
-from dataclasses import dataclass, field
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from datetime import date
 from pathlib import Path
 from typing import Any
 
+from core.git_executable import run_git
+
+from .discovery_cache import DiscoveryCache, cache_disabled, fingerprint
+
 # Import the existing secrets scanner
 try:
     from security.scan_secrets import SecretMatch, get_all_tracked_files, scan_files
@@ -38,6 +48,78 @@ except ImportError:
     HAS_SECRETS_SCANNER = False
     SecretMatch = None
 
+# Version of the cached tool results in .auto-claude/cache/security_*.json
+SCHEMA_VERSION = 1
+
+# Default per-tool timeouts in seconds
+TOOL_TIMEOUTS = {
+    "bandit": 120.0,
+    "npm_audit": 120.0,
+    "pip_audit": 120.0,
+}
+
+_TOOL_LABELS = {
+    "secrets": "Secrets scan",
+    "bandit": "Bandit scan",
+    "npm_audit": "npm audit",
+    "pip_audit": "pip-audit",
+}
+
+# Files whose content determines the dependency audits' results
+NPM_AUDIT_INPUTS = ["package.json", "package-lock.json", "npm-shrinkwrap.json"]
+PIP_AUDIT_INPUTS = [
+    "requirements.txt",
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "poetry.lock",
+    "uv.lock",
+    "Pipfile.lock",
+]
+
+# Tool availability, probed once per process (and PATH)
+_available_tools: dict[tuple[str, str], bool] = {}
+_available_tools_lock = threading.Lock()
+
+
+def tool_available(name: str) -> bool:
+    """Whether an executable is on the PATH (cached for the process)."""
+    key = (name, os.environ.get("PATH", ""))
+    with _available_tools_lock:
+        if key not in _available_tools:
+            _available_tools[key] = shutil.which(name) is not None
+        return _available_tools[key]
+
+
+def clear_tool_probes() -> None:
+    """Forget cached tool availability (e.g. after installing a tool)."""
+    with _available_tools_lock:
+        _available_tools.clear()
+
+
+class _ToolRun:
+    """Processes started by one scan job, so the scan can cancel them."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._processes: list[subprocess.Popen] = []
+        self.cancelled = False
+
+    def attach(self, proc: subprocess.Popen) -> None:
+        with self._lock:
+            self._processes.append(proc)
+            cancelled = self.cancelled
+        if cancelled:
+            proc.kill()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            processes = list(self._processes)
+        for proc in processes:
+            if proc.poll() is None:
+                proc.kill()
+
 
 # =============================================================================
 # DATA CLASSES
@@ -101,12 +183,31 @@ class SecurityScanner:
     - scan_secrets.py for secrets detection
     - Bandit for Python SAST (if available)
     - npm audit for JavaScript vulnerabilities (if applicable)
+    - pip-audit for Python dependencies (if available)
+
+    The scans run concurrently, each external tool under its own timeout.
+    Tool results are cached in the project's .auto-claude/cache/, keyed by
+    the tool's inputs: the dependency manifests and lockfiles for the
+    audits (refreshed daily, as advisories change), and the content of the
+    scanned files for Bandit when only changed files are scanned.
     """
 
-    def __init__(self) -> None:
-        """Initialize the security scanner."""
-        self._bandit_available: bool | None = None
-        self._npm_available: bool | None = None
+    def __init__(
+        self,
+        use_cache: bool = True,
+        timeouts: dict[str, float] | None = None,
+    ) -> None:
+        """
+        Initialize the security scanner.
+
+        Args:
+            use_cache: Reuse tool results from the on-disk cache (also
+                disabled by AUTO_CLAUDE_NO_DISCOVERY_CACHE)
+            timeouts: Per-tool timeouts in seconds, overriding TOOL_TIMEOUTS
+        """
+        self.use_cache = use_cache and not cache_disabled()
+        self.timeouts = {**TOOL_TIMEOUTS, **(timeouts or {})}
+        self._local = threading.local()
 
     def scan(
         self,
@@ -116,6 +217,8 @@ class SecurityScanner:
         run_secrets: bool = True,
         run_sast: bool = True,
         run_dependency_audit: bool = True,
+        base_ref: str | None = None,
+        timeout: float | None = None,
     ) -> SecurityScanResult:
         """
         Run all applicable security scans.
@@ -127,6 +230,10 @@ class SecurityScanner:
             run_secrets: Whether to run secrets scanning
             run_sast: Whether to run SAST tools
             run_dependency_audit: Whether to run dependency audits
+            base_ref: Only scan files changed since this git ref (used when
+                changed_files is not given)
+            timeout: Overall deadline in seconds; scans still running then
+                are cancelled and the finished ones are reported
 
         Returns:
             SecurityScanResult with all findings
@@ -134,17 +241,20 @@ class SecurityScanner:
         project_dir = Path(project_dir)
         result = SecurityScanResult()
 
-        # Run secrets scan
-        if run_secrets:
-            self._run_secrets_scan(project_dir, changed_files, result)
+        if changed_files is None and base_ref:
+            changed_files = self._get_changed_files(project_dir, base_ref, result)
 
-        # Run SAST based on project type
+        jobs: dict[str, Callable[[SecurityScanResult], None]] = {}
+        if run_secrets:
+            jobs["secrets"] = lambda r: self._run_secrets_scan(
+                project_dir, changed_files, r
+            )
         if run_sast:
-            self._run_sast_scans(project_dir, result)
-
-        # Run dependency audits
+            jobs.update(self._sast_jobs(project_dir, changed_files))
         if run_dependency_audit:
-            self._run_dependency_audits(project_dir, result)
+            jobs.update(self._dependency_audit_jobs(project_dir))
+
+        self._run_jobs(jobs, result, timeout)
 
         # Determine if should block QA
         result.has_critical_issues = (
@@ -163,6 +273,182 @@ class SecurityScanner:
 
         return result
 
+    # -------------------------------------------------------------------------
+    # Scheduling
+    # -------------------------------------------------------------------------
+
+    def _sast_jobs(
+        self, project_dir: Path, changed_files: list[str] | None
+    ) -> dict[str, Callable[[SecurityScanResult], None]]:
+        """SAST tools that apply to the project."""
+        jobs: dict[str, Callable[[SecurityScanResult], None]] = {}
+        # Python SAST with Bandit
+        if self._is_python_project(project_dir):
+            if changed_files is None:
+                jobs["bandit"] = lambda r: self._run_bandit(project_dir, r)
+            else:
+                py_files = sorted(
+                    {
+                        f
+                        for f in changed_files
+                        if f.endswith(".py") and (project_dir / f).is_file()
+                    }
+                )
+                if py_files:
+                    jobs["bandit"] = lambda r: self._run_bandit(
+                        project_dir, r, py_files
+                    )
+
+        # JavaScript/Node.js - npm audit
+        # (handled in dependency audits for Node projects)
+        return jobs
+
+    def _dependency_audit_jobs(
+        self, project_dir: Path
+    ) -> dict[str, Callable[[SecurityScanResult], None]]:
+        """Dependency audits that apply to the project."""
+        jobs: dict[str, Callable[[SecurityScanResult], None]] = {}
+        # npm audit for JavaScript projects
+        if (project_dir / "package.json").exists():
+            jobs["npm_audit"] = lambda r: self._run_npm_audit(project_dir, r)
+
+        # pip-audit for Python projects (if available)
+        if self._is_python_project(project_dir):
+            jobs["pip_audit"] = lambda r: self._run_pip_audit(project_dir, r)
+        return jobs
+
+    def _run_jobs(
+        self,
+        jobs: dict[str, Callable[[SecurityScanResult], None]],
+        result: SecurityScanResult,
+        timeout: float | None,
+    ) -> None:
+        """
+        Run scan jobs concurrently and merge their results in job order.
+
+        Each job fills its own partial result. Jobs still running at the
+        deadline are cancelled (their tool processes killed) and reported in
+        scan_errors; the results of the other jobs are kept.
+        """
+        if not jobs:
+            return
+
+        runs = {name: _ToolRun() for name in jobs}
+
+        def run_job(name: str) -> SecurityScanResult:
+            partial = SecurityScanResult()
+            self._local.run = runs[name]
+            try:
+                jobs[name](partial)
+            finally:
+                self._local.run = None
+            return partial
+
+        pool = ThreadPoolExecutor(
+            max_workers=len(jobs), thread_name_prefix="security-scan"
+        )
+        try:
+            futures = {name: pool.submit(run_job, name) for name in jobs}
+            wait(futures.values(), timeout=timeout)
+            for name, future in futures.items():
+                if not future.done():
+                    runs[name].cancel()
+                    result.scan_errors.append(
+                        f"{_TOOL_LABELS.get(name, name)} cancelled after {timeout}s"
+                    )
+                    continue
+                try:
+                    partial = future.result()
+                except Exception as e:
+                    label = _TOOL_LABELS.get(name, name)
+                    result.scan_errors.append(f"{label} error: {e}")
+                    continue
+                result.secrets.extend(partial.secrets)
+                result.vulnerabilities.extend(partial.vulnerabilities)
+                result.scan_errors.extend(partial.scan_errors)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run_tool(self, cmd: list[str], cwd: Path, tool: str) -> str:
+        """
+        Run an external tool and return its stdout.
+
+        The process is killed when the tool's timeout expires (raising
+        subprocess.TimeoutExpired) or when the scan cancels the tool.
+        """
+        run: _ToolRun | None = getattr(self._local, "run", None)
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        if run is not None:
+            run.attach(proc)
+        try:
+            stdout, _ = proc.communicate(timeout=self.timeouts.get(tool))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        return stdout
+
+    def _get_changed_files(
+        self, project_dir: Path, base_ref: str, result: SecurityScanResult
+    ) -> list[str] | None:
+        """Files changed since base_ref, including untracked files."""
+        diff = run_git(["diff", "--relative", "--name-only", base_ref], cwd=project_dir)
+        if diff.returncode != 0:
+            result.scan_errors.append(
+                f"Could not diff against {base_ref}, scanning all files"
+            )
+            return None
+        untracked = run_git(
+            ["ls-files", "--others", "--exclude-standard"], cwd=project_dir
+        )
+        files = diff.stdout.splitlines() + untracked.stdout.splitlines()
+        return sorted({f.strip() for f in files if f.strip()})
+
+    # -------------------------------------------------------------------------
+    # Result cache
+    # -------------------------------------------------------------------------
+
+    def _cached_findings(
+        self, project_dir: Path, tool: str, key: str
+    ) -> list[SecurityVulnerability] | None:
+        if not self.use_cache:
+            return None
+        cached = DiscoveryCache(project_dir, f"security_{tool}", SCHEMA_VERSION).load(
+            key
+        )
+        if cached is None:
+            return None
+        return [SecurityVulnerability(**v) for v in cached.get("vulnerabilities", [])]
+
+    def _store_findings(
+        self,
+        project_dir: Path,
+        tool: str,
+        key: str,
+        findings: list[SecurityVulnerability],
+    ) -> None:
+        if not self.use_cache:
+            return
+        DiscoveryCache(project_dir, f"security_{tool}", SCHEMA_VERSION).store(
+            key, {"vulnerabilities": [asdict(v) for v in findings]}
+        )
+
+    def _dependency_key(self, project_dir: Path, manifests: list[str]) -> str:
+        # Advisory databases change independently of the lockfile
+        return fingerprint(
+            project_dir, manifests=manifests, extra={"day": date.today().isoformat()}
+        )
+
+    # -------------------------------------------------------------------------
+    # Scanners
+    # -------------------------------------------------------------------------
+
     def _run_secrets_scan(
         self,
         project_dir: Path,
@@ -210,59 +496,71 @@ class SecurityScanner:
         except Exception as e:
             result.scan_errors.append(f"Secrets scan error: {str(e)}")
 
-    def _run_sast_scans(self, project_dir: Path, result: SecurityScanResult) -> None:
-        """Run SAST tools based on project type."""
-        # Python SAST with Bandit
-        if self._is_python_project(project_dir):
-            self._run_bandit(project_dir, result)
-
-        # JavaScript/Node.js - npm audit
-        # (handled in dependency audits for Node projects)
+    def _run_bandit(
+        self,
+        project_dir: Path,
+        result: SecurityScanResult,
+        py_files: list[str] | None = None,
+    ) -> None:
+        """
+        Run Bandit security scanner for Python projects.
 
-    def _run_bandit(self, project_dir: Path, result: SecurityScanResult) -> None:
-        """Run Bandit security scanner for Python projects."""
+        Args:
+            project_dir: Project root
+            result: Result to add findings to
+            py_files: Only scan these Python files (results are cached by
+                their content); None scans the source directories
+        """
         if not self._check_bandit_available():
             return
 
+        cache_key = None
+        if py_files is not None:
+            cache_key = fingerprint(
+                project_dir, manifests=py_files, extra={"files": py_files}
+            )
+            cached = self._cached_findings(project_dir, "bandit", cache_key)
+            if cached is not None:
+                result.vulnerabilities.extend(cached)
+                return
+
         try:
-            # Find Python source directories
-            src_dirs = []
-            for candidate in ["src", "app", project_dir.name, "."]:
-                candidate_path = project_dir / candidate
-                if (
-                    candidate_path.exists()
-                    and (candidate_path / "__init__.py").exists()
-                ):
-                    src_dirs.append(str(candidate_path))
-
-            if not src_dirs:
-                # Try to find any Python files
-                py_files = list(project_dir.glob("**/*.py"))
-                if not py_files:
-                    return
-                src_dirs = ["."]
+            if py_files is not None:
+                targets = py_files
+            else:
+                # Find Python source directories
+                src_dirs = []
+                for candidate in ["src", "app", project_dir.name, "."]:
+                    candidate_path = project_dir / candidate
+                    if (
+                        candidate_path.exists()
+                        and (candidate_path / "__init__.py").exists()
+                    ):
+                        src_dirs.append(str(candidate_path))
+
+                if not src_dirs:
+                    # Try to find any Python files
+                    py_paths = list(project_dir.glob("**/*.py"))
+                    if not py_paths:
+                        return
+                    src_dirs = ["."]
+                targets = ["-r", *src_dirs]
 
             # Run bandit
             cmd = [
                 "bandit",
-                "-r",
-                *src_dirs,
+                *targets,
                 "-f",
                 "json",
                 "--exit-zero",  # Don't fail on findings
             ]
 
-            proc = subprocess.run(
-                cmd,
-                cwd=project_dir,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+            stdout = self._run_tool(cmd, project_dir, "bandit")
 
-            if proc.stdout:
+            findings = []
+            if stdout:
                 try:
-                    bandit_output = json.loads(proc.stdout)
+                    bandit_output = json.loads(stdout)
                     for finding in bandit_output.get("results", []):
                         severity = finding.get("issue_severity", "MEDIUM").lower()
                         if severity == "high":
@@ -272,7 +570,7 @@ class SecurityScanner:
                         else:
                             severity = "low"
 
-                        result.vulnerabilities.append(
+                        findings.append(
                             SecurityVulnerability(
                                 severity=severity,
                                 source="bandit",
@@ -285,6 +583,11 @@ class SecurityScanner:
                         )
                 except json.JSONDecodeError:
                     result.scan_errors.append("Failed to parse Bandit output")
+                    return
+
+            result.vulnerabilities.extend(findings)
+            if cache_key is not None:
+                self._store_findings(project_dir, "bandit", cache_key, findings)
 
         except subprocess.TimeoutExpired:
             result.scan_errors.append("Bandit scan timed out")
@@ -293,34 +596,26 @@ class SecurityScanner:
         except Exception as e:
             result.scan_errors.append(f"Bandit error: {str(e)}")
 
-    def _run_dependency_audits(
-        self, project_dir: Path, result: SecurityScanResult
-    ) -> None:
-        """Run dependency vulnerability audits."""
-        # npm audit for JavaScript projects
-        if (project_dir / "package.json").exists():
-            self._run_npm_audit(project_dir, result)
-
-        # pip-audit for Python projects (if available)
-        if self._is_python_project(project_dir):
-            self._run_pip_audit(project_dir, result)
-
     def _run_npm_audit(self, project_dir: Path, result: SecurityScanResult) -> None:
         """Run npm audit for JavaScript projects."""
+        if not tool_available("npm"):
+            return  # npm not available
+
+        cache_key = self._dependency_key(project_dir, NPM_AUDIT_INPUTS)
+        cached = self._cached_findings(project_dir, "npm_audit", cache_key)
+        if cached is not None:
+            result.vulnerabilities.extend(cached)
+            return
+
         try:
             cmd = ["npm", "audit", "--json"]
 
-            proc = subprocess.run(
-                cmd,
-                cwd=project_dir,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+            stdout = self._run_tool(cmd, project_dir, "npm_audit")
 
-            if proc.stdout:
+            findings = []
+            if stdout:
                 try:
-                    audit_output = json.loads(proc.stdout)
+                    audit_output = json.loads(stdout)
 
                     # npm audit v2+ format
                     vulnerabilities = audit_output.get("vulnerabilities", {})
@@ -335,7 +630,7 @@ class SecurityScanner:
                         else:
                             severity = "low"
 
-                        result.vulnerabilities.append(
+                        findings.append(
                             SecurityVulnerability(
                                 severity=severity,
                                 source="npm_audit",
@@ -350,7 +645,10 @@ class SecurityScanner:
                             )
                         )
                 except json.JSONDecodeError:
-                    pass  # npm audit may return invalid JSON on no findings
+                    return  # npm audit may return invalid JSON on no findings
+
+            result.vulnerabilities.extend(findings)
+            self._store_findings(project_dir, "npm_audit", cache_key, findings)
 
         except subprocess.TimeoutExpired:
             result.scan_errors.append("npm audit timed out")
@@ -361,24 +659,28 @@ class SecurityScanner:
 
     def _run_pip_audit(self, project_dir: Path, result: SecurityScanResult) -> None:
         """Run pip-audit for Python projects (if available)."""
+        if not tool_available("pip-audit"):
+            return  # pip-audit not available
+
+        cache_key = self._dependency_key(project_dir, PIP_AUDIT_INPUTS)
+        cached = self._cached_findings(project_dir, "pip_audit", cache_key)
+        if cached is not None:
+            result.vulnerabilities.extend(cached)
+            return
+
         try:
             cmd = ["pip-audit", "--format", "json"]
 
-            proc = subprocess.run(
-                cmd,
-                cwd=project_dir,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+            stdout = self._run_tool(cmd, project_dir, "pip_audit")
 
-            if proc.stdout:
+            findings = []
+            if stdout:
                 try:
-                    audit_output = json.loads(proc.stdout)
+                    audit_output = json.loads(stdout)
                     for vuln in audit_output:
                         severity = "high" if vuln.get("fix_versions") else "medium"
 
-                        result.vulnerabilities.append(
+                        findings.append(
                             SecurityVulnerability(
                                 severity=severity,
                                 source="pip_audit",
@@ -390,7 +692,10 @@ class SecurityScanner:
                             )
                         )
                 except json.JSONDecodeError:
-                    pass
+                    return
+
+            result.vulnerabilities.extend(findings)
+            self._store_findings(project_dir, "pip_audit", cache_key, findings)
 
         except FileNotFoundError:
             pass  # pip-audit not available
@@ -411,17 +716,7 @@ class SecurityScanner:
 
     def _check_bandit_available(self) -> bool:
         """Check if Bandit is available."""
-        if self._bandit_available is None:
-            try:
-                subprocess.run(
-                    ["bandit", "--version"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                self._bandit_available = True
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                self._bandit_available = False
-        return self._bandit_available
+        return tool_available("bandit")
 
     def _redact_secret(self, text: str) -> str:
         """Redact a secret for safe logging."""
@@ -557,16 +852,21 @@ def main() -> None:
     parser.add_argument(
         "--secrets-only", action="store_true", help="Only scan for secrets"
     )
+    parser.add_argument("--base-ref", help="Only scan files changed since this git ref")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Ignore cached tool results"
+    )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
 
     args = parser.parse_args()
 
-    scanner = SecurityScanner()
+    scanner = SecurityScanner(use_cache=not args.no_cache)
     result = scanner.scan(
         args.project_dir,
         spec_dir=args.spec_dir,
         run_sast=not args.secrets_only,
         run_dependency_audit=not args.secrets_only,
+        base_ref=args.base_ref,
     )
 
     if args.json:
@@ -29,6 +29,41 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .discovery_cache import DiscoveryCache, cache_disabled, fingerprint
+
+# Version of the cached result layout in .auto-claude/cache/test_discovery.json
+SCHEMA_VERSION = 1
+
+# Files whose content affects discovery (besides FRAMEWORK_PATTERNS configs)
+MANIFEST_FILES = [
+    "package.json",
+    "pyproject.toml",
+    "requirements.txt",
+    "setup.py",
+    "setup.cfg",
+    "pytest.ini",
+    "conftest.py",
+    "tests/conftest.py",
+    "Cargo.toml",
+    "go.mod",
+    "Gemfile",
+]
+
+# Files whose existence affects discovery
+MARKER_FILES = [
+    "pnpm-lock.yaml",
+    "yarn.lock",
+    "package-lock.json",
+    "bun.lockb",
+    "bun.lock",
+    "uv.lock",
+    "poetry.lock",
+    "Pipfile.lock",
+    "Cargo.lock",
+    "go.sum",
+    "Gemfile.lock",
+]
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -195,13 +230,23 @@ class TestDiscovery:
     - Package files (package.json, pyproject.toml, Cargo.toml, etc.)
     - Configuration files (jest.config.js, pytest.ini, etc.)
     - Directory structure (tests/, spec/, __tests__/)
+
+    Results are cached per instance and, across processes, in the
+    project's .auto-claude/cache/ (see analysis.discovery_cache).
     """
 
     __test__ = False  # Prevent pytest from collecting this as a test class
 
-    def __init__(self) -> None:
-        """Initialize the test discovery."""
+    def __init__(self, use_cache: bool = True) -> None:
+        """
+        Initialize the test discovery.
+
+        Args:
+            use_cache: Read and write the on-disk cache (also disabled by
+                AUTO_CLAUDE_NO_DISCOVERY_CACHE)
+        """
         self._cache: dict[str, TestDiscoveryResult] = {}
+        self.use_cache = use_cache and not cache_disabled()
 
     def discover(self, project_dir: Path) -> TestDiscoveryResult:
         """
@@ -219,6 +264,16 @@ class TestDiscovery:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
+        disk_cache = None
+        if self.use_cache:
+            disk_cache = DiscoveryCache(project_dir, "test_discovery", SCHEMA_VERSION)
+            fp = self._fingerprint(project_dir)
+            cached = disk_cache.load(fp)
+            if cached is not None:
+                result = self.from_dict(cached)
+                self._cache[cache_key] = result
+                return result
+
         result = TestDiscoveryResult()
 
         # Detect package manager
@@ -264,9 +319,28 @@ class TestDiscovery:
                     result.coverage_command = framework.coverage_command
                     break
 
+        # Test files outside the test directories are not part of the
+        # fingerprint, so only a positive has_tests is safe to keep
+        if disk_cache is not None and result.has_tests:
+            disk_cache.store(fp, self.to_dict(result))
+
         self._cache[cache_key] = result
         return result
 
+    def _fingerprint(self, project_dir: Path) -> str:
+        """Fingerprint of the files discovery reads (see DiscoveryCache)."""
+        configs = [
+            cf
+            for pattern in FRAMEWORK_PATTERNS.values()
+            for cf in pattern["config_files"]
+        ]
+        return fingerprint(
+            project_dir,
+            manifests=[*MANIFEST_FILES, *configs],
+            markers=MARKER_FILES,
+            listed_dirs=self._find_test_directories(project_dir),
+        )
+
     def _detect_package_manager(self, project_dir: Path) -> str:
         """Detect the package manager used by the project."""
         if (project_dir / "pnpm-lock.yaml").exists():
@@ -596,8 +670,19 @@ class TestDiscovery:
             "coverage_command": result.coverage_command,
         }
 
+    def from_dict(self, data: dict[str, Any]) -> TestDiscoveryResult:
+        """Rebuild a result from to_dict() output."""
+        return TestDiscoveryResult(
+            frameworks=[TestFramework(**f) for f in data.get("frameworks", [])],
+            test_command=data.get("test_command", ""),
+            test_directories=list(data.get("test_directories", [])),
+            package_manager=data.get("package_manager", ""),
+            has_tests=bool(data.get("has_tests")),
+            coverage_command=data.get("coverage_command"),
+        )
+
     def clear_cache(self) -> None:
-        """Clear the internal cache."""
+        """Clear the internal cache (the on-disk cache is kept)."""
         self._cache.clear()
 
 
@@ -662,10 +747,13 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Discover test frameworks")
     parser.add_argument("project_dir", type=Path, help="Path to project root")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Ignore the on-disk cache"
+    )
 
     args = parser.parse_args()
 
-    discovery = TestDiscovery()
+    discovery = TestDiscovery(use_cache=not args.no_cache)
     result = discovery.discover(args.project_dir)
 
     if args.json:
@@ -0,0 +1,39 @@
+"""
+Benchmarks
+==========
+
+Reproducible micro/macro benchmarks for the backend's hot paths, run
+against deterministic synthetic repositories.
+
+Usage:
+    cd apps/backend
+    python -m benchmarks run --size medium --output bench-results.json
+    python -m benchmarks compare baseline.json bench-results.json --threshold 0.2
+"""
+
+from .compare import Comparison, compare_results, format_comparison, has_regressions
+from .harness import (
+    Benchmark,
+    BenchmarkResult,
+    build_results,
+    load_results,
+    run_benchmark,
+    write_results,
+)
+from .synthetic import SIZES, RepoSpec, build_repo
+
+__all__ = [
+    "Benchmark",
+    "BenchmarkResult",
+    "Comparison",
+    "RepoSpec",
+    "SIZES",
+    "build_repo",
+    "build_results",
+    "compare_results",
+    "format_comparison",
+    "has_regressions",
+    "load_results",
+    "run_benchmark",
+    "write_results",
+]
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark CLI
+=============
+
+Commands:
+    run       Build a synthetic repository, run the suite, write JSON results
+    compare   Compare results against a baseline; exits 1 on regressions
+
+Examples:
+    python -m benchmarks run --size small
+    python -m benchmarks run --size large --only security merge --repeat 20
+    python -m benchmarks run --output baseline.json
+    python -m benchmarks compare baseline.json bench-results.json --threshold 0.15
+"""
+
+import argparse
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+from .compare import (
+    DEFAULT_THRESHOLD,
+    compare_results,
+    format_comparison,
+    has_regressions,
+)
+from .harness import (
+    build_results,
+    format_seconds,
+    load_results,
+    run_benchmark,
+    write_results,
+)
+from .suite import build_suite
+from .synthetic import SIZES, build_repo
+
+
+def _run(args: argparse.Namespace) -> int:
+    spec = SIZES[args.size]
+    overrides = {
+        key: value
+        for key, value in (
+            ("services", args.services),
+            ("files_per_service", args.files),
+            ("commits", args.commits),
+            ("seed", args.seed),
+        )
+        if value is not None
+    }
+    if overrides:
+        spec = replace(spec, **overrides)
+
+    with tempfile.TemporaryDirectory(prefix="auto-claude-bench-") as tmp:
+        tmp_dir = Path(tmp)
+        print(f"Building synthetic repository ({args.size}): {spec.to_dict()}")
+        repo = build_repo(tmp_dir / "repo", spec)
+        benchmarks = build_suite(repo, spec, tmp_dir / "work")
+        if args.only:
+            benchmarks = [
+                b for b in benchmarks if any(pattern in b.name for pattern in args.only)
+            ]
+
+        results = []
+        print(f"\n{'benchmark':<40} {'median':>10} {'p95':>10} {'stdev':>10}")
+        for benchmark in benchmarks:
+            result = run_benchmark(benchmark, warmup=args.warmup, repeat=args.repeat)
+            results.append(result)
+            if result.error:
+                print(f"{result.name:<40} ERROR {result.error}")
+            else:
+                print(
+                    f"{result.name:<40} {format_seconds(result.median):>10} "
+                    f"{format_seconds(result.p95):>10} "
+                    f"{format_seconds(result.stdev):>10}"
+                )
+
+    document = build_results(
+        results,
+        config={
+            "size": args.size,
+            "repo": spec.to_dict(),
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+        },
+        include_times=args.include_times,
+    )
+    write_results(args.output, document)
+    print(f"\nResults written to {args.output}")
+    return 1 if any(r.error for r in results) else 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    try:
+        baseline = load_results(args.baseline)
+        current = load_results(args.current)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if baseline.get("config", {}).get("repo") != current.get("config", {}).get("repo"):
+        print("Warning: baseline was recorded with a different repository shape\n")
+
+    comparisons = compare_results(baseline, current, args.threshold)
+    print(format_comparison(comparisons, args.threshold))
+    return 1 if has_regressions(comparisons) else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Hot-path benchmarks on synthetic repositories",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmark suite")
+    run.add_argument("--size", choices=sorted(SIZES), default="medium")
+    run.add_argument("--services", type=int, help="Override number of services")
+    run.add_argument("--files", type=int, help="Override files per service")
+    run.add_argument("--commits", type=int, help="Override git history length")
+    run.add_argument("--seed", type=int, help="Override the content seed")
+    run.add_argument("--warmup", type=int, default=2)
+    run.add_argument("--repeat", type=int, default=10)
+    run.add_argument(
+        "--only", nargs="+", help="Only run benchmarks whose name contains one of these"
+    )
+    run.add_argument(
+        "--output", type=Path, default=Path("bench-results.json"), help="Results file"
+    )
+    run.add_argument(
+        "--include-times", action="store_true", help="Store individual sample times"
+    )
+    run.set_defaults(handler=_run)
+
+    compare = commands.add_parser("compare", help="Compare results to a baseline")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Allowed slowdown as a fraction (default: {DEFAULT_THRESHOLD})",
+    )
+    compare.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
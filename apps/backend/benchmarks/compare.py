@@ -0,0 +1,99 @@
+"""
+Baseline Comparison
+===================
+
+Compares a results file against a stored baseline and flags benchmarks
+whose median slowed down by more than a threshold.
+"""
+
+from dataclasses import dataclass
+
+from .harness import format_seconds
+
+DEFAULT_THRESHOLD = 0.20  # 20% slower than baseline counts as a regression
+
+
+@dataclass
+class Comparison:
+    """
+    One benchmark compared against the baseline.
+
+    Attributes:
+        name: Benchmark name
+        status: "ok", "regression", "improved", "new", "missing" or "error"
+        baseline: Baseline median (seconds per call), if any
+        current: Current median (seconds per call), if any
+        ratio: current / baseline, if both exist
+    """
+
+    name: str
+    status: str
+    baseline: float | None = None
+    current: float | None = None
+    ratio: float | None = None
+
+
+def compare_results(
+    baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD
+) -> list[Comparison]:
+    """
+    Compare two results documents (as written by the harness).
+
+    A benchmark regresses when its median exceeds the baseline median by
+    more than ``threshold`` (a fraction), and improves when it is faster
+    by more than the same margin.
+    """
+    base_results = baseline.get("results", {})
+    current_results = current.get("results", {})
+    comparisons = []
+
+    for name in sorted(set(base_results) | set(current_results)):
+        base = base_results.get(name)
+        cur = current_results.get(name)
+        if cur is None:
+            comparisons.append(Comparison(name, "missing", base.get("median")))
+            continue
+        if cur.get("error"):
+            comparisons.append(Comparison(name, "error"))
+            continue
+        if base is None or base.get("error") or not base.get("median"):
+            comparisons.append(Comparison(name, "new", current=cur["median"]))
+            continue
+
+        ratio = cur["median"] / base["median"]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improved"
+        else:
+            status = "ok"
+        comparisons.append(
+            Comparison(name, status, base["median"], cur["median"], ratio)
+        )
+
+    return comparisons
+
+
+def has_regressions(comparisons: list[Comparison]) -> bool:
+    return any(c.status in ("regression", "error") for c in comparisons)
+
+
+def format_comparison(comparisons: list[Comparison], threshold: float) -> str:
+    """Render comparisons as a table."""
+    lines = [
+        f"{'benchmark':<40} {'baseline':>10} {'current':>10} {'change':>8}  status",
+        "-" * 80,
+    ]
+    for c in comparisons:
+        baseline = format_seconds(c.baseline) if c.baseline is not None else "-"
+        current = format_seconds(c.current) if c.current is not None else "-"
+        change = f"{(c.ratio - 1):+.0%}" if c.ratio is not None else ""
+        status = c.status.upper() if c.status in ("regression", "error") else c.status
+        lines.append(f"{c.name:<40} {baseline:>10} {current:>10} {change:>8}  {status}")
+    regressions = sum(c.status == "regression" for c in comparisons)
+    lines.append("")
+    lines.append(
+        f"{regressions} regression(s) beyond {threshold:.0%} "
+        f"across {len(comparisons)} benchmark(s)"
+    )
+    return "\n".join(lines)
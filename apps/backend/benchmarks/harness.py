@@ -0,0 +1,167 @@
+"""
+Benchmark Harness
+=================
+
+Runs benchmark callables with warm-up and repetition, summarizes timings
+and reads/writes JSON result files.
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+RESULTS_SCHEMA_VERSION = 1
+
+
+@dataclass
+class Benchmark:
+    """
+    A named hot path.
+
+    Attributes:
+        name: Unique benchmark name (stable across runs; used as the key
+            when comparing against a baseline)
+        func: The measured callable (no arguments)
+        group: Area of the codebase (context, security, merge, ...)
+        setup: Optional callable run once before warm-up; its return
+            value is ignored
+        teardown: Optional callable run once after measuring
+        inner_loops: Calls of ``func`` per measured sample, for paths
+            that are too fast to time individually
+    """
+
+    name: str
+    func: Callable[[], Any]
+    group: str = "default"
+    setup: Callable[[], Any] | None = None
+    teardown: Callable[[], Any] | None = None
+    inner_loops: int = 1
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing summary for one benchmark. Times are seconds per call."""
+
+    name: str
+    group: str
+    samples: int
+    inner_loops: int
+    min: float = 0.0
+    median: float = 0.0
+    mean: float = 0.0
+    p95: float = 0.0
+    stdev: float = 0.0
+    error: str | None = None
+    times: list[float] = field(default_factory=list, repr=False)
+
+    def to_dict(self, include_times: bool = False) -> dict:
+        data = asdict(self)
+        if not include_times:
+            data.pop("times")
+        return data
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    last = len(sorted_values) - 1
+    index = min(last, int(round(fraction * last)))
+    return sorted_values[index]
+
+
+def run_benchmark(
+    benchmark: Benchmark, warmup: int = 2, repeat: int = 10
+) -> BenchmarkResult:
+    """
+    Measure one benchmark.
+
+    Errors in setup or the measured function are recorded on the result
+    instead of raised, so one broken path does not abort the suite.
+    """
+    result = BenchmarkResult(
+        name=benchmark.name,
+        group=benchmark.group,
+        samples=0,
+        inner_loops=benchmark.inner_loops,
+    )
+    try:
+        if benchmark.setup:
+            benchmark.setup()
+        for _ in range(warmup):
+            benchmark.func()
+
+        times = []
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            for _ in range(benchmark.inner_loops):
+                benchmark.func()
+            times.append((time.perf_counter() - start) / benchmark.inner_loops)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+        return result
+    finally:
+        if benchmark.teardown:
+            try:
+                benchmark.teardown()
+            except Exception:
+                pass
+
+    ordered = sorted(times)
+    result.samples = len(times)
+    result.times = times
+    result.min = ordered[0]
+    result.median = statistics.median(ordered)
+    result.mean = statistics.fmean(ordered)
+    result.p95 = _percentile(ordered, 0.95)
+    result.stdev = statistics.stdev(ordered) if len(ordered) > 1 else 0.0
+    return result
+
+
+def build_results(
+    results: list[BenchmarkResult],
+    config: dict[str, Any],
+    include_times: bool = False,
+) -> dict:
+    """Assemble the JSON results document."""
+    return {
+        "schema": RESULTS_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "config": config,
+        "results": {r.name: r.to_dict(include_times) for r in results},
+    }
+
+
+def write_results(path: Path, document: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+        f.write("\n")
+
+
+def load_results(path: Path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    if document.get("schema") != RESULTS_SCHEMA_VERSION:
+        raise ValueError(
+            f"{path}: unsupported results schema {document.get('schema')!r}"
+        )
+    return document
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.1f}us"
@@ -0,0 +1,201 @@
+"""
+Synthetic Repositories
+======================
+
+Deterministic fixture repositories for benchmarks. The same RepoSpec (and
+seed) always produces the same tree and the same git history, so timings
+from different runs and machines measure the code, not the input.
+"""
+
+import os
+import random
+import subprocess
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+LANGUAGES = ("python", "typescript", "go")
+
+_WORDS = (
+    "user account session token payment invoice order cart search index "
+    "cache queue worker schedule report export import profile settings "
+    "notification email webhook audit permission role tenant billing"
+).split()
+
+# A fixed date keeps commit hashes stable across runs
+_GIT_DATE = "2024-01-01T00:00:00+00:00"
+
+
+@dataclass
+class RepoSpec:
+    """
+    Shape of a synthetic repository.
+
+    Attributes:
+        services: Number of services under services/
+        files_per_service: Source files per service
+        lines_per_file: Approximate lines per source file
+        languages: Languages assigned to services round-robin
+        commits: Commits of git history (0 for no git repo)
+        worktrees: Spec worktrees created by the worktree benchmarks
+        seed: Random seed for file contents
+    """
+
+    services: int = 4
+    files_per_service: int = 25
+    lines_per_file: int = 80
+    languages: list[str] = field(default_factory=lambda: list(LANGUAGES))
+    commits: int = 10
+    worktrees: int = 50
+    seed: int = 1234
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# Size presets for `python -m benchmarks run --size ...`
+SIZES: dict[str, RepoSpec] = {
+    "small": RepoSpec(
+        services=2, files_per_service=10, lines_per_file=40, commits=5, worktrees=10
+    ),
+    "medium": RepoSpec(),
+    "large": RepoSpec(
+        services=10, files_per_service=80, lines_per_file=150, commits=40
+    ),
+}
+
+
+def _ident(rng: random.Random) -> str:
+    return "_".join(rng.sample(_WORDS, 2))
+
+
+def _python_source(rng: random.Random, lines: int) -> str:
+    out = ["import logging", "", "logger = logging.getLogger(__name__)", ""]
+    while len(out) < lines:
+        name = _ident(rng)
+        out += [
+            "",
+            f"def {name}(request, limit=10):",
+            f'    """Handle {name.replace("_", " ")}."""',
+            f"    items = request.get('{rng.choice(_WORDS)}', [])[:limit]",
+            f"    logger.info('processing %d {rng.choice(_WORDS)} items', len(items))",
+            "    return [item for item in items if item]",
+        ]
+    # Whole functions only, so the file stays valid Python
+    return "\n".join(out) + "\n"
+
+
+def _typescript_source(rng: random.Random, lines: int) -> str:
+    out = ["import { Router } from 'express';", "", "const router = Router();"]
+    while len(out) < lines:
+        name = _ident(rng)
+        out += [
+            "",
+            f"router.get('/api/{name.replace('_', '/')}', async (req, res) => {{",
+            f"  const {rng.choice(_WORDS)} = "
+            f"await fetch{rng.randint(0, 99)}(req.query);",
+            f"  res.json({{ {rng.choice(_WORDS)}: true }});",
+            "});",
+        ]
+    return "\n".join(out[:lines]) + "\nexport default router;\n"
+
+
+def _go_source(rng: random.Random, lines: int) -> str:
+    out = ["package main", "", 'import "net/http"']
+    while len(out) < lines:
+        name = "".join(w.title() for w in _ident(rng).split("_"))
+        out += [
+            "",
+            f"func {name}(w http.ResponseWriter, r *http.Request) {{",
+            f'\tw.Write([]byte("{rng.choice(_WORDS)}"))',
+            "}",
+        ]
+    return "\n".join(out[:lines]) + "\n"
+
+
+_SOURCES = {
+    "python": (".py", _python_source),
+    "typescript": (".ts", _typescript_source),
+    "go": (".go", _go_source),
+}
+
+
+def _manifest(language: str, name: str) -> tuple[str, str]:
+    if language == "python":
+        return "requirements.txt", "fastapi==0.110.0\nuvicorn==0.29.0\npytest==8.1.1\n"
+    if language == "typescript":
+        return (
+            "package.json",
+            f'{{\n  "name": "{name}",\n  "scripts": {{"dev": "node index.js", '
+            '"test": "jest"},\n  "dependencies": {"express": "^4.18.2"},\n'
+            '  "devDependencies": {"jest": "^29.0.0"}\n}\n',
+        )
+    return "go.mod", f"module example.com/{name}\n\ngo 1.22\n"
+
+
+def _git(repo: Path, *args: str) -> None:
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Bench",
+        "GIT_AUTHOR_EMAIL": "bench@example.com",
+        "GIT_COMMITTER_NAME": "Bench",
+        "GIT_COMMITTER_EMAIL": "bench@example.com",
+        "GIT_AUTHOR_DATE": _GIT_DATE,
+        "GIT_COMMITTER_DATE": _GIT_DATE,
+    }
+    subprocess.run(["git", *args], cwd=repo, env=env, check=True, capture_output=True)
+
+
+def build_repo(root: Path, spec: RepoSpec) -> Path:
+    """
+    Generate a synthetic repository.
+
+    Args:
+        root: Directory to create the repository in (created if missing)
+        spec: Repository shape
+
+    Returns:
+        The repository root
+    """
+    rng = random.Random(spec.seed)
+    root.mkdir(parents=True, exist_ok=True)
+    source_files: list[Path] = []
+
+    for i in range(spec.services):
+        language = spec.languages[i % len(spec.languages)]
+        extension, make_source = _SOURCES[language]
+        name = f"svc{i}-{_WORDS[i % len(_WORDS)]}"
+        service_dir = root / "services" / name
+        (service_dir / "src").mkdir(parents=True, exist_ok=True)
+
+        manifest, content = _manifest(language, name)
+        (service_dir / manifest).write_text(content, encoding="utf-8")
+        for j in range(spec.files_per_service):
+            path = service_dir / "src" / f"{_ident(rng)}_{j}{extension}"
+            path.write_text(make_source(rng, spec.lines_per_file), encoding="utf-8")
+            source_files.append(path)
+
+    (root / "README.md").write_text("# Synthetic benchmark repo\n", encoding="utf-8")
+
+    if spec.commits > 0:
+        _git(root, "init", "-q", "-b", "main")
+        _git(root, "add", "-A")
+        _git(root, "commit", "-q", "-m", "Initial commit")
+        for n in range(1, spec.commits):
+            if source_files:
+                path = source_files[rng.randrange(len(source_files))]
+            else:
+                path = root / "README.md"
+            comment = "#" if path.suffix == ".py" else "//"
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(f"\n{comment} change {n}: {rng.choice(_WORDS)}\n")
+            _git(root, "commit", "-q", "-am", f"Change {n}")
+
+    return root
+
+
+def service_dirs(root: Path) -> list[Path]:
+    """Service directories of a synthetic repository, in creation order."""
+    services = root / "services"
+    if not services.exists():
+        return []
+    return sorted(p for p in services.iterdir() if p.is_dir())
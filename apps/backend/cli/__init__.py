@@ -10,6 +10,7 @@ This package provides a modular CLI structure:
 - build_commands.py: Build execution and follow-up tasks
 - workspace_commands.py: Workspace management (merge, review, discard)
 - qa_commands.py: QA validation commands
+- profile_commands.py: Session telemetry view
 - utils.py: Shared utilities and configuration
 """
 
@@ -16,19 +16,10 @@ if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
 
-from .batch_commands import (
-    handle_batch_cleanup_command,
-    handle_batch_create_command,
-    handle_batch_status_command,
-)
-from .build_commands import handle_build_command
-from .followup_commands import handle_followup_command
-from .qa_commands import (
-    handle_qa_command,
-    handle_qa_status_command,
-    handle_review_status_command,
-)
-from .spec_commands import print_specs_list
+# Command handlers are imported inside _run_cli() right before they run:
+# quick commands (--list, status queries, --merge-preview) are invoked often
+# by the UI and must not pay for importing the agent SDK, Graphiti, the
+# merge system or the build pipeline.
 from .utils import (
     DEFAULT_MODEL,
     find_spec,
@@ -36,14 +27,6 @@ from .utils import (
     print_banner,
     setup_environment,
 )
-from .workspace_commands import (
-    handle_cleanup_worktrees_command,
-    handle_create_pr_command,
-    handle_discard_command,
-    handle_list_worktrees_command,
-    handle_merge_command,
-    handle_review_command,
-)
 
 
 def parse_args() -> argparse.Namespace:
@@ -72,6 +55,7 @@ Examples:
   # Status checks
   python auto-claude/run.py --spec 001 --review-status  # Check human review status
   python auto-claude/run.py --spec 001 --qa-status      # Check QA validation status
+  python auto-claude/run.py --spec 001 --profile        # Time per phase, session and tool
 
 Prerequisites:
   1. Authenticate: Run 'claude' and type '/login'
@@ -222,6 +206,13 @@ Environment Variables:
         help="Show human review/approval status for a spec",
     )
 
+    # Telemetry
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Show a flame-style time breakdown of recorded agent sessions",
+    )
+
     # Non-interactive mode (for UI/automation)
     parser.add_argument(
         "--auto-continue",
@@ -329,30 +320,42 @@ def _run_cli() -> None:
 
     # Handle --list command
     if args.list:
+        from .spec_commands import print_specs_list
+
         print_banner()
         print_specs_list(project_dir)
         return
 
     # Handle --list-worktrees command
     if args.list_worktrees:
+        from .workspace_commands import handle_list_worktrees_command
+
         handle_list_worktrees_command(project_dir)
         return
 
     # Handle --cleanup-worktrees command
     if args.cleanup_worktrees:
+        from .workspace_commands import handle_cleanup_worktrees_command
+
         handle_cleanup_worktrees_command(project_dir)
         return
 
     # Handle batch commands
     if args.batch_create:
+        from .batch_commands import handle_batch_create_command
+
         handle_batch_create_command(args.batch_create, str(project_dir))
         return
 
     if args.batch_status:
+        from .batch_commands import handle_batch_status_command
+
         handle_batch_status_command(str(project_dir))
         return
 
     if args.batch_cleanup:
+        from .batch_commands import handle_batch_cleanup_command
+
         handle_batch_cleanup_command(str(project_dir), dry_run=not args.no_dry_run)
         return
 
@@ -371,6 +374,8 @@ def _run_cli() -> None:
     debug("run.py", "Finding spec", spec_identifier=args.spec)
     spec_dir = find_spec(project_dir, args.spec)
     if not spec_dir:
+        from .spec_commands import print_specs_list
+
         debug_error("run.py", "Spec not found", spec=args.spec)
         print_banner()
         print(f"\nError: Spec '{args.spec}' not found")
@@ -391,7 +396,7 @@ def _run_cli() -> None:
 
     # Handle build management commands
     if args.merge_preview:
-        from cli.workspace_commands import handle_merge_preview_command
+        from .workspace_commands import handle_merge_preview_command
 
         result = handle_merge_preview_command(
             project_dir, spec_dir.name, base_branch=args.base_branch
@@ -403,6 +408,8 @@ def _run_cli() -> None:
         return
 
     if args.merge:
+        from .workspace_commands import handle_merge_command
+
         success = handle_merge_command(
             project_dir,
             spec_dir.name,
@@ -414,14 +421,20 @@ def _run_cli() -> None:
         return
 
     if args.review:
+        from .workspace_commands import handle_review_command
+
         handle_review_command(project_dir, spec_dir.name)
         return
 
     if args.discard:
+        from .workspace_commands import handle_discard_command
+
         handle_discard_command(project_dir, spec_dir.name)
         return
 
     if args.create_pr:
+        from .workspace_commands import handle_create_pr_command
+
         # Pass args.pr_target directly - WorktreeManager._detect_base_branch
         # handles base branch detection internally when target_branch is None
         result = handle_create_pr_command(
@@ -438,14 +451,26 @@ def _run_cli() -> None:
 
     # Handle QA commands
     if args.qa_status:
+        from .qa_commands import handle_qa_status_command
+
         handle_qa_status_command(spec_dir)
         return
 
     if args.review_status:
+        from .qa_commands import handle_review_status_command
+
         handle_review_status_command(spec_dir)
         return
 
+    if args.profile:
+        from .profile_commands import handle_profile_command
+
+        handle_profile_command(spec_dir)
+        return
+
     if args.qa:
+        from .qa_commands import handle_qa_command
+
         handle_qa_command(
             project_dir=project_dir,
             spec_dir=spec_dir,
@@ -456,6 +481,8 @@ def _run_cli() -> None:
 
     # Handle --followup command
     if args.followup:
+        from .followup_commands import handle_followup_command
+
         handle_followup_command(
             project_dir=project_dir,
             spec_dir=spec_dir,
@@ -465,6 +492,8 @@ def _run_cli() -> None:
         return
 
     # Normal build flow
+    from .build_commands import handle_build_command
+
     handle_build_command(
         project_dir=project_dir,
         spec_dir=spec_dir,
@@ -0,0 +1,40 @@
+"""
+Profile Commands
+================
+
+CLI command for viewing a spec's session telemetry (--profile)
+"""
+
+import sys
+from pathlib import Path
+
+# Ensure parent directory is in path for imports (before other imports)
+_PARENT_DIR = Path(__file__).parent.parent
+if str(_PARENT_DIR) not in sys.path:
+    sys.path.insert(0, str(_PARENT_DIR))
+
+from core.telemetry import TRACE_FILE, build_profile, format_profile, load_trace
+from ui import Icons, icon, info
+
+from .utils import print_banner
+
+
+def handle_profile_command(spec_dir: Path) -> None:
+    """
+    Handle the --profile command.
+
+    Prints a flame-style breakdown of time spent per phase, session, tool
+    call and hook, followed by token and cost counters.
+
+    Args:
+        spec_dir: Spec directory path
+    """
+    print_banner()
+    print(f"\nSpec: {spec_dir.name}\n")
+
+    spans, counters = load_trace(spec_dir)
+    if not spans and not counters:
+        print(info(f"{icon(Icons.INFO)} No telemetry recorded yet ({TRACE_FILE})."))
+        return
+
+    print(format_profile(build_profile(spans), counters))
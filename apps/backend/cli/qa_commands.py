@@ -15,12 +15,7 @@ if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
 from progress import count_subtasks
-from qa_loop import (
-    is_qa_approved,
-    print_qa_status,
-    run_qa_validation_loop,
-    should_run_qa,
-)
+from qa import is_qa_approved, print_qa_status, should_run_qa
 from review import ReviewState, display_review_status
 from ui import (
     Icons,
@@ -108,6 +103,9 @@ def handle_qa_command(
     if has_human_feedback:
         print("\n📝 Human feedback detected - processing fix request...")
 
+    # The QA loop pulls in the agent SDK; import it only when QA actually runs
+    from qa_loop import run_qa_validation_loop
+
     try:
         approved = asyncio.run(
             run_qa_validation_loop(
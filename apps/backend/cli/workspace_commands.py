@@ -15,6 +15,13 @@ _PARENT_DIR = Path(__file__).parent.parent
 if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
+from core.workspace import (
+    cleanup_all_worktrees,
+    discard_existing_build,
+    get_existing_build_worktree,
+    list_all_worktrees,
+    review_existing_build,
+)
 from core.workspace.git_utils import (
     _is_auto_claude_file,
     apply_path_mapping,
@@ -30,14 +37,6 @@ from ui import (
     Icons,
     icon,
 )
-from workspace import (
-    cleanup_all_worktrees,
-    discard_existing_build,
-    get_existing_build_worktree,
-    list_all_worktrees,
-    merge_existing_build,
-    review_existing_build,
-)
 
 from .utils import print_banner
 
@@ -384,6 +383,9 @@ def handle_merge_command(
     Returns:
         True if merge succeeded, False otherwise
     """
+    # Loads the merge system; deferred so listing/review commands stay light
+    from core.workspace import merge_existing_build
+
     success = merge_existing_build(
         project_dir, spec_name, no_commit=no_commit, base_branch=base_branch
     )
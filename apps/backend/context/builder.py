@@ -6,10 +6,11 @@ Main builder class that orchestrates context building for tasks.
 """
 
 import asyncio
-import json
 from dataclasses import asdict
 from pathlib import Path
 
+from core.project_index import ProjectIndex
+
 from .categorizer import FileCategorizer
 from .graphiti_integration import fetch_graph_hints, is_graphiti_enabled
 from .keyword_extractor import KeywordExtractor
@@ -35,14 +36,10 @@ class ContextBuilder:
 
     def _load_project_index(self) -> dict:
         """Load project index from file or create new one (.auto-claude is the installed instance)."""
-        index_file = self.project_dir / ".auto-claude" / "project_index.json"
-        if index_file.exists():
-            try:
-                with open(index_file, encoding="utf-8") as f:
-                    return json.load(f)
-            except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-                # Corrupted or legacy-encoded file, regenerate
-                pass
+        index = ProjectIndex.for_project(self.project_dir)
+        if index.exists():
+            return index.data()
+        # Missing, corrupted or legacy-encoded file, regenerate
 
         # Try to create one
         from analyzer import analyze_project
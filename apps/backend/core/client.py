@@ -12,12 +12,9 @@ The client factory now uses AGENT_CONFIGS from agents/tools_pkg/models.py as the
 single source of truth for phase-aware tool and MCP server configuration.
 """
 
-import copy
 import json
 import logging
 import os
-import threading
-import time
 from pathlib import Path
 from typing import Any
 
@@ -25,18 +22,16 @@ from core.platform import (
     is_windows,
     validate_cli_path,
 )
+from core.project_index import ProjectIndex
 
 logger = logging.getLogger(__name__)
 
 # =============================================================================
 # Project Index Cache
 # =============================================================================
-# Caches project index and capabilities to avoid reloading on every create_client() call.
-# This significantly reduces the time to create new agent sessions.
-
-_PROJECT_INDEX_CACHE: dict[str, tuple[dict[str, Any], dict[str, bool], float]] = {}
-_CACHE_TTL_SECONDS = 300  # 5 minute TTL
-_CACHE_LOCK = threading.Lock()  # Protects _PROJECT_INDEX_CACHE access
+# The project index and its capabilities come from the shared ProjectIndex,
+# which only re-parses project_index.json when the file changes. This keeps
+# create_client() cheap without serving a stale index.
 
 
 def _get_cached_project_data(
@@ -49,62 +44,13 @@ def _get_cached_project_data(
         project_dir: Path to the project directory
 
     Returns:
-        Tuple of (project_index, project_capabilities)
+        Tuple of (project_index, project_capabilities); the index is shared
+        and must not be mutated
     """
-
-    key = str(project_dir.resolve())
-    now = time.time()
-    debug = os.environ.get("DEBUG", "").lower() in ("true", "1")
-
-    # Check cache with lock
-    with _CACHE_LOCK:
-        if key in _PROJECT_INDEX_CACHE:
-            cached_index, cached_capabilities, cached_time = _PROJECT_INDEX_CACHE[key]
-            cache_age = now - cached_time
-            if cache_age < _CACHE_TTL_SECONDS:
-                if debug:
-                    print(
-                        f"[ClientCache] Cache HIT for project index (age: {cache_age:.1f}s / TTL: {_CACHE_TTL_SECONDS}s)"
-                    )
-                logger.debug(f"Using cached project index for {project_dir}")
-                # Return deep copies to prevent callers from corrupting the cache
-                return copy.deepcopy(cached_index), copy.deepcopy(cached_capabilities)
-            elif debug:
-                print(
-                    f"[ClientCache] Cache EXPIRED for project index (age: {cache_age:.1f}s > TTL: {_CACHE_TTL_SECONDS}s)"
-                )
-
-    # Cache miss or expired - load fresh data (outside lock to avoid blocking)
-    load_start = time.time()
-    logger.debug(f"Loading project index for {project_dir}")
-    project_index = load_project_index(project_dir)
-    project_capabilities = detect_project_capabilities(project_index)
-
-    if debug:
-        load_duration = (time.time() - load_start) * 1000
-        print(
-            f"[ClientCache] Cache MISS - loaded project index in {load_duration:.1f}ms"
-        )
-
-    # Store in cache with lock - use double-checked locking pattern
-    # Re-check if another thread populated the cache while we were loading
-    with _CACHE_LOCK:
-        if key in _PROJECT_INDEX_CACHE:
-            cached_index, cached_capabilities, cached_time = _PROJECT_INDEX_CACHE[key]
-            cache_age = time.time() - cached_time
-            if cache_age < _CACHE_TTL_SECONDS:
-                # Another thread already cached valid data while we were loading
-                if debug:
-                    print(
-                        "[ClientCache] Cache was populated by another thread, using cached data"
-                    )
-                # Return deep copies to prevent callers from corrupting the cache
-                return copy.deepcopy(cached_index), copy.deepcopy(cached_capabilities)
-        # Either no cache entry or it's expired - store our fresh data
-        _PROJECT_INDEX_CACHE[key] = (project_index, project_capabilities, time.time())
-
-    # Return the freshly loaded data (no need to copy since it's not from cache)
-    return project_index, project_capabilities
+    index = ProjectIndex.for_project(project_dir)
+    project_index = index.data() if index.exists() else {}
+    logger.debug(f"Using project index for {project_dir} (stats: {index.stats})")
+    return project_index, index.capabilities()
 
 
 def invalidate_project_cache(project_dir: Path | None = None) -> None:
@@ -114,15 +60,8 @@ def invalidate_project_cache(project_dir: Path | None = None) -> None:
     Args:
         project_dir: Specific project to invalidate, or None to clear all
     """
-    with _CACHE_LOCK:
-        if project_dir is None:
-            _PROJECT_INDEX_CACHE.clear()
-            logger.debug("Cleared all project index cache entries")
-        else:
-            key = str(project_dir.resolve())
-            if key in _PROJECT_INDEX_CACHE:
-                del _PROJECT_INDEX_CACHE[key]
-                logger.debug(f"Invalidated project index cache for {project_dir}")
+    ProjectIndex.invalidate(project_dir)
+    logger.debug(f"Invalidated project index cache for {project_dir or 'all'}")
 
 
 from agents.tools_pkg import (
@@ -143,8 +82,13 @@ from core.auth import (
     require_auth_token,
     validate_token_not_encrypted,
 )
+from core.sparse_worktree import (
+    SPARSE_HOOK_MATCHER,
+    get_cone_directories,
+    make_sparse_widening_hook,
+)
+from core.telemetry import get_recorder, traced_hook
 from linear_updater import is_linear_enabled
-from prompts_pkg.project_context import detect_project_capabilities, load_project_index
 from security import bash_security_hook
 
 
@@ -795,6 +739,31 @@ def create_client(
         print("   - CLAUDE.md: disabled by project settings")
     print()
 
+    # Hook invocations are recorded as spans in the spec's telemetry trace
+    recorder = get_recorder(spec_dir)
+    pre_tool_use_hooks = [
+        HookMatcher(
+            matcher="Bash",
+            hooks=[traced_hook(recorder, "bash_security_hook", bash_security_hook)],
+        ),
+    ]
+    # Sparse spec worktrees materialize directories on demand before file tools
+    # and Bash commands run
+    if get_cone_directories(project_dir) is not None:
+        pre_tool_use_hooks.append(
+            HookMatcher(
+                matcher=SPARSE_HOOK_MATCHER,
+                hooks=[
+                    traced_hook(
+                        recorder,
+                        "sparse_widening_hook",
+                        make_sparse_widening_hook(project_dir),
+                    )
+                ],
+            )
+        )
+        print("   - Sparse worktree: directories widen on demand")
+
     # Build options dict, conditionally including output_format
     options_kwargs: dict[str, Any] = {
         "model": model,
@@ -802,9 +771,7 @@ def create_client(
         "allowed_tools": allowed_tools_list,
         "mcp_servers": mcp_servers,
         "hooks": {
-            "PreToolUse": [
-                HookMatcher(matcher="Bash", hooks=[bash_security_hook]),
-            ],
+            "PreToolUse": pre_tool_use_hooks,
         },
         "max_turns": 1000,
         "cwd": str(project_dir.resolve()),
@@ -0,0 +1,507 @@
+"""
+Dependency Cache
+================
+
+Shares installed dependency trees (node_modules, Python virtualenvs)
+between a project and its worktrees, so agents and QA runs do not reinstall
+them in every worktree.
+
+Package roots are the project root plus every service directory from the
+project index. Each installed tree is keyed by the hash of the lockfile it
+was installed from (workspace packages without their own lockfile use the
+nearest one above them, as npm/pnpm/yarn workspaces hoist to the root):
+
+    .auto-claude/dependency-cache/<kind>/<installed path>/<lockfile hash>/
+
+A snapshot is taken from the project's installed tree the first time a
+worktree needs that lockfile hash, and is only rebuilt when the lockfile
+changes. It is a reflink clone or a real copy, never hardlinks into the
+live tree. Worktrees get a copy-on-write clone of the snapshot:
+
+- reflink (FICLONE) where the filesystem supports it - fully independent
+- hardlinks otherwise - adding, removing or reinstalling packages in the
+  worktree leaves the snapshot intact, since package managers replace
+  files rather than editing them in place
+- a symlink to the snapshot when neither works (e.g. across devices)
+
+Virtualenvs are not relocatable as-is: pyvenv.cfg, the activate scripts
+and console script shebangs hold the venv's absolute path. A cloned venv
+has that path rewritten to its new location (in fresh files, so the
+snapshot is untouched), and a venv is never symlinked - a worktree that
+cannot get its own clone installs its own.
+
+A worktree whose lockfile differs from every snapshot gets nothing and
+installs as before; capture() can then snapshot its tree for later
+worktrees.
+
+Configuration:
+    AUTO_CLAUDE_DEPENDENCY_CACHE - "on" (default) or "off" (only symlink
+                                   the project's node_modules, as before)
+
+Usage:
+    from core.dependency_cache import DependencyCache
+
+    cache = DependencyCache(project_dir)
+    for linked in cache.materialize(worktree_path):
+        print(linked.path, linked.method)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import uuid
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+from core.git_executable import run_git
+from core.project_index import ProjectIndex
+
+CACHE_DIR = Path(".auto-claude") / "dependency-cache"
+DEPENDENCY_CACHE_ENV_VAR = "AUTO_CLAUDE_DEPENDENCY_CACHE"
+
+# Snapshots kept per installed tree (older lockfile versions are pruned)
+SNAPSHOTS_PER_TREE = 3
+
+# Roots always considered, besides the project index services
+DEFAULT_ROOTS = (".", "apps/frontend")
+
+_COMPLETE_MARKER = ".complete"
+_ORIGIN_FILE = "origin"  # Absolute path the snapshot was taken from
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+
+@dataclass(frozen=True)
+class DependencyKind:
+    """A kind of installed dependency tree."""
+
+    name: str
+    installed: tuple[str, ...]  # Directory names of the installed tree
+    lockfiles: tuple[str, ...]  # In order of preference
+    inherit: bool  # Use the nearest ancestor's lockfile (workspaces)
+
+
+DEPENDENCY_KINDS = (
+    DependencyKind(
+        name="node",
+        installed=("node_modules",),
+        lockfiles=(
+            "pnpm-lock.yaml",
+            "package-lock.json",
+            "yarn.lock",
+            "bun.lock",
+            "bun.lockb",
+        ),
+        inherit=True,
+    ),
+    DependencyKind(
+        name="python",
+        installed=(".venv", "venv"),
+        lockfiles=("uv.lock", "poetry.lock", "Pipfile.lock", "requirements.txt"),
+        inherit=False,
+    ),
+)
+
+
+@dataclass(frozen=True)
+class InstalledTree:
+    """An installed dependency tree of a package root (paths are relative)."""
+
+    kind: DependencyKind
+    path: str  # e.g. "apps/frontend/node_modules"
+    lockfile: str  # e.g. "package-lock.json"
+
+
+@dataclass(frozen=True)
+class Materialized:
+    """An installed tree placed into a worktree."""
+
+    path: str
+    method: str  # "reflink", "hardlink" or "symlink"
+    lockfile_hash: str | None = None  # None when symlinked to the project
+
+
+def dependency_cache_enabled() -> bool:
+    """Whether worktrees get dependencies from the cache (the default)."""
+    return os.environ.get(DEPENDENCY_CACHE_ENV_VAR, "on").lower() not in (
+        "off",
+        "false",
+        "0",
+        "no",
+    )
+
+
+def lockfile_hash(path: Path) -> str:
+    """Hash of a lockfile's content."""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def discover_package_roots(project_dir: Path) -> list[str]:
+    """
+    Package root directories of a project, relative to it.
+
+    The project root and apps/frontend are always candidates; the project
+    index adds every service directory inside the project.
+    """
+    project_dir = Path(project_dir).resolve()
+    roots = set(DEFAULT_ROOTS)
+    for service in ProjectIndex.for_project(project_dir).services().values():
+        raw = service.get("path")
+        if not isinstance(raw, str) or not raw:
+            continue
+        path = Path(raw)
+        if not path.is_absolute():
+            path = project_dir / path
+        try:
+            rel = path.resolve().relative_to(project_dir)
+        except ValueError:
+            continue  # Outside the project
+        roots.add(rel.as_posix() or ".")
+    return sorted(r for r in roots if (project_dir / r).is_dir())
+
+
+def _find_lockfile(base_dir: Path, root: str, kind: DependencyKind) -> str | None:
+    """Lockfile of a root (relative to base_dir), if it has one."""
+    current = PurePosixPath(root)
+    while True:
+        for name in kind.lockfiles:
+            candidate = (current / name).as_posix()
+            if (base_dir / candidate).is_file():
+                return candidate.removeprefix("./")
+        if not kind.inherit or current == PurePosixPath("."):
+            return None
+        current = current.parent
+
+
+def _references(tree: Path, needle: str) -> bool:
+    """Whether a virtualenv has editable installs pointing at needle."""
+    for pattern in ("*.pth", "*.egg-link", "__editable__*"):
+        for path in tree.glob(f"lib*/python*/site-packages/{pattern}"):
+            try:
+                if path.is_file() and needle in path.read_text(
+                    encoding="utf-8", errors="ignore"
+                ):
+                    return True
+            except OSError:
+                continue
+    return False
+
+
+# =============================================================================
+# Copy-on-write cloning
+# =============================================================================
+
+
+class _Cloner:
+    """Clones files by reflink, falling back to `fallback` for the tree."""
+
+    def __init__(self, fallback: str) -> None:
+        self.fallback = fallback
+        self.method = "reflink" if sys.platform.startswith("linux") else fallback
+
+    def clone(self, src: str, dst: str) -> None:
+        if self.method == "reflink":
+            try:
+                _reflink(src, dst)
+                return
+            except OSError:
+                self.method = self.fallback
+                if os.path.lexists(dst):
+                    os.unlink(dst)
+        if self.method == "copy":
+            shutil.copy2(src, dst)
+        else:
+            os.link(src, dst)
+
+
+def _reflink(src: str, dst: str) -> None:
+    import fcntl
+
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+    shutil.copymode(src, dst)
+
+
+def _clone_tree(src: Path, dst: Path, fallback: str = "hardlink") -> str:
+    """
+    Clone a directory tree file by file, recreating symlinks.
+
+    Args:
+        fallback: "hardlink" or "copy", used where reflinks are unsupported
+
+    Returns:
+        The method used ("reflink" or the fallback)
+
+    Raises:
+        OSError: If files can be neither reflinked nor hardlinked/copied
+    """
+    cloner = _Cloner(fallback)
+    dst.mkdir(parents=True)
+    for root, dirs, files in os.walk(src):
+        rel = os.path.relpath(root, src)
+        target_root = dst / rel if rel != "." else dst
+        # os.walk lists symlinks to directories in dirs without descending
+        for name in dirs:
+            source = os.path.join(root, name)
+            if os.path.islink(source):
+                os.symlink(os.readlink(source), target_root / name)
+            else:
+                (target_root / name).mkdir()
+        for name in files:
+            source = os.path.join(root, name)
+            mode = os.lstat(source).st_mode
+            if stat.S_ISLNK(mode):
+                os.symlink(os.readlink(source), target_root / name)
+            elif stat.S_ISREG(mode):
+                cloner.clone(source, str(target_root / name))
+    return cloner.method
+
+
+def _relocate_venv(venv: Path, origin: str) -> None:
+    """
+    Point a cloned virtualenv at its own location instead of origin.
+
+    Rewrites pyvenv.cfg, the scripts directory (activate scripts, console
+    script shebangs) and .pth files. Changed files are replaced, not edited,
+    so hardlinked or reflinked snapshot files are left alone.
+
+    Raises:
+        OSError: If a binary file (e.g. a Windows launcher) embeds origin
+    """
+    old, new = origin.encode(), str(venv.absolute()).encode()
+    candidates = [venv / "pyvenv.cfg"]
+    for pattern in ("bin/*", "Scripts/*", "lib*/python*/site-packages/*.pth"):
+        candidates.extend(venv.glob(pattern))
+    for path in candidates:
+        if path.is_symlink() or not path.is_file():
+            continue
+        data = path.read_bytes()
+        if old not in data:
+            continue
+        if b"\0" in data:
+            raise OSError(f"{path} embeds the venv path {origin}")
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}")
+        tmp.write_bytes(data.replace(old, new))
+        shutil.copystat(path, tmp)
+        os.replace(tmp, path)
+
+
+def _symlink(target: Path, source: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if sys.platform == "win32":
+        # Junctions need no admin rights and take absolute paths
+        result = subprocess.run(
+            ["cmd", "/c", "mklink", "/J", str(target), str(source)],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise OSError(result.stderr or "mklink /J failed")
+    else:
+        os.symlink(os.path.relpath(source, target.parent), target)
+
+
+def _is_complete(snapshot: Path) -> bool:
+    """Whether a snapshot is complete, marking it as recently used."""
+    try:
+        os.utime(snapshot / _COMPLETE_MARKER)
+    except OSError:
+        return False
+    return True
+
+
+def _remove(path: Path) -> None:
+    if path.is_symlink() or path.is_file():
+        path.unlink()
+    elif path.exists():
+        shutil.rmtree(path, ignore_errors=True)
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+class DependencyCache:
+    """Lockfile-keyed snapshots of a project's installed dependency trees."""
+
+    def __init__(self, project_dir: Path, cache_dir: Path | None = None):
+        """
+        Args:
+            project_dir: The main project directory
+            cache_dir: Where snapshots live (defaults to
+                .auto-claude/dependency-cache in the project)
+        """
+        self.project_dir = Path(project_dir).resolve()
+        self.cache_dir = Path(cache_dir or self.project_dir / CACHE_DIR)
+
+    def installed_trees(self, base_dir: Path | None = None) -> list[InstalledTree]:
+        """
+        Installed trees with a lockfile under base_dir (default: the project).
+        """
+        base_dir = Path(base_dir or self.project_dir)
+        trees = []
+        for root in discover_package_roots(self.project_dir):
+            for kind in DEPENDENCY_KINDS:
+                lockfile = _find_lockfile(base_dir, root, kind)
+                if lockfile is None:
+                    continue
+                for name in kind.installed:
+                    path = (PurePosixPath(root) / name).as_posix()
+                    if (base_dir / path).is_dir():
+                        trees.append(InstalledTree(kind, path, lockfile))
+                        break
+        return trees
+
+    def snapshot_path(self, tree: InstalledTree, digest: str) -> Path:
+        return self.cache_dir / tree.kind.name / tree.path.replace("/", "__") / digest
+
+    def snapshot(self, tree: InstalledTree, source_dir: Path) -> Path | None:
+        """
+        The snapshot of a tree for source_dir's lockfile, taken if missing.
+
+        Returns:
+            Snapshot directory, or None if it cannot be taken (no lockfile,
+            an editable install of source_dir, or the copy failed)
+        """
+        source_dir = Path(source_dir).resolve()
+        try:
+            digest = lockfile_hash(source_dir / tree.lockfile)
+        except OSError:
+            return None
+        snapshot = self.snapshot_path(tree, digest)
+        if _is_complete(snapshot):
+            return snapshot
+
+        source = source_dir / tree.path
+        if not source.is_dir() or self._editable(tree, source_dir):
+            return None
+
+        staging = snapshot.with_name(f".{digest}.{uuid.uuid4().hex[:8]}")
+        try:
+            # A real copy where reflinks are unsupported: hardlinks would
+            # tie the snapshot to files the project may still modify
+            _clone_tree(source, staging / "tree", fallback="copy")
+            (staging / _ORIGIN_FILE).write_text(str(source), encoding="utf-8")
+            (staging / _COMPLETE_MARKER).touch()
+            if snapshot.exists():
+                _remove(snapshot)  # Incomplete leftover
+            os.replace(staging, snapshot)
+        except OSError:
+            _remove(staging)
+            return snapshot if (snapshot / _COMPLETE_MARKER).exists() else None
+        self._prune(snapshot.parent)
+        return snapshot
+
+    def _editable(self, tree: InstalledTree, source_dir: Path) -> bool:
+        """Whether a virtualenv imports source_dir's code (editable install)."""
+        return tree.kind.name == "python" and _references(
+            source_dir / tree.path, str(Path(source_dir).resolve())
+        )
+
+    def _prune(self, tree_dir: Path) -> None:
+        """Drop the oldest snapshots of a tree beyond SNAPSHOTS_PER_TREE."""
+        snapshots = sorted(
+            (p for p in tree_dir.iterdir() if (p / _COMPLETE_MARKER).exists()),
+            key=lambda p: (p / _COMPLETE_MARKER).stat().st_mtime_ns,
+            reverse=True,
+        )
+        for old in snapshots[SNAPSHOTS_PER_TREE:]:
+            _remove(old)
+
+    def capture(self, source_dir: Path) -> list[Path]:
+        """
+        Snapshot source_dir's installed trees whose lockfile has none yet.
+
+        Use after dependencies were installed in a worktree for a changed
+        lockfile, so later worktrees with that lockfile reuse them.
+        """
+        snapshots = []
+        for tree in self.installed_trees(source_dir):
+            snapshot = self.snapshot(tree, source_dir)
+            if snapshot is not None:
+                snapshots.append(snapshot)
+        return snapshots
+
+    def materialize(self, worktree_path: Path) -> list[Materialized]:
+        """
+        Place the project's installed trees into a worktree.
+
+        A tree is placed only if the worktree's lockfile matches a snapshot
+        (or the project's own lockfile), the target does not exist yet and
+        git ignores it in the worktree.
+        """
+        worktree_path = Path(worktree_path)
+        candidates = []
+        for tree in self.installed_trees():
+            target = worktree_path / tree.path
+            if target.exists() or target.is_symlink():
+                continue
+            try:
+                digest = lockfile_hash(worktree_path / tree.lockfile)
+            except OSError:
+                continue  # Not in this (possibly sparse) worktree
+            candidates.append((tree, digest))
+
+        ignored = self._ignored(worktree_path, [t.path for t, _ in candidates])
+        placed = []
+        for tree, digest in candidates:
+            if tree.path not in ignored:
+                continue
+            snapshot = self.snapshot_path(tree, digest)
+            if not _is_complete(snapshot):
+                try:
+                    project_digest = lockfile_hash(self.project_dir / tree.lockfile)
+                except OSError:
+                    continue
+                if project_digest != digest:
+                    continue  # Lockfile changed in the worktree: install there
+                if self._editable(tree, self.project_dir):
+                    continue
+                snapshot = self.snapshot(tree, self.project_dir)
+            placed_tree = self._place(tree, digest, snapshot, worktree_path)
+            if placed_tree is not None:
+                placed.append(placed_tree)
+        return placed
+
+    def _place(
+        self,
+        tree: InstalledTree,
+        digest: str,
+        snapshot: Path | None,
+        worktree_path: Path,
+    ) -> Materialized | None:
+        target = worktree_path / tree.path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        python = tree.kind.name == "python"
+        if snapshot is not None:
+            try:
+                method = _clone_tree(snapshot / "tree", target)
+                if python:
+                    origin = (snapshot / _ORIGIN_FILE).read_text(encoding="utf-8")
+                    _relocate_venv(target, origin)
+                return Materialized(tree.path, method, digest)
+            except OSError:
+                _remove(target)
+        if python:
+            return None  # A shared venv would install into the original
+        # Share the snapshot (or the project's tree) read-write as before
+        source = snapshot / "tree" if snapshot is not None else None
+        try:
+            _symlink(target, source or self.project_dir / tree.path)
+        except OSError:
+            return None
+        return Materialized(tree.path, "symlink", digest if source else None)
+
+    def _ignored(self, worktree_path: Path, paths: list[str]) -> set[str]:
+        """The paths git ignores in the worktree."""
+        if not paths:
+            return set()
+        # The targets do not exist yet: mark them as directories for
+        # patterns like "node_modules/"
+        result = run_git(["check-ignore", *(f"{p}/" for p in paths)], cwd=worktree_path)
+        return {line.strip().rstrip("/") for line in result.stdout.splitlines()}
@@ -0,0 +1,495 @@
+"""
+Git Prefetch Service
+====================
+
+Keeps a repository's objects ahead of the runners that need them.
+
+PR reviews, PR worktrees and spec builds used to fetch the commits they
+needed on demand, paying network and pack negotiation latency on their
+critical path - even when the objects were already present. The service
+instead:
+
+- Maintains refs/prefetch/* for watched remotes and PRs on a schedule,
+  the way `git maintenance`'s prefetch task does. Objects arrive in the
+  background without moving any branch or remote-tracking ref:
+
+      refs/heads/*          -> refs/prefetch/remotes/<remote>/*
+      refs/pull/<n>/head    -> refs/prefetch/pull/<remote>/<n>
+
+- Runs commit-graph and multi-pack-index updates (and drops loose objects
+  that are already packed), so lookups stay fast as fetches from many
+  worktrees accumulate in the shared object store
+- Exposes ensure_commits(), which checks locally first and only fetches
+  (and blocks) when a commit is truly missing. A fetch already in flight
+  is waited for rather than raced.
+
+refs/prefetch/* lives in the repository, so one process's prefetch
+benefits every later run. Maintenance is rate-limited across processes by
+a stamp file in the git directory.
+
+Configuration:
+    AUTO_CLAUDE_GIT_PREFETCH          - "on" (default) or "off" to disable
+                                        the background schedule
+    AUTO_CLAUDE_GIT_PREFETCH_INTERVAL - Seconds between prefetches
+                                        (default: 300)
+
+Usage:
+    from core.git_prefetch import GitPrefetcher
+
+    prefetcher = GitPrefetcher.for_repo(project_dir)
+    prefetcher.watch_prs([42, 43])
+    prefetcher.start()
+    ...
+    if not prefetcher.ensure_commits([head_sha, base_sha]):
+        print("commits unavailable")
+    prefetcher.stop()
+
+    # Or as a standalone service:
+    python -m core.git_prefetch /path/to/repo --pr 42 --pr 43
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from core.git_executable import run_git
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_ENV_VAR = "AUTO_CLAUDE_GIT_PREFETCH"
+PREFETCH_INTERVAL_ENV_VAR = "AUTO_CLAUDE_GIT_PREFETCH_INTERVAL"
+
+DEFAULT_PREFETCH_INTERVAL = 300.0  # Seconds
+MAINTENANCE_INTERVAL = 3600.0  # Seconds between commit-graph/MIDX updates
+FETCH_TIMEOUT = 120
+MAINTENANCE_TIMEOUT = 600
+LOOSE_OBJECTS_BATCH = 50000  # Loose objects packed per maintenance run
+
+PREFETCH_REF_PREFIX = "refs/prefetch"
+_MAINTENANCE_STAMP = "auto-claude-maintenance"
+
+# Same options as `git maintenance run --task=prefetch`: never touch tags,
+# FETCH_HEAD or submodules, and leave housekeeping to maintain()
+_FETCH_OPTIONS = [
+    "--refmap=",  # Do not update remote-tracking refs opportunistically
+    "--prune",
+    "--no-tags",
+    "--no-write-fetch-head",
+    "--recurse-submodules=no",
+    "--no-auto-gc",
+    "--quiet",
+]
+
+
+def prefetch_enabled() -> bool:
+    """Whether the background prefetch schedule runs (the default)."""
+    return os.environ.get(PREFETCH_ENV_VAR, "on").lower() not in (
+        "off",
+        "false",
+        "0",
+        "no",
+    )
+
+
+def _get_prefetch_interval() -> float:
+    """Get the prefetch interval, read at runtime for testability."""
+    try:
+        value = float(
+            os.environ.get(PREFETCH_INTERVAL_ENV_VAR, DEFAULT_PREFETCH_INTERVAL)
+        )
+        return value if value > 0 else DEFAULT_PREFETCH_INTERVAL
+    except (ValueError, TypeError):
+        return DEFAULT_PREFETCH_INTERVAL
+
+
+def branch_prefetch_ref(remote: str, branch: str) -> str:
+    """Where the prefetched head of a remote branch is kept."""
+    return f"{PREFETCH_REF_PREFIX}/remotes/{remote}/{branch}"
+
+
+def pr_prefetch_ref(remote: str, pr_number: int) -> str:
+    """Where the prefetched head of a PR is kept."""
+    return f"{PREFETCH_REF_PREFIX}/pull/{remote}/{pr_number}"
+
+
+def _is_hex(name: str) -> bool:
+    return all(c in "0123456789abcdef" for c in name)
+
+
+def _pr_refspec(remote: str, pr_number: int) -> str:
+    return f"+refs/pull/{pr_number}/head:{pr_prefetch_ref(remote, pr_number)}"
+
+
+class GitPrefetcher:
+    """Background prefetch and maintenance for one repository."""
+
+    _instances: dict[Path, GitPrefetcher] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, repo_dir: Path, remotes: Iterable[str] = ("origin",)):
+        """
+        Args:
+            repo_dir: Repository (or any of its worktrees)
+            remotes: Remotes whose branches are prefetched
+        """
+        self.repo_dir = Path(repo_dir)
+        self.remotes = list(remotes)
+        self._prs: dict[int, str] = {}  # PR number -> remote
+        self._lock = threading.Lock()  # Guards the watch lists
+        self._fetch_lock = threading.Lock()  # One fetch at a time
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def for_repo(cls, repo_dir: Path) -> GitPrefetcher:
+        """Get the shared prefetcher for a repository."""
+        key = Path(repo_dir).resolve()
+        with cls._registry_lock:
+            prefetcher = cls._instances.get(key)
+            if prefetcher is None:
+                prefetcher = cls._instances[key] = cls(key)
+            return prefetcher
+
+    @classmethod
+    def reset(cls) -> None:
+        """Stop and forget all shared prefetchers."""
+        with cls._registry_lock:
+            prefetchers = list(cls._instances.values())
+            cls._instances.clear()
+        for prefetcher in prefetchers:
+            prefetcher.stop()
+
+    # ------------------------------------------------------------------
+    # Watch lists
+    # ------------------------------------------------------------------
+
+    def watch_remote(self, remote: str) -> None:
+        """Prefetch a remote's branches."""
+        with self._lock:
+            if remote not in self.remotes:
+                self.remotes.append(remote)
+
+    def watch_prs(self, pr_numbers: Iterable[int], remote: str = "origin") -> None:
+        """Prefetch the heads of PRs (refs/pull/<n>/head on the remote)."""
+        with self._lock:
+            for pr_number in pr_numbers:
+                self._prs[int(pr_number)] = remote
+
+    def unwatch_pr(self, pr_number: int) -> None:
+        """Stop prefetching a PR and drop its prefetch ref."""
+        with self._lock:
+            remote = self._prs.pop(pr_number, None)
+        if remote is not None:
+            run_git(
+                ["update-ref", "-d", pr_prefetch_ref(remote, pr_number)],
+                cwd=self.repo_dir,
+            )
+
+    def watched_prs(self) -> dict[int, str]:
+        """Watched PR numbers and their remotes."""
+        with self._lock:
+            return dict(self._prs)
+
+    # ------------------------------------------------------------------
+    # Objects
+    # ------------------------------------------------------------------
+
+    def missing_commits(self, shas: Iterable[str]) -> list[str]:
+        """The commits not present locally (checked in one git call)."""
+        shas = [sha for sha in dict.fromkeys(shas) if sha]
+        if not shas:
+            return []
+        result = run_git(
+            ["cat-file", "--batch-check=%(objectname)"],
+            cwd=self.repo_dir,
+            input_data="".join(f"{sha}^{{commit}}\n" for sha in shas),
+        )
+        lines = result.stdout.splitlines()
+        if result.returncode != 0 or len(lines) != len(shas):
+            return shas
+        # Present commits print their object name, anything else is
+        # "<input> missing" (or "ambiguous")
+        return [sha for sha, line in zip(shas, lines) if " " in line]
+
+    def has_commit(self, sha: str) -> bool:
+        return not self.missing_commits([sha])
+
+    def ensure_commits(
+        self,
+        shas: Iterable[str],
+        remote: str = "origin",
+        refspecs: Iterable[str] = (),
+        timeout: int = 60,
+    ) -> bool:
+        """
+        Make sure commits are available locally.
+
+        Returns immediately when they already are (typically because a
+        prefetch brought them in). Otherwise waits for any fetch in flight,
+        then fetches the missing commits by SHA, falling back to refspecs
+        (e.g. a PR ref, for servers that refuse fetching by SHA).
+
+        Args:
+            shas: Commit SHAs that are needed
+            remote: Remote to fetch from
+            refspecs: Fallback refspecs that lead to the commits
+            timeout: Timeout for each fetch in seconds
+
+        Returns:
+            True if all commits are available
+        """
+        missing = self.missing_commits(shas)
+        if not missing:
+            return True
+
+        with self._fetch_lock:
+            # A prefetch may have brought them in while we waited
+            missing = self.missing_commits(missing)
+            if not missing:
+                return True
+
+            result = run_git(
+                ["fetch", "--no-tags", remote, *missing],
+                cwd=self.repo_dir,
+                timeout=timeout,
+            )
+            if result.returncode != 0:
+                logger.warning(
+                    f"Could not fetch {', '.join(m[:8] for m in missing)} "
+                    f"from {remote}: {result.stderr.strip()}"
+                )
+            refspecs = list(refspecs)
+            if result.returncode != 0 and refspecs:
+                run_git(
+                    ["fetch", "--no-tags", remote, *refspecs],
+                    cwd=self.repo_dir,
+                    timeout=timeout,
+                )
+            return not self.missing_commits(missing)
+
+    # ------------------------------------------------------------------
+    # Prefetch and maintenance
+    # ------------------------------------------------------------------
+
+    def _fetch(self, remote: str, refspecs: list[str]) -> bool:
+        result = run_git(
+            ["fetch", *_FETCH_OPTIONS, remote, *refspecs],
+            cwd=self.repo_dir,
+            timeout=FETCH_TIMEOUT,
+        )
+        return result.returncode == 0
+
+    def prefetch(self) -> dict[str, bool]:
+        """
+        Fetch watched remotes and PRs into refs/prefetch/*.
+
+        Each remote's branches and PRs are fetched in a single negotiation.
+        If that fails (e.g. a PR ref no longer exists), the branches and
+        each PR are retried separately.
+
+        Returns:
+            Success per fetched target ("<remote>" or "<remote>#<pr>")
+        """
+        with self._lock:
+            remotes = list(self.remotes)
+            prs = dict(self._prs)
+        for remote in prs.values():
+            if remote not in remotes:
+                remotes.append(remote)
+
+        results: dict[str, bool] = {}
+        with self._fetch_lock:
+            for remote in remotes:
+                heads = [f"+refs/heads/*:{branch_prefetch_ref(remote, '*')}"]
+                remote_prs = sorted(n for n, r in prs.items() if r == remote)
+                pr_specs = [_pr_refspec(remote, n) for n in remote_prs]
+
+                if self._fetch(remote, heads + pr_specs):
+                    results[remote] = True
+                    results.update({f"{remote}#{n}": True for n in remote_prs})
+                    continue
+                results[remote] = self._fetch(remote, heads)
+                for n, spec in zip(remote_prs, pr_specs):
+                    results[f"{remote}#{n}"] = self._fetch(remote, [spec])
+
+        failed = [target for target, ok in results.items() if not ok]
+        if failed:
+            logger.warning(f"Prefetch failed for {', '.join(failed)}")
+        return results
+
+    def _stamp_file(self) -> Path | None:
+        result = run_git(["rev-parse", "--git-common-dir"], cwd=self.repo_dir)
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        # Relative to the repository when run from its top level
+        return self.repo_dir / result.stdout.strip() / _MAINTENANCE_STAMP
+
+    def maintenance_due(self, interval: float = MAINTENANCE_INTERVAL) -> bool:
+        """Whether maintain() has not run (in any process) within interval."""
+        stamp = self._stamp_file()
+        if stamp is None:
+            return False
+        try:
+            return time.time() - stamp.stat().st_mtime >= interval
+        except OSError:
+            return True
+
+    def _objects_dir(self) -> Path | None:
+        result = run_git(["rev-parse", "--git-path", "objects"], cwd=self.repo_dir)
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        return self.repo_dir / result.stdout.strip()
+
+    def _pack_loose_objects(self) -> bool:
+        """Pack loose objects into a new pack, as the loose-objects task does."""
+        objects_dir = self._objects_dir()
+        if objects_dir is None:
+            return False
+        loose = []
+        for fanout in sorted(objects_dir.glob("[0-9a-f][0-9a-f]")):
+            loose.extend(fanout.name + entry.name for entry in fanout.iterdir())
+            if len(loose) >= LOOSE_OBJECTS_BATCH:
+                break
+        loose = [name for name in loose[:LOOSE_OBJECTS_BATCH] if _is_hex(name)]
+        if not loose:
+            return True
+        result = run_git(
+            ["pack-objects", "--quiet", str(objects_dir / "pack" / "loose")],
+            cwd=self.repo_dir,
+            input_data="".join(f"{name}\n" for name in loose),
+            timeout=MAINTENANCE_TIMEOUT,
+        )
+        if result.returncode != 0:
+            logger.warning(f"git pack-objects failed: {result.stderr.strip()}")
+        return result.returncode == 0
+
+    def maintain(self) -> bool:
+        """
+        Pack loose objects and update the commit-graph and multi-pack-index.
+
+        Like `git maintenance`'s loose-objects, commit-graph and
+        incremental-repack tasks, without rewriting existing packs: loose
+        objects (from fetches in any worktree) go into one new pack, the
+        multi-pack-index covers all packs again and the split commit-graph
+        is extended with new commits.
+
+        Returns:
+            True if every step succeeded
+        """
+        ok = self._pack_loose_objects()
+        steps = [["prune-packed", "--quiet"]]
+        objects_dir = self._objects_dir()
+        if objects_dir is not None and any((objects_dir / "pack").glob("*.pack")):
+            steps.append(["multi-pack-index", "write", "--no-progress"])
+        steps.append(
+            ["commit-graph", "write", "--reachable", "--split", "--no-progress"]
+        )
+        for args in steps:
+            result = run_git(args, cwd=self.repo_dir, timeout=MAINTENANCE_TIMEOUT)
+            if result.returncode != 0:
+                logger.warning(f"git {args[0]} failed: {result.stderr.strip()}")
+                ok = False
+
+        stamp = self._stamp_file()
+        if stamp is not None:
+            try:
+                stamp.touch()
+            except OSError:
+                pass
+        return ok
+
+    def run_once(self) -> None:
+        """One scheduled round: prefetch, then maintenance if it is due."""
+        self.prefetch()
+        if self.maintenance_due():
+            self.maintain()
+
+    # ------------------------------------------------------------------
+    # Schedule
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval: float | None = None) -> bool:
+        """
+        Start prefetching in a background thread (first round immediately).
+
+        Returns:
+            True if the schedule is running
+        """
+        if not prefetch_enabled():
+            return False
+        if self.running:
+            return True
+        interval = interval if interval is not None else _get_prefetch_interval()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop,
+            args=(interval,),
+            name=f"git-prefetch-{self.repo_dir.name}",
+            daemon=True,
+        )
+        self._thread.start()
+        return True
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the schedule, waiting for a round in progress to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self, interval: float) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.warning(f"Git prefetch round failed: {e}")
+            self._stop.wait(interval)
+
+
+def main() -> None:
+    """CLI entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Prefetch git objects and maintain a repository"
+    )
+    parser.add_argument("repo", type=Path, nargs="?", default=Path.cwd())
+    parser.add_argument(
+        "--remote",
+        action="append",
+        help="Remote to prefetch (repeatable, default: origin)",
+    )
+    parser.add_argument(
+        "--pr", type=int, action="append", default=[], help="PR to prefetch"
+    )
+    parser.add_argument("--interval", type=float, help="Seconds between rounds")
+    parser.add_argument("--once", action="store_true", help="Run a single round")
+    args = parser.parse_args()
+
+    prefetcher = GitPrefetcher(args.repo, remotes=args.remote or ["origin"])
+    prefetcher.watch_prs(args.pr)
+    if args.once:
+        results = prefetcher.prefetch()
+        maintained = prefetcher.maintain()
+        for target, ok in results.items():
+            print(f"{target}: {'ok' if ok else 'failed'}")
+        print(f"maintenance: {'ok' if maintained else 'failed'}")
+        return
+
+    interval = args.interval or _get_prefetch_interval()
+    while True:
+        prefetcher.run_once()
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+HTTP Utilities
+==============
+
+Helpers shared by the stdlib-based API clients (GitLab, Linear).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (integer seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return float(max(0, int(value)))
+    except ValueError:
+        pass
+    try:
+        # HTTP-date (e.g., "Wed, 21 Oct 2015 07:28:00 GMT")
+        retry_date = parsedate_to_datetime(value)
+        delta = (retry_date - datetime.now(timezone.utc)).total_seconds()
+        return max(1.0, delta)  # At least 1 second
+    except (ValueError, TypeError):
+        return None
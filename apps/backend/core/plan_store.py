@@ -0,0 +1,488 @@
+"""
+Implementation Plan Store
+=========================
+
+Shared in-process cache of implementation_plan.json, one store per spec
+directory.
+
+Progress helpers, agent tools and the QA loop used to re-open and re-parse
+the plan on every call (several times per agent turn), and rewrote the
+whole file for one-field updates. The store instead:
+
+- Keeps the parsed plan and only re-reads it when the file's
+  (mtime_ns, size) signature changes, e.g. after an agent edits it
+- Applies updates as small typed mutations under a per-store lock
+- Writes atomically via write_json_atomic; mutations inside batch() are
+  coalesced into a single write
+- Maintains status counts incrementally and caches the next pending
+  subtask, so progress reads cost O(1) regardless of plan size
+
+build_subtask_graph() exposes the same phase dependency rules as a subtask
+DAG, for running independent subtasks concurrently.
+
+Usage:
+    from core.plan_store import PlanStore
+
+    store = PlanStore.for_spec(spec_dir)
+    stats = store.aggregates()
+    print(f"{stats.completed}/{stats.total}")
+    store.set_subtask_status("1.2", "completed", notes="done")
+
+    with store.batch():  # one write for both mutations
+        store.set_subtask_status("1.3", "in_progress")
+        store.update(lambda plan: plan.setdefault("qa_signoff", {}))
+"""
+
+import copy
+import json
+import os
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from core.file_utils import write_json_atomic
+from core.plan_normalization import normalize_subtask_aliases
+
+PLAN_FILE = "implementation_plan.json"
+
+# Statuses counted separately; anything else is counted as pending
+COUNTED_STATUSES = ("completed", "in_progress", "failed")
+PENDING_STATUSES = frozenset({"pending", "not_started", "not started"})
+
+_Signature = tuple[int, int, int]  # (mtime_ns, size, inode)
+
+
+def _phase_subtasks(phase: dict) -> list:
+    """Subtasks of a phase, accepting the legacy 'chunks' key."""
+    return phase.get("subtasks", phase.get("chunks", []))
+
+
+def _phase_dependencies(phase: dict) -> list[str]:
+    """Phase keys a phase depends on (depends_on may be a list or a scalar)."""
+    depends_on = phase.get("depends_on", [])
+    if isinstance(depends_on, list):
+        return [str(d) for d in depends_on if d is not None]
+    if depends_on is None:
+        return []
+    return [str(depends_on)]
+
+
+def _status_bucket(status: Any) -> str:
+    return status if status in COUNTED_STATUSES else "pending"
+
+
+def _phase_key(phase: dict, index: int) -> str:
+    phase_id = phase.get("id")
+    if phase_id is None:
+        phase_id = phase.get("phase")
+    return str(phase_id) if phase_id is not None else f"unknown:{index}"
+
+
+@dataclass
+class PlanAggregates:
+    """
+    Precomputed plan statistics.
+
+    Attributes:
+        total: Number of subtasks
+        counts: Subtask counts per status (completed, in_progress, failed,
+            pending); unknown statuses count as pending
+        phase_completed: Completed subtasks per phase (by position)
+        phase_total: Subtasks per phase (by position)
+    """
+
+    total: int = 0
+    counts: dict[str, int] = field(
+        default_factory=lambda: {
+            "completed": 0,
+            "in_progress": 0,
+            "pending": 0,
+            "failed": 0,
+        }
+    )
+    phase_completed: list[int] = field(default_factory=list)
+    phase_total: list[int] = field(default_factory=list)
+
+    @property
+    def completed(self) -> int:
+        return self.counts["completed"]
+
+
+@dataclass
+class SubtaskNode:
+    """
+    A subtask in the plan's dependency graph.
+
+    Attributes:
+        subtask_id: Subtask ID
+        phase_key: Key of the containing phase (its id, or phase number)
+        parallel_safe: Whether the phase allows its subtasks to run in parallel
+        depends_on: IDs of subtasks that must complete first
+        blocked: A phase dependency does not exist in the plan, so the
+            subtask can never become ready (matches next_subtask())
+    """
+
+    subtask_id: str
+    phase_key: str
+    parallel_safe: bool = False
+    depends_on: set[str] = field(default_factory=set)
+    blocked: bool = False
+
+
+def build_subtask_graph(plan: dict) -> dict[str, SubtaskNode]:
+    """
+    Dependency graph of a plan's subtasks, in plan order.
+
+    A subtask depends on every subtask of the phases in its phase's
+    depends_on. Subtasks of a phase that is not parallel_safe also depend on
+    the subtask before them, so they run in order; subtasks of a
+    parallel_safe phase only depend on other phases. Subtasks without an ID
+    are skipped; for duplicate IDs the first occurrence wins.
+    """
+    phases = plan.get("phases", [])
+    phase_members: dict[str, list[str]] = {}
+    graph: dict[str, SubtaskNode] = {}
+
+    for i, phase in enumerate(phases):
+        key = _phase_key(phase, i)
+        members = phase_members.setdefault(key, [])
+        previous: str | None = None
+        for subtask in _phase_subtasks(phase):
+            subtask_id = subtask.get("id")
+            if subtask_id is None or subtask_id in graph:
+                continue
+            node = SubtaskNode(
+                subtask_id=subtask_id,
+                phase_key=key,
+                parallel_safe=bool(phase.get("parallel_safe", False)),
+            )
+            if previous is not None and not node.parallel_safe:
+                node.depends_on.add(previous)
+            graph[subtask_id] = node
+            members.append(subtask_id)
+            previous = subtask_id
+
+    for i, phase in enumerate(phases):
+        key = _phase_key(phase, i)
+        for dep in _phase_dependencies(phase):
+            for subtask_id in phase_members.get(key, []):
+                node = graph[subtask_id]
+                if dep not in phase_members:
+                    node.blocked = True
+                else:
+                    node.depends_on.update(
+                        d for d in phase_members[dep] if d != subtask_id
+                    )
+    return graph
+
+
+class PlanStore:
+    """
+    Cached, mutation-based access to one spec's implementation_plan.json.
+
+    Plans returned by plan() are shared and must be treated as read-only;
+    use snapshot() for a private copy or update() to change the plan.
+    """
+
+    _stores: dict[Path, "PlanStore"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, spec_dir: Path):
+        self.spec_dir = Path(spec_dir)
+        self.plan_file = self.spec_dir / PLAN_FILE
+        self._lock = threading.RLock()
+        self._plan: dict | None = None
+        self._signature: _Signature | None = None
+        self._aggregates: PlanAggregates | None = None
+        self._index: dict[str, tuple[dict, int]] = {}
+        self._next_subtask: dict | None = None
+        self._next_valid = False
+        self._batch_depth = 0
+        self._dirty = False
+        self.stats = {"reads": 0, "parses": 0, "writes": 0}
+
+    @classmethod
+    def for_spec(cls, spec_dir: Path) -> "PlanStore":
+        """Get the shared store for a spec directory."""
+        key = Path(spec_dir).resolve()
+        with cls._registry_lock:
+            store = cls._stores.get(key)
+            if store is None:
+                store = cls._stores[key] = cls(key)
+            return store
+
+    @classmethod
+    def clear_registry(cls) -> None:
+        """Forget all stores (flushing pending writes first)."""
+        with cls._registry_lock:
+            stores = list(cls._stores.values())
+            cls._stores.clear()
+        for store in stores:
+            store.flush()
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    def _stat(self) -> _Signature | None:
+        try:
+            st = os.stat(self.plan_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _refresh(self, strict: bool) -> dict | None:
+        """Re-read the plan if the file changed on disk. Caller holds the lock."""
+        self.stats["reads"] += 1
+        if self._dirty:
+            # Unflushed in-memory changes are newer than the file
+            return self._plan
+
+        signature = self._stat()
+        if signature is None:
+            self._set_plan(None, None)
+            return None
+        if signature == self._signature:
+            return self._plan
+
+        try:
+            with open(self.plan_file, encoding="utf-8") as f:
+                plan = json.load(f)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            self._set_plan(None, None)
+            if strict:
+                raise
+            return None
+
+        self.stats["parses"] += 1
+        self._set_plan(plan if isinstance(plan, dict) else None, signature)
+        return self._plan
+
+    def _set_plan(self, plan: dict | None, signature: _Signature | None) -> None:
+        self._plan = plan
+        self._signature = signature
+        self._aggregates = None
+        self._index = {}
+        self._next_valid = False
+
+    def exists(self) -> bool:
+        return self.plan() is not None
+
+    def plan(self, strict: bool = False) -> dict | None:
+        """
+        The cached plan (shared - do not mutate).
+
+        Args:
+            strict: Raise OSError/json.JSONDecodeError instead of returning
+                None when the file cannot be read or parsed
+
+        Returns:
+            Parsed plan, or None if missing/unreadable
+        """
+        with self._lock:
+            return self._refresh(strict)
+
+    def snapshot(self) -> dict | None:
+        """A private deep copy of the plan, safe to mutate."""
+        with self._lock:
+            plan = self._refresh(strict=False)
+            return copy.deepcopy(plan) if plan is not None else None
+
+    # -------------------------------------------------------------------------
+    # Aggregates
+    # -------------------------------------------------------------------------
+
+    def _build_aggregates(self) -> PlanAggregates:
+        aggregates = PlanAggregates()
+        self._index = {}
+        for i, phase in enumerate(self._plan.get("phases", []) if self._plan else []):
+            subtasks = _phase_subtasks(phase)
+            aggregates.phase_total.append(len(subtasks))
+            aggregates.phase_completed.append(0)
+            for subtask in subtasks:
+                status = subtask.get("status", "pending")
+                aggregates.total += 1
+                aggregates.counts[_status_bucket(status)] += 1
+                if status == "completed":
+                    aggregates.phase_completed[i] += 1
+                subtask_id = subtask.get("id")
+                if subtask_id is not None and subtask_id not in self._index:
+                    self._index[subtask_id] = (subtask, i)
+        return aggregates
+
+    def aggregates(self) -> PlanAggregates:
+        """Status counts for the current plan (empty if there is none)."""
+        with self._lock:
+            self._refresh(strict=False)
+            if self._aggregates is None:
+                self._aggregates = self._build_aggregates()
+            return self._aggregates
+
+    def next_subtask(self) -> dict | None:
+        """
+        The next pending subtask, respecting phase dependencies.
+
+        Returns:
+            A copy of the subtask with phase_id, phase_name and phase_num
+            added, or None if nothing is pending
+        """
+        with self._lock:
+            plan = self._refresh(strict=False)
+            if plan is None:
+                return None
+            if not self._next_valid:
+                self._next_subtask = self._find_next_subtask(plan)
+                self._next_valid = True
+            return copy.deepcopy(self._next_subtask)
+
+    @staticmethod
+    def _find_next_subtask(plan: dict) -> dict | None:
+        phases = plan.get("phases", [])
+
+        # Build a map of phase completion
+        phase_complete: dict[str, bool] = {}
+        for i, phase in enumerate(phases):
+            phase_complete[_phase_key(phase, i)] = all(
+                s.get("status") == "completed" for s in _phase_subtasks(phase)
+            )
+
+        # Find next available subtask
+        for phase in phases:
+            phase_id_value = phase.get("id")
+            phase_id = (
+                phase_id_value if phase_id_value is not None else phase.get("phase")
+            )
+            # Check if dependencies are satisfied
+            if not all(
+                phase_complete.get(dep, False) for dep in _phase_dependencies(phase)
+            ):
+                continue
+
+            # Find first pending subtask in this phase
+            for subtask in _phase_subtasks(phase):
+                if subtask.get("status", "pending") in PENDING_STATUSES:
+                    subtask_out, _changed = normalize_subtask_aliases(subtask)
+                    subtask_out["status"] = "pending"
+                    return {
+                        **subtask_out,
+                        "phase_id": phase_id,
+                        "phase_name": phase.get("name"),
+                        "phase_num": phase.get("phase"),
+                    }
+
+        return None
+
+    # -------------------------------------------------------------------------
+    # Mutations
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def batch(self) -> Iterator["PlanStore"]:
+        """Coalesce all mutations inside the block into a single write."""
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes to disk."""
+        with self._lock:
+            if not self._dirty or self._plan is None:
+                self._dirty = False
+                return
+            self._dirty = False
+            try:
+                write_json_atomic(self.plan_file, self._plan, indent=2)
+            except BaseException:
+                # Drop the unwritten state; the next read re-parses the file
+                self._set_plan(None, None)
+                raise
+            self.stats["writes"] += 1
+            # Our own write must not trigger a re-parse
+            self._signature = self._stat()
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    def set_subtask_status(
+        self,
+        subtask_id: str,
+        status: str,
+        notes: str = "",
+        strict: bool = False,
+    ) -> bool:
+        """
+        Update one subtask's status (and optionally notes).
+
+        Returns:
+            True if the subtask was found and updated, False otherwise
+        """
+        with self._lock:
+            if self._refresh(strict) is None:
+                return False
+            if self._aggregates is None:
+                self._aggregates = self._build_aggregates()
+            aggregates = self._aggregates
+            entry = self._index.get(subtask_id)
+            if entry is None:
+                return False
+            subtask, phase_index = entry
+
+            old_status = subtask.get("status", "pending")
+            now = datetime.now(timezone.utc).isoformat()
+            subtask["status"] = status
+            if notes:
+                subtask["notes"] = notes
+            subtask["updated_at"] = now
+            self._plan["last_updated"] = now
+
+            # Maintain counts incrementally
+            aggregates.counts[_status_bucket(old_status)] -= 1
+            aggregates.counts[_status_bucket(status)] += 1
+            if old_status == "completed":
+                aggregates.phase_completed[phase_index] -= 1
+            if status == "completed":
+                aggregates.phase_completed[phase_index] += 1
+            if old_status != status:
+                self._next_valid = False
+
+            self._mark_dirty()
+            return True
+
+    def update(self, mutate: Callable[[dict], Any], strict: bool = False) -> Any:
+        """
+        Apply an arbitrary in-place mutation to the plan.
+
+        Aggregates are recomputed lazily afterwards.
+
+        Returns:
+            Whatever ``mutate`` returns, or None if there is no plan
+        """
+        with self._lock:
+            plan = self._refresh(strict)
+            if plan is None:
+                return None
+            result = mutate(plan)
+            self._aggregates = None
+            self._next_valid = False
+            self._mark_dirty()
+            return result
+
+    def replace(self, plan: dict) -> None:
+        """Replace the whole plan (e.g. a caller-built snapshot).
+
+        The store keeps its own copy, so the caller may keep using ``plan``.
+        """
+        with self._lock:
+            self._set_plan(copy.deepcopy(plan), self._signature)
+            self._mark_dirty()
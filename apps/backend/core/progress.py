@@ -6,12 +6,14 @@ Functions for tracking and displaying progress of the autonomous coding agent.
 Uses subtask-based implementation plans (implementation_plan.json).
 
 Enhanced with colored output, icons, and better visual formatting.
+
+Plan reads go through the shared PlanStore (core/plan_store.py), so
+repeated progress checks don't re-parse implementation_plan.json.
 """
 
-import json
 from pathlib import Path
 
-from core.plan_normalization import normalize_subtask_aliases
+from core.plan_store import PlanStore
 from ui import (
     Icons,
     bold,
@@ -37,27 +39,8 @@ def count_subtasks(spec_dir: Path) -> tuple[int, int]:
     Returns:
         (completed_count, total_count)
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
-        return 0, 0
-
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        total = 0
-        completed = 0
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                total += 1
-                if subtask.get("status") == "completed":
-                    completed += 1
-
-        return completed, total
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return 0, 0
+    aggregates = PlanStore.for_spec(spec_dir).aggregates()
+    return aggregates.completed, aggregates.total
 
 
 def count_subtasks_detailed(spec_dir: Path) -> dict:
@@ -67,35 +50,8 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
     Returns:
         Dict with completed, in_progress, pending, failed counts
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    result = {
-        "completed": 0,
-        "in_progress": 0,
-        "pending": 0,
-        "failed": 0,
-        "total": 0,
-    }
-
-    if not plan_file.exists():
-        return result
-
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                result["total"] += 1
-                status = subtask.get("status", "pending")
-                if status in result:
-                    result[status] += 1
-                else:
-                    result["pending"] += 1
-
-        return result
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return result
+    aggregates = PlanStore.for_spec(spec_dir).aggregates()
+    return {**aggregates.counts, "total": aggregates.total}
 
 
 def is_build_complete(spec_dir: Path) -> bool:
@@ -181,10 +137,8 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
             print_status(f"{remaining} subtasks remaining", "info")
 
         # Phase summary
-        try:
-            with open(spec_dir / "implementation_plan.json", encoding="utf-8") as f:
-                plan = json.load(f)
-
+        plan = PlanStore.for_spec(spec_dir).plan()
+        if plan is not None:
             print("\nPhases:")
             for phase in plan.get("phases", []):
                 phase_subtasks = phase.get("subtasks", [])
@@ -229,9 +183,6 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
                     print(
                         f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
                     )
-
-        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-            pass  # Ignore corrupted/unreadable progress files
     else:
         print()
         print_status("No implementation subtasks yet - planner needs to run", "pending")
@@ -287,9 +238,9 @@ def get_plan_summary(spec_dir: Path) -> dict:
     Returns:
         Dictionary with plan statistics
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    plan = PlanStore.for_spec(spec_dir).plan()
 
-    if not plan_file.exists():
+    if plan is None:
         return {
             "workflow_type": None,
             "total_phases": 0,
@@ -301,103 +252,78 @@ def get_plan_summary(spec_dir: Path) -> dict:
             "phases": [],
         }
 
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+    summary = {
+        "workflow_type": plan.get("workflow_type"),
+        "total_phases": len(plan.get("phases", [])),
+        "total_subtasks": 0,
+        "completed_subtasks": 0,
+        "pending_subtasks": 0,
+        "in_progress_subtasks": 0,
+        "failed_subtasks": 0,
+        "phases": [],
+    }
 
-        summary = {
-            "workflow_type": plan.get("workflow_type"),
-            "total_phases": len(plan.get("phases", [])),
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
+    for phase in plan.get("phases", []):
+        phase_info = {
+            "id": phase.get("id"),
+            "phase": phase.get("phase"),
+            "name": phase.get("name"),
+            "depends_on": phase.get("depends_on", []),
+            "subtasks": [],
+            "completed": 0,
+            "total": 0,
         }
 
-        for phase in plan.get("phases", []):
-            phase_info = {
-                "id": phase.get("id"),
-                "phase": phase.get("phase"),
-                "name": phase.get("name"),
-                "depends_on": phase.get("depends_on", []),
-                "subtasks": [],
-                "completed": 0,
-                "total": 0,
-            }
+        for subtask in phase.get("subtasks", []):
+            status = subtask.get("status", "pending")
+            summary["total_subtasks"] += 1
+            phase_info["total"] += 1
+
+            if status == "completed":
+                summary["completed_subtasks"] += 1
+                phase_info["completed"] += 1
+            elif status == "in_progress":
+                summary["in_progress_subtasks"] += 1
+            elif status == "failed":
+                summary["failed_subtasks"] += 1
+            else:
+                summary["pending_subtasks"] += 1
+
+            phase_info["subtasks"].append(
+                {
+                    "id": subtask.get("id"),
+                    "description": subtask.get("description"),
+                    "status": status,
+                    "service": subtask.get("service"),
+                }
+            )
 
-            for subtask in phase.get("subtasks", []):
-                status = subtask.get("status", "pending")
-                summary["total_subtasks"] += 1
-                phase_info["total"] += 1
-
-                if status == "completed":
-                    summary["completed_subtasks"] += 1
-                    phase_info["completed"] += 1
-                elif status == "in_progress":
-                    summary["in_progress_subtasks"] += 1
-                elif status == "failed":
-                    summary["failed_subtasks"] += 1
-                else:
-                    summary["pending_subtasks"] += 1
-
-                phase_info["subtasks"].append(
-                    {
-                        "id": subtask.get("id"),
-                        "description": subtask.get("description"),
-                        "status": status,
-                        "service": subtask.get("service"),
-                    }
-                )
+        summary["phases"].append(phase_info)
 
-            summary["phases"].append(phase_info)
-
-        return summary
-
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return {
-            "workflow_type": None,
-            "total_phases": 0,
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
-        }
+    return summary
 
 
 def get_current_phase(spec_dir: Path) -> dict | None:
     """Get the current phase being worked on."""
-    plan_file = spec_dir / "implementation_plan.json"
+    plan = PlanStore.for_spec(spec_dir).plan()
 
-    if not plan_file.exists():
+    if plan is None:
         return None
 
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            subtasks = phase.get("subtasks", phase.get("chunks", []))
-            # Phase is current if it has incomplete subtasks and dependencies are met
-            has_incomplete = any(s.get("status") != "completed" for s in subtasks)
-            if has_incomplete:
-                return {
-                    "id": phase.get("id"),
-                    "phase": phase.get("phase"),
-                    "name": phase.get("name"),
-                    "completed": sum(
-                        1 for s in subtasks if s.get("status") == "completed"
-                    ),
-                    "total": len(subtasks),
-                }
-
-        return None
+    for phase in plan.get("phases", []):
+        subtasks = phase.get("subtasks", phase.get("chunks", []))
+        # Phase is current if it has incomplete subtasks and dependencies are met
+        has_incomplete = any(s.get("status") != "completed" for s in subtasks)
+        if has_incomplete:
+            return {
+                "id": phase.get("id"),
+                "phase": phase.get("phase"),
+                "name": phase.get("name"),
+                "completed": sum(1 for s in subtasks if s.get("status") == "completed"),
+                "total": len(subtasks),
+            }
 
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return None
+    return None
 
 
 def get_next_subtask(spec_dir: Path) -> dict | None:
@@ -410,68 +336,7 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
     Returns:
         The next subtask dict to work on, or None if all complete
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
-        return None
-
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        phases = plan.get("phases", [])
-
-        # Build a map of phase completion
-        phase_complete: dict[str, bool] = {}
-        for i, phase in enumerate(phases):
-            phase_id_value = phase.get("id")
-            phase_id_raw = (
-                phase_id_value if phase_id_value is not None else phase.get("phase")
-            )
-            phase_id_key = (
-                str(phase_id_raw) if phase_id_raw is not None else f"unknown:{i}"
-            )
-            subtasks = phase.get("subtasks", phase.get("chunks", []))
-            phase_complete[phase_id_key] = all(
-                s.get("status") == "completed" for s in subtasks
-            )
-
-        # Find next available subtask
-        for phase in phases:
-            phase_id_value = phase.get("id")
-            phase_id = (
-                phase_id_value if phase_id_value is not None else phase.get("phase")
-            )
-            depends_on_raw = phase.get("depends_on", [])
-            if isinstance(depends_on_raw, list):
-                depends_on = [str(d) for d in depends_on_raw if d is not None]
-            elif depends_on_raw is None:
-                depends_on = []
-            else:
-                depends_on = [str(depends_on_raw)]
-
-            # Check if dependencies are satisfied
-            deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
-            if not deps_satisfied:
-                continue
-
-            # Find first pending subtask in this phase
-            for subtask in phase.get("subtasks", phase.get("chunks", [])):
-                status = subtask.get("status", "pending")
-                if status in {"pending", "not_started", "not started"}:
-                    subtask_out, _changed = normalize_subtask_aliases(subtask)
-                    subtask_out["status"] = "pending"
-                    return {
-                        **subtask_out,
-                        "phase_id": phase_id,
-                        "phase_name": phase.get("name"),
-                        "phase_num": phase.get("phase"),
-                    }
-
-        return None
-
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return None
+    return PlanStore.for_spec(spec_dir).next_subtask()
 
 
 def format_duration(seconds: float) -> str:
@@ -0,0 +1,340 @@
+"""
+Project Index Service
+=====================
+
+Shared in-process access to project_index.json, one instance per file.
+
+The index is read by prompt assembly, client creation, ideation, insights,
+the context builder, the spec pipeline and the AI analyzer runner. In large
+monorepos it runs to megabytes and used to be re-parsed by each of them.
+The service instead:
+
+- Parses the file once per process and only re-reads it when its
+  (mtime_ns, size) signature changes
+- Exposes typed accessors for services, dependencies and capabilities, and
+  memoizes derived views (capabilities, MCP tool docs) until the file
+  changes
+- Optionally persists a side-cache next to the index (set
+  AUTO_CLAUDE_INDEX_SIDECAR=true), keyed by the JSON's hash. Each
+  top-level section is stored as a separate marshal blob and only decoded
+  when first accessed, so a process that needs just the services never
+  decodes the rest of the index
+
+Usage:
+    from core.project_index import ProjectIndex
+
+    index = ProjectIndex.for_project(project_dir)
+    for name, service in index.services().items():
+        print(name, service.get("framework"))
+    tools = index.mcp_tools()
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from core.file_utils import atomic_write
+
+INDEX_FILE = "project_index.json"
+SIDECAR_ENV_VAR = "AUTO_CLAUDE_INDEX_SIDECAR"
+
+# Side-cache format: magic + marshal((header, sections)); sections are
+# marshal blobs per top-level key, decoded lazily
+_SIDECAR_MAGIC = b"ACPI1\n"
+_SIDECAR_VERSION = (marshal.version, *sys.version_info[:2])
+
+_Signature = tuple[int, int]  # (mtime_ns, size)
+T = TypeVar("T")
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ProjectIndex:
+    """
+    Cached, section-level access to one project_index.json.
+
+    Values returned by data(), section(), services() and service() are
+    shared and must be treated as read-only. A missing or unparsable file
+    reads as an empty index.
+    """
+
+    _indexes: dict[Path, "ProjectIndex"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, index_file: Path, persist: bool | None = None):
+        """
+        Args:
+            index_file: Path to the project_index.json
+            persist: Keep a side-cache next to the index (defaults to the
+                AUTO_CLAUDE_INDEX_SIDECAR environment variable)
+        """
+        self.index_file = Path(index_file)
+        self.sidecar_file = self.index_file.with_name(f".{self.index_file.stem}.cache")
+        self.persist = persist
+        self._lock = threading.RLock()
+        self._signature: _Signature | None = None
+        self._loaded = False
+        self._keys: list[str] = []
+        self._decoded: dict[str, Any] = {}
+        self._encoded: dict[str, bytes] = {}
+        self._derived: dict[str, Any] = {}
+        self.stats = {"reads": 0, "parses": 0, "sidecar_hits": 0, "decodes": 0}
+
+    @classmethod
+    def for_file(cls, index_file: Path) -> "ProjectIndex":
+        """Get the shared instance for an index file."""
+        key = Path(index_file).resolve()
+        with cls._registry_lock:
+            index = cls._indexes.get(key)
+            if index is None:
+                index = cls._indexes[key] = cls(key)
+            return index
+
+    @classmethod
+    def for_project(cls, project_dir: Path) -> "ProjectIndex":
+        """Get the shared instance for a project's .auto-claude index."""
+        return cls.for_file(Path(project_dir) / ".auto-claude" / INDEX_FILE)
+
+    @classmethod
+    def invalidate(cls, path: Path | None = None) -> None:
+        """
+        Forget cached indexes.
+
+        Args:
+            path: An index file or project directory, or None for all
+        """
+        with cls._registry_lock:
+            if path is None:
+                cls._indexes.clear()
+                return
+            path = Path(path).resolve()
+            for key in (path, path / ".auto-claude" / INDEX_FILE):
+                cls._indexes.pop(key, None)
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    def _persist_enabled(self) -> bool:
+        if self.persist is not None:
+            return self.persist
+        return os.environ.get(SIDECAR_ENV_VAR, "").lower() in ("true", "1", "yes")
+
+    def _stat(self) -> _Signature | None:
+        try:
+            st = os.stat(self.index_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _refresh(self) -> None:
+        """Re-read the index if the file changed on disk. Caller holds the lock."""
+        self.stats["reads"] += 1
+        signature = self._stat()
+        if signature == self._signature:
+            return
+
+        self._keys, self._decoded, self._encoded = [], {}, {}
+        self._derived = {}
+        self._loaded = False
+        self._signature = signature
+        if signature is None:
+            return
+
+        persist = self._persist_enabled()
+        sidecar = self._read_sidecar() if persist else None
+        if sidecar is not None and sidecar[0] == signature:
+            self.stats["sidecar_hits"] += 1
+            self._set_encoded(sidecar[2])
+            return
+
+        try:
+            raw = self.index_file.read_bytes()
+        except OSError:
+            return
+        digest = _digest(raw)
+        if sidecar is not None and sidecar[1] == digest:
+            # Same content under a new mtime (copied or touched)
+            self.stats["sidecar_hits"] += 1
+            self._set_encoded(sidecar[2])
+            self._write_sidecar(signature, digest, sidecar[2])
+            return
+
+        try:
+            data = json.loads(raw)
+        except (ValueError, UnicodeDecodeError):
+            return
+        if not isinstance(data, dict):
+            return
+        self.stats["parses"] += 1
+        self._keys = list(data)
+        self._decoded = data
+        self._loaded = True
+        if persist:
+            try:
+                sections = {key: marshal.dumps(value) for key, value in data.items()}
+            except ValueError:
+                return
+            self._write_sidecar(signature, digest, sections)
+
+    def _set_encoded(self, sections: dict[str, bytes]) -> None:
+        self._keys = list(sections)
+        self._encoded = dict(sections)
+        self._loaded = True
+
+    def _read_sidecar(self) -> tuple[_Signature, str, dict[str, bytes]] | None:
+        try:
+            raw = self.sidecar_file.read_bytes()
+            if not raw.startswith(_SIDECAR_MAGIC):
+                return None
+            header, sections = marshal.loads(raw[len(_SIDECAR_MAGIC) :])
+            version, signature, digest = header
+        except (OSError, ValueError, EOFError, TypeError):
+            return None
+        if tuple(version) != _SIDECAR_VERSION or not isinstance(sections, dict):
+            return None
+        return tuple(signature), digest, sections
+
+    def _write_sidecar(
+        self, signature: _Signature, digest: str, sections: dict[str, bytes]
+    ) -> None:
+        payload = marshal.dumps(((_SIDECAR_VERSION, signature, digest), sections))
+        try:
+            with atomic_write(self.sidecar_file, "wb", encoding=None) as f:
+                f.write(_SIDECAR_MAGIC + payload)
+        except OSError:
+            pass  # The side-cache is an optimization only
+
+    # -------------------------------------------------------------------------
+    # Access
+    # -------------------------------------------------------------------------
+
+    def exists(self) -> bool:
+        """Whether the index file exists and parsed as a JSON object."""
+        with self._lock:
+            self._refresh()
+            return self._loaded
+
+    def keys(self) -> list[str]:
+        """Top-level sections of the index, in file order."""
+        with self._lock:
+            self._refresh()
+            return list(self._keys)
+
+    def section(self, name: str, default: Any = None) -> Any:
+        """One top-level section of the index (shared - do not mutate)."""
+        with self._lock:
+            self._refresh()
+            if name in self._decoded:
+                return self._decoded[name]
+            blob = self._encoded.pop(name, None)
+            if blob is None:
+                return default
+            self.stats["decodes"] += 1
+            try:
+                value = marshal.loads(blob)
+            except (ValueError, EOFError, TypeError):
+                return default
+            self._decoded[name] = value
+            return value
+
+    def data(self) -> dict:
+        """The whole index (shared - do not mutate)."""
+        return self.derived(
+            "data", lambda index: {key: index.section(key) for key in index._keys}
+        )
+
+    def derived(self, name: str, build: Callable[["ProjectIndex"], T]) -> T:
+        """
+        A view computed from the index, memoized until the file changes.
+
+        Args:
+            name: Cache key for the view
+            build: Called with this index to compute the view
+        """
+        with self._lock:
+            self._refresh()
+            if name not in self._derived:
+                self._derived[name] = build(self)
+            return self._derived[name]
+
+    def services(self) -> dict[str, dict]:
+        """
+        Services by name (shared - do not mutate).
+
+        Accepts both the dict format and the legacy list format, where
+        services are keyed by their "name" (or position).
+        """
+
+        def build(index: "ProjectIndex") -> dict[str, dict]:
+            services = index.section("services", {})
+            if isinstance(services, list):
+                services = {
+                    str(service.get("name", i)): service
+                    for i, service in enumerate(services)
+                    if isinstance(service, dict)
+                }
+            if not isinstance(services, dict):
+                return {}
+            return {
+                name: service
+                for name, service in services.items()
+                if isinstance(service, dict)
+            }
+
+        return self.derived("services", build)
+
+    def service(self, name: str) -> dict | None:
+        return self.services().get(name)
+
+    def dependencies(self, service: str | None = None) -> frozenset[str]:
+        """
+        Runtime and dev dependencies of one service, or of all services.
+        """
+
+        def build(index: "ProjectIndex") -> dict[str, frozenset[str]]:
+            result = {}
+            for name, info in index.services().items():
+                deps = [
+                    *info.get("dependencies", []),
+                    *info.get("dev_dependencies", []),
+                ]
+                result[name] = frozenset(d for d in deps if isinstance(d, str))
+            return result
+
+        by_service = self.derived("dependencies", build)
+        if service is not None:
+            return by_service.get(service, frozenset())
+        return frozenset().union(*by_service.values())
+
+    def capabilities(self) -> dict[str, bool]:
+        """Capability flags from detect_project_capabilities() (a copy)."""
+        from prompts_pkg.project_context import detect_project_capabilities
+
+        return dict(
+            self.derived(
+                "capabilities",
+                lambda index: detect_project_capabilities(
+                    {"services": index.section("services", {})}
+                ),
+            )
+        )
+
+    def mcp_tools(self) -> list[str]:
+        """MCP tool doc files for the project's capabilities (a copy)."""
+        from prompts_pkg.project_context import get_mcp_tools_for_project
+
+        return list(
+            self.derived(
+                "mcp_tools",
+                lambda index: get_mcp_tools_for_project(index.capabilities()),
+            )
+        )
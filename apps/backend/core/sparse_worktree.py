@@ -0,0 +1,357 @@
+"""
+Sparse Spec Worktrees
+=====================
+
+Optional cone-mode sparse-checkout for per-spec worktrees.
+
+On a large monorepo a full checkout per spec dominates worktree creation
+time and disk usage, which limits how many specs can run in parallel. In
+sparse mode a spec worktree only materializes:
+
+- Root-level files (always included by cone mode)
+- Directories of files_to_modify / files_to_reference from context.json
+- Directories of the spec's scoped services (from project_index.json)
+
+The sparse set widens automatically: a PreToolUse hook adds the directory of
+any file the agent reads, writes or searches outside the current set before
+the tool runs, and of tracked paths named in Bash commands (see
+make_sparse_widening_hook).
+
+Configuration:
+    AUTO_CLAUDE_SPARSE_WORKTREES - "off" (default), "on", or "auto" (sparse
+                                   when the repo tracks more than
+                                   SPARSE_AUTO_THRESHOLD files)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import shlex
+import threading
+from collections.abc import Iterable
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from core.git_executable import run_git
+
+SPARSE_MODE_ENV_VAR = "AUTO_CLAUDE_SPARSE_WORKTREES"
+SPARSE_AUTO_THRESHOLD = 20000  # Tracked files before "auto" turns sparse on
+
+# Tools whose path arguments can trigger widening, and the input keys holding them
+_PATH_TOOLS: dict[str, tuple[str, ...]] = {
+    "Read": ("file_path",),
+    "Write": ("file_path",),
+    "Edit": ("file_path",),
+    "MultiEdit": ("file_path",),
+    "NotebookEdit": ("notebook_path",),
+    "Glob": ("path",),
+    "Grep": ("path",),
+}
+SPARSE_HOOK_MATCHER = "|".join([*_PATH_TOOLS, "Bash"])
+
+# Bash arguments checked against the tree per command (keeps ls-tree cheap)
+_MAX_BASH_PATHS = 64
+_GLOB_CHARS = "*?["
+
+# Cone directories per worktree, None for full checkouts (avoids a git call
+# per tool use and per client)
+_cone_cache: dict[Path, set[str] | None] = {}
+_cone_lock = threading.Lock()
+
+
+def get_sparse_mode() -> str:
+    """Get the sparse worktree mode ("off", "on" or "auto")."""
+    mode = os.environ.get(SPARSE_MODE_ENV_VAR, "off").strip().lower()
+    if mode in ("1", "true", "yes"):
+        return "on"
+    return mode if mode in ("on", "auto") else "off"
+
+
+def should_use_sparse(project_dir: Path) -> bool:
+    """Whether new spec worktrees for this project should be sparse."""
+    mode = get_sparse_mode()
+    if mode == "on":
+        return True
+    if mode != "auto":
+        return False
+    result = run_git(["ls-files", "-z"], cwd=project_dir, timeout=60)
+    if result.returncode != 0:
+        return False
+    return result.stdout.count("\0") > SPARSE_AUTO_THRESHOLD
+
+
+def cone_directories(
+    paths: Iterable[str], directories: Iterable[str] = ()
+) -> list[str]:
+    """
+    Minimal set of cone-mode directories covering the given paths.
+
+    ``paths`` are files (their parent directory is included), ``directories``
+    are included as-is. Root-level files need no entry and directories nested
+    inside another selected directory are dropped.
+    """
+    dirs = set()
+    for path in paths:
+        parent = str(PurePosixPath(path.replace("\\", "/")).parent)
+        if parent not in ("", "."):
+            dirs.add(parent.strip("/"))
+    for directory in directories:
+        directory = directory.replace("\\", "/").strip("/")
+        if directory and directory != ".":
+            dirs.add(directory)
+    return sorted(
+        d
+        for d in dirs
+        if not any(d != other and d.startswith(other + "/") for other in dirs)
+    )
+
+
+def _entry_path(entry: Any) -> str | None:
+    if isinstance(entry, str):
+        return entry
+    if isinstance(entry, dict) and isinstance(entry.get("path"), str):
+        return entry["path"]
+    return None
+
+
+def _load_json(path: Path) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return {}
+
+
+def collect_sparse_seed(
+    project_dir: Path, spec_dir: Path
+) -> tuple[list[str], list[str]]:
+    """
+    Read the initial sparse set for a spec.
+
+    Returns:
+        Tuple of (file paths, directories) relative to the project root.
+        Both are empty if the spec has no usable context.json.
+    """
+    context = _load_json(spec_dir / "context.json")
+    files = [
+        path
+        for key in ("files_to_modify", "files_to_reference")
+        for path in map(_entry_path, context.get(key) or [])
+        if path
+    ]
+
+    directories = []
+    scoped = context.get("scoped_services") or []
+    if scoped:
+        index = _load_json(spec_dir / "project_index.json") or _load_json(
+            project_dir / ".auto-claude" / "project_index.json"
+        )
+        services = index.get("services") or {}
+        root = project_dir.resolve()
+        for name in scoped:
+            info = services.get(name) if isinstance(services, dict) else None
+            service_path = Path(
+                info.get("path", name) if isinstance(info, dict) else name
+            )
+            if service_path.is_absolute():
+                try:
+                    service_path = service_path.resolve().relative_to(root)
+                except ValueError:
+                    continue
+            directories.append(service_path.as_posix())
+
+    return files, directories
+
+
+def apply_sparse_checkout(worktree_path: Path, directories: list[str]) -> None:
+    """
+    Restrict a freshly added (--no-checkout) worktree to the given directories
+    and populate it.
+
+    Raises:
+        RuntimeError: If sparse-checkout or the checkout fails
+    """
+    for args in (
+        ["sparse-checkout", "set", "--cone", *directories],
+        ["reset", "--hard", "-q", "HEAD"],
+    ):
+        result = run_git(args, cwd=worktree_path, timeout=300)
+        if result.returncode != 0:
+            raise RuntimeError(f"git {args[0]} failed: {result.stderr.strip()}")
+    with _cone_lock:
+        _cone_cache[worktree_path.resolve()] = set(directories)
+
+
+def forget_cone_directories(worktree_path: Path) -> None:
+    """Drop the cached cone of a worktree that was (re)created or disabled."""
+    with _cone_lock:
+        _cone_cache.pop(worktree_path.resolve(), None)
+
+
+def get_cone_directories(worktree_path: Path) -> set[str] | None:
+    """Cone directories of a sparse worktree, or None if it is a full checkout."""
+    key = worktree_path.resolve()
+    with _cone_lock:
+        if key in _cone_cache:
+            return _cone_cache[key]
+
+    cone: set[str] | None = None
+    config = run_git(["config", "--bool", "core.sparseCheckout"], cwd=worktree_path)
+    if config.returncode == 0 and config.stdout.strip() == "true":
+        listing = run_git(["sparse-checkout", "list"], cwd=worktree_path)
+        if listing.returncode == 0:
+            cone = {
+                line.strip() for line in listing.stdout.splitlines() if line.strip()
+            }
+
+    with _cone_lock:
+        _cone_cache[key] = cone
+    return cone
+
+
+def widen_sparse_checkout(
+    worktree_path: Path, paths: Iterable[str] = (), directories: Iterable[str] = ()
+) -> list[str]:
+    """
+    Add the directories needed for ``paths``/``directories`` to a sparse worktree.
+
+    Returns:
+        The directories that were added (empty for full checkouts or when
+        everything is already covered).
+    """
+    cone = get_cone_directories(worktree_path)
+    if cone is None:
+        return []
+
+    wanted = cone_directories(paths, directories)
+    missing = [
+        d for d in wanted if not any(d == c or d.startswith(c + "/") for c in cone)
+    ]
+    if not missing:
+        return []
+
+    result = run_git(
+        ["sparse-checkout", "add", *missing], cwd=worktree_path, timeout=300
+    )
+    if result.returncode != 0:
+        return []
+    with _cone_lock:
+        _cone_cache[worktree_path.resolve()] = cone | set(missing)
+    return missing
+
+
+def _relative_tool_path(worktree_root: Path, raw: str, cwd: str | None) -> str | None:
+    path = Path(raw)
+    if not path.is_absolute():
+        path = Path(cwd or worktree_root) / path
+    try:
+        relative = path.resolve().relative_to(worktree_root)
+    except ValueError:
+        return None  # Outside the worktree
+    posix = relative.as_posix()
+    if posix in ("", ".") or posix.startswith((".auto-claude", ".git/")):
+        return None
+    return posix
+
+
+def _bash_targets(
+    worktree_root: Path, command: str, cwd: str | None
+) -> tuple[list[str], list[str]]:
+    """
+    Tracked files and directories named in a Bash command but not checked out.
+
+    Every word that could be a path is resolved against the worktree; only
+    those that exist in HEAD count, so ordinary arguments never widen.
+    """
+    lexer = shlex.shlex(command, posix=True, punctuation_chars=True)
+    lexer.whitespace_split = True
+    try:
+        words = list(lexer)
+    except ValueError:
+        return [], []  # Unbalanced quotes
+
+    candidates: list[str] = []
+    for word in words:
+        if not word or word.startswith("-") or "=" in word or "$" in word:
+            continue
+        glob_at = min((word.find(c) for c in _GLOB_CHARS if c in word), default=-1)
+        if glob_at == 0:
+            continue
+        if glob_at > 0:
+            # src/**/*.py -> src
+            word = word[:glob_at].rpartition("/")[0]
+            if not word:
+                continue
+        relative = _relative_tool_path(worktree_root, word, cwd)
+        if relative is None or relative in candidates:
+            continue
+        if not (worktree_root / relative).exists():
+            candidates.append(relative)
+        if len(candidates) >= _MAX_BASH_PATHS:
+            break
+    if not candidates:
+        return [], []
+
+    result = run_git(["ls-tree", "HEAD", "--", *candidates], cwd=worktree_root)
+    if result.returncode != 0:
+        return [], []
+    files, directories = [], []
+    for line in result.stdout.splitlines():
+        info, _, path = line.partition("\t")
+        (directories if info.split()[1:2] == ["tree"] else files).append(path)
+    return files, directories
+
+
+def make_sparse_widening_hook(worktree_path: Path):
+    """
+    Build a PreToolUse hook that widens a sparse worktree on demand.
+
+    The hook never blocks a tool call; it only makes sure the target
+    directory is materialized before the tool runs. For Bash, tracked paths
+    named in the command are materialized.
+    """
+    worktree_root = worktree_path.resolve()
+
+    async def sparse_widening_hook(
+        input_data: dict[str, Any],
+        tool_use_id: str | None = None,
+        context: Any | None = None,
+    ) -> dict[str, Any]:
+        tool_name = input_data.get("tool_name", "")
+        keys = _PATH_TOOLS.get(tool_name, ())
+        tool_input = input_data.get("tool_input")
+        if not isinstance(tool_input, dict):
+            return {}
+
+        files, directories = [], []
+        command = tool_input.get("command") if tool_name == "Bash" else None
+        if isinstance(command, str) and command:
+            files, directories = await asyncio.to_thread(
+                _bash_targets, worktree_root, command, input_data.get("cwd")
+            )
+        for key in keys:
+            raw = tool_input.get(key)
+            if not isinstance(raw, str) or not raw:
+                continue
+            relative = _relative_tool_path(worktree_root, raw, input_data.get("cwd"))
+            if relative is None:
+                continue
+            # Search roots are directories unless they look like a file
+            if key == "path" and not PurePosixPath(relative).suffix:
+                directories.append(relative)
+            else:
+                files.append(relative)
+
+        if files or directories:
+            # sparse-checkout add can take a while; keep the event loop free
+            added = await asyncio.to_thread(
+                widen_sparse_checkout, worktree_root, files, directories
+            )
+            if added:
+                print(f"   - Sparse worktree widened: {', '.join(added)}")
+        return {}
+
+    return sparse_widening_hook
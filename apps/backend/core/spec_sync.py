@@ -0,0 +1,340 @@
+"""
+Incremental Spec Directory Sync
+===============================
+
+Mirrors a worktree's spec directory into the main project's spec directory
+without re-copying files that did not change.
+
+sync_spec_to_source() runs after every agent session. Copying the whole
+directory each time made its cost grow with the spec directory (task logs,
+memory files, reports) instead of with what the session changed. This
+module keeps a manifest in the target directory recording, per file, the
+source (size, mtime_ns), a content hash and the target's stat after the
+last write, and uses it to:
+
+- Skip files whose source and target are both unchanged (a stat call each)
+- Append only the new tail of files that grew, after checking the old
+  content is still there (the hash of the source's first `size` bytes must
+  match the recorded content hash)
+- Copy everything else through a temp file + os.replace(), so readers never
+  see a half-written file; content that hashes the same is not rewritten
+- Delete only files the sync itself created whose source disappeared
+
+Usage:
+    from core.spec_sync import sync_tree
+
+    result = sync_tree(worktree_spec_dir, main_spec_dir)
+    if result.changed:
+        print(f"{result.bytes_written} bytes synced")
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from core.file_utils import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = ".spec_sync_manifest.json"
+MANIFEST_VERSION = 2
+
+_CHUNK_BYTES = 1 << 20
+
+
+@dataclass
+class FileRecord:
+    """Manifest entry for one synced file (path relative to the spec dir)."""
+
+    size: int
+    mtime_ns: int
+    target_size: int
+    target_mtime_ns: int
+    # Hash of the `size` bytes last written to the target
+    digest: str
+    created: bool = False
+
+    def source_unchanged(self, st: os.stat_result) -> bool:
+        return self.size == st.st_size and self.mtime_ns == st.st_mtime_ns
+
+    def target_unchanged(self, st: os.stat_result | None) -> bool:
+        return (
+            st is not None
+            and self.target_size == st.st_size
+            and self.target_mtime_ns == st.st_mtime_ns
+        )
+
+
+@dataclass
+class SyncResult:
+    """What a sync_tree() call did."""
+
+    copied: list[str] = field(default_factory=list)
+    appended: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    bytes_written: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.copied or self.appended or self.deleted)
+
+
+# Parsed manifests by resolved target dir, with the manifest file's
+# (mtime_ns, size) signature at the time it was loaded or written
+_manifests: dict[Path, tuple[tuple[int, int] | None, dict[str, FileRecord]]] = {}
+_locks: dict[Path, threading.Lock] = {}
+_registry_lock = threading.Lock()
+
+
+def clear_manifest_cache() -> None:
+    """Forget in-memory manifests (they are re-read from disk on next sync)."""
+    with _registry_lock:
+        _manifests.clear()
+
+
+def sync_tree(source_dir: Path, target_dir: Path) -> SyncResult:
+    """
+    Incrementally mirror source_dir into target_dir.
+
+    Symlinks and temp files left by atomic writers are skipped. Files in
+    target_dir that are not in source_dir are left alone unless an earlier
+    sync created them.
+
+    Args:
+        source_dir: Directory to copy from (the worktree's spec dir)
+        target_dir: Directory to copy into (the main project's spec dir)
+
+    Returns:
+        SyncResult describing the files written and deleted
+
+    Raises:
+        OSError: If a file cannot be read or written; the manifest still
+            records every file synced before the failure
+    """
+    target_dir.mkdir(parents=True, exist_ok=True)
+    key = target_dir.resolve()
+    with _registry_lock:
+        lock = _locks.setdefault(key, threading.Lock())
+
+    with lock:
+        records = _load_manifest(key)
+        result = SyncResult()
+        seen: set[str] = set()
+        dirty = False
+        try:
+            for rel, source, st in _walk(source_dir, target_dir):
+                seen.add(rel)
+                dirty |= _sync_file(rel, source, st, target_dir / rel, records, result)
+            for rel in [rel for rel in records if rel not in seen]:
+                _forget(rel, target_dir / rel, records, result)
+                dirty = True
+        finally:
+            if dirty:
+                _save_manifest(key, records)
+        return result
+
+
+def _sync_file(
+    rel: str,
+    source: Path,
+    st: os.stat_result,
+    target: Path,
+    records: dict[str, FileRecord],
+    result: SyncResult,
+) -> bool:
+    """Bring one target file up to date; returns True if records changed."""
+    record = records.get(rel)
+    target_st = _stat(target)
+
+    if record is not None and record.target_unchanged(target_st):
+        if record.source_unchanged(st):
+            result.unchanged += 1
+            return False
+        appended = _append_if_grown(source, st, target, record)
+        if appended is not None:
+            written, digest = appended
+            records[rel] = _record_after_write(
+                target, st, digest, record.created, size=record.size + written
+            )
+            result.appended.append(rel)
+            result.bytes_written += written
+            return True
+
+    created = record.created if record is not None else target_st is None
+    tmp_path, size, digest = _copy_to_temp(source, target)
+    if (
+        record is not None
+        and record.digest == digest
+        and record.target_unchanged(target_st)
+    ):
+        # Touched or rewritten with identical content: keep the target
+        os.unlink(tmp_path)
+        record.size, record.mtime_ns = size, st.st_mtime_ns
+        result.unchanged += 1
+        return True
+
+    shutil.copystat(source, tmp_path)
+    os.replace(tmp_path, target)
+    records[rel] = _record_after_write(target, st, digest, created, size=size)
+    result.copied.append(rel)
+    result.bytes_written += size
+    return True
+
+
+def _forget(
+    rel: str, target: Path, records: dict[str, FileRecord], result: SyncResult
+) -> None:
+    """Drop a file that is gone from the source; delete it if we created it."""
+    record = records.pop(rel)
+    if record.created and record.target_unchanged(_stat(target)):
+        target.unlink()
+        result.deleted.append(rel)
+
+
+def _walk(source_dir: Path, target_dir: Path):
+    """Yield (relative posix path, path, stat) for every file to sync."""
+    stack = [(source_dir, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                rel = f"{prefix}{entry.name}"
+                if entry.is_symlink():
+                    # Skip symlinks to prevent path traversal attacks
+                    logger.warning(f"Skipping symlink during sync: {rel}")
+                elif entry.is_dir():
+                    (target_dir / rel).mkdir(exist_ok=True)
+                    stack.append((Path(entry.path), f"{rel}/"))
+                elif entry.is_file() and not _is_skipped(entry.name):
+                    yield rel, Path(entry.path), entry.stat()
+
+
+def _is_skipped(name: str) -> bool:
+    # The manifest itself, and in-flight temp files of atomic writers
+    # (".name.tmp.XXXX", ".task_logs_XXXX.tmp")
+    return name == MANIFEST_FILE or (name.startswith(".") and ".tmp" in name)
+
+
+def _append_if_grown(
+    source: Path, st: os.stat_result, target: Path, record: FileRecord
+) -> tuple[int, str] | None:
+    """
+    Append source's new tail to target if the rest of source is unchanged.
+
+    Returns:
+        (bytes written, hash of the whole new content), or None if source
+        did not grow or its first `record.size` bytes differ from what was
+        last synced (nothing is written then)
+    """
+    if st.st_size <= record.size:
+        return None
+    digest = hashlib.sha256()
+    with open(source, "rb") as src:
+        remaining = record.size
+        while remaining:
+            chunk = src.read(min(_CHUNK_BYTES, remaining))
+            if not chunk:
+                return None
+            digest.update(chunk)
+            remaining -= len(chunk)
+        if digest.hexdigest() != record.digest:
+            return None
+
+        written = 0
+        with open(target, "ab") as dst:
+            while chunk := src.read(_CHUNK_BYTES):
+                digest.update(chunk)
+                dst.write(chunk)
+                written += len(chunk)
+    source_st = os.stat(source)
+    os.utime(target, ns=(source_st.st_atime_ns, source_st.st_mtime_ns))
+    return written, digest.hexdigest()
+
+
+def _copy_to_temp(source: Path, target: Path) -> tuple[str, int, str]:
+    """Copy source next to target; returns (temp path, size, content hash)."""
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.tmp.")
+    try:
+        with open(source, "rb") as src, os.fdopen(fd, "wb") as dst:
+            while chunk := src.read(_CHUNK_BYTES):
+                digest.update(chunk)
+                dst.write(chunk)
+                size += len(chunk)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return tmp_path, size, digest.hexdigest()
+
+
+def _record_after_write(
+    target: Path,
+    source_st: os.stat_result,
+    digest: str,
+    created: bool,
+    size: int,
+) -> FileRecord:
+    target_st = os.stat(target)
+    # `size` is the bytes actually written; the source may have grown while
+    # we read it, in which case its mtime no longer matches and the next
+    # sync catches up
+    return FileRecord(
+        size=size,
+        mtime_ns=source_st.st_mtime_ns,
+        target_size=target_st.st_size,
+        target_mtime_ns=target_st.st_mtime_ns,
+        digest=digest,
+        created=created,
+    )
+
+
+def _stat(path: Path) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _signature(path: Path) -> tuple[int, int] | None:
+    st = _stat(path)
+    return None if st is None else (st.st_mtime_ns, st.st_size)
+
+
+def _load_manifest(target_dir: Path) -> dict[str, FileRecord]:
+    manifest_path = target_dir / MANIFEST_FILE
+    signature = _signature(manifest_path)
+    cached = _manifests.get(target_dir)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    records: dict[str, FileRecord] = {}
+    if signature is not None:
+        try:
+            data = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                records = {
+                    rel: FileRecord(**entry) for rel, entry in data["files"].items()
+                }
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            # Unreadable manifest: every file is re-copied once
+            records = {}
+    _manifests[target_dir] = (signature, records)
+    return records
+
+
+def _save_manifest(target_dir: Path, records: dict[str, FileRecord]) -> None:
+    manifest_path = target_dir / MANIFEST_FILE
+    data = {
+        "version": MANIFEST_VERSION,
+        "files": {rel: asdict(record) for rel, record in sorted(records.items())},
+    }
+    write_json_atomic(manifest_path, data, indent=None)
+    _manifests[target_dir] = (_signature(manifest_path), records)
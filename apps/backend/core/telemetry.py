@@ -0,0 +1,400 @@
+"""
+Session Telemetry
+=================
+
+Lightweight spans and counters for agent runs, written to a per-spec JSONL
+trace (telemetry.jsonl in the spec directory).
+
+Recording is cheap enough for the session hot loop: spans and counters
+are appended to an in-memory buffer and only serialized on flush() (at
+the end of each session, or when the buffer fills up).
+
+Span kinds:
+- phase: consecutive sessions of the same phase (planning, coding, qa...)
+- session: one run_agent_session call
+- tool: one tool call, from ToolUseBlock to its ToolResultBlock
+- hook: one hook invocation (e.g. bash_security_hook)
+
+Usage:
+    from core.telemetry import get_recorder
+
+    recorder = get_recorder(spec_dir)
+    with recorder.span("session", kind="session", phase="coding") as span:
+        span.attrs["messages"] = 3
+        recorder.count("tokens.input", 1200)
+    recorder.flush()
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+TRACE_FILE = "telemetry.jsonl"
+DEFAULT_BUFFER_SIZE = 2048
+
+# Set AUTO_CLAUDE_TELEMETRY=0 to disable trace recording
+_TELEMETRY_ENV = "AUTO_CLAUDE_TELEMETRY"
+
+
+def is_telemetry_enabled() -> bool:
+    return os.environ.get(_TELEMETRY_ENV, "1").strip().lower() not in (
+        "0",
+        "false",
+        "no",
+        "off",
+    )
+
+
+@dataclass
+class Span:
+    """An open span. Attributes may be added until it is ended."""
+
+    name: str
+    kind: str
+    span_id: str
+    parent_id: str | None
+    start: float  # time.time() at start
+    start_perf: float  # time.perf_counter() at start
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+
+class TelemetryRecorder:
+    """
+    Buffered span/counter recorder for one spec directory.
+
+    Not thread-safe for span nesting (the session loop is single-task);
+    the buffer itself is guarded so hooks running elsewhere can record.
+    """
+
+    def __init__(
+        self,
+        spec_dir: Path,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        enabled: bool | None = None,
+    ):
+        self.spec_dir = Path(spec_dir)
+        self.trace_file = self.spec_dir / TRACE_FILE
+        self.buffer_size = max(1, buffer_size)
+        self.enabled = is_telemetry_enabled() if enabled is None else enabled
+        self._buffer: list[dict[str, Any]] = []
+        self._counters: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stack: list[Span] = []
+        self._phase: Span | None = None
+
+    # -------------------------------------------------------------------------
+    # Spans
+    # -------------------------------------------------------------------------
+
+    def start_span(
+        self, name: str, kind: str, parent: Span | None = None, **attrs: Any
+    ) -> Span:
+        """Open a span; parented to the innermost active span by default."""
+        if parent is None and self._stack:
+            parent = self._stack[-1]
+        return Span(
+            name=name,
+            kind=kind,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            start=time.time(),
+            start_perf=time.perf_counter(),
+            attrs=attrs,
+        )
+
+    def elapsed_ms(self, span: Span) -> float:
+        """Milliseconds since a span started."""
+        return (time.perf_counter() - span.start_perf) * 1000
+
+    def end_span(self, span: Span, **attrs: Any) -> float:
+        """Close a span and buffer it. Returns its duration in ms."""
+        duration_ms = self.elapsed_ms(span)
+        if attrs:
+            span.attrs.update(attrs)
+        self._append(
+            {
+                "type": "span",
+                "name": span.name,
+                "kind": span.kind,
+                "id": span.span_id,
+                "parent": span.parent_id,
+                "start": round(span.start, 6),
+                "duration_ms": round(duration_ms, 3),
+                "attrs": span.attrs,
+            }
+        )
+        return duration_ms
+
+    def push_span(self, name: str, kind: str, **attrs: Any) -> Span:
+        """Open a span and make it the parent of spans started after it."""
+        span = self.start_span(name, kind, **attrs)
+        self._stack.append(span)
+        return span
+
+    def pop_span(self, span: Span, **attrs: Any) -> float:
+        """Close a span opened with push_span()."""
+        if span in self._stack:
+            self._stack.remove(span)
+        return self.end_span(span, **attrs)
+
+    @contextmanager
+    def span(self, name: str, kind: str = "span", **attrs: Any) -> Iterator[Span]:
+        """Record a nested span around a block."""
+        current = self.push_span(name, kind, **attrs)
+        try:
+            yield current
+        except BaseException as e:
+            current.attrs["error"] = type(e).__name__
+            raise
+        finally:
+            self.pop_span(current)
+
+    def enter_phase(self, phase: str) -> Span:
+        """
+        Make ``phase`` the active phase span.
+
+        Consecutive sessions of the same phase share one phase span; a
+        different phase closes the previous one.
+        """
+        if self._phase is not None and self._phase.name == phase:
+            return self._phase
+        self.end_phase()
+        self._phase = self.start_span(phase, "phase", parent=None)
+        self._stack.insert(0, self._phase)
+        return self._phase
+
+    def end_phase(self) -> None:
+        if self._phase is None:
+            return
+        if self._phase in self._stack:
+            self._stack.remove(self._phase)
+        self.end_span(self._phase)
+        self._phase = None
+
+    # -------------------------------------------------------------------------
+    # Counters
+    # -------------------------------------------------------------------------
+
+    def count(self, name: str, value: float = 1) -> None:
+        """Add to a counter (written as one record per flush)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    # -------------------------------------------------------------------------
+    # Buffering
+    # -------------------------------------------------------------------------
+
+    def _append(self, record: dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._buffer.append(record)
+            full = len(self._buffer) >= self.buffer_size
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered records and counters to the trace file."""
+        with self._lock:
+            records = self._buffer
+            self._buffer = []
+            if self._counters:
+                records.append(
+                    {"type": "counters", "time": time.time(), "values": self._counters}
+                )
+                self._counters = {}
+        if not records:
+            return
+        try:
+            self.spec_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.trace_file, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(r, default=str) + "\n" for r in records))
+        except OSError:
+            pass  # Telemetry must never break a build
+
+    def close(self) -> None:
+        """End any open phase span and flush."""
+        self.end_phase()
+        self.flush()
+
+
+_recorders: dict[Path, TelemetryRecorder] = {}
+_recorders_lock = threading.Lock()
+
+
+def get_recorder(spec_dir: Path) -> TelemetryRecorder:
+    """Get the shared recorder for a spec directory."""
+    key = Path(spec_dir).resolve()
+    with _recorders_lock:
+        recorder = _recorders.get(key)
+        if recorder is None:
+            recorder = _recorders[key] = TelemetryRecorder(key)
+        return recorder
+
+
+@atexit.register
+def close_all() -> None:
+    """End open phase spans and flush every recorder (runs at exit)."""
+    with _recorders_lock:
+        recorders = list(_recorders.values())
+    for recorder in recorders:
+        recorder.close()
+
+
+def traced_hook(recorder: TelemetryRecorder, name: str, hook: Callable) -> Callable:
+    """Wrap an async SDK hook so each invocation is recorded as a hook span."""
+
+    async def _traced(input_data, tool_use_id=None, context=None):
+        span = recorder.start_span(
+            name,
+            "hook",
+            tool=input_data.get("tool_name") if isinstance(input_data, dict) else None,
+            tool_use_id=tool_use_id,
+        )
+        try:
+            result = await hook(input_data, tool_use_id, context)
+        except BaseException as e:
+            recorder.end_span(span, error=type(e).__name__)
+            raise
+        decision = None
+        if isinstance(result, dict):
+            decision = (result.get("hookSpecificOutput") or {}).get(
+                "permissionDecision"
+            ) or result.get("decision")
+        recorder.end_span(span, decision=decision)
+        return result
+
+    _traced.__name__ = getattr(hook, "__name__", name)
+    return _traced
+
+
+# =============================================================================
+# TRACE ANALYSIS
+# =============================================================================
+
+
+def load_trace(spec_dir: Path) -> tuple[list[dict], dict[str, float]]:
+    """
+    Read a spec's trace.
+
+    Returns:
+        (spans, summed counters)
+    """
+    spans: list[dict] = []
+    counters: dict[str, float] = {}
+    trace_file = Path(spec_dir) / TRACE_FILE
+    if not trace_file.exists():
+        return spans, counters
+    with open(trace_file, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("type") == "span":
+                spans.append(record)
+            elif record.get("type") == "counters":
+                for key, value in record.get("values", {}).items():
+                    counters[key] = counters.get(key, 0) + value
+    return spans, counters
+
+
+def build_profile(spans: list[dict]) -> list[dict[str, Any]]:
+    """
+    Aggregate spans into a flame-style tree.
+
+    Spans are grouped by their name path (phase > session > tool/hook);
+    each node has total/self time, call count and children.
+    """
+    by_id = {span["id"]: span for span in spans}
+
+    def path(span: dict) -> tuple[str, ...]:
+        names = []
+        current: dict | None = span
+        seen: set[str] = set()
+        while current is not None and current["id"] not in seen:
+            seen.add(current["id"])
+            label = current["name"]
+            if current["kind"] == "tool":
+                label = f"tool:{label}"
+            elif current["kind"] == "hook":
+                label = f"hook:{label}"
+            names.append(label)
+            parent = by_id.get(current.get("parent"))
+            if parent is None and current["kind"] == "session":
+                # Phase span not written (e.g. the process was killed)
+                phase = current.get("attrs", {}).get("phase")
+                if phase:
+                    names.append(phase)
+            current = parent
+        return tuple(reversed(names))
+
+    root: dict[str, Any] = {"children": {}}
+    for span in spans:
+        node = root
+        for label in path(span):
+            node = node["children"].setdefault(
+                label,
+                {"name": label, "total_ms": 0.0, "count": 0, "children": {}},
+            )
+        node["total_ms"] += span["duration_ms"]
+        node["count"] += 1
+
+    def finalize(node: dict) -> list[dict]:
+        out = []
+        for child in node["children"].values():
+            children = finalize(child)
+            child_ms = sum(c["total_ms"] for c in children)
+            out.append(
+                {
+                    "name": child["name"],
+                    "total_ms": child["total_ms"],
+                    "self_ms": max(0.0, child["total_ms"] - child_ms),
+                    "count": child["count"],
+                    "children": children,
+                }
+            )
+        return sorted(out, key=lambda n: n["total_ms"], reverse=True)
+
+    return finalize(root)
+
+
+def format_profile(
+    tree: list[dict[str, Any]], counters: dict[str, float], width: int = 30
+) -> str:
+    """Render a profile tree as an indented flame-style breakdown."""
+    lines: list[str] = []
+    grand_total = sum(node["total_ms"] for node in tree) or 1.0
+
+    def render(nodes: list[dict], depth: int) -> None:
+        for node in nodes:
+            share = node["total_ms"] / grand_total
+            bar = "#" * max(1, round(share * width)) if node["total_ms"] else ""
+            label = "  " * depth + node["name"]
+            lines.append(
+                f"{label:<40} {node['total_ms'] / 1000:>9.2f}s "
+                f"{node['count']:>5}x {share:>6.1%}  {bar}"
+            )
+            render(node["children"], depth + 1)
+
+    lines.append(f"{'span':<40} {'total':>10} {'calls':>6} {'share':>7}")
+    render(tree, 0)
+
+    if counters:
+        lines.append("")
+        lines.append("Counters:")
+        for key in sorted(counters):
+            value = counters[key]
+            shown = f"{value:,.0f}" if float(value).is_integer() else f"{value:,.4f}"
+            lines.append(f"  {key:<38} {shown:>12}")
+    return "\n".join(lines)
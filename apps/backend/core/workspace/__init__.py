@@ -17,21 +17,42 @@ Public API exported from sub-modules.
 """
 
 import importlib.util
-import sys
 from pathlib import Path
+from typing import Any
+
+# Merge functions live in workspace.py (which coexists with this package).
+# It imports the whole merge system, so it is loaded on first access via
+# __getattr__ below rather than whenever a workspace submodule is imported.
+_WORKSPACE_MODULE_EXPORTS = (
+    "AI_MERGE_SYSTEM_PROMPT",
+    "_build_merge_prompt",
+    "_check_git_conflicts",
+    "_rebase_spec_branch",
+    "_run_parallel_merges",
+    "merge_existing_build",
+)
+
+
+def _load_workspace_module():
+    # We use importlib to explicitly load workspace.py since Python prefers the package
+    workspace_file = Path(__file__).parent.parent / "workspace.py"
+    spec = importlib.util.spec_from_file_location("workspace_module", workspace_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def __getattr__(name: str) -> Any:
+    """Load workspace.py on first access to one of its exports."""
+    if name == "_workspace_module" or name in _WORKSPACE_MODULE_EXPORTS:
+        module = _load_workspace_module()
+        # Cache in globals so subsequent accesses bypass __getattr__
+        globals()["_workspace_module"] = module
+        for export in _WORKSPACE_MODULE_EXPORTS:
+            globals()[export] = getattr(module, export)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Import merge functions from workspace.py (which coexists with this package)
-# We use importlib to explicitly load workspace.py since Python prefers the package
-_workspace_file = Path(__file__).parent.parent / "workspace.py"
-_spec = importlib.util.spec_from_file_location("workspace_module", _workspace_file)
-_workspace_module = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_workspace_module)
-merge_existing_build = _workspace_module.merge_existing_build
-_run_parallel_merges = _workspace_module._run_parallel_merges
-AI_MERGE_SYSTEM_PROMPT = _workspace_module.AI_MERGE_SYSTEM_PROMPT
-_build_merge_prompt = _workspace_module._build_merge_prompt
-_check_git_conflicts = _workspace_module._check_git_conflicts
-_rebase_spec_branch = _workspace_module._rebase_spec_branch
 
 # Models and Enums
 # Display Functions
@@ -13,8 +13,9 @@ import subprocess
 import sys
 from pathlib import Path
 
+from core.dependency_cache import DependencyCache, dependency_cache_enabled
 from core.git_executable import run_git
-from merge import FileTimelineTracker
+from core.sparse_worktree import collect_sparse_seed, should_use_sparse
 from security.constants import ALLOWLIST_FILENAME, PROFILE_FILENAME
 from ui import (
     Icons,
@@ -283,6 +284,37 @@ def symlink_node_modules_to_worktree(
     return symlinked
 
 
+def link_dependencies_to_worktree(project_dir: Path, worktree_path: Path) -> list[str]:
+    """
+    Give a worktree the project's installed dependencies.
+
+    Every package root's node_modules or virtualenv whose lockfile matches
+    the worktree's is cloned copy-on-write from the dependency cache (see
+    core.dependency_cache). The fixed node_modules locations are then
+    symlinked as before where the cache did not place them.
+
+    Args:
+        project_dir: The main project directory
+        worktree_path: Path to the worktree
+
+    Returns:
+        Descriptions of the linked paths (relative to worktree)
+    """
+    linked = []
+    if dependency_cache_enabled():
+        try:
+            placed = DependencyCache(project_dir).materialize(worktree_path)
+        except OSError as e:
+            debug_warning(MODULE, f"Dependency cache unavailable: {e}")
+            placed = []
+        for tree in placed:
+            linked.append(f"{tree.path} ({tree.method})")
+            debug(MODULE, f"Placed {tree.path} in worktree by {tree.method}")
+
+    linked.extend(symlink_node_modules_to_worktree(project_dir, worktree_path))
+    return linked
+
+
 def copy_spec_to_worktree(
     source_spec_dir: Path,
     worktree_path: Path,
@@ -360,8 +392,13 @@ def setup_workspace(
     manager = WorktreeManager(project_dir, base_branch=base_branch)
     manager.setup()
 
+    # Optionally limit a new worktree to the spec's files and scoped services
+    sparse_paths = None
+    if source_spec_dir and should_use_sparse(project_dir):
+        sparse_paths = collect_sparse_seed(project_dir, source_spec_dir)
+
     # Get or create worktree for THIS SPECIFIC SPEC
-    worktree_info = manager.get_or_create_worktree(spec_name)
+    worktree_info = manager.get_or_create_worktree(spec_name, sparse_paths=sparse_paths)
 
     # Copy .env files to worktree so user can run the project
     copied_env_files = copy_env_files_to_worktree(project_dir, worktree_info.path)
@@ -370,13 +407,13 @@ def setup_workspace(
             f"Environment files copied: {', '.join(copied_env_files)}", "success"
         )
 
-    # Symlink node_modules to worktree for TypeScript and tooling support
-    # This allows pre-commit hooks to run typecheck without npm install in worktree
-    symlinked_modules = symlink_node_modules_to_worktree(
-        project_dir, worktree_info.path
-    )
-    if symlinked_modules:
-        print_status(f"Dependencies linked: {', '.join(symlinked_modules)}", "success")
+    # Share installed dependencies with the worktree for TypeScript and tooling
+    # support. This allows pre-commit hooks and QA to run without reinstalling
+    linked_dependencies = link_dependencies_to_worktree(project_dir, worktree_info.path)
+    if linked_dependencies:
+        print_status(
+            f"Dependencies linked: {', '.join(linked_dependencies)}", "success"
+        )
 
     # Copy security configuration files if they exist
     # Note: Unlike env files, security files always overwrite to ensure
@@ -512,6 +549,9 @@ def initialize_timeline_tracking(
     enabling intent-aware merge conflict resolution later.
     """
     try:
+        # Deferred: the merge system is only needed once a task starts
+        from merge import FileTimelineTracker
+
         tracker = FileTimelineTracker(project_dir)
 
         # Get task intent from implementation plan
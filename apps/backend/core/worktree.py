@@ -28,6 +28,19 @@ from typing import TypedDict, TypeVar
 
 from core.gh_executable import get_gh_executable, invalidate_gh_cache
 from core.git_executable import get_git_executable, get_isolated_git_env, run_git
+from core.sparse_worktree import (
+    apply_sparse_checkout,
+    cone_directories,
+    forget_cone_directories,
+)
+from core.worktree_inventory import (
+    collect_worktree_stats,
+    days_since,
+    list_registered_worktrees,
+    parse_git_date,
+    resolve_commit,
+    worktree_key,
+)
 from debug import debug_warning
 
 T = TypeVar("T")
@@ -532,46 +545,9 @@ class WorktreeManager:
             ["log", "-1", "--format=%cd", "--date=iso"], cwd=worktree_path
         )
         if result.returncode == 0 and result.stdout.strip():
-            try:
-                # Parse ISO date format: "2026-01-04 00:25:25 +0100"
-                date_str = result.stdout.strip()
-                # Convert git format to ISO format for fromisoformat()
-                # "2026-01-04 00:25:25 +0100" -> "2026-01-04T00:25:25+01:00"
-                parts = date_str.rsplit(" ", 1)
-                if len(parts) == 2:
-                    date_part, tz_part = parts
-                    # Convert timezone format: "+0100" -> "+01:00"
-                    if len(tz_part) == 5 and (
-                        tz_part.startswith("+") or tz_part.startswith("-")
-                    ):
-                        tz_formatted = f"{tz_part[:3]}:{tz_part[3:]}"
-                        iso_str = f"{date_part.replace(' ', 'T')}{tz_formatted}"
-                        last_commit_date = datetime.fromisoformat(iso_str)
-                        stats["last_commit_date"] = last_commit_date
-                        # Use timezone-aware now() for accurate comparison
-                        now_aware = datetime.now(last_commit_date.tzinfo)
-                        stats["days_since_last_commit"] = (
-                            now_aware - last_commit_date
-                        ).days
-                    else:
-                        # Fallback for unexpected timezone format
-                        last_commit_date = datetime.strptime(
-                            parts[0], "%Y-%m-%d %H:%M:%S"
-                        )
-                        stats["last_commit_date"] = last_commit_date
-                        stats["days_since_last_commit"] = (
-                            datetime.now() - last_commit_date
-                        ).days
-                else:
-                    # No timezone in output
-                    last_commit_date = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                    stats["last_commit_date"] = last_commit_date
-                    stats["days_since_last_commit"] = (
-                        datetime.now() - last_commit_date
-                    ).days
-            except (ValueError, TypeError) as e:
-                # If parsing fails, silently continue without date info
-                pass
+            last_commit_date = parse_git_date(result.stdout)
+            stats["last_commit_date"] = last_commit_date
+            stats["days_since_last_commit"] = days_since(last_commit_date)
 
         # Diff stats
         result = self._run_git(
@@ -591,7 +567,9 @@ class WorktreeManager:
 
         return stats
 
-    def create_worktree(self, spec_name: str) -> WorktreeInfo:
+    def create_worktree(
+        self, spec_name: str, sparse_paths: tuple[list[str], list[str]] | None = None
+    ) -> WorktreeInfo:
         """
         Create a worktree for a spec (idempotent).
 
@@ -609,6 +587,9 @@ class WorktreeManager:
 
         Args:
             spec_name: The spec folder name (e.g., "002-implement-memory")
+            sparse_paths: Optional (files, directories) seed for a cone-mode sparse
+                checkout (see core.sparse_worktree). Only applies to newly created
+                worktrees; None or an empty seed gives a full checkout.
 
         Returns:
             WorktreeInfo for the created or existing worktree
@@ -679,11 +660,17 @@ class WorktreeManager:
             )
             print("Falling back to local branch...")
 
+        # Sparse worktrees are added without a checkout, then populated below
+        sparse_dirs = cone_directories(*sparse_paths) if sparse_paths else []
+        no_checkout = ["--no-checkout"] if sparse_dirs else []
+
         # Step 7: Create the worktree
         if branch_exists:
             # Branch exists - attach worktree to existing branch (no -b flag)
             print(f"Reusing existing branch: {branch_name}")
-            result = self._run_git(["worktree", "add", str(worktree_path), branch_name])
+            result = self._run_git(
+                ["worktree", "add", *no_checkout, str(worktree_path), branch_name]
+            )
         else:
             # Branch doesn't exist - create new branch from remote or local base
             # Determine the start point for the worktree
@@ -702,7 +689,15 @@ class WorktreeManager:
 
             # Create worktree with new branch from the start point
             result = self._run_git(
-                ["worktree", "add", "-b", branch_name, str(worktree_path), start_point]
+                [
+                    "worktree",
+                    "add",
+                    *no_checkout,
+                    "-b",
+                    branch_name,
+                    str(worktree_path),
+                    start_point,
+                ]
             )
 
         if result.returncode != 0:
@@ -710,6 +705,18 @@ class WorktreeManager:
                 f"Failed to create worktree for {spec_name}: {result.stderr}"
             )
 
+        # Step 8: Populate a sparse worktree (falls back to a full checkout)
+        forget_cone_directories(worktree_path)  # The path may have been reused
+        if sparse_dirs:
+            try:
+                apply_sparse_checkout(worktree_path, sparse_dirs)
+                print(f"Sparse checkout: {len(sparse_dirs)} directories")
+            except RuntimeError as e:
+                print(f"Warning: Sparse checkout failed, using full checkout: {e}")
+                self._run_git(["sparse-checkout", "disable"], cwd=worktree_path)
+                self._run_git(["reset", "--hard", "-q", "HEAD"], cwd=worktree_path)
+                forget_cone_directories(worktree_path)
+
         print(f"Created worktree: {worktree_path.name} on branch {branch_name}")
 
         return WorktreeInfo(
@@ -720,12 +727,15 @@ class WorktreeManager:
             is_active=True,
         )
 
-    def get_or_create_worktree(self, spec_name: str) -> WorktreeInfo:
+    def get_or_create_worktree(
+        self, spec_name: str, sparse_paths: tuple[list[str], list[str]] | None = None
+    ) -> WorktreeInfo:
         """
         Get existing worktree or create a new one for a spec.
 
         Args:
             spec_name: The spec folder name
+            sparse_paths: Optional sparse-checkout seed for a new worktree
 
         Returns:
             WorktreeInfo for the worktree
@@ -735,7 +745,7 @@ class WorktreeManager:
             print(f"Using existing worktree: {existing.path}")
             return existing
 
-        return self.create_worktree(spec_name)
+        return self.create_worktree(spec_name, sparse_paths=sparse_paths)
 
     def remove_worktree(self, spec_name: str, delete_branch: bool = False) -> None:
         """
@@ -886,27 +896,73 @@ class WorktreeManager:
     # ==================== Listing & Discovery ====================
 
     def list_all_worktrees(self) -> list[WorktreeInfo]:
-        """List all spec worktrees (includes legacy .worktrees/ location)."""
-        worktrees = []
-        seen_specs = set()
+        """
+        List all spec worktrees (includes legacy .worktrees/ location).
+
+        Statistics for all worktrees are gathered in one batch (see
+        core.worktree_inventory) instead of three git calls per worktree.
+        """
+        spec_names = []
 
         # Check new location first
         if self.worktrees_dir.exists():
             for item in self.worktrees_dir.iterdir():
                 if item.is_dir():
-                    info = self.get_worktree_info(item.name)
-                    if info:
-                        worktrees.append(info)
-                        seen_specs.add(item.name)
+                    spec_names.append(item.name)
 
         # Check legacy location (.worktrees/)
         legacy_dir = self.project_dir / ".worktrees"
         if legacy_dir.exists():
             for item in legacy_dir.iterdir():
-                if item.is_dir() and item.name not in seen_specs:
-                    info = self.get_worktree_info(item.name)
-                    if info:
-                        worktrees.append(info)
+                if item.is_dir() and item.name not in spec_names:
+                    spec_names.append(item.name)
+
+        if not spec_names:
+            return []
+
+        registered = list_registered_worktrees(self.project_dir)
+        base_oid = resolve_commit(self.project_dir, self.base_branch)
+        entries = {}
+        for spec_name in spec_names:
+            entry = registered.get(worktree_key(self.get_worktree_path(spec_name)))
+            if entry is not None and entry.head:
+                entries[spec_name] = entry
+
+        stats_by_head = {}
+        if base_oid and entries:
+            stats_by_head = collect_worktree_stats(
+                self.project_dir, base_oid, [e.head for e in entries.values()]
+            )
+
+        worktrees = []
+        for spec_name in spec_names:
+            entry = entries.get(spec_name)
+            if entry is None or entry.head not in stats_by_head:
+                # Not registered with git (or no base to compare against):
+                # fall back to the per-worktree lookup
+                info = self.get_worktree_info(spec_name)
+                if info:
+                    worktrees.append(info)
+                continue
+
+            branch = entry.branch
+            if branch is None:
+                branch = self.get_branch_name(spec_name)
+                debug_warning(
+                    "worktree",
+                    f"Worktree '{spec_name}' is in detached HEAD state. "
+                    f"Using expected branch name: {branch}",
+                )
+            worktrees.append(
+                WorktreeInfo(
+                    path=self.get_worktree_path(spec_name),
+                    branch=branch,
+                    spec_name=spec_name,
+                    base_branch=self.base_branch,
+                    is_active=True,
+                    **stats_by_head[entry.head],
+                )
+            )
 
         return worktrees
 
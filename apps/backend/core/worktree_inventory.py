@@ -0,0 +1,315 @@
+"""
+Batched Worktree Inventory
+==========================
+
+Statistics for many spec worktrees with a fixed number of git processes.
+
+WorktreeManager._get_worktree_stats runs three git commands per worktree
+(rev-list, log, diff). Listing 50 spec worktrees that way costs ~150 process
+spawns. The inventory instead runs, for any number of worktrees:
+
+- ``git worktree list --porcelain`` for every worktree's HEAD and branch
+- ``git rev-list --stdin --parents`` over all branch tips; commit counts and
+  merge bases are computed from the returned commit graph
+- ``git log --no-walk --stdin`` for the last commit dates
+- ``git diff-tree --stdin --shortstat`` for the ``base...HEAD`` diff stats,
+  one (tip, merge base) pair per input line
+
+Stats are cached by (tip OID, base OID), so unchanged worktrees cost nothing
+when the list is refreshed.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from core.git_executable import run_git
+
+# Upper bound on cached (tip, base) entries; oldest entries are evicted first
+STATS_CACHE_MAX_ENTRIES = 1024
+
+_stats_cache: dict[tuple[str, str], dict] = {}
+_stats_lock = threading.Lock()
+
+_OID_RE = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+
+
+@dataclass
+class RegisteredWorktree:
+    """A worktree entry from ``git worktree list --porcelain``."""
+
+    path: Path
+    head: str | None
+    branch: str | None  # None when detached
+
+
+def worktree_key(path: Path) -> str:
+    """Normalized key for comparing worktree paths."""
+    return os.path.normcase(str(path.resolve()))
+
+
+def list_registered_worktrees(project_dir: Path) -> dict[str, RegisteredWorktree]:
+    """
+    All worktrees registered with git, keyed by worktree_key(path).
+
+    Returns an empty dict if git fails.
+    """
+    result = run_git(["worktree", "list", "--porcelain"], cwd=project_dir)
+    if result.returncode != 0:
+        return {}
+
+    worktrees: dict[str, RegisteredWorktree] = {}
+    current: RegisteredWorktree | None = None
+    for line in result.stdout.split("\n"):
+        if line.startswith("worktree "):
+            current = RegisteredWorktree(Path(line[len("worktree ") :]), None, None)
+            worktrees[worktree_key(current.path)] = current
+        elif current is None:
+            continue
+        elif line.startswith("HEAD "):
+            current.head = line[len("HEAD ") :].strip()
+        elif line.startswith("branch refs/heads/"):
+            current.branch = line[len("branch refs/heads/") :]
+        elif line == "":
+            current = None
+    return worktrees
+
+
+def parse_git_date(date_str: str) -> datetime | None:
+    """
+    Parse ``git log --date=iso`` output ("2026-01-04 00:25:25 +0100").
+
+    Returns a timezone-aware datetime, a naive one if the timezone is
+    missing or malformed, or None if the string cannot be parsed.
+    """
+    try:
+        parts = date_str.strip().rsplit(" ", 1)
+        if len(parts) == 2:
+            date_part, tz_part = parts
+            if len(tz_part) == 5 and tz_part[0] in "+-":
+                # "+0100" -> "+01:00" for fromisoformat()
+                tz_formatted = f"{tz_part[:3]}:{tz_part[3:]}"
+                return datetime.fromisoformat(
+                    f"{date_part.replace(' ', 'T')}{tz_formatted}"
+                )
+            return datetime.strptime(parts[0], "%Y-%m-%d %H:%M:%S")
+        return datetime.strptime(date_str.strip(), "%Y-%m-%d %H:%M:%S")
+    except (ValueError, TypeError):
+        return None
+
+
+def days_since(date: datetime | None) -> int | None:
+    """Whole days from date until now (None if date is None)."""
+    if date is None:
+        return None
+    return (datetime.now(date.tzinfo) - date).days
+
+
+def resolve_commit(project_dir: Path, ref: str) -> str | None:
+    """OID of the commit a ref points to, or None if it does not resolve."""
+    result = run_git(["rev-parse", "--verify", f"{ref}^{{commit}}"], cwd=project_dir)
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def clear_stats_cache() -> None:
+    """Drop all cached worktree statistics."""
+    with _stats_lock:
+        _stats_cache.clear()
+
+
+def collect_worktree_stats(
+    project_dir: Path, base_oid: str, heads: list[str]
+) -> dict[str, dict]:
+    """
+    Statistics for many branch tips against one base commit.
+
+    Equivalent to running, for every tip, ``rev-list --count base..tip``,
+    ``log -1`` and ``diff --shortstat base...tip``.
+
+    Args:
+        project_dir: Repository (any worktree of it)
+        base_oid: Resolved base branch commit
+        heads: Tip commit OIDs (duplicates are fine)
+
+    Returns:
+        Dict of tip OID -> stats dict with the WorktreeInfo statistic fields
+    """
+    stats: dict[str, dict] = {}
+    missing: list[str] = []
+    with _stats_lock:
+        for head in dict.fromkeys(heads):
+            cached = _stats_cache.get((head, base_oid))
+            if cached is not None:
+                stats[head] = dict(cached)
+            else:
+                missing.append(head)
+
+    if missing:
+        computed = _compute_stats(project_dir, base_oid, missing)
+        with _stats_lock:
+            for head, entry in computed.items():
+                _stats_cache[(head, base_oid)] = entry
+                stats[head] = dict(entry)
+            while len(_stats_cache) > STATS_CACHE_MAX_ENTRIES:
+                del _stats_cache[next(iter(_stats_cache))]
+
+    for entry in stats.values():
+        entry["days_since_last_commit"] = days_since(entry["last_commit_date"])
+    return stats
+
+
+def _compute_stats(project_dir: Path, base_oid: str, heads: list[str]) -> dict:
+    graph = _branch_commit_graph(project_dir, base_oid, heads)
+    dates = _commit_dates(project_dir, heads)
+
+    results: dict[str, dict] = {}
+    diff_pairs: dict[str, str] = {}
+    for head in heads:
+        commit_count, merge_base = _walk_branch(graph, head)
+        if merge_base is _AMBIGUOUS:
+            merge_base = _merge_base(project_dir, base_oid, head)
+        results[head] = {
+            "commit_count": commit_count,
+            "files_changed": 0,
+            "additions": 0,
+            "deletions": 0,
+            "last_commit_date": dates.get(head),
+        }
+        if merge_base is not None and merge_base != head:
+            diff_pairs[head] = merge_base
+
+    for head, (files, additions, deletions) in _diff_stats(
+        project_dir, diff_pairs
+    ).items():
+        results[head].update(
+            files_changed=files, additions=additions, deletions=deletions
+        )
+    return results
+
+
+def _branch_commit_graph(
+    project_dir: Path, base_oid: str, heads: list[str]
+) -> dict[str, list[str]]:
+    """Commit -> parents for every commit reachable from a tip but not base."""
+    result = run_git(
+        ["rev-list", "--parents", "--stdin"],
+        cwd=project_dir,
+        input_data="".join(f"{head}\n" for head in heads) + f"^{base_oid}\n",
+    )
+    graph: dict[str, list[str]] = {}
+    if result.returncode != 0:
+        return graph
+    for line in result.stdout.splitlines():
+        commit, *parents = line.split()
+        graph[commit] = parents
+    return graph
+
+
+# Sentinel: several candidate merge bases, ask git
+_AMBIGUOUS = object()
+
+
+def _walk_branch(graph: dict[str, list[str]], head: str) -> tuple[int, object]:
+    """
+    Count a tip's commits not on base and find its merge base.
+
+    Every commit reachable from the tip that is missing from the graph is
+    reachable from base; those are the merge base candidates.
+
+    Returns:
+        (commit count, merge base OID, None if the histories are unrelated,
+        or _AMBIGUOUS if there are several candidates)
+    """
+    if head not in graph:
+        # The tip is already contained in base
+        return 0, head
+
+    seen = {head}
+    boundary: set[str] = set()
+    stack = [head]
+    while stack:
+        for parent in graph[stack.pop()]:
+            if parent in seen:
+                continue
+            seen.add(parent)
+            if parent in graph:
+                stack.append(parent)
+            else:
+                boundary.add(parent)
+
+    count = len(seen) - len(boundary)
+    if not boundary:
+        return count, None
+    if len(boundary) == 1:
+        return count, next(iter(boundary))
+    return count, _AMBIGUOUS
+
+
+def _merge_base(project_dir: Path, base_oid: str, head: str) -> str | None:
+    result = run_git(["merge-base", base_oid, head], cwd=project_dir)
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def _commit_dates(project_dir: Path, heads: list[str]) -> dict[str, datetime]:
+    result = run_git(
+        ["log", "--no-walk=unsorted", "--stdin", "--format=%H %cd", "--date=iso"],
+        cwd=project_dir,
+        input_data="".join(f"{head}\n" for head in heads),
+    )
+    dates: dict[str, datetime] = {}
+    if result.returncode != 0:
+        return dates
+    for line in result.stdout.splitlines():
+        oid, _, date_str = line.partition(" ")
+        date = parse_git_date(date_str)
+        if date is not None:
+            dates[oid] = date
+    return dates
+
+
+def _diff_stats(
+    project_dir: Path, pairs: dict[str, str]
+) -> dict[str, tuple[int, int, int]]:
+    """
+    (files, insertions, deletions) from merge base to tip for each tip.
+
+    diff-tree --stdin reads "<commit> <parent>" lines and prints the commit
+    OID followed by its shortstat (nothing at all for an empty diff).
+    """
+    if not pairs:
+        return {}
+    result = run_git(
+        ["diff-tree", "--stdin", "-r", "-M", "--shortstat"],
+        cwd=project_dir,
+        input_data="".join(f"{head} {base}\n" for head, base in pairs.items()),
+    )
+    stats: dict[str, tuple[int, int, int]] = {}
+    if result.returncode != 0:
+        return stats
+
+    current: str | None = None
+    for line in result.stdout.splitlines():
+        line = line.strip()
+        if _OID_RE.match(line):
+            current = line
+        elif current is not None and "changed" in line:
+            stats[current] = (
+                _shortstat_number(r"(\d+) files? changed", line),
+                _shortstat_number(r"(\d+) insertions?", line),
+                _shortstat_number(r"(\d+) deletions?", line),
+            )
+    return stats
+
+
+def _shortstat_number(pattern: str, line: str) -> int:
+    match = re.search(pattern, line)
+    return int(match.group(1)) if match else 0
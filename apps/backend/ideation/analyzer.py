@@ -16,6 +16,7 @@ from pathlib import Path
 # Add auto-claude to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from core.project_index import ProjectIndex
 from debug import (
     debug_success,
     debug_warning,
@@ -48,20 +49,14 @@ class ProjectAnalyzer:
         }
 
         # Get project index (from .auto-claude - the installed instance)
-        project_index_path = self.project_dir / ".auto-claude" / "project_index.json"
-        if project_index_path.exists():
-            try:
-                with open(project_index_path, encoding="utf-8") as f:
-                    index = json.load(f)
-                    # Extract tech stack from services
-                    for service_name, service_info in index.get("services", {}).items():
-                        if service_info.get("language"):
-                            context["tech_stack"].append(service_info["language"])
-                        if service_info.get("framework"):
-                            context["tech_stack"].append(service_info["framework"])
-                    context["tech_stack"] = list(set(context["tech_stack"]))
-            except (json.JSONDecodeError, KeyError):
-                pass
+        project_index = ProjectIndex.for_project(self.project_dir)
+        # Extract tech stack from services
+        for service_info in project_index.services().values():
+            if service_info.get("language"):
+                context["tech_stack"].append(service_info["language"])
+            if service_info.get("framework"):
+                context["tech_stack"].append(service_info["framework"])
+        context["tech_stack"] = list(set(context["tech_stack"]))
 
         # Get roadmap context if enabled
         if self.include_roadmap:
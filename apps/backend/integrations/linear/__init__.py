@@ -7,6 +7,7 @@ Integration with Linear issue tracking.
 
 from .config import LinearConfig
 from .integration import LinearManager
+from .sync import LinearOutbox, LinearSyncEngine, LinearSyncError
 from .updater import (
     STATUS_CANCELED,
     STATUS_DONE,
@@ -30,6 +31,9 @@ __all__ = [
     "LinearIntegration",
     "LinearTaskState",
     "LinearUpdater",
+    "LinearOutbox",
+    "LinearSyncEngine",
+    "LinearSyncError",
     "is_linear_enabled",
     "get_linear_api_key",
     "create_linear_task",
@@ -0,0 +1,461 @@
+"""
+Linear Sync Engine - Direct GraphQL Updates
+===========================================
+
+Deterministic replacement for the per-operation mini-agent sessions used
+for routine Linear updates (status transitions and progress comments).
+
+Transitions are queued in a durable per-spec outbox (.linear_outbox.json)
+and flushed as ONE batched GraphQL mutation document:
+
+- Status changes are coalesced per issue - only the latest state wins
+- Comments are kept in order and sent in the same document
+- Only operations Linear confirms are removed from the outbox; failed
+  flushes and failed operations stay on disk and the next flush (in this
+  or a later process) delivers everything still pending
+- An operation Linear rejects MAX_REJECTIONS times, or a status that is not
+  a workflow state of the issue's team, is dropped (and logged) so it never
+  blocks the rest of the queue
+- The outbox is read and written under a cross-process file lock, and
+  flushes of one outbox never overlap, so nothing is sent twice
+
+Free-form operations (e.g. creating the task from a spec) still go
+through the agent in updater.py.
+"""
+
+import asyncio
+import json
+import os
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from core.file_lock import FileLock, FileLockTimeout
+from core.file_utils import write_json_atomic
+from core.http_utils import parse_retry_after
+
+LINEAR_GRAPHQL_URL = "https://api.linear.app/graphql"
+
+# Outbox file name (lives next to .linear_task.json)
+LINEAR_OUTBOX_FILE = ".linear_outbox.json"
+
+# Seconds to wait for the outbox lock (queueing) and for another flush
+OUTBOX_LOCK_TIMEOUT = 10.0
+FLUSH_LOCK_TIMEOUT = 120.0
+
+# Times Linear may reject one operation before it is dropped
+MAX_REJECTIONS = 3
+
+# Statuses worth retrying: rate limit and transient server errors
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_STATES_QUERY_FIELDS = "team { states { nodes { id name } } }"
+
+
+class LinearSyncError(Exception):
+    """Linear API request failed or returned GraphQL errors."""
+
+    def __init__(self, message: str, status: int = 0):
+        super().__init__(message)
+        self.status = status
+
+
+def get_linear_api_url() -> str:
+    """GraphQL endpoint (LINEAR_API_URL overrides the public API)."""
+    return os.environ.get("LINEAR_API_URL") or LINEAR_GRAPHQL_URL
+
+
+class LinearGraphQLClient:
+    """
+    Minimal Linear GraphQL client.
+
+    Requests run in a worker thread so awaiting them never blocks the event
+    loop. Rate limits, transient 5xx and connection errors are retried with
+    exponential backoff (honouring Retry-After).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        url: str | None = None,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+    ):
+        self.api_key = api_key
+        self.url = url or get_linear_api_url()
+        self.timeout = timeout
+        self.max_retries = max(1, max_retries)
+
+    def _post(self, payload: bytes) -> tuple[int, dict[str, str], bytes]:
+        request = urllib.request.Request(
+            self.url,
+            data=payload,
+            method="POST",
+            headers={
+                # Personal API keys are sent as-is (no Bearer prefix)
+                "Authorization": self.api_key,
+                "Content-Type": "application/json",
+            },
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.status, dict(response.headers), response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, dict(e.headers or {}), e.read()
+
+    async def execute(
+        self, query: str, variables: dict | None = None, partial: bool = False
+    ) -> dict:
+        """
+        Execute a GraphQL document and return its ``data``.
+
+        Args:
+            query: GraphQL document
+            variables: Variables for the document
+            partial: Return ``data`` even if the response also has errors.
+                Fields that failed are null in it; the rest were applied.
+
+        Raises:
+            LinearSyncError: On HTTP errors after retries or GraphQL errors
+                (with partial=True, only when there is no data at all)
+        """
+        payload = json.dumps({"query": query, "variables": variables or {}}).encode(
+            "utf-8"
+        )
+
+        for attempt in range(self.max_retries):
+            last_attempt = attempt == self.max_retries - 1
+            try:
+                status, headers, body = await asyncio.to_thread(self._post, payload)
+            except OSError as e:
+                if last_attempt:
+                    raise LinearSyncError(f"Linear API unreachable: {e}") from e
+                await asyncio.sleep(2**attempt)
+                continue
+
+            if status in RETRYABLE_STATUSES and not last_attempt:
+                wait_time = parse_retry_after(headers.get("Retry-After"))
+                await asyncio.sleep(2**attempt if wait_time is None else wait_time)
+                continue
+
+            text = body.decode("utf-8", errors="replace")
+            if status >= 400:
+                raise LinearSyncError(f"Linear API error {status}: {text}", status)
+            try:
+                result = json.loads(text)
+            except json.JSONDecodeError as e:
+                raise LinearSyncError(f"Invalid JSON response from Linear: {e}") from e
+            if result.get("errors"):
+                messages = "; ".join(
+                    str(err.get("message", err)) for err in result["errors"]
+                )
+                data = result.get("data")
+                if not partial or not isinstance(data, dict):
+                    raise LinearSyncError(f"Linear GraphQL error: {messages}", status)
+                print(f"Linear GraphQL errors (partial result): {messages}")
+                return data
+            return result.get("data") or {}
+
+        # Should not reach here, but just in case
+        raise LinearSyncError(f"No response after {self.max_retries} retries")
+
+
+class LinearOutbox:
+    """
+    Durable per-spec queue of pending Linear updates.
+
+    File layout:
+        {
+          "issues": {"VAL-123": {"status": "In Review", "comments": ["..."]}},
+          "state_ids": {"VAL-123": {"In Review": "<workflow state id>"}}
+        }
+
+    Issues may also carry ``status_rejections`` and ``comment_rejections``
+    (one count per leading comment): how often Linear rejected them.
+    """
+
+    def __init__(self, spec_dir: Path):
+        self.path = Path(spec_dir) / LINEAR_OUTBOX_FILE
+        # Held for a whole flush so two flushes never send the same updates
+        self.flush_lock_path = self.path.with_name(f"{LINEAR_OUTBOX_FILE}.flush")
+
+    def load(self) -> dict[str, Any]:
+        if not self.path.exists():
+            return {"issues": {}, "state_ids": {}}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            return {"issues": {}, "state_ids": {}}
+        data.setdefault("issues", {})
+        data.setdefault("state_ids", {})
+        return data
+
+    def save(self, data: dict[str, Any]) -> None:
+        # Drop issues with nothing left to send
+        data["issues"] = {
+            issue: entry
+            for issue, entry in data["issues"].items()
+            if entry.get("status") or entry.get("comments")
+        }
+        write_json_atomic(self.path, data)
+
+    @contextmanager
+    def locked(self) -> Iterator[dict[str, Any]]:
+        """Load the outbox under a cross-process lock and save it on exit."""
+        with FileLock(self.path, timeout=OUTBOX_LOCK_TIMEOUT):
+            data = self.load()
+            yield data
+            self.save(data)
+
+    def _entry(self, data: dict, issue_id: str) -> dict:
+        return data["issues"].setdefault(issue_id, {"status": None, "comments": []})
+
+    def queue_status(self, issue_id: str, status: str) -> None:
+        """Queue a status change; replaces any pending status for the issue."""
+        with self.locked() as data:
+            entry = self._entry(data, issue_id)
+            entry["status"] = status
+            entry.pop("status_rejections", None)
+
+    def queue_comment(self, issue_id: str, body: str) -> None:
+        """Queue a comment (comments are delivered in order)."""
+        with self.locked() as data:
+            self._entry(data, issue_id)["comments"].append(body)
+
+    def pending(self) -> dict[str, dict]:
+        """Pending updates keyed by issue ID."""
+        return self.load()["issues"]
+
+    def is_empty(self) -> bool:
+        return not self.pending()
+
+
+def build_sync_mutation(
+    updates: dict[str, dict], state_ids: dict[str, dict[str, str]]
+) -> tuple[str, dict[str, str]]:
+    """
+    Build one aliased mutation document for all pending updates.
+
+    Values are passed as variables, never interpolated into the document.
+
+    Returns:
+        (document, variables)
+    """
+    declarations: list[str] = []
+    fields: list[str] = []
+    variables: dict[str, str] = {}
+
+    for index, (issue_id, entry) in enumerate(updates.items()):
+        issue_var = f"i{index}"
+        declarations.append(f"${issue_var}: String!")
+        variables[issue_var] = issue_id
+
+        status = entry.get("status")
+        if status:
+            state_var = f"s{index}"
+            declarations.append(f"${state_var}: String!")
+            variables[state_var] = state_ids[issue_id][status]
+            fields.append(
+                f"  u{index}: issueUpdate(id: ${issue_var}, input: {{stateId: ${state_var}}}) "
+                "{ success }"
+            )
+
+        for position, body in enumerate(entry.get("comments", [])):
+            body_var = f"b{index}_{position}"
+            declarations.append(f"${body_var}: String!")
+            variables[body_var] = body
+            fields.append(
+                f"  c{index}_{position}: commentCreate(input: {{issueId: ${issue_var}, "
+                f"body: ${body_var}}}) {{ success }}"
+            )
+
+    document = (
+        f"mutation LinearSync({', '.join(declarations)}) {{\n"
+        + "\n".join(fields)
+        + "\n}"
+    )
+    return document, variables
+
+
+class LinearSyncEngine:
+    """
+    Queues and flushes Linear updates for one spec.
+
+    Usage:
+        engine = LinearSyncEngine(spec_dir, api_key)
+        engine.queue_status("VAL-123", "In Progress")
+        engine.queue_comment("VAL-123", "Build started")
+        await engine.flush()  # one batched mutation
+    """
+
+    def __init__(
+        self,
+        spec_dir: Path,
+        api_key: str,
+        client: LinearGraphQLClient | None = None,
+    ):
+        self.spec_dir = Path(spec_dir)
+        self.outbox = LinearOutbox(self.spec_dir)
+        self.client = client or LinearGraphQLClient(api_key)
+
+    def queue_status(self, issue_id: str, status: str) -> None:
+        self.outbox.queue_status(issue_id, status)
+
+    def queue_comment(self, issue_id: str, body: str) -> None:
+        self.outbox.queue_comment(issue_id, body)
+
+    async def _resolve_state_ids(
+        self, updates: dict[str, dict], state_ids: dict[str, dict[str, str]]
+    ) -> set[str]:
+        """
+        Look up workflow state IDs for issues not yet cached (one query).
+
+        Returns:
+            Issues whose queued status is not a workflow state of their team
+            (or that Linear did not return)
+        """
+        missing = [
+            issue_id
+            for issue_id, entry in updates.items()
+            if entry.get("status")
+            and entry["status"] not in state_ids.get(issue_id, {})
+        ]
+        if not missing:
+            return set()
+
+        declarations = ", ".join(f"$i{n}: String!" for n in range(len(missing)))
+        fields = "\n".join(
+            f"  q{n}: issue(id: $i{n}) {{ {_STATES_QUERY_FIELDS} }}"
+            for n in range(len(missing))
+        )
+        data = await self.client.execute(
+            f"query LinearSyncStates({declarations}) {{\n{fields}\n}}",
+            {f"i{n}": issue_id for n, issue_id in enumerate(missing)},
+            partial=True,
+        )
+        for n, issue_id in enumerate(missing):
+            nodes = ((data.get(f"q{n}") or {}).get("team") or {}).get("states") or {}
+            state_ids[issue_id] = {
+                node["name"]: node["id"] for node in nodes.get("nodes", [])
+            }
+
+        return {
+            issue_id
+            for issue_id in missing
+            if updates[issue_id]["status"] not in state_ids[issue_id]
+        }
+
+    async def flush(self) -> bool:
+        """
+        Deliver all pending updates in one batched mutation.
+
+        Returns:
+            True if the outbox is empty afterwards, False if updates remain
+            queued (they are retried on the next flush)
+        """
+        try:
+            async with FileLock(
+                self.outbox.flush_lock_path, timeout=FLUSH_LOCK_TIMEOUT
+            ):
+                return await self._flush()
+        except FileLockTimeout:
+            print("Linear sync: another flush is still running (updates kept)")
+            return False
+
+    async def _flush(self) -> bool:
+        data = self.outbox.load()
+        updates = data["issues"]
+        if not updates:
+            return True
+
+        try:
+            unknown = await self._resolve_state_ids(updates, data["state_ids"])
+            # Statuses without a workflow state are dropped below; the
+            # issue's comments and all other issues are still sent
+            sendable = {
+                issue_id: {**entry, "status": None} if issue_id in unknown else entry
+                for issue_id, entry in updates.items()
+            }
+            result = {}
+            if any(e.get("status") or e.get("comments") for e in sendable.values()):
+                document, variables = build_sync_mutation(sendable, data["state_ids"])
+                result = await self.client.execute(document, variables, partial=True)
+        except LinearSyncError as e:
+            print(f"Linear sync failed (updates kept for retry): {e}")
+            return False
+
+        # Aliases match build_sync_mutation: u<issue> and c<issue>_<comment>
+        delivered = {
+            alias for alias, value in result.items() if (value or {}).get("success")
+        }
+        failed, dropped = [], []
+
+        # Remove only what Linear confirmed; anything queued meanwhile stays
+        with self.outbox.locked() as current:
+            current["state_ids"] = data["state_ids"]
+            for index, (issue_id, sent) in enumerate(sendable.items()):
+                entry = current["issues"].get(issue_id)
+                if entry is None:
+                    continue
+                queued_status = updates[issue_id].get("status")
+                same_status = entry.get("status") == queued_status
+
+                if issue_id in unknown:
+                    if same_status:
+                        entry["status"] = None
+                        dropped.append(
+                            f"{issue_id} status '{queued_status}' (no such "
+                            "workflow state)"
+                        )
+                elif sent.get("status") and same_status:
+                    if f"u{index}" in delivered:
+                        entry["status"] = None
+                        entry.pop("status_rejections", None)
+                    else:
+                        rejections = entry.get("status_rejections", 0) + 1
+                        if rejections >= MAX_REJECTIONS:
+                            entry["status"] = None
+                            entry.pop("status_rejections", None)
+                            dropped.append(
+                                f"{issue_id} status '{queued_status}' "
+                                f"(rejected {rejections} times)"
+                            )
+                        else:
+                            entry["status_rejections"] = rejections
+                            failed.append(f"u{index}")
+
+                sent_comments = sent.get("comments", [])
+                previous = sent.get("comment_rejections", [])
+                kept, kept_rejections = [], []
+                for position, body in enumerate(sent_comments):
+                    if f"c{index}_{position}" in delivered:
+                        continue
+                    rejections = (
+                        previous[position] if position < len(previous) else 0
+                    ) + 1
+                    if rejections >= MAX_REJECTIONS:
+                        dropped.append(
+                            f"{issue_id} comment (rejected {rejections} times)"
+                        )
+                        continue
+                    failed.append(f"c{index}_{position}")
+                    kept.append(body)
+                    kept_rejections.append(rejections)
+                # Queueing only appends, so the sent comments are a prefix
+                entry["comments"] = (
+                    kept + entry.get("comments", [])[len(sent_comments) :]
+                )
+                if kept_rejections:
+                    entry["comment_rejections"] = kept_rejections
+                else:
+                    entry.pop("comment_rejections", None)
+
+        if failed:
+            print(f"Linear sync: operations not applied (kept): {', '.join(failed)}")
+        for reason in dropped:
+            print(f"Linear sync: dropped {reason}")
+        return self.outbox.is_empty()
@@ -2,9 +2,14 @@
 Linear Updater - Python-Orchestrated Linear Updates
 ====================================================
 
-Provides reliable Linear updates via focused mini-agent calls.
-Instead of relying on agents to remember Linear updates in long prompts,
-the Python orchestrator triggers small, focused agents at key transitions.
+Provides reliable Linear updates at key transitions, triggered by the
+Python orchestrator instead of relying on agents to remember Linear
+updates in long prompts.
+
+Status changes and progress comments are sent directly over GraphQL by
+the batched sync engine (sync.py). Free-form operations such as creating
+the task still use a small, focused mini-agent. Set LINEAR_SYNC_MODE=agent
+to route every update through the agent instead.
 
 Design Principles:
 - ONE task per spec (not one issue per subtask)
@@ -29,6 +34,8 @@ from typing import Optional
 
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 
+from .sync import LinearSyncEngine
+
 # Linear status constants (matching Valma AI team setup)
 STATUS_TODO = "Todo"
 STATUS_IN_PROGRESS = "In Progress"
@@ -108,6 +115,44 @@ def get_linear_api_key() -> str:
     return os.environ.get("LINEAR_API_KEY", "")
 
 
+def use_direct_sync() -> bool:
+    """Check if routine updates go through the direct GraphQL sync engine."""
+    return os.environ.get("LINEAR_SYNC_MODE", "direct").strip().lower() != "agent"
+
+
+async def _sync_transition(
+    spec_dir: Path,
+    new_status: str | None = None,
+    comments: list[str] | None = None,
+) -> bool:
+    """
+    Queue a status change and/or comments in the outbox and flush them
+    as one batched mutation.
+
+    Anything that fails to deliver stays in the outbox and goes out with
+    the next transition.
+    """
+    state = LinearTaskState.load(spec_dir)
+    if not state or not state.task_id:
+        print("No Linear task found for this spec")
+        return False
+
+    engine = LinearSyncEngine(spec_dir, get_linear_api_key())
+    if new_status and state.status != new_status:
+        engine.queue_status(state.task_id, new_status)
+    for comment in comments or []:
+        engine.queue_comment(state.task_id, comment)
+
+    if not await engine.flush():
+        return False
+
+    if new_status and state.status != new_status:
+        state.status = new_status
+        state.save(spec_dir)
+        print(f"Updated Linear task {state.task_id} to: {new_status}")
+    return True
+
+
 def _create_linear_client() -> ClaudeSDKClient:
     """
     Create a minimal Claude client with only Linear MCP tools.
@@ -283,6 +328,9 @@ async def update_linear_status(
     if state.status == new_status:
         return True
 
+    if use_direct_sync():
+        return await _sync_transition(spec_dir, new_status)
+
     prompt = f"""Update Linear issue status:
 
 1. First, use mcp__linear-server__list_issue_statuses with teamId: "{state.team_id}" to find the state ID for "{new_status}"
@@ -325,6 +373,9 @@ async def add_linear_comment(
         print("No Linear task found for this spec")
         return False
 
+    if use_direct_sync():
+        return await _sync_transition(spec_dir, comments=[comment])
+
     # Escape any quotes in the comment
     safe_comment = comment.replace('"', '\\"').replace("\n", "\\n")
 
@@ -348,15 +399,27 @@ Confirm when done.
 # === Convenience functions for specific transitions ===
 
 
+async def _transition(spec_dir: Path, new_status: str, comment: str) -> bool:
+    """Move the task to a new status and record why."""
+    if not is_linear_enabled():
+        return False
+    if use_direct_sync():
+        return await _sync_transition(spec_dir, new_status, [comment])
+
+    success = await update_linear_status(spec_dir, new_status)
+    if success:
+        await add_linear_comment(spec_dir, comment)
+    return success
+
+
 async def linear_task_started(spec_dir: Path) -> bool:
     """
     Mark task as started (In Progress).
     Called when planner session begins.
     """
-    success = await update_linear_status(spec_dir, STATUS_IN_PROGRESS)
-    if success:
-        await add_linear_comment(spec_dir, "Build started - planning phase initiated")
-    return success
+    return await _transition(
+        spec_dir, STATUS_IN_PROGRESS, "Build started - planning phase initiated"
+    )
 
 
 async def linear_subtask_completed(
@@ -401,10 +464,7 @@ async def linear_qa_started(spec_dir: Path) -> bool:
     Mark task as In Review for QA phase.
     Called when QA validation loop starts.
     """
-    success = await update_linear_status(spec_dir, STATUS_IN_REVIEW)
-    if success:
-        await add_linear_comment(spec_dir, "QA validation started")
-    return success
+    return await _transition(spec_dir, STATUS_IN_REVIEW, "QA validation started")
 
 
 async def linear_qa_approved(spec_dir: Path) -> bool:
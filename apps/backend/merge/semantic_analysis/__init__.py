@@ -5,8 +5,19 @@ This package provides modular semantic analysis capabilities:
 - models.py: Data structures for extracted elements
 - comparison.py: Element comparison and change classification
 - regex_analyzer.py: Regex-based analysis for code changes
+- parser_analyzer.py: Parser-backed analysis (symbol table diffs)
+- python_parser.py: Python symbol extraction via ast
+- cache.py: Content-hash cache of analysis results
 """
 
+from .cache import AnalysisCache, content_hash
 from .models import ExtractedElement
+from .parser_analyzer import analyze_with_parser, register_parser
 
-__all__ = ["ExtractedElement"]
+__all__ = [
+    "AnalysisCache",
+    "ExtractedElement",
+    "analyze_with_parser",
+    "content_hash",
+    "register_parser",
+]
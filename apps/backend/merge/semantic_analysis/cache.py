@@ -0,0 +1,72 @@
+"""
+Content-addressed cache for semantic analysis results.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
+from ..types import FileAnalysis
+
+DEFAULT_MAX_ENTRIES = 512
+
+
+def content_hash(text: str) -> str:
+    """Git blob OID of the text (as `git hash-object` would compute it)."""
+    data = text.encode("utf-8", errors="surrogatepass")
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+class AnalysisCache:
+    """
+    LRU cache of FileAnalysis results keyed by (before blob, after blob, ext).
+
+    The analysis of a pair of file versions depends only on their contents
+    and the language, so repeated merge previews and merges of the same
+    versions reuse the first result. Entries are copied on the way in and
+    out; callers may mutate what they get back.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str, str], FileAnalysis] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(before: str, after: str, ext: str) -> tuple[str, str, str]:
+        return (content_hash(before), content_hash(after), ext)
+
+    def get(self, key: tuple[str, str, str], file_path: str) -> FileAnalysis | None:
+        """Cached analysis for the key, relabelled with file_path."""
+        with self._lock:
+            analysis = self._entries.get(key)
+            if analysis is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        result = copy.deepcopy(analysis)
+        result.file_path = file_path
+        return result
+
+    def put(self, key: tuple[str, str, str], analysis: FileAnalysis) -> None:
+        stored = copy.deepcopy(analysis)
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -5,6 +5,7 @@ Element comparison and change classification logic.
 from __future__ import annotations
 
 import re
+from typing import Any
 
 from ..types import ChangeType, SemanticChange
 from .models import ExtractedElement
@@ -65,8 +66,9 @@ def compare_elements(
             )
 
         elif elem_before and elem_after:
-            # Element exists in both - check if modified
-            if elem_before.content != elem_after.content:
+            # Element exists in both - check if modified. Parsers can supply
+            # a narrower compare_text (e.g. a class without its methods).
+            if _compare_text(elem_before) != _compare_text(elem_after):
                 change_type = classify_modification(elem_before, elem_after, ext)
                 changes.append(
                     SemanticChange(
@@ -83,6 +85,17 @@ def compare_elements(
     return changes
 
 
+def _compare_text(element: ExtractedElement) -> str:
+    text = _metadata(element, "compare_text")
+    return element.content if text is None else text
+
+
+def _metadata(element: ExtractedElement, key: str) -> Any:
+    """Metadata value; parsers may defer costly values as zero-arg callables."""
+    value = element.metadata.get(key)
+    return value() if callable(value) else value
+
+
 def get_add_change_type(element_type: str) -> ChangeType:
     """
     Map element type to add change type.
@@ -160,12 +173,33 @@ def classify_modification(
     """
     element_type = after.element_type
 
+    # Parser-backed elements carry a structural fingerprint; an unchanged
+    # fingerprint means only whitespace, comments or layout changed
+    fingerprint = _metadata(before, "fingerprint")
+    if fingerprint is not None and fingerprint == _metadata(after, "fingerprint"):
+        return ChangeType.FORMATTING_ONLY
+
+    decorators_before = _metadata(before, "decorators")
+    decorators_after = _metadata(after, "decorators")
+    if (
+        decorators_before is not None
+        and decorators_before != decorators_after
+        and _metadata(before, "body_fingerprint")
+        == _metadata(after, "body_fingerprint")
+    ):
+        if set(decorators_after or []) - set(decorators_before):
+            return ChangeType.ADD_DECORATOR
+        return ChangeType.REMOVE_DECORATOR
+
     if element_type == "import":
         return ChangeType.MODIFY_IMPORT
 
     if element_type in {"function", "method"}:
         # Analyze the function content for specific changes
-        return classify_function_modification(before.content, after.content, ext)
+        change_type = classify_function_modification(before.content, after.content, ext)
+        if element_type == "method" and change_type == ChangeType.MODIFY_FUNCTION:
+            return ChangeType.MODIFY_METHOD
+        return change_type
 
     if element_type == "class":
         return ChangeType.MODIFY_CLASS
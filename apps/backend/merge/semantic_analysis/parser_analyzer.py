@@ -0,0 +1,134 @@
+"""
+Parser-backed semantic analysis for code changes.
+
+Extracts the top-level symbols of both file versions with a real parser,
+diffs the two symbol tables (see comparison.py) and reports the result as
+SemanticChanges. Python uses the standard library ``ast`` module; parsers
+for other languages (e.g. a tree-sitter grammar for JS/TS) plug in through
+register_parser(). Files without a parser, or that fail to parse, return
+None so the caller can fall back to the regex analyzer.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Iterable
+
+from ..types import ChangeType, FileAnalysis
+from .comparison import compare_elements
+from .models import ExtractedElement
+from .python_parser import extract_python_elements
+
+# source -> {key: element}; raises on unparsable input
+ElementExtractor = Callable[[str], dict[str, ExtractedElement]]
+
+_PARSERS: dict[str, ElementExtractor] = {".py": extract_python_elements}
+
+_FUNCTION_CHANGES = {
+    ChangeType.MODIFY_FUNCTION,
+    ChangeType.MODIFY_METHOD,
+    ChangeType.ADD_HOOK_CALL,
+    ChangeType.REMOVE_HOOK_CALL,
+    ChangeType.WRAP_JSX,
+    ChangeType.UNWRAP_JSX,
+    ChangeType.MODIFY_JSX_PROPS,
+    ChangeType.ADD_DECORATOR,
+    ChangeType.REMOVE_DECORATOR,
+}
+
+
+def register_parser(extensions: Iterable[str], extractor: ElementExtractor) -> None:
+    """
+    Register a symbol extractor for file extensions (".ts", ".tsx", ...).
+
+    The extractor receives the file source and returns ExtractedElements
+    keyed by "<element_type>:<name>". Any exception it raises makes the
+    analyzer fall back to regex analysis for that file.
+    """
+    for ext in extensions:
+        _PARSERS[ext.lower()] = extractor
+
+
+def get_parser(ext: str) -> ElementExtractor | None:
+    return _PARSERS.get(ext.lower())
+
+
+def parser_extensions() -> set[str]:
+    return set(_PARSERS)
+
+
+def analyze_with_parser(
+    file_path: str,
+    before: str,
+    after: str,
+    ext: str,
+) -> FileAnalysis | None:
+    """
+    Analyze code changes by diffing parsed symbol tables.
+
+    Args:
+        file_path: Path to the file being analyzed
+        before: Content before changes
+        after: Content after changes
+        ext: File extension
+
+    Returns:
+        FileAnalysis, or None if no parser handles the extension or either
+        version fails to parse
+    """
+    extractor = get_parser(ext)
+    if extractor is None:
+        return None
+
+    before = before.replace("\r\n", "\n").replace("\r", "\n")
+    after = after.replace("\r\n", "\n").replace("\r", "\n")
+    try:
+        elements_before = extractor(before)
+        elements_after = extractor(after)
+    except Exception:
+        return None
+
+    changes = compare_elements(elements_before, elements_after, ext)
+    for change in changes:
+        if change.change_type in (ChangeType.ADD_IMPORT, ChangeType.REMOVE_IMPORT):
+            # Same location as the regex analyzer, so different imports
+            # added by two tasks group together and combine
+            change.location = "file_top"
+    changes.sort(key=lambda c: (c.line_start, c.location, c.change_type.value))
+
+    analysis = FileAnalysis(file_path=file_path, changes=changes)
+    _summarize(analysis)
+    analysis.total_lines_changed = count_changed_lines(before, after)
+    return analysis
+
+
+def _summarize(analysis: FileAnalysis) -> None:
+    for change in analysis.changes:
+        change_type = change.change_type
+        if change_type == ChangeType.ADD_IMPORT:
+            analysis.imports_added.add(change.target)
+        elif change_type == ChangeType.REMOVE_IMPORT:
+            analysis.imports_removed.add(change.target)
+        elif change_type in (ChangeType.ADD_FUNCTION, ChangeType.ADD_METHOD):
+            analysis.functions_added.add(change.target)
+        elif change_type in _FUNCTION_CHANGES:
+            analysis.functions_modified.add(change.target)
+        elif change_type == ChangeType.MODIFY_CLASS:
+            analysis.classes_modified.add(change.target)
+
+        if change.location.startswith("method:"):
+            analysis.classes_modified.add(change.target.split(".")[0])
+
+
+def count_changed_lines(before: str, after: str) -> int:
+    """
+    Approximate added + removed lines without computing a diff.
+
+    Compares line multisets, which is linear in file size; lines that only
+    moved are not counted.
+    """
+    lines_before = Counter(before.splitlines())
+    lines_after = Counter(after.splitlines())
+    return sum((lines_before - lines_after).values()) + sum(
+        (lines_after - lines_before).values()
+    )
@@ -0,0 +1,196 @@
+"""
+Python symbol extraction using the standard library ``ast`` module.
+"""
+
+from __future__ import annotations
+
+import ast
+from functools import partial
+
+from .models import ExtractedElement
+
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def extract_python_elements(source: str) -> dict[str, ExtractedElement]:
+    """
+    Extract top-level symbols from Python source.
+
+    Produces imports, functions, classes, the methods of top-level classes
+    and module-level variables, keyed by "<element_type>:<name>".
+
+    Element metadata carries what comparison.py needs to classify changes:
+    ``fingerprint`` (AST dump, ignores formatting and comments),
+    ``body_fingerprint`` and ``decorators`` for functions and methods, and
+    ``compare_text`` for classes (the class text without its methods, so a
+    method edit is reported once, as a method change). Fingerprints and
+    decorators are computed on demand: only elements whose text changed
+    need them, and ast.dump dominates the cost otherwise.
+
+    Args:
+        source: Python source code
+
+    Returns:
+        Dict of key -> ExtractedElement
+
+    Raises:
+        SyntaxError: If the source does not parse
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    elements: dict[str, ExtractedElement] = {}
+
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            statement = ast.unparse(node)
+            _add(
+                elements,
+                ExtractedElement(
+                    element_type="import",
+                    name=statement,
+                    start_line=node.lineno,
+                    end_line=node.end_lineno,
+                    content=_text(lines, node.lineno, node.end_lineno),
+                    metadata={"fingerprint": statement},
+                ),
+            )
+        elif isinstance(node, _FUNCTION_NODES):
+            _add(elements, _function_element(lines, node, "function", node.name))
+        elif isinstance(node, ast.ClassDef):
+            _add_class(elements, lines, node)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    _add(
+                        elements,
+                        ExtractedElement(
+                            element_type="variable",
+                            name=target.id,
+                            start_line=node.lineno,
+                            end_line=node.end_lineno,
+                            content=_text(lines, node.lineno, node.end_lineno),
+                            metadata={"fingerprint": partial(ast.dump, node)},
+                        ),
+                    )
+
+    return elements
+
+
+def _text(lines: list[str], start: int, end: int) -> str:
+    return "".join(lines[start - 1 : end])
+
+
+def _start_line(node: ast.AST) -> int:
+    decorators = getattr(node, "decorator_list", [])
+    return min([node.lineno] + [d.lineno for d in decorators])
+
+
+def _function_element(
+    lines: list[str],
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+    element_type: str,
+    name: str,
+    parent: str | None = None,
+) -> ExtractedElement:
+    start = _start_line(node)
+    return ExtractedElement(
+        element_type=element_type,
+        name=name,
+        start_line=start,
+        end_line=node.end_lineno,
+        content=_text(lines, start, node.end_lineno),
+        parent=parent,
+        metadata={
+            "fingerprint": partial(ast.dump, node),
+            "body_fingerprint": partial(_undecorated_dump, node),
+            "decorators": partial(_decorators, node),
+        },
+    )
+
+
+def _undecorated_dump(node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
+    return ast.dump(type(node)(**{**_fields(node), "decorator_list": []}))
+
+
+def _decorators(node: ast.FunctionDef | ast.AsyncFunctionDef) -> list[str]:
+    return [ast.unparse(d) for d in node.decorator_list]
+
+
+def _fields(node: ast.AST) -> dict:
+    return {field: getattr(node, field, None) for field in node._fields}
+
+
+def _add_class(
+    elements: dict[str, ExtractedElement], lines: list[str], node: ast.ClassDef
+) -> None:
+    start = _start_line(node)
+    methods = [child for child in node.body if isinstance(child, _FUNCTION_NODES)]
+
+    # Class text with the method spans (and the blank lines between
+    # methods) cut out
+    method_lines: set[int] = set()
+    for method in methods:
+        method_lines.update(range(_start_line(method), method.end_lineno + 1))
+    compare_text = "".join(
+        lines[i - 1]
+        for i in range(start, node.end_lineno + 1)
+        if i not in method_lines and lines[i - 1].strip()
+    )
+    skeleton = ast.ClassDef(
+        **{
+            **_fields(node),
+            "body": [
+                child for child in node.body if not isinstance(child, _FUNCTION_NODES)
+            ],
+        }
+    )
+
+    _add(
+        elements,
+        ExtractedElement(
+            element_type="class",
+            name=node.name,
+            start_line=start,
+            end_line=node.end_lineno,
+            content=_text(lines, start, node.end_lineno),
+            metadata={
+                "fingerprint": partial(ast.dump, skeleton),
+                "compare_text": compare_text,
+            },
+        ),
+    )
+    for method in methods:
+        _add(
+            elements,
+            _function_element(
+                lines, method, "method", f"{node.name}.{method.name}", node.name
+            ),
+        )
+
+
+def _add(elements: dict[str, ExtractedElement], element: ExtractedElement) -> None:
+    """
+    Add an element, merging redefinitions of the same name.
+
+    Property getters/setters and conditional redefinitions share a name;
+    they are tracked as one element spanning all definitions.
+    """
+    key = f"{element.element_type}:{element.name}"
+    existing = elements.get(key)
+    if existing is None:
+        elements[key] = element
+        return
+
+    existing.end_line = max(existing.end_line, element.end_line)
+    existing.content += element.content
+    for field, value in element.metadata.items():
+        if field in existing.metadata:
+            existing.metadata[field] = partial(_concat, existing.metadata[field], value)
+
+
+def _concat(first, second):
+    """Concatenate two (possibly deferred) metadata values."""
+    first = first() if callable(first) else first
+    second = second() if callable(second) else second
+    return first + second
@@ -2,11 +2,15 @@
 Semantic Analyzer
 =================
 
-Analyzes code changes at a semantic level using regex-based heuristics.
+Analyzes code changes at a semantic level.
 
 This module provides analysis of code changes, extracting meaningful
 semantic changes like "added import", "modified function", "wrapped JSX element"
 rather than line-level diffs.
+
+Files with a registered parser (Python via ast) are analyzed by diffing
+their symbol tables; everything else, and files that fail to parse, use
+regex-based heuristics. Results are cached by content hash.
 """
 
 from __future__ import annotations
@@ -42,14 +46,23 @@ except ImportError:
 logger = logging.getLogger(__name__)
 MODULE = "merge.semantic_analyzer"
 
-# Import regex-based analyzer
+# Import parser-backed and regex-based analyzers
+from .semantic_analysis.cache import AnalysisCache
 from .semantic_analysis.models import ExtractedElement
+from .semantic_analysis.parser_analyzer import analyze_with_parser, parser_extensions
 from .semantic_analysis.regex_analyzer import analyze_with_regex
 
+# Shared by all analyzers, so repeated previews/merges of the same file
+# versions are analyzed once per process
+_shared_cache = AnalysisCache()
+
 
 class SemanticAnalyzer:
     """
-    Analyzes code changes at a semantic level using regex-based heuristics.
+    Analyzes code changes at a semantic level.
+
+    Uses a parser-backed analyzer where one is registered for the file
+    type and regex-based heuristics otherwise.
 
     Example:
         analyzer = SemanticAnalyzer()
@@ -58,9 +71,15 @@ class SemanticAnalyzer:
             print(f"{change.change_type.value}: {change.target}")
     """
 
-    def __init__(self):
-        """Initialize the analyzer."""
-        debug(MODULE, "Initializing SemanticAnalyzer (regex-based)")
+    def __init__(self, cache: AnalysisCache | None = None):
+        """
+        Initialize the analyzer.
+
+        Args:
+            cache: Result cache (defaults to the process-wide cache)
+        """
+        self.cache = cache if cache is not None else _shared_cache
+        debug(MODULE, "Initializing SemanticAnalyzer")
 
     def analyze_diff(
         self,
@@ -93,12 +112,23 @@ class SemanticAnalyzer:
             task_id=task_id,
         )
 
-        # Use regex-based analysis
-        analysis = analyze_with_regex(file_path, before, after, ext)
+        cache_key = self.cache.key(before, after, ext)
+        cached = self.cache.get(cache_key, file_path)
+        if cached is not None:
+            debug_detailed(MODULE, f"Cache hit for {file_path}")
+            return cached
+
+        analysis = analyze_with_parser(file_path, before, after, ext)
+        analyzer = "parser"
+        if analysis is None:
+            analysis = analyze_with_regex(file_path, before, after, ext)
+            analyzer = "regex"
+        self.cache.put(cache_key, analysis)
 
         debug_success(
             MODULE,
             f"Analysis complete for {file_path}",
+            analyzer=analyzer,
             changes_found=len(analysis.changes),
             functions_modified=len(analysis.functions_modified),
             functions_added=len(analysis.functions_added),
@@ -137,7 +167,7 @@ class SemanticAnalyzer:
     @property
     def supported_extensions(self) -> set[str]:
         """Get the set of supported file extensions."""
-        return {".py", ".js", ".jsx", ".ts", ".tsx"}
+        return {".py", ".js", ".jsx", ".ts", ".tsx"} | parser_extensions()
 
     def is_supported(self, file_path: str) -> bool:
         """Check if a file type is supported for semantic analysis."""
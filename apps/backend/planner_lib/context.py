@@ -6,6 +6,7 @@ import json
 import re
 from pathlib import Path
 
+from core.project_index import ProjectIndex
 from implementation_plan import WorkflowType
 
 from .models import PlannerContext
@@ -46,14 +47,9 @@ class ContextLoader:
         )
 
         # Read project_index.json
-        index_file = self.spec_dir / "project_index.json"
-        project_index = {}
-        if index_file.exists():
-            try:
-                with open(index_file, encoding="utf-8") as f:
-                    project_index = json.load(f)
-            except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-                pass  # Use empty dict on error
+        index = ProjectIndex.for_file(self.spec_dir / "project_index.json")
+        # Use empty dict on error
+        project_index = index.data() if index.exists() else {}
 
         # Read context.json
         context_file = self.spec_dir / "context.json"
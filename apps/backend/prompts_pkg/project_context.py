@@ -10,29 +10,28 @@ for tools relevant to their project type (Electron, Expo, Next.js, etc.),
 saving context window and keeping agents focused.
 """
 
-import json
 from pathlib import Path
 
+from core.project_index import ProjectIndex
+
 
 def load_project_index(project_dir: Path) -> dict:
     """
     Load project_index.json from the project's .auto-claude directory.
 
+    The index is shared through ProjectIndex and only re-parsed when the
+    file changes, so the returned dict must not be mutated.
+
     Args:
         project_dir: Root directory of the project
 
     Returns:
         Parsed project index dict, or empty dict if not found
     """
-    index_file = project_dir / ".auto-claude" / "project_index.json"
-    if not index_file.exists():
-        return {}
-
-    try:
-        with open(index_file, encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+    index = ProjectIndex.for_project(project_dir)
+    if not index.exists():
         return {}
+    return index.data()
 
 
 def detect_project_capabilities(project_index: dict) -> dict:
@@ -12,11 +12,7 @@ import re
 import subprocess
 from pathlib import Path
 
-from .project_context import (
-    detect_project_capabilities,
-    get_mcp_tools_for_project,
-    load_project_index,
-)
+from core.project_index import ProjectIndex
 
 
 def _validate_branch_name(branch: str | None) -> str | None:
@@ -299,9 +295,12 @@ Stuck subtasks:
         # Check for subtasks with multiple attempts
         subtasks_with_retries = []
         for subtask_id, subtask_data in history.get("subtasks", {}).items():
-            attempts = subtask_data.get("attempts", [])
-            if len(attempts) > 1 and subtask_data.get("status") != "completed":
-                subtasks_with_retries.append((subtask_id, len(attempts)))
+            # attempts keeps only the most recent ones; attempt_count is the total
+            attempt_count = subtask_data.get(
+                "attempt_count", len(subtask_data.get("attempts", []))
+            )
+            if attempt_count > 1 and subtask_data.get("status") != "completed":
+                subtasks_with_retries.append((subtask_id, attempt_count))
 
         if subtasks_with_retries:
             context = """## ⚠️ RECOVERY CONTEXT - RETRY AWARENESS
@@ -458,12 +457,11 @@ def get_qa_reviewer_prompt(spec_dir: Path, project_dir: Path) -> str:
     # Replace {{BASE_BRANCH}} placeholder with the actual base branch
     base_prompt = base_prompt.replace("{{BASE_BRANCH}}", base_branch)
 
-    # Load project index and detect capabilities
-    project_index = load_project_index(project_dir)
-    capabilities = detect_project_capabilities(project_index)
-
-    # Get list of MCP tool doc files to include
-    mcp_tool_files = get_mcp_tools_for_project(capabilities)
+    # Detect capabilities and the MCP tool doc files to include (memoized
+    # until project_index.json changes)
+    project_index = ProjectIndex.for_project(project_dir)
+    capabilities = project_index.capabilities()
+    mcp_tool_files = project_index.mcp_tools()
 
     # Load and assemble MCP tool sections
     mcp_sections = []
@@ -20,7 +20,9 @@ Module structure:
     - criteria.py: Acceptance criteria and status management
 """
 
-# Configuration constants
+import importlib
+from typing import Any
+
 # Criteria & status
 from .criteria import (
     get_qa_iteration_count,
@@ -34,13 +36,6 @@ from .criteria import (
     should_run_fixes,
     should_run_qa,
 )
-from .fixer import (
-    load_qa_fixer_prompt,
-    run_qa_fixer_session,
-)
-
-# Main loop
-from .loop import MAX_QA_ITERATIONS, run_qa_validation_loop
 
 # Report & tracking
 from .report import (
@@ -59,8 +54,16 @@ from .report import (
     record_iteration,
 )
 
-# Agent sessions
-from .reviewer import run_qa_agent_session
+# The main loop and the agent sessions import the Claude SDK and the memory
+# integrations; they are loaded on first access (see __getattr__) so status
+# checks such as `--qa-status` stay cheap.
+_LAZY_EXPORTS = {
+    "load_qa_fixer_prompt": ".fixer",
+    "run_qa_fixer_session": ".fixer",
+    "MAX_QA_ITERATIONS": ".loop",
+    "run_qa_validation_loop": ".loop",
+    "run_qa_agent_session": ".reviewer",
+}
 
 # Public API
 __all__ = [
@@ -97,3 +100,14 @@ __all__ = [
     "load_qa_fixer_prompt",
     "run_qa_fixer_session",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the agent-session exports on first access and cache them."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -5,9 +5,10 @@ QA Acceptance Criteria Handling
 Manages acceptance criteria validation and status tracking.
 """
 
-import json
+import copy
 from pathlib import Path
 
+from core.plan_store import PlanStore
 from progress import is_build_complete
 
 # =============================================================================
@@ -16,23 +17,14 @@ from progress import is_build_complete
 
 
 def load_implementation_plan(spec_dir: Path) -> dict | None:
-    """Load the implementation plan JSON."""
-    plan_file = spec_dir / "implementation_plan.json"
-    if not plan_file.exists():
-        return None
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return None
+    """Load the implementation plan JSON (a private copy, safe to modify)."""
+    return PlanStore.for_spec(spec_dir).snapshot()
 
 
 def save_implementation_plan(spec_dir: Path, plan: dict) -> bool:
-    """Save the implementation plan JSON."""
-    plan_file = spec_dir / "implementation_plan.json"
+    """Save the implementation plan JSON (atomically)."""
     try:
-        with open(plan_file, "w", encoding="utf-8") as f:
-            json.dump(plan, f, indent=2)
+        PlanStore.for_spec(spec_dir).replace(plan)
         return True
     except OSError:
         return False
@@ -45,10 +37,10 @@ def save_implementation_plan(spec_dir: Path, plan: dict) -> bool:
 
 def get_qa_signoff_status(spec_dir: Path) -> dict | None:
     """Get the current QA sign-off status from implementation plan."""
-    plan = load_implementation_plan(spec_dir)
+    plan = PlanStore.for_spec(spec_dir).plan()
     if not plan:
         return None
-    return plan.get("qa_signoff")
+    return copy.deepcopy(plan.get("qa_signoff"))
 
 
 def is_qa_approved(spec_dir: Path) -> bool:
@@ -8,6 +8,10 @@ from typing import Any
 class BaseAnalyzer:
     """Base class for all analyzers."""
 
+    # Bump when the prompt or the expected result format changes, so cached
+    # results from the previous version are re-queried
+    VERSION = 1
+
     def __init__(self, project_index: dict[str, Any]):
         """
         Initialize analyzer.
@@ -33,10 +37,31 @@ class BaseAnalyzer:
             return None
         return next(iter(services.items()))
 
+    def get_cache_inputs(self) -> Any:
+        """
+        The part of the project index this analyzer's result depends on.
+
+        Cached results are reused while these inputs (and the prompt and
+        VERSION) are unchanged. Defaults to all services.
+        """
+        return self.get_services()
+
 
 class CodeRelationshipsAnalyzer(BaseAnalyzer):
     """Analyzes code relationships and dependencies."""
 
+    def get_cache_inputs(self) -> Any:
+        """Routes and models of the first service, as used by the prompt."""
+        service_data_tuple = self.get_first_service()
+        if not service_data_tuple:
+            return None
+        service_name, service_data = service_data_tuple
+        return {
+            "service": service_name,
+            "api": service_data.get("api", {}),
+            "database": service_data.get("database", {}),
+        }
+
     def get_prompt(self) -> str:
         """Generate analysis prompt."""
         service_data_tuple = self.get_first_service()
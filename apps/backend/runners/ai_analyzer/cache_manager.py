@@ -1,8 +1,16 @@
 """
 Cache management for AI analysis results.
+
+Two layers:
+- ai_insights.json: the last complete report
+- analyzers/<name>.json: one entry per analyzer, keyed by a hash of that
+  analyzer's prompt inputs. Entries are written as soon as an analyzer
+  finishes, so an interrupted run keeps the analyzers that completed.
 """
 
+import hashlib
 import json
+import os
 import time
 from pathlib import Path
 from typing import Any
@@ -23,6 +31,7 @@ class CacheManager:
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = self.cache_dir / "ai_insights.json"
+        self.analyzer_cache_dir = self.cache_dir / "analyzers"
 
     def get_cached_result(self, skip_cache: bool = False) -> dict[str, Any] | None:
         """
@@ -59,3 +68,69 @@ class CacheManager:
         """
         self.cache_file.write_text(json.dumps(result, indent=2), encoding="utf-8")
         print(f"\n✓ AI insights cached to: {self.cache_file}")
+
+    @staticmethod
+    def analyzer_key(name: str, version: int, prompt: str, inputs: Any) -> str:
+        """
+        Content hash of everything an analyzer's result depends on.
+
+        Args:
+            name: Analyzer name
+            version: Analyzer VERSION
+            prompt: The prompt sent to Claude
+            inputs: The project index slice the analyzer reads
+
+        Returns:
+            Hex digest identifying the query
+        """
+        payload = json.dumps(
+            {"analyzer": name, "version": version, "prompt": prompt, "inputs": inputs},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_analyzer_result(self, name: str, key: str) -> dict[str, Any] | None:
+        """
+        Retrieve a cached analyzer result if its inputs are unchanged.
+
+        Args:
+            name: Analyzer name
+            key: Current analyzer_key() for the analyzer
+
+        Returns:
+            Cached result, or None if missing, stale or for other inputs
+        """
+        entry_file = self.analyzer_cache_dir / f"{name}.json"
+        try:
+            entry = json.loads(entry_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        hours_old = (time.time() - entry.get("saved_at", 0)) / 3600
+        if hours_old >= self.CACHE_VALIDITY_HOURS:
+            return None
+        return entry.get("result")
+
+    def save_analyzer_result(self, name: str, key: str, result: dict[str, Any]) -> None:
+        """
+        Save one analyzer's result.
+
+        Written to a temporary file and renamed into place, so a crash never
+        leaves a truncated entry.
+
+        Args:
+            name: Analyzer name
+            key: analyzer_key() of the inputs the result was computed from
+            result: Analyzer result
+        """
+        self.analyzer_cache_dir.mkdir(parents=True, exist_ok=True)
+        entry_file = self.analyzer_cache_dir / f"{name}.json"
+        tmp_file = entry_file.with_suffix(f".json.{os.getpid()}.tmp")
+        tmp_file.write_text(
+            json.dumps({"key": key, "saved_at": time.time(), "result": result}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_file, entry_file)
@@ -3,6 +3,7 @@ Claude SDK client wrapper for AI analysis.
 """
 
 import json
+import uuid
 from pathlib import Path
 from typing import Any
 
@@ -86,7 +87,12 @@ class ClaudeAnalysisClient:
             },
         }
 
-        settings_file = self.project_dir / ".claude_ai_analyzer_settings.json"
+        # Unique per query: analyzers run concurrently and each query
+        # deletes its settings file when done
+        settings_file = (
+            self.project_dir
+            / f".claude_ai_analyzer_settings_{uuid.uuid4().hex[:8]}.json"
+        )
         with open(settings_file, "w", encoding="utf-8") as f:
             json.dump(settings, f, indent=2)
 
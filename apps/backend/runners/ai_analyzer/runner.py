@@ -2,7 +2,9 @@
 Main orchestrator for AI-powered project analysis.
 """
 
+import asyncio
 import time
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -19,16 +21,30 @@ from .summary_printer import SummaryPrinter
 class AIAnalyzerRunner:
     """Orchestrates AI-powered project analysis."""
 
-    def __init__(self, project_dir: Path, project_index: dict[str, Any]):
+    # Concurrent Claude queries; each analyzer is an independent session
+    MAX_CONCURRENT_ANALYZERS = 3
+
+    def __init__(
+        self,
+        project_dir: Path,
+        project_index: dict[str, Any],
+        max_concurrency: int | None = None,
+        client_factory: Callable[[Path], Any] = ClaudeAnalysisClient,
+    ):
         """
         Initialize AI analyzer.
 
         Args:
             project_dir: Root directory of project
             project_index: Output from programmatic analyzer (analyzer.py)
+            max_concurrency: Maximum analyzers running at once
+                (default MAX_CONCURRENT_ANALYZERS)
+            client_factory: Creates the query client for a project directory
         """
         self.project_dir = project_dir
         self.project_index = project_index
+        self.max_concurrency = max(1, max_concurrency or self.MAX_CONCURRENT_ANALYZERS)
+        self.client_factory = client_factory
         self.cache_manager = CacheManager(project_dir / ".auto-claude" / "ai_cache")
         self.cost_estimator = CostEstimator(project_dir, project_index)
         self.result_parser = ResultParser()
@@ -40,6 +56,9 @@ class AIAnalyzerRunner:
         """
         Run all AI analyzers.
 
+        Analyzers whose inputs are unchanged since their last run reuse the
+        cached result; the rest run concurrently.
+
         Args:
             skip_cache: If True, ignore cached results
             selected_analyzers: If provided, only run these analyzers
@@ -49,31 +68,39 @@ class AIAnalyzerRunner:
         """
         self._print_header()
 
-        # Check for cached analysis
-        cached_result = self.cache_manager.get_cached_result(skip_cache)
-        if cached_result:
-            return cached_result
-
-        if not CLAUDE_SDK_AVAILABLE:
-            print("✗ Claude Agent SDK not available. Cannot run AI analysis.")
-            return {"error": "Claude SDK not installed"}
-
-        # Estimate cost before running
-        cost_estimate = self.cost_estimator.estimate_cost()
-        self.summary_printer.print_cost_estimate(cost_estimate.__dict__)
-
         # Initialize results
-        insights = {
+        insights: dict[str, Any] = {
             "analysis_timestamp": datetime.now().isoformat(),
             "project_dir": str(self.project_dir),
-            "cost_estimate": cost_estimate.__dict__,
         }
 
         # Determine which analyzers to run
         analyzers_to_run = self._get_analyzers_to_run(selected_analyzers)
 
-        # Run each analyzer
-        await self._run_analyzers(analyzers_to_run, insights)
+        # Reuse cached results for analyzers whose inputs are unchanged
+        cache_keys = {name: self._cache_key(name) for name in analyzers_to_run}
+        pending = []
+        for name in analyzers_to_run:
+            cached = None
+            if not skip_cache and cache_keys[name]:
+                cached = self.cache_manager.get_analyzer_result(name, cache_keys[name])
+            if cached is not None:
+                print(f"✓ Using cached {self._display_name(name)} analysis")
+                insights[name] = cached
+            else:
+                pending.append(name)
+
+        if pending:
+            if self.client_factory is ClaudeAnalysisClient and not CLAUDE_SDK_AVAILABLE:
+                print("✗ Claude Agent SDK not available. Cannot run AI analysis.")
+                return {"error": "Claude SDK not installed"}
+
+            # Estimate cost before running
+            cost_estimate = self.cost_estimator.estimate_cost()
+            self.summary_printer.print_cost_estimate(cost_estimate.__dict__)
+            insights["cost_estimate"] = cost_estimate.__dict__
+
+            await self._run_analyzers(pending, insights, cache_keys)
 
         # Calculate overall score
         insights["overall_score"] = self._calculate_overall_score(
@@ -115,30 +142,51 @@ class AIAnalyzerRunner:
         return AnalyzerType.all_analyzers()
 
     async def _run_analyzers(
-        self, analyzers_to_run: list[str], insights: dict[str, Any]
+        self,
+        analyzers_to_run: list[str],
+        insights: dict[str, Any],
+        cache_keys: dict[str, str | None] | None = None,
     ) -> None:
         """
-        Run all specified analyzers.
+        Run the specified analyzers concurrently.
+
+        At most max_concurrency queries are in flight. Each successful result
+        is cached as soon as it arrives, so an interrupted run keeps the
+        analyzers that finished.
 
         Args:
             analyzers_to_run: List of analyzer names to run
             insights: Dictionary to store results
+            cache_keys: Analyzer name -> cache key (None: don't cache)
         """
-        for analyzer_name in analyzers_to_run:
-            print(f"\n🤖 Running {analyzer_name.replace('_', ' ').title()} Analyzer...")
-            start_time = time.time()
-
-            try:
-                result = await self._run_single_analyzer(analyzer_name)
-                insights[analyzer_name] = result
-
-                duration = time.time() - start_time
-                score = result.get("score", 0)
-                print(f"   ✓ Completed in {duration:.1f}s (score: {score}/100)")
-
-            except Exception as e:
-                print(f"   ✗ Error: {e}")
-                insights[analyzer_name] = {"error": str(e)}
+        cache_keys = cache_keys or {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(analyzer_name: str) -> None:
+            async with semaphore:
+                print(f"\n🤖 Running {self._display_name(analyzer_name)} Analyzer...")
+                start_time = time.time()
+
+                try:
+                    result = await self._run_single_analyzer(analyzer_name)
+                except Exception as e:
+                    print(f"   ✗ {self._display_name(analyzer_name)} error: {e}")
+                    insights[analyzer_name] = {"error": str(e)}
+                    return
+
+            insights[analyzer_name] = result
+            key = cache_keys.get(analyzer_name)
+            if key:
+                self.cache_manager.save_analyzer_result(analyzer_name, key, result)
+
+            duration = time.time() - start_time
+            score = result.get("score", 0)
+            print(
+                f"   ✓ {self._display_name(analyzer_name)} completed in "
+                f"{duration:.1f}s (score: {score}/100)"
+            )
+
+        await asyncio.gather(*(run(name) for name in analyzers_to_run))
 
     async def _run_single_analyzer(self, analyzer_name: str) -> dict[str, Any]:
         """
@@ -158,12 +206,33 @@ class AIAnalyzerRunner:
         default_result = analyzer.get_default_result()
 
         # Run Claude query
-        client = ClaudeAnalysisClient(self.project_dir)
+        client = self.client_factory(self.project_dir)
         response = await client.run_analysis_query(prompt)
 
         # Parse and return result
         return self.result_parser.parse_json_response(response, default_result)
 
+    def _cache_key(self, analyzer_name: str) -> str | None:
+        """
+        Cache key for an analyzer's current inputs.
+
+        Returns:
+            Key, or None if the analyzer cannot build its prompt (it will
+            run and report the error)
+        """
+        analyzer = AnalyzerFactory.create(analyzer_name, self.project_index)
+        try:
+            prompt = analyzer.get_prompt()
+        except ValueError:
+            return None
+        return self.cache_manager.analyzer_key(
+            analyzer_name, analyzer.VERSION, prompt, analyzer.get_cache_inputs()
+        )
+
+    @staticmethod
+    def _display_name(analyzer_name: str) -> str:
+        return analyzer_name.replace("_", " ").title()
+
     def _calculate_overall_score(
         self, analyzers_to_run: list[str], insights: dict[str, Any]
     ) -> int:
@@ -46,6 +46,12 @@ def main() -> int:
         nargs="+",
         help="Run only specific analyzers (code_relationships, business_logic, etc.)",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help="Maximum analyzers to run at once (default: 3)",
+    )
 
     args = parser.parse_args()
 
@@ -67,7 +73,9 @@ def main() -> int:
         return 1
 
     # Create and run analyzer
-    analyzer = AIAnalyzerRunner(args.project_dir, project_index)
+    analyzer = AIAnalyzerRunner(
+        args.project_dir, project_index, max_concurrency=args.max_concurrency
+    )
 
     # Run async analysis
     insights = asyncio.run(
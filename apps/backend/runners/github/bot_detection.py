@@ -284,6 +284,18 @@ class BotDetector:
 
         return False, ""
 
+    def has_reviewed_pr(self, pr_number: int) -> bool:
+        """
+        Check if we've reviewed any commit of this PR.
+
+        Args:
+            pr_number: The PR number
+
+        Returns:
+            True if at least one commit of the PR was reviewed
+        """
+        return bool(self.state.reviewed_commits.get(str(pr_number)))
+
     def has_reviewed_commit(self, pr_number: int, commit_sha: str) -> bool:
         """
         Check if we've already reviewed this specific commit.
@@ -25,6 +25,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from core.git_prefetch import GitPrefetcher
+
 try:
     from .gh_client import GHClient, PRTooLargeError
     from .services.io_utils import safe_print
@@ -386,57 +388,30 @@ class PRContextGatherer:
             )
             return False
 
+        # Returns at once when the commits are present (e.g. prefetched);
+        # otherwise fetches them by SHA - this works even for fork PRs - and
+        # falls back to the PR ref
+        prefetcher = GitPrefetcher.for_repo(self.project_dir)
         try:
-            # Fetch the specific commits - this works even for fork PRs
-            proc = await asyncio.create_subprocess_exec(
-                "git",
-                "fetch",
-                "origin",
-                head_sha,
-                base_sha,
-                cwd=self.project_dir,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            available = await asyncio.to_thread(
+                prefetcher.ensure_commits,
+                [head_sha, base_sha],
+                refspecs=[f"pull/{self.pr_number}/head:refs/pr/{self.pr_number}"],
+                timeout=30,
             )
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30.0)
-
-            if proc.returncode == 0:
-                safe_print(
-                    f"[Context] Fetched PR refs: base={base_sha[:8]} → head={head_sha[:8]}",
-                    flush=True,
-                )
-                return True
-            else:
-                # If direct SHA fetch fails, try fetching the PR ref
-                safe_print("[Context] Direct SHA fetch failed, trying PR ref...")
-                proc2 = await asyncio.create_subprocess_exec(
-                    "git",
-                    "fetch",
-                    "origin",
-                    f"pull/{self.pr_number}/head:refs/pr/{self.pr_number}",
-                    cwd=self.project_dir,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                await asyncio.wait_for(proc2.communicate(), timeout=30.0)
-                if proc2.returncode == 0:
-                    safe_print(
-                        f"[Context] Fetched PR ref: refs/pr/{self.pr_number}",
-                        flush=True,
-                    )
-                    return True
-                safe_print(
-                    f"[Context] Failed to fetch PR refs: {stderr.decode('utf-8')}",
-                    flush=True,
-                )
-                return False
-        except asyncio.TimeoutError:
-            safe_print("[Context] Timeout fetching PR refs")
-            return False
         except Exception as e:
             safe_print(f"[Context] Error fetching PR refs: {e}")
             return False
 
+        if available:
+            safe_print(
+                f"[Context] PR refs available: base={base_sha[:8]} → head={head_sha[:8]}",
+                flush=True,
+            )
+        else:
+            safe_print("[Context] Failed to fetch PR refs", flush=True)
+        return available
+
     async def _fetch_changed_files(self, pr_data: dict) -> list[ChangedFile]:
         """
         Fetch all changed files with their full content.
@@ -21,17 +21,30 @@ Usage:
 
     # Get accuracy metrics
     metrics = tracker.get_accuracy("repo")
+
+Storage:
+    Outcomes are stored in an append-only JSONL log per repo
+    ({repo}_outcomes.jsonl). Each line is a full snapshot of one ReviewOutcome;
+    on load the last snapshot per review_id wins. Aggregate statistics are
+    maintained incrementally in (repo, prediction type, day) buckets so that
+    accuracy queries and the dashboard do not rescan every stored outcome.
 """
 
 from __future__ import annotations
 
+import heapq
 import json
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .file_lock import FileLock
+except (ImportError, ValueError, SystemError):
+    from file_lock import FileLock
+
 
 class PredictionType(str, Enum):
     """Types of predictions the system makes."""
@@ -225,6 +238,36 @@ class AccuracyStats:
         }
 
 
+@dataclass
+class _BucketStats:
+    """Incrementally maintained counters for one (repo, prediction type, day)."""
+
+    total: int = 0
+    correct: int = 0
+    incorrect: int = 0
+    pending: int = 0
+    merge_seconds: float = 0.0
+    merge_count: int = 0
+
+    def is_empty(self) -> bool:
+        return self.total == 0
+
+
+def _day_bucket(moment: datetime) -> date:
+    """Day bucket for a timestamp (UTC for timezone-aware values)."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.date()
+
+
+# Dimensions used by detect_patterns, mapped to their pattern_type / id prefix
+_PATTERN_DIMENSIONS = {
+    "file_type": "file_type_accuracy",
+    "category": "category_accuracy",
+    "change_size": "change_size_accuracy",
+}
+
+
 @dataclass
 class LearningPattern:
     """
@@ -289,41 +332,110 @@ class LearningTracker:
         self.learning_dir.mkdir(parents=True, exist_ok=True)
 
         self._outcomes: dict[str, ReviewOutcome] = {}
+
+        # Incremental aggregates, updated on every record_* call
+        # (repo, prediction type) -> day -> counters
+        self._buckets: dict[tuple[str, str], dict[date, _BucketStats]] = {}
+        # day -> review_ids created that day (for exact window boundaries)
+        self._by_day: dict[date, set[str]] = {}
+        # review_ids without an outcome yet (dict used as an ordered set)
+        self._pending: dict[str, None] = {}
+        # dimension -> value -> [correct, incorrect]
+        self._pattern_counts: dict[str, dict[str, list[int]]] = {
+            dimension: {} for dimension in _PATTERN_DIMENSIONS
+        }
+
         self._load_outcomes()
 
     def _get_outcomes_file(self, repo: str) -> Path:
         safe_name = repo.replace("/", "_")
-        return self.learning_dir / f"{safe_name}_outcomes.json"
+        return self.learning_dir / f"{safe_name}_outcomes.jsonl"
 
     def _load_outcomes(self) -> None:
-        """Load all outcomes from disk."""
+        """Load all outcomes from disk and rebuild the aggregates."""
+        loaded: dict[str, ReviewOutcome] = {}
+
+        # Legacy whole-file snapshots written by older versions
         for file in self.learning_dir.glob("*_outcomes.json"):
             try:
                 with open(file, encoding="utf-8") as f:
                     data = json.load(f)
                     for item in data.get("outcomes", []):
                         outcome = ReviewOutcome.from_dict(item)
-                        self._outcomes[outcome.review_id] = outcome
-            except (json.JSONDecodeError, KeyError):
+                        loaded[outcome.review_id] = outcome
+            except (json.JSONDecodeError, KeyError, ValueError):
                 continue
 
-    def _save_outcomes(self, repo: str) -> None:
-        """Save outcomes for a repo to disk with file locking for concurrency safety."""
-        from .file_lock import FileLock, atomic_write
+        # Append-only logs: later snapshots of the same review win
+        for file in sorted(self.learning_dir.glob("*_outcomes.jsonl")):
+            try:
+                with open(file, encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            outcome = ReviewOutcome.from_dict(json.loads(line))
+                        except (json.JSONDecodeError, KeyError, ValueError):
+                            # Skip torn or malformed lines (e.g. crash mid-append)
+                            continue
+                        loaded[outcome.review_id] = outcome
+            except OSError:
+                continue
 
-        file = self._get_outcomes_file(repo)
-        repo_outcomes = [o for o in self._outcomes.values() if o.repo == repo]
+        for outcome in loaded.values():
+            self._outcomes[outcome.review_id] = outcome
+            self._apply_to_aggregates(outcome, 1)
 
-        data = {
-            "repo": repo,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "outcomes": [o.to_dict() for o in repo_outcomes],
-        }
+    def _append_outcome(self, outcome: ReviewOutcome) -> None:
+        """Append a snapshot of an outcome to its repo log (O(1) per event)."""
+        file = self._get_outcomes_file(outcome.repo)
+        line = json.dumps(outcome.to_dict(), separators=(",", ":")) + "\n"
 
-        # Use file locking and atomic write for safe concurrent access
+        # Lock so concurrent writers never interleave partial lines
         with FileLock(file, timeout=5.0):
-            with atomic_write(file) as f:
-                json.dump(data, f, indent=2)
+            with open(file, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def _apply_to_aggregates(self, outcome: ReviewOutcome, sign: int) -> None:
+        """
+        Add (sign=1) or retract (sign=-1) an outcome's contribution.
+
+        Updates are retract-then-apply so that re-recording an outcome never
+        double counts.
+        """
+        day = _day_bucket(outcome.created_at)
+        days = self._buckets.setdefault((outcome.repo, outcome.prediction.value), {})
+        bucket = days.setdefault(day, _BucketStats())
+        self._accumulate(bucket, outcome, sign)
+
+        day_ids = self._by_day.setdefault(day, set())
+        if sign > 0:
+            day_ids.add(outcome.review_id)
+        else:
+            day_ids.discard(outcome.review_id)
+            if not day_ids:
+                del self._by_day[day]
+
+        if not outcome.is_complete:
+            if sign > 0:
+                self._pending[outcome.review_id] = None
+            else:
+                self._pending.pop(outcome.review_id, None)
+        elif outcome.was_correct is not None:
+            index = 0 if outcome.was_correct else 1
+            dimensions = {
+                "file_type": outcome.file_types,
+                "category": outcome.categories,
+                "change_size": [outcome.change_size],
+            }
+            for dimension, values in dimensions.items():
+                counts = self._pattern_counts[dimension]
+                for value in values:
+                    counts.setdefault(value, [0, 0])[index] += sign
+
+        if bucket.is_empty():
+            del days[day]
 
     def record_prediction(
         self,
@@ -366,8 +478,13 @@ class LearningTracker:
             categories=categories or [],
         )
 
+        previous = self._outcomes.get(review_id)
+        if previous is not None:
+            self._apply_to_aggregates(previous, -1)
+
         self._outcomes[review_id] = outcome
-        self._save_outcomes(repo)
+        self._apply_to_aggregates(outcome, 1)
+        self._append_outcome(outcome)
 
         return outcome
 
@@ -396,22 +513,25 @@ class LearningTracker:
             return None
 
         review_outcome = self._outcomes[review_id]
+        self._apply_to_aggregates(review_outcome, -1)
+
         review_outcome.actual_outcome = outcome
         review_outcome.time_to_outcome = time_to_outcome
         review_outcome.author_response = author_response
         review_outcome.outcome_recorded_at = datetime.now(timezone.utc)
 
-        self._save_outcomes(repo)
+        self._apply_to_aggregates(review_outcome, 1)
+        self._append_outcome(review_outcome)
 
         return review_outcome
 
     def get_pending_outcomes(self, repo: str | None = None) -> list[ReviewOutcome]:
         """Get predictions that don't have outcomes yet."""
         pending = []
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete:
-                if repo is None or outcome.repo == repo:
-                    pending.append(outcome)
+        for review_id in self._pending:
+            outcome = self._outcomes[review_id]
+            if repo is None or outcome.repo == repo:
+                pending.append(outcome)
         return pending
 
     def get_accuracy(
@@ -423,6 +543,9 @@ class LearningTracker:
         """
         Get accuracy statistics.
 
+        Answered from the day buckets; only outcomes created on the boundary
+        day of ``since`` are inspected individually.
+
         Args:
             repo: Filter by repo (None for all)
             since: Only include predictions after this time
@@ -432,69 +555,93 @@ class LearningTracker:
             AccuracyStats with aggregated metrics
         """
         stats = AccuracyStats()
-        merge_times = []
-
-        for outcome in self._outcomes.values():
-            # Apply filters
-            if repo and outcome.repo != repo:
-                continue
-            if since and outcome.created_at < since:
+        merge_seconds = 0.0
+        merge_count = 0
+        since_day = _day_bucket(since) if since else None
+
+        def add(type_key: str, bucket: _BucketStats) -> None:
+            nonlocal merge_seconds, merge_count
+            stats.total_predictions += bucket.total
+            stats.correct_predictions += bucket.correct
+            stats.incorrect_predictions += bucket.incorrect
+            stats.pending_outcomes += bucket.pending
+            merge_seconds += bucket.merge_seconds
+            merge_count += bucket.merge_count
+
+            by_type = stats.by_type.setdefault(
+                type_key, {"total": 0, "correct": 0, "incorrect": 0}
+            )
+            by_type["total"] += bucket.total
+            by_type["correct"] += bucket.correct
+            by_type["incorrect"] += bucket.incorrect
+
+        for (bucket_repo, type_key), days in self._buckets.items():
+            if repo and bucket_repo != repo:
                 continue
-            if prediction_type and outcome.prediction != prediction_type:
+            if prediction_type and type_key != prediction_type.value:
                 continue
-
-            stats.total_predictions += 1
-
-            # Track by type
-            type_key = outcome.prediction.value
-            if type_key not in stats.by_type:
-                stats.by_type[type_key] = {"total": 0, "correct": 0, "incorrect": 0}
-            stats.by_type[type_key]["total"] += 1
-
-            if outcome.is_complete:
-                was_correct = outcome.was_correct
-                if was_correct is True:
-                    stats.correct_predictions += 1
-                    stats.by_type[type_key]["correct"] += 1
-                elif was_correct is False:
-                    stats.incorrect_predictions += 1
-                    stats.by_type[type_key]["incorrect"] += 1
-
-                # Track merge times
-                if (
-                    outcome.actual_outcome == OutcomeType.MERGED
-                    and outcome.time_to_outcome
-                ):
-                    merge_times.append(outcome.time_to_outcome)
-            else:
-                stats.pending_outcomes += 1
+            for day, bucket in days.items():
+                if since_day is None or day > since_day:
+                    add(type_key, bucket)
+
+        # The boundary day is only partially inside the window
+        if since is not None:
+            for review_id in self._by_day.get(since_day, ()):
+                outcome = self._outcomes[review_id]
+                if repo and outcome.repo != repo:
+                    continue
+                if prediction_type and outcome.prediction != prediction_type:
+                    continue
+                if outcome.created_at < since:
+                    continue
+                partial = _BucketStats()
+                self._accumulate(partial, outcome)
+                add(outcome.prediction.value, partial)
 
         # Calculate average merge time
-        if merge_times:
-            avg_seconds = sum(t.total_seconds() for t in merge_times) / len(merge_times)
-            stats.avg_time_to_merge = timedelta(seconds=avg_seconds)
+        if merge_count:
+            stats.avg_time_to_merge = timedelta(seconds=merge_seconds / merge_count)
 
         return stats
 
+    @staticmethod
+    def _accumulate(
+        bucket: _BucketStats, outcome: ReviewOutcome, sign: int = 1
+    ) -> None:
+        """Add (or retract) a single outcome's counters to a bucket."""
+        bucket.total += sign
+        if not outcome.is_complete:
+            bucket.pending += sign
+            return
+        was_correct = outcome.was_correct
+        if was_correct is True:
+            bucket.correct += sign
+        elif was_correct is False:
+            bucket.incorrect += sign
+        if outcome.actual_outcome == OutcomeType.MERGED and outcome.time_to_outcome:
+            bucket.merge_seconds += sign * outcome.time_to_outcome.total_seconds()
+            bucket.merge_count += sign
+
     def get_recent_outcomes(
         self,
         repo: str | None = None,
         limit: int = 50,
     ) -> list[ReviewOutcome]:
         """Get recent outcomes, most recent first."""
-        outcomes = list(self._outcomes.values())
+        outcomes = self._outcomes.values()
 
         if repo:
             outcomes = [o for o in outcomes if o.repo == repo]
 
-        outcomes.sort(key=lambda o: o.created_at, reverse=True)
-        return outcomes[:limit]
+        return heapq.nlargest(limit, outcomes, key=lambda o: o.created_at)
 
     def detect_patterns(self, min_sample_size: int = 20) -> list[LearningPattern]:
         """
         Detect learning patterns from outcomes.
 
         Aggregates data to identify where the system performs well or poorly.
+        Counts per file type, category and change size are maintained
+        incrementally as outcomes are recorded.
 
         Args:
             min_sample_size: Minimum samples to create a pattern
@@ -504,99 +651,21 @@ class LearningTracker:
         """
         patterns = []
 
-        # Pattern: Accuracy by file type
-        by_file_type: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete or outcome.was_correct is None:
-                continue
-
-            for file_type in outcome.file_types:
-                if file_type not in by_file_type:
-                    by_file_type[file_type] = {"correct": 0, "incorrect": 0}
-
-                if outcome.was_correct:
-                    by_file_type[file_type]["correct"] += 1
-                else:
-                    by_file_type[file_type]["incorrect"] += 1
-
-        for file_type, counts in by_file_type.items():
-            total = counts["correct"] + counts["incorrect"]
-            if total >= min_sample_size:
-                accuracy = counts["correct"] / total
-                confidence = min(1.0, total / 100)  # More samples = higher confidence
-
-                patterns.append(
-                    LearningPattern(
-                        pattern_id=f"file_type_{file_type}",
-                        pattern_type="file_type_accuracy",
-                        context={"file_type": file_type},
-                        sample_size=total,
-                        accuracy=accuracy,
-                        confidence=confidence,
-                    )
-                )
-
-        # Pattern: Accuracy by category
-        by_category: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete or outcome.was_correct is None:
-                continue
-
-            for category in outcome.categories:
-                if category not in by_category:
-                    by_category[category] = {"correct": 0, "incorrect": 0}
-
-                if outcome.was_correct:
-                    by_category[category]["correct"] += 1
-                else:
-                    by_category[category]["incorrect"] += 1
-
-        for category, counts in by_category.items():
-            total = counts["correct"] + counts["incorrect"]
-            if total >= min_sample_size:
-                accuracy = counts["correct"] / total
-                confidence = min(1.0, total / 100)
-
-                patterns.append(
-                    LearningPattern(
-                        pattern_id=f"category_{category}",
-                        pattern_type="category_accuracy",
-                        context={"category": category},
-                        sample_size=total,
-                        accuracy=accuracy,
-                        confidence=confidence,
-                    )
-                )
-
-        # Pattern: Accuracy by change size
-        by_size: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete or outcome.was_correct is None:
-                continue
-
-            size = outcome.change_size
-            if size not in by_size:
-                by_size[size] = {"correct": 0, "incorrect": 0}
-
-            if outcome.was_correct:
-                by_size[size]["correct"] += 1
-            else:
-                by_size[size]["incorrect"] += 1
-
-        for size, counts in by_size.items():
-            total = counts["correct"] + counts["incorrect"]
-            if total >= min_sample_size:
-                accuracy = counts["correct"] / total
-                confidence = min(1.0, total / 100)
+        for dimension, pattern_type in _PATTERN_DIMENSIONS.items():
+            for value, (correct, incorrect) in self._pattern_counts[dimension].items():
+                total = correct + incorrect
+                if total == 0 or total < min_sample_size:
+                    continue
 
                 patterns.append(
                     LearningPattern(
-                        pattern_id=f"change_size_{size}",
-                        pattern_type="change_size_accuracy",
-                        context={"change_size": size},
+                        pattern_id=f"{dimension}_{value}",
+                        pattern_type=pattern_type,
+                        context={dimension: value},
                         sample_size=total,
-                        accuracy=accuracy,
-                        confidence=confidence,
+                        accuracy=correct / total,
+                        # More samples = higher confidence
+                        confidence=min(1.0, total / 100),
                     )
                 )
 
@@ -40,6 +40,11 @@ try:
     )
     from .permissions import GitHubPermissionChecker
     from .rate_limiter import RateLimiter
+    from .review_scheduler import (
+        ReviewRequest,
+        ReviewScheduler,
+        ReviewSchedulerConfig,
+    )
     from .services import (
         AutoFixProcessor,
         BatchProcessor,
@@ -69,6 +74,7 @@ except (ImportError, ValueError, SystemError):
     )
     from permissions import GitHubPermissionChecker
     from rate_limiter import RateLimiter
+    from review_scheduler import ReviewRequest, ReviewScheduler, ReviewSchedulerConfig
     from services import (
         AutoFixProcessor,
         BatchProcessor,
@@ -590,6 +596,68 @@ class GitHubOrchestrator:
             await result.save(self.github_dir)
             return result
 
+    async def review_prs(
+        self,
+        pr_numbers: list[int],
+        max_concurrent: int = 3,
+        force_review: bool = False,
+    ) -> tuple[dict[int, PRReviewResult], dict[int, str]]:
+        """
+        Review many PRs concurrently under the shared GitHub/cost budgets.
+
+        PRs are prioritized (new commits, CI status, size, labels) and
+        re-requests for an already reviewed head SHA are skipped.
+
+        Args:
+            pr_numbers: PR numbers to review
+            max_concurrent: Maximum reviews running at once
+            force_review: Review even if the head SHA was already reviewed
+
+        Returns:
+            Tuple of (PRReviewResult per PR that was reviewed, reason per PR
+            that should have been reviewed but was not, e.g. because the cost
+            budget ran out or the review raised)
+        """
+        scheduler = ReviewScheduler(
+            review_fn=lambda request: self.review_pr(
+                request.pr_number, force_review=request.force
+            ),
+            rate_limiter=self.rate_limiter,
+            bot_detector=self.bot_detector,
+            config=ReviewSchedulerConfig(max_concurrent=max_concurrent),
+        )
+
+        for pr_number in pr_numbers:
+            pr_data = await self.gh_client.pr_get(
+                pr_number,
+                json_fields=[
+                    "number",
+                    "headRefOid",
+                    "additions",
+                    "deletions",
+                    "labels",
+                    "statusCheckRollup",
+                ],
+            )
+            scheduler.submit(
+                ReviewRequest.from_pr_data(
+                    pr_data,
+                    has_new_commits=self.bot_detector.has_reviewed_pr(pr_number),
+                    force=force_review,
+                )
+            )
+
+        safe_print(
+            f"[ReviewScheduler] {scheduler.queue_depth} PR(s) queued "
+            f"({scheduler.metrics.deduped} already reviewed at head)",
+            flush=True,
+        )
+        results = await scheduler.run_until_empty()
+        skipped = dict(scheduler.skipped)
+        for pr_number, error in scheduler.errors.items():
+            skipped[pr_number] = f"review failed: {error}"
+        return results, skipped
+
     async def followup_review_pr(self, pr_number: int) -> PRReviewResult:
         """
         Perform a focused follow-up review of a PR.
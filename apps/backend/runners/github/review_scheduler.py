@@ -0,0 +1,461 @@
+"""
+Multi-PR Review Scheduler
+=========================
+
+Schedules many PR reviews against shared, process-wide budgets:
+- A priority queue ordered by new commits, CI status, PR size and labels
+- N concurrent reviews, bounded by PR worktree slots and CPU count
+- GitHub API token bucket and AI cost budget from RateLimiter
+- Dedupe of re-requests for the same head SHA (BotDetector.has_reviewed_commit)
+- Queue depth and latency metrics
+
+Usage:
+    scheduler = ReviewScheduler(
+        review_fn=lambda req: orchestrator.review_pr(req.pr_number),
+        rate_limiter=RateLimiter.get_instance(),
+        bot_detector=orchestrator.bot_detector,
+        config=ReviewSchedulerConfig(max_concurrent=3),
+    )
+
+    scheduler.submit(ReviewRequest.from_pr_data(pr_data))
+
+    # Batch mode: review everything queued, then return
+    await scheduler.run_until_empty()
+
+    # Long-running mode: keep serving submissions until stop()
+    await scheduler.serve()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import statistics
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Labels that move a PR up (positive) or down (negative) the queue
+DEFAULT_LABEL_WEIGHTS: dict[str, float] = {
+    "priority:critical": 80.0,
+    "priority:high": 50.0,
+    "urgent": 50.0,
+    "security": 40.0,
+    "hotfix": 40.0,
+    "priority:low": -30.0,
+    "wip": -80.0,
+    "do-not-review": -100.0,
+}
+
+# Completed reviews kept for latency percentiles
+_LATENCY_SAMPLES = 1000
+
+
+@dataclass
+class ReviewRequest:
+    """A request to review one PR at a specific head commit."""
+
+    pr_number: int
+    head_sha: str
+    has_new_commits: bool = False  # Previously reviewed PR that got new commits
+    ci_status: str | None = None  # "success" | "pending" | "failure" | None
+    additions: int = 0
+    deletions: int = 0
+    labels: list[str] = field(default_factory=list)
+    force: bool = False
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def size(self) -> int:
+        return self.additions + self.deletions
+
+    @classmethod
+    def from_pr_data(
+        cls,
+        pr_data: dict[str, Any],
+        has_new_commits: bool = False,
+        force: bool = False,
+    ) -> ReviewRequest:
+        """
+        Build a request from `gh pr view --json` output.
+
+        Expects number, headRefOid, additions, deletions, labels and
+        (optionally) statusCheckRollup.
+        """
+        return cls(
+            pr_number=pr_data["number"],
+            head_sha=pr_data.get("headRefOid", ""),
+            has_new_commits=has_new_commits,
+            ci_status=_summarize_checks(pr_data.get("statusCheckRollup") or []),
+            additions=pr_data.get("additions", 0) or 0,
+            deletions=pr_data.get("deletions", 0) or 0,
+            labels=[
+                label.get("name", "") if isinstance(label, dict) else str(label)
+                for label in pr_data.get("labels") or []
+            ],
+            force=force,
+        )
+
+
+def _default_worktree_slots() -> int:
+    """PR worktree slots, shared with PRWorktreeManager's MAX_PR_WORKTREES."""
+    # Lazy import: pr_worktree_manager pulls in core.git_executable
+    try:
+        from .services.pr_worktree_manager import _get_max_pr_worktrees
+    except (ImportError, ValueError, SystemError):
+        from services.pr_worktree_manager import _get_max_pr_worktrees
+    return _get_max_pr_worktrees()
+
+
+def _summarize_checks(checks: list[dict[str, Any]]) -> str | None:
+    """Collapse a statusCheckRollup into success/pending/failure."""
+    if not checks:
+        return None
+    states = set()
+    for check in checks:
+        # CheckRun uses status/conclusion, StatusContext uses state
+        conclusion = (check.get("conclusion") or check.get("state") or "").upper()
+        status = (check.get("status") or "").upper()
+        if conclusion in ("FAILURE", "ERROR", "TIMED_OUT", "CANCELLED"):
+            states.add("failure")
+        elif status in ("QUEUED", "IN_PROGRESS", "PENDING") or conclusion in (
+            "",
+            "PENDING",
+            "EXPECTED",
+        ):
+            states.add("pending")
+        else:
+            states.add("success")
+    for state in ("failure", "pending"):
+        if state in states:
+            return state
+    return "success"
+
+
+@dataclass
+class ReviewPriorityPolicy:
+    """Weights used to score queued reviews (higher score = reviewed sooner)."""
+
+    new_commits_weight: float = 100.0
+    ci_weights: dict[str, float] = field(
+        default_factory=lambda: {"success": 30.0, "pending": 10.0, "failure": -20.0}
+    )
+    size_penalty_per_100_lines: float = 1.0
+    max_size_penalty: float = 50.0
+    label_weights: dict[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_LABEL_WEIGHTS)
+    )
+
+    def score(self, request: ReviewRequest) -> float:
+        score = 0.0
+        if request.has_new_commits:
+            score += self.new_commits_weight
+        if request.ci_status:
+            score += self.ci_weights.get(request.ci_status, 0.0)
+        score -= min(
+            self.max_size_penalty,
+            request.size / 100 * self.size_penalty_per_100_lines,
+        )
+        for label in request.labels:
+            score += self.label_weights.get(label.lower(), 0.0)
+        return score
+
+
+@dataclass
+class ReviewSchedulerConfig:
+    """Global limits for the scheduler."""
+
+    max_concurrent: int = 3
+    # Defaults: MAX_PR_WORKTREES and os.cpu_count()
+    worktree_slots: int | None = None
+    cpu_slots: int | None = None
+    # GitHub tokens that must be available before a review starts
+    github_reserve: int = 50
+    # Seconds to wait between budget re-checks while paused
+    budget_poll_interval: float = 5.0
+    policy: ReviewPriorityPolicy = field(default_factory=ReviewPriorityPolicy)
+
+    @property
+    def effective_concurrency(self) -> int:
+        worktree_slots = self.worktree_slots or _default_worktree_slots()
+        cpu_slots = self.cpu_slots or os.cpu_count() or 1
+        return max(1, min(self.max_concurrent, worktree_slots, cpu_slots))
+
+
+def _percentile(samples: list[float], pct: float) -> float | None:
+    if not samples:
+        return None
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[int(pct) - 1]
+
+
+@dataclass
+class ReviewSchedulerMetrics:
+    """Queue depth, throughput and latency counters."""
+
+    submitted: int = 0
+    deduped: int = 0
+    superseded: int = 0
+    started: int = 0
+    completed: int = 0
+    failed: int = 0
+    queue_depth: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    budget_pauses: int = 0
+    queue_wait_seconds: deque[float] = field(
+        default_factory=lambda: deque(maxlen=_LATENCY_SAMPLES)
+    )
+    review_seconds: deque[float] = field(
+        default_factory=lambda: deque(maxlen=_LATENCY_SAMPLES)
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        waits = list(self.queue_wait_seconds)
+        durations = list(self.review_seconds)
+        return {
+            "submitted": self.submitted,
+            "deduped": self.deduped,
+            "superseded": self.superseded,
+            "started": self.started,
+            "completed": self.completed,
+            "failed": self.failed,
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "budget_pauses": self.budget_pauses,
+            "queue_wait_p50": _percentile(waits, 50),
+            "queue_wait_p95": _percentile(waits, 95),
+            "review_p50": _percentile(durations, 50),
+            "review_p95": _percentile(durations, 95),
+        }
+
+
+class _QueueEntry:
+    __slots__ = ("request", "valid")
+
+    def __init__(self, request: ReviewRequest):
+        self.request = request
+        self.valid = True
+
+
+class ReviewScheduler:
+    """
+    Priority-queue scheduler that runs PR reviews under global budgets.
+
+    Args:
+        review_fn: Coroutine function performing one review
+        rate_limiter: RateLimiter providing the GitHub bucket and cost tracker
+        bot_detector: BotDetector used to skip already-reviewed head SHAs
+        config: Concurrency and budget settings
+    """
+
+    def __init__(
+        self,
+        review_fn: Callable[[ReviewRequest], Awaitable[Any]],
+        rate_limiter: Any,
+        bot_detector: Any | None = None,
+        config: ReviewSchedulerConfig | None = None,
+    ):
+        self.review_fn = review_fn
+        self.rate_limiter = rate_limiter
+        self.bot_detector = bot_detector
+        self.config = config or ReviewSchedulerConfig()
+        self.metrics = ReviewSchedulerMetrics()
+        self.results: dict[int, Any] = {}
+        self.errors: dict[int, BaseException] = {}
+        # PRs left unreviewed by a batch run, with the reason
+        self.skipped: dict[int, str] = {}
+
+        self._heap: list[tuple[float, int, _QueueEntry]] = []
+        self._counter = itertools.count()
+        self._queued: dict[int, _QueueEntry] = {}  # pr_number -> live entry
+        self._in_flight: dict[int, str] = {}  # pr_number -> head_sha
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    def submit(self, request: ReviewRequest) -> bool:
+        """
+        Queue a review request.
+
+        Returns:
+            False if the request was a duplicate (same PR and head SHA already
+            reviewed, queued or running), True otherwise.
+        """
+        self.metrics.submitted += 1
+
+        if self._is_duplicate(request):
+            self.metrics.deduped += 1
+            logger.debug(
+                f"[ReviewScheduler] Dedupe PR #{request.pr_number} @ {request.head_sha[:8]}"
+            )
+            return False
+
+        previous = self._queued.get(request.pr_number)
+        if previous is not None:
+            # A newer head replaces the queued one (only the latest SHA matters)
+            previous.valid = False
+            self.metrics.superseded += 1
+            self.metrics.queue_depth -= 1
+
+        entry = _QueueEntry(request)
+        priority = -self.config.policy.score(request)
+        heapq.heappush(self._heap, (priority, next(self._counter), entry))
+        self._queued[request.pr_number] = entry
+        self.metrics.queue_depth += 1
+        self._wakeup.set()
+        return True
+
+    def _is_duplicate(self, request: ReviewRequest) -> bool:
+        if request.force:
+            return False
+        if self._in_flight.get(request.pr_number) == request.head_sha:
+            return True
+        queued = self._queued.get(request.pr_number)
+        if queued is not None and queued.request.head_sha == request.head_sha:
+            return True
+        if self.bot_detector is not None and request.head_sha:
+            return self.bot_detector.has_reviewed_commit(
+                request.pr_number, request.head_sha
+            )
+        return False
+
+    def _pop(self) -> ReviewRequest | None:
+        while self._heap:
+            _, _, entry = heapq.heappop(self._heap)
+            if not entry.valid:
+                continue
+            request = entry.request
+            del self._queued[request.pr_number]
+            self.metrics.queue_depth -= 1
+            return request
+        return None
+
+    @property
+    def queue_depth(self) -> int:
+        return self.metrics.queue_depth
+
+    # ------------------------------------------------------------------
+    # Budgets
+    # ------------------------------------------------------------------
+
+    def _cost_exhausted(self) -> str | None:
+        """Why the AI cost budget allows no new reviews, or None if it does."""
+        available, message = self.rate_limiter.check_cost_available()
+        if available:
+            return None
+        logger.warning(f"[ReviewScheduler] Pausing dispatch: {message}")
+        return message or "cost budget exhausted"
+
+    def _skip_queued(self, reason: str) -> None:
+        """Record every queued PR as skipped (they stay queued)."""
+        for pr_number in self._queued:
+            self.skipped[pr_number] = reason
+
+    async def _wait_for_github_budget(self) -> None:
+        """Wait until enough GitHub tokens are available to start a review."""
+        bucket = self.rate_limiter.github_bucket
+        reserve = min(self.config.github_reserve, bucket.capacity)
+        while not self._stopping and bucket.available() < reserve:
+            self.metrics.budget_pauses += 1
+            wait = bucket.time_until_available(reserve)
+            await asyncio.sleep(min(max(wait, 0.01), self.config.budget_poll_interval))
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def _run_one(self, request: ReviewRequest) -> None:
+        pr_number = request.pr_number
+        self._in_flight[pr_number] = request.head_sha
+        self.metrics.in_flight += 1
+        self.metrics.peak_in_flight = max(
+            self.metrics.peak_in_flight, self.metrics.in_flight
+        )
+        self.metrics.started += 1
+        self.metrics.queue_wait_seconds.append(time.monotonic() - request.enqueued_at)
+
+        start = time.monotonic()
+        try:
+            self.results[pr_number] = await self.review_fn(request)
+            self.metrics.completed += 1
+        except Exception as e:
+            logger.error(f"[ReviewScheduler] Review of PR #{pr_number} failed: {e}")
+            self.errors[pr_number] = e
+            self.metrics.failed += 1
+        finally:
+            self.metrics.review_seconds.append(time.monotonic() - start)
+            self.metrics.in_flight -= 1
+            del self._in_flight[pr_number]
+
+    async def _worker(self, stop_when_empty: bool) -> None:
+        while not self._stopping:
+            # Re-check budgets before taking work so queued items stay queued
+            exhausted = self._cost_exhausted()
+            if exhausted:
+                if stop_when_empty:
+                    self._skip_queued(exhausted)
+                    return
+                await asyncio.sleep(self.config.budget_poll_interval)
+                continue
+            await self._wait_for_github_budget()
+
+            request = self._pop()
+            if request is None:
+                if stop_when_empty:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            # The same SHA may have been reviewed while this one was queued
+            if self._is_duplicate(request):
+                self.metrics.deduped += 1
+                continue
+
+            await self._run_one(request)
+
+    async def _run_workers(self, stop_when_empty: bool) -> None:
+        workers = [
+            asyncio.create_task(self._worker(stop_when_empty))
+            for _ in range(self.config.effective_concurrency)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            logger.info(f"[ReviewScheduler] Metrics: {self.metrics.to_dict()}")
+
+    async def run_until_empty(self) -> dict[int, Any]:
+        """
+        Review everything currently queued, then return the results.
+
+        If the cost budget runs out, the remaining PRs stay queued and are
+        listed with the reason in ``skipped``.
+        """
+        self._stopping = False
+        await self._run_workers(stop_when_empty=True)
+        return self.results
+
+    async def serve(self) -> None:
+        """Keep reviewing submissions until stop() is called."""
+        self._stopping = False
+        await self._run_workers(stop_when_empty=False)
+
+    def stop(self) -> None:
+        """Stop taking new work; in-flight reviews finish normally."""
+        self._stopping = True
+        self._wakeup.set()
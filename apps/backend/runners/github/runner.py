@@ -13,6 +13,9 @@ Usage:
     # Review a specific PR
     python runner.py review-pr 123
 
+    # Review several PRs concurrently (prioritized, deduped by head SHA)
+    python runner.py review-prs 123 124 125 --max-concurrent 3
+
     # Triage all open issues
     python runner.py triage --apply-labels
 
@@ -82,11 +85,41 @@ from debug import debug_error
 sys.path.insert(0, str(Path(__file__).parent))
 
 # Now import models and orchestrator directly (they use relative imports internally)
+from core.git_prefetch import GitPrefetcher
 from models import GitHubRunnerConfig
 from orchestrator import GitHubOrchestrator, ProgressCallback
+from services.client_pool import close_client_pool
 from services.io_utils import safe_print
 
 
+async def run_with_client_pool(handler, args) -> int:
+    """Run a command handler, closing pooled SDK clients when it finishes."""
+    prefetcher = start_pr_prefetch(args)
+    try:
+        return await handler(args)
+    finally:
+        await close_client_pool()
+        if prefetcher is not None:
+            prefetcher.stop(timeout=10)
+
+
+def start_pr_prefetch(args) -> GitPrefetcher | None:
+    """
+    Prefetch the PRs a review command works on in the background.
+
+    The fetch overlaps with the GitHub API calls that precede checkout and
+    context gathering, which then find the commits already present.
+    """
+    pr_numbers = getattr(args, "pr_numbers", None) or []
+    if getattr(args, "pr_number", None):
+        pr_numbers = [args.pr_number]
+    if not pr_numbers or not args.command.startswith(("review-pr", "followup")):
+        return None
+    prefetcher = GitPrefetcher.for_repo(args.project)
+    prefetcher.watch_prs(pr_numbers)
+    return prefetcher if prefetcher.start() else None
+
+
 def print_progress(callback: ProgressCallback) -> None:
     """Print progress updates to console."""
     prefix = ""
@@ -254,6 +287,35 @@ async def cmd_review_pr(args) -> int:
         return 1
 
 
+async def cmd_review_prs(args) -> int:
+    """Review several pull requests concurrently."""
+    config = get_config(args)
+    orchestrator = GitHubOrchestrator(
+        project_dir=args.project,
+        config=config,
+        progress_callback=print_progress,
+    )
+
+    results, skipped = await orchestrator.review_prs(
+        args.pr_numbers,
+        max_concurrent=args.max_concurrent,
+        force_review=getattr(args, "force", False),
+    )
+
+    safe_print(f"\n{'=' * 60}")
+    safe_print(f"Reviewed {len(results)} of {len(args.pr_numbers)} PR(s)")
+    safe_print(f"{'=' * 60}")
+    for pr_number, result in sorted(results.items()):
+        status = result.overall_status if result.success else "failed"
+        safe_print(f"  PR #{pr_number}: {status} ({len(result.findings)} findings)")
+    for pr_number, reason in sorted(skipped.items()):
+        safe_print(f"  PR #{pr_number}: not reviewed ({reason})")
+
+    if skipped:
+        return 1
+    return 0 if all(r.success for r in results.values()) else 1
+
+
 async def cmd_followup_review_pr(args) -> int:
     """Perform a follow-up review of a pull request."""
     import sys
@@ -708,6 +770,30 @@ def main():
         help="Force a new review even if commit was already reviewed",
     )
 
+    # review-prs command
+    review_many_parser = subparsers.add_parser(
+        "review-prs", help="Review several pull requests concurrently"
+    )
+    review_many_parser.add_argument(
+        "pr_numbers", type=int, nargs="+", help="PR numbers to review"
+    )
+    review_many_parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=3,
+        help="Maximum reviews to run at once (default: 3)",
+    )
+    review_many_parser.add_argument(
+        "--auto-post",
+        action="store_true",
+        help="Automatically post reviews to GitHub",
+    )
+    review_many_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Force new reviews even if commits were already reviewed",
+    )
+
     # followup-review-pr command
     followup_parser = subparsers.add_parser(
         "followup-review-pr",
@@ -803,6 +889,7 @@ def main():
     # Route to command handler
     commands = {
         "review-pr": cmd_review_pr,
+        "review-prs": cmd_review_prs,
         "followup-review-pr": cmd_followup_review_pr,
         "triage": cmd_triage,
         "auto-fix": cmd_auto_fix,
@@ -831,7 +918,7 @@ def main():
             },
         )
 
-        exit_code = asyncio.run(handler(args))
+        exit_code = asyncio.run(run_with_client_pool(handler, args))
         sys.exit(exit_code)
     except KeyboardInterrupt:
         safe_print("\nInterrupted.")
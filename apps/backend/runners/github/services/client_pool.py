@@ -0,0 +1,406 @@
+"""
+SDK Client Pool
+===============
+
+Bounded pool of warm Claude SDK client sessions shared across PR reviews.
+
+Creating a client rebuilds MCP server configs and security settings and
+spawns a Claude CLI subprocess. When many PRs are reviewed in one run this
+startup cost is paid for every PR and every subagent. The pool keeps
+connected clients around, keyed by everything that shapes their options
+(model, agent type / tool set, working directory and extras such as the
+output schema), and hands them out again on the next matching checkout.
+
+Isolation:
+    A reused CLI process keeps its transcript across queries, whatever
+    ``session_id`` is passed. Before a pooled client is handed out again it
+    is therefore sent ``/clear``, which starts an empty conversation; if the
+    clear fails the client is disconnected and replaced by a new one. Every
+    checkout also passes a new ``session_id`` to ``client.query()``. Clients
+    whose checkout raised, whose response stream was not fully drained, or
+    that reached ``max_uses`` are disconnected instead of being returned to
+    the pool.
+
+Usage:
+    pool = get_client_pool()
+    async with pool.session(
+        key=client_key(model=model, agent_type="pr_reviewer", project_dir=root),
+        factory=lambda: create_client(...),
+    ) as client:
+        await client.query(prompt)
+        async for msg in client.receive_response():
+            ...
+
+Configuration:
+    GITHUB_SDK_CLIENT_POOL_SIZE - maximum number of live clients (default 4,
+                                  0 disables pooling)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Hashable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_MAX_USES = 20
+DEFAULT_IDLE_TTL_SECONDS = 300.0
+
+# Sent to a reused client to drop the previous review's conversation
+CLEAR_COMMAND = "/clear"
+CLEAR_TIMEOUT_SECONDS = 30.0
+
+
+def _pool_size_from_env() -> int:
+    """Read the configured pool size (0 disables pooling)."""
+    raw = os.environ.get("GITHUB_SDK_CLIENT_POOL_SIZE", "")
+    try:
+        return max(0, int(raw)) if raw else DEFAULT_POOL_SIZE
+    except ValueError:
+        logger.warning(f"Invalid GITHUB_SDK_CLIENT_POOL_SIZE={raw!r}, using default")
+        return DEFAULT_POOL_SIZE
+
+
+def client_key(
+    model: str,
+    agent_type: str,
+    project_dir: Path | str | None,
+    **extra: Any,
+) -> tuple:
+    """
+    Build a pool key from everything that shapes a client's options.
+
+    ``project_dir`` is the client's working directory class: the resolved
+    directory for tool-using agents, or None for tool-less clients that can
+    be shared regardless of where the review runs.
+
+    Extra options (thinking budget, output schema, subagent definitions) are
+    folded into a stable digest so that two checkouts only share a client if
+    the CLI would have been started with identical settings.
+    """
+    digest = ""
+    if extra:
+        payload = json.dumps(extra, sort_keys=True, default=str)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+    working_dir = str(Path(project_dir).resolve()) if project_dir else ""
+    return (model, agent_type, working_dir, digest)
+
+
+@dataclass
+class ClientPoolMetrics:
+    """Counters describing pool behaviour."""
+
+    checkouts: int = 0
+    created: int = 0
+    reused: int = 0
+    clear_failures: int = 0
+    discarded: int = 0
+    evicted: int = 0
+    waits: int = 0
+    wait_seconds: float = 0.0
+    in_use: int = 0
+    idle: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        if self.checkouts == 0:
+            return 0.0
+        return self.reused / self.checkouts
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "checkouts": self.checkouts,
+            "created": self.created,
+            "reused": self.reused,
+            "clear_failures": self.clear_failures,
+            "discarded": self.discarded,
+            "evicted": self.evicted,
+            "waits": self.waits,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "in_use": self.in_use,
+            "idle": self.idle,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+class _PoolEntry:
+    """A live client plus bookkeeping."""
+
+    def __init__(self, key: Hashable, client: Any):
+        self.key = key
+        self.client = client
+        self.uses = 0
+        self.last_used = time.monotonic()
+
+
+class PooledClient:
+    """
+    Checkout handle for one conversation on a pooled client.
+
+    Supports ``async with`` as a no-op so existing ``async with client:``
+    blocks keep working unchanged; the pool owns the connection lifecycle.
+    """
+
+    def __init__(self, client: Any):
+        self._client = client
+        self.session_id = f"pool-{uuid.uuid4().hex}"
+        self._drained = True
+
+    @property
+    def is_clean(self) -> bool:
+        """True if every query's response stream was consumed to the end."""
+        return self._drained
+
+    async def query(self, prompt: Any, session_id: str | None = None) -> None:
+        self._drained = False
+        await self._client.query(prompt, session_id=session_id or self.session_id)
+
+    async def receive_response(self) -> AsyncIterator[Any]:
+        async for message in self._client.receive_response():
+            yield message
+        self._drained = True
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    async def __aenter__(self) -> PooledClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return False
+
+
+class SDKClientPool:
+    """
+    Bounded, keyed pool of connected SDK clients.
+
+    ``max_size`` bounds the number of live clients (idle + checked out).
+    When the pool is full, an idle client of another key is evicted (least
+    recently used first); if every client is checked out, the caller waits.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_POOL_SIZE,
+        max_uses: int = DEFAULT_MAX_USES,
+        idle_ttl: float = DEFAULT_IDLE_TTL_SECONDS,
+    ):
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.idle_ttl = idle_ttl
+        self._idle: OrderedDict[int, _PoolEntry] = OrderedDict()
+        self._live = 0
+        self._condition = asyncio.Condition()
+        self._closed = False
+        self._metrics = ClientPoolMetrics()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    @property
+    def metrics(self) -> ClientPoolMetrics:
+        self._metrics.idle = len(self._idle)
+        return self._metrics
+
+    @asynccontextmanager
+    async def session(
+        self, key: Hashable, factory: Callable[[], Any]
+    ) -> AsyncIterator[PooledClient]:
+        """
+        Check out a client for ``key``, creating one with ``factory`` if needed.
+
+        The client is returned to the pool on clean exit and disconnected
+        otherwise.
+        """
+        if not self.enabled or self._closed:
+            # Pooling disabled: behave exactly like a fresh client per call
+            client = factory()
+            async with client:
+                yield PooledClient(client)
+            return
+
+        entry = await self._acquire(key, factory)
+        handle = PooledClient(entry.client)
+        healthy = False
+        try:
+            yield handle
+            healthy = handle.is_clean
+        finally:
+            await self._release(entry, healthy)
+
+    async def _acquire(self, key: Hashable, factory: Callable[[], Any]) -> _PoolEntry:
+        to_close: list[_PoolEntry] = []
+        wait_start: float | None = None
+
+        async with self._condition:
+            self._metrics.checkouts += 1
+            while True:
+                to_close.extend(self._expire_idle())
+
+                entry = self._pop_idle(key)
+                if entry is not None:
+                    self._metrics.reused += 1
+                    break
+
+                if self._live < self.max_size:
+                    entry = None
+                    self._live += 1
+                    break
+
+                victim = self._pop_lru_idle()
+                if victim is not None:
+                    # Replace an idle client of another key
+                    self._metrics.evicted += 1
+                    to_close.append(victim)
+                    continue
+
+                if wait_start is None:
+                    wait_start = time.monotonic()
+                    self._metrics.waits += 1
+                await self._condition.wait()
+
+            if wait_start is not None:
+                self._metrics.wait_seconds += time.monotonic() - wait_start
+            self._metrics.in_use += 1
+
+        for stale in to_close:
+            await self._close_entry(stale)
+
+        if entry is not None and not await self._clear_conversation(entry):
+            # Keep the slot but replace the client
+            self._metrics.clear_failures += 1
+            await self._close_entry(entry)
+            entry = None
+
+        if entry is None:
+            try:
+                client = factory()
+                await client.__aenter__()
+            except BaseException:
+                async with self._condition:
+                    self._live -= 1
+                    self._metrics.in_use -= 1
+                    self._condition.notify()
+                raise
+            entry = _PoolEntry(key, client)
+            self._metrics.created += 1
+
+        entry.uses += 1
+        return entry
+
+    async def _release(self, entry: _PoolEntry, healthy: bool) -> None:
+        keep = healthy and not self._closed and entry.uses < self.max_uses
+        async with self._condition:
+            self._metrics.in_use -= 1
+            if keep:
+                entry.last_used = time.monotonic()
+                self._idle[id(entry)] = entry
+            else:
+                self._live -= 1
+                self._metrics.discarded += 1
+            self._condition.notify()
+
+        if not keep:
+            await self._close_entry(entry)
+
+    async def _clear_conversation(self, entry: _PoolEntry) -> bool:
+        """Start an empty conversation on a reused client."""
+        handle = PooledClient(entry.client)
+
+        async def clear() -> None:
+            await handle.query(CLEAR_COMMAND)
+            async for _ in handle.receive_response():
+                pass
+
+        try:
+            await asyncio.wait_for(clear(), timeout=CLEAR_TIMEOUT_SECONDS)
+        except Exception as e:
+            logger.debug(f"[ClientPool] Could not clear reused client: {e}")
+            return False
+        return handle.is_clean
+
+    def _pop_idle(self, key: Hashable) -> _PoolEntry | None:
+        # Most recently used first, so warm clients stay warm
+        for entry_id in reversed(self._idle):
+            entry = self._idle[entry_id]
+            if entry.key == key:
+                del self._idle[entry_id]
+                return entry
+        return None
+
+    def _pop_lru_idle(self) -> _PoolEntry | None:
+        if not self._idle:
+            return None
+        _, entry = self._idle.popitem(last=False)
+        self._live -= 1
+        return entry
+
+    def _expire_idle(self) -> list[_PoolEntry]:
+        now = time.monotonic()
+        expired = [
+            entry_id
+            for entry_id, entry in self._idle.items()
+            if now - entry.last_used > self.idle_ttl
+        ]
+        entries = [self._idle.pop(entry_id) for entry_id in expired]
+        self._live -= len(entries)
+        return entries
+
+    async def _close_entry(self, entry: _PoolEntry) -> None:
+        try:
+            await entry.client.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug(f"[ClientPool] Error closing client: {e}")
+
+    async def close(self) -> None:
+        """Disconnect all idle clients and stop pooling new ones."""
+        async with self._condition:
+            self._closed = True
+            entries = list(self._idle.values())
+            self._idle.clear()
+            self._live -= len(entries)
+            self._condition.notify_all()
+
+        for entry in entries:
+            await self._close_entry(entry)
+
+        if self._metrics.checkouts:
+            logger.info(f"[ClientPool] Closed: {self._metrics.to_dict()}")
+
+
+# Pools are bound to the event loop their clients were connected on
+_POOLS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SDKClientPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_client_pool() -> SDKClientPool:
+    """Get the client pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _POOLS.get(loop)
+    if pool is None:
+        pool = SDKClientPool(max_size=_pool_size_from_env())
+        _POOLS[loop] = pool
+    return pool
+
+
+async def close_client_pool() -> None:
+    """Close the running loop's client pool, if one was created."""
+    loop = asyncio.get_running_loop()
+    pool = _POOLS.pop(loop, None)
+    if pool is not None:
+        await pool.close()
@@ -35,6 +35,7 @@ try:
         ReviewSeverity,
     )
     from .category_utils import map_category
+    from .client_pool import client_key, get_client_pool
     from .io_utils import safe_print
     from .prompt_manager import PromptManager
     from .pydantic_models import FollowupReviewResponse
@@ -48,6 +49,7 @@ except (ImportError, ValueError, SystemError):
         ReviewSeverity,
     )
     from services.category_utils import map_category
+    from services.client_pool import client_key, get_client_pool
     from services.io_utils import safe_print
     from services.prompt_manager import PromptManager
     from services.pydantic_models import FollowupReviewResponse
@@ -682,7 +684,7 @@ Analyze this follow-up review context and provide your structured response.
         try:
             # Use Claude Agent SDK query() with structured outputs
             # Reference: https://platform.claude.com/docs/en/agent-sdk/structured-outputs
-            from claude_agent_sdk import ClaudeAgentOptions, query
+            from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
             from phase_config import get_thinking_budget, resolve_model_id
 
             model_shorthand = self.config.model or "sonnet"
@@ -697,74 +699,84 @@ Analyze this follow-up review context and provide your structured response.
             )
             safe_print(f"[Followup] SDK query with output_format, model={model}")
 
-            # Iterate through messages from the query
-            # Note: max_turns=2 because structured output uses a tool call + response
-            async for message in query(
-                prompt=user_message,
-                options=ClaudeAgentOptions(
-                    model=model,
-                    system_prompt="You are a code review assistant. Analyze the provided context and provide structured feedback.",
-                    allowed_tools=[],
-                    max_turns=2,  # Need 2 turns for structured output tool call
-                    max_thinking_tokens=thinking_budget,
-                    output_format={
-                        "type": "json_schema",
-                        "schema": schema,
-                    },
-                ),
-            ):
-                msg_type = type(message).__name__
-
-                # SDK delivers structured output via ToolUseBlock named 'StructuredOutput'
-                # in an AssistantMessage
-                if msg_type == "AssistantMessage":
-                    content = getattr(message, "content", [])
-                    for block in content:
-                        block_type = type(block).__name__
-                        if block_type == "ToolUseBlock":
-                            tool_name = getattr(block, "name", "")
-                            if tool_name == "StructuredOutput":
-                                # Extract structured data from tool input
-                                structured_data = getattr(block, "input", None)
-                                if structured_data:
-                                    logger.info(
-                                        "[Followup] Found StructuredOutput tool use"
-                                    )
-                                    safe_print(
-                                        "[Followup] Using SDK structured output",
-                                        flush=True,
-                                    )
-                                    # Validate with Pydantic and convert
-                                    result = FollowupReviewResponse.model_validate(
-                                        structured_data
-                                    )
-                                    return self._convert_structured_to_internal(result)
-
-                    # Also check for direct structured_output attribute (SDK validated JSON)
-                    if (
-                        hasattr(message, "structured_output")
-                        and message.structured_output
-                    ):
-                        logger.info(
-                            "[Followup] Found structured_output attribute on message"
-                        )
-                        safe_print(
-                            "[Followup] Using SDK structured output (direct attribute)",
-                            flush=True,
-                        )
-                        result = FollowupReviewResponse.model_validate(
-                            message.structured_output
-                        )
-                        return self._convert_structured_to_internal(result)
-
-                # Handle ResultMessage for errors
-                if msg_type == "ResultMessage":
-                    subtype = getattr(message, "subtype", None)
-                    if subtype == "error_max_structured_output_retries":
-                        logger.warning(
-                            "Claude could not produce valid structured output after retries"
-                        )
-                        return None
+            options = ClaudeAgentOptions(
+                model=model,
+                system_prompt="You are a code review assistant. Analyze the provided context and provide structured feedback.",
+                allowed_tools=[],
+                max_turns=2,  # Need 2 turns for structured output tool call
+                max_thinking_tokens=thinking_budget,
+                output_format={
+                    "type": "json_schema",
+                    "schema": schema,
+                },
+            )
+            key = client_key(
+                model=model,
+                agent_type="followup_structured",
+                project_dir=None,  # No tools, so no working directory dependency
+                thinking_budget=thinking_budget,
+                schema=schema,
+            )
+
+            # Iterate through messages from a pooled client session. The stream
+            # is drained to the end so the client can be returned to the pool.
+            structured_data = None
+            async with get_client_pool().session(
+                key, lambda: ClaudeSDKClient(options=options)
+            ) as client:
+                await client.query(user_message)
+
+                async for message in client.receive_response():
+                    msg_type = type(message).__name__
+
+                    # SDK delivers structured output via ToolUseBlock named 'StructuredOutput'
+                    # in an AssistantMessage
+                    if msg_type == "AssistantMessage" and structured_data is None:
+                        content = getattr(message, "content", [])
+                        for block in content:
+                            block_type = type(block).__name__
+                            if block_type == "ToolUseBlock":
+                                tool_name = getattr(block, "name", "")
+                                if tool_name == "StructuredOutput":
+                                    # Extract structured data from tool input
+                                    structured_data = getattr(block, "input", None)
+                                    if structured_data:
+                                        logger.info(
+                                            "[Followup] Found StructuredOutput tool use"
+                                        )
+                                        safe_print(
+                                            "[Followup] Using SDK structured output",
+                                            flush=True,
+                                        )
+                                        break
+
+                        # Also check for direct structured_output attribute (SDK validated JSON)
+                        if (
+                            not structured_data
+                            and hasattr(message, "structured_output")
+                            and message.structured_output
+                        ):
+                            logger.info(
+                                "[Followup] Found structured_output attribute on message"
+                            )
+                            safe_print(
+                                "[Followup] Using SDK structured output (direct attribute)",
+                                flush=True,
+                            )
+                            structured_data = message.structured_output
+
+                    # Handle ResultMessage for errors
+                    if msg_type == "ResultMessage":
+                        subtype = getattr(message, "subtype", None)
+                        if subtype == "error_max_structured_output_retries":
+                            logger.warning(
+                                "Claude could not produce valid structured output after retries"
+                            )
+
+            if structured_data:
+                # Validate with Pydantic and convert
+                result = FollowupReviewResponse.model_validate(structured_data)
+                return self._convert_structured_to_internal(result)
 
             logger.warning("No structured output received from AI")
             return None
@@ -152,12 +152,15 @@ class ParallelFollowupReviewer:
         logger.warning(f"Prompt file not found: {prompt_file}")
         return ""
 
-    def _create_pr_worktree(self, head_sha: str, pr_number: int) -> Path:
-        """Create a temporary worktree at the PR head commit.
+    def _create_pr_worktree(
+        self, head_sha: str, pr_number: int, sparse_paths: list[str] | None = None
+    ) -> Path:
+        """Check out a worktree at the PR head commit (pooled slot when enabled).
 
         Args:
             head_sha: The commit SHA of the PR head (validated before use)
             pr_number: The PR number for naming
+            sparse_paths: Changed/related file paths that bound a sparse checkout
 
         Returns:
             Path to the created worktree
@@ -173,15 +176,17 @@ class ParallelFollowupReviewer:
                 "Must contain only alphanumeric characters, dots, slashes, underscores, and hyphens."
             )
 
-        return self.worktree_manager.create_worktree(head_sha, pr_number)
+        return self.worktree_manager.checkout_worktree(
+            head_sha, pr_number, sparse_paths=sparse_paths
+        )
 
     def _cleanup_pr_worktree(self, worktree_path: Path) -> None:
-        """Remove a temporary PR review worktree with fallback chain.
+        """Release a PR review worktree (returned to the pool or removed).
 
         Args:
-            worktree_path: Path to the worktree to remove
+            worktree_path: Path to the worktree to release
         """
-        self.worktree_manager.remove_worktree(worktree_path)
+        self.worktree_manager.release_worktree(worktree_path)
 
     def _define_specialist_agents(self) -> dict[str, AgentDefinition]:
         """
@@ -463,7 +468,10 @@ The SDK will run invoked agents in parallel automatically.
                             flush=True,
                         )
                     worktree_path = self._create_pr_worktree(
-                        head_sha, context.pr_number
+                        head_sha,
+                        context.pr_number,
+                        sparse_paths=list(context.files_changed_since_review)
+                        + [f.file for f in context.previous_review.findings if f.file],
                     )
                     project_root = worktree_path
                     safe_print(
@@ -42,6 +42,7 @@ try:
         ReviewSeverity,
     )
     from .category_utils import map_category
+    from .client_pool import client_key, get_client_pool
     from .io_utils import safe_print
     from .pr_worktree_manager import PRWorktreeManager
     from .pydantic_models import AgentAgreement, ParallelOrchestratorResponse
@@ -61,6 +62,7 @@ except (ImportError, ValueError, SystemError):
     )
     from phase_config import get_thinking_budget, resolve_model_id
     from services.category_utils import map_category
+    from services.client_pool import client_key, get_client_pool
     from services.io_utils import safe_print
     from services.pr_worktree_manager import PRWorktreeManager
     from services.pydantic_models import AgentAgreement, ParallelOrchestratorResponse
@@ -251,12 +253,15 @@ class ParallelOrchestratorReviewer:
         logger.warning(f"Prompt file not found: {prompt_file}")
         return ""
 
-    def _create_pr_worktree(self, head_sha: str, pr_number: int) -> Path:
-        """Create a temporary worktree at the PR head commit.
+    def _create_pr_worktree(
+        self, head_sha: str, pr_number: int, sparse_paths: list[str] | None = None
+    ) -> Path:
+        """Check out a worktree at the PR head commit (pooled slot when enabled).
 
         Args:
             head_sha: The commit SHA of the PR head (validated before use)
             pr_number: The PR number for naming
+            sparse_paths: Changed/related file paths that bound a sparse checkout
 
         Returns:
             Path to the created worktree
@@ -272,15 +277,17 @@ class ParallelOrchestratorReviewer:
                 "Must contain only alphanumeric characters, dots, slashes, underscores, and hyphens."
             )
 
-        return self.worktree_manager.create_worktree(head_sha, pr_number)
+        return self.worktree_manager.checkout_worktree(
+            head_sha, pr_number, sparse_paths=sparse_paths
+        )
 
     def _cleanup_pr_worktree(self, worktree_path: Path) -> None:
-        """Remove a temporary PR review worktree with fallback chain.
+        """Release a PR review worktree (returned to the pool or removed).
 
         Args:
-            worktree_path: Path to the worktree to remove
+            worktree_path: Path to the worktree to release
         """
-        self.worktree_manager.remove_worktree(worktree_path)
+        self.worktree_manager.release_worktree(worktree_path)
 
     def _cleanup_stale_pr_worktrees(self) -> None:
         """Clean up orphaned, expired, and excess PR review worktrees on startup."""
@@ -499,6 +506,31 @@ The SDK will run invoked agents in parallel automatically.
             },
         )
 
+    def _client_session(
+        self, project_root: Path, model: str, thinking_budget: int | None
+    ):
+        """Check out an orchestrator client from the shared SDK client pool.
+
+        Args:
+            project_root: Root directory of the project
+            model: Model to use for orchestrator
+            thinking_budget: Max thinking tokens budget
+
+        Returns:
+            Async context manager yielding a pooled client
+        """
+        key = client_key(
+            model=model,
+            agent_type="pr_orchestrator_parallel",
+            project_dir=project_root,
+            spec_dir=str(self.github_dir),
+            thinking_budget=thinking_budget,
+        )
+        return get_client_pool().session(
+            key,
+            lambda: self._create_sdk_client(project_root, model, thinking_budget),
+        )
+
     def _extract_structured_output(
         self, structured_output: dict[str, Any] | None, result_text: str
     ) -> tuple[list[PRReviewFinding], list[str]]:
@@ -664,7 +696,10 @@ The SDK will run invoked agents in parallel automatically.
                     )
                 try:
                     worktree_path = self._create_pr_worktree(
-                        head_sha, context.pr_number
+                        head_sha,
+                        context.pr_number,
+                        sparse_paths=[f.path for f in context.changed_files]
+                        + list(context.related_files),
                     )
                     project_root = worktree_path
                     # Count files in worktree to give user visibility (with limit to avoid slowdown)
@@ -744,10 +779,6 @@ The SDK will run invoked agents in parallel automatically.
                 f"thinking_level={thinking_level}, thinking_budget={thinking_budget}"
             )
 
-            # Create client with subagents defined
-            # SDK handles parallel execution when Claude invokes multiple Task tools
-            client = self._create_sdk_client(project_root, model, thinking_budget)
-
             self._report_progress(
                 "orchestrating",
                 40,
@@ -755,8 +786,12 @@ The SDK will run invoked agents in parallel automatically.
                 pr_number=context.pr_number,
             )
 
-            # Run orchestrator session using shared SDK stream processor
-            async with client:
+            # Check out a client with subagents defined from the shared pool
+            # (reused when a previous review ran in the same worktree slot).
+            # SDK handles parallel execution when Claude invokes multiple Task tools
+            async with self._client_session(
+                project_root, model, thinking_budget
+            ) as client:
                 await client.query(prompt)
 
                 safe_print(
@@ -9,6 +9,7 @@ Features:
 - Count-based cleanup (keep only N most recent worktrees)
 - Orphaned worktree cleanup (worktrees not registered with git)
 - Automatic cleanup on review completion
+- Pooled checkouts: reusable slots reset to each new PR head (see pr_worktree_pool)
 """
 
 from __future__ import annotations
@@ -22,12 +23,14 @@ from pathlib import Path
 from typing import NamedTuple
 
 from core.git_executable import get_isolated_git_env
+from core.git_prefetch import GitPrefetcher
 
 logger = logging.getLogger(__name__)
 
 # Default cleanup policies (can be overridden via environment variables)
 DEFAULT_MAX_PR_WORKTREES = 10  # Max worktrees to keep
 DEFAULT_PR_WORKTREE_MAX_AGE_DAYS = 7  # Max age in days
+POOL_DIR_NAME = "worktree-pool"  # Sibling of the worktree dir
 
 
 def _get_max_pr_worktrees() -> int:
@@ -87,6 +90,71 @@ class PRWorktreeManager:
         """
         self.project_dir = Path(project_dir)
         self.worktree_base_dir = self.project_dir / worktree_dir
+        # Pool slots live next to (not inside) the per-review worktrees so
+        # cleanup_worktrees() never removes a warm slot
+        self.pool_dir = self.worktree_base_dir.parent / POOL_DIR_NAME
+        self._pool = None
+
+    @property
+    def pool(self):
+        """Lazily created PR worktree pool, or None if pooling is disabled."""
+        if self._pool is None:
+            try:
+                from .pr_worktree_pool import PRWorktreePool, _get_pool_size
+            except (ImportError, ValueError, SystemError):
+                from services.pr_worktree_pool import PRWorktreePool, _get_pool_size
+
+            if _get_pool_size() <= 0:
+                return None
+            self._pool = PRWorktreePool(self.project_dir, self.pool_dir)
+        return self._pool
+
+    def checkout_worktree(
+        self, head_sha: str, pr_number: int, sparse_paths: list[str] | None = None
+    ) -> Path:
+        """
+        Get a worktree at head_sha, reusing a pooled slot when possible.
+
+        Falls back to create_worktree() when pooling is disabled or every slot
+        is in use. Release the result with release_worktree().
+
+        Args:
+            head_sha: Git commit SHA to checkout
+            pr_number: PR number
+            sparse_paths: Changed/related file paths used to limit the checkout
+                          with sparse-checkout on large repositories
+
+        Raises:
+            RuntimeError: If the checkout fails
+            ValueError: If head_sha or pr_number are invalid
+        """
+        if not head_sha or not SAFE_REF_PATTERN.match(head_sha):
+            raise ValueError(
+                f"Invalid head_sha: must match pattern {SAFE_REF_PATTERN.pattern}"
+            )
+        if not isinstance(pr_number, int) or pr_number <= 0:
+            raise ValueError(
+                f"Invalid pr_number: must be a positive integer, got {pr_number}"
+            )
+
+        pool = self.pool
+        if pool is not None:
+            # Never block here: callers run inside the event loop, so when all
+            # slots are busy a one-off worktree is cheaper than waiting
+            slot_path = pool.try_acquire(head_sha, pr_number, sparse_paths=sparse_paths)
+            if slot_path is not None:
+                return slot_path
+            logger.info(
+                "[WorktreeManager] All pool slots busy, creating one-off worktree"
+            )
+        return self.create_worktree(head_sha, pr_number)
+
+    def release_worktree(self, worktree_path: Path) -> None:
+        """Return a pooled slot to the pool, or remove a one-off worktree."""
+        if self._pool is not None and self._pool.owns(worktree_path):
+            self._pool.release(worktree_path)
+        else:
+            self.remove_worktree(worktree_path)
 
     def create_worktree(
         self, head_sha: str, pr_number: int, auto_cleanup: bool = True
@@ -132,23 +200,11 @@ class PRWorktreeManager:
         logger.debug(f"Creating worktree: {worktree_path}")
 
         env = get_isolated_git_env()
-        try:
-            fetch_result = subprocess.run(
-                ["git", "fetch", "origin", head_sha],
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                env=env,
-            )
-
-            if fetch_result.returncode != 0:
-                logger.warning(
-                    f"Could not fetch {head_sha} from origin (fork PR?): {fetch_result.stderr}"
-                )
-        except subprocess.TimeoutExpired:
+        # Only fetches when the commit has not been fetched or prefetched yet
+        prefetcher = GitPrefetcher.for_repo(self.project_dir)
+        if not prefetcher.ensure_commits([head_sha]):
             logger.warning(
-                f"Timeout fetching {head_sha} from origin, continuing anyway"
+                f"{head_sha} unavailable from origin (fork PR?), continuing anyway"
             )
 
         try:
@@ -310,6 +366,7 @@ class PRWorktreeManager:
         1. Remove orphaned worktrees (not registered with git)
         2. Remove worktrees older than PR_WORKTREE_MAX_AGE_DAYS
         3. If still over MAX_PR_WORKTREES, remove oldest worktrees
+        4. Remove idle pool slots unused for PR_WORKTREE_MAX_AGE_DAYS
 
         Args:
             force: If True, skip age check and only enforce count limit
@@ -319,12 +376,17 @@ class PRWorktreeManager:
                 'orphaned': count,
                 'expired': count,
                 'excess': count,
+                'pool': count,
                 'total': count
             }
         """
-        stats = {"orphaned": 0, "expired": 0, "excess": 0, "total": 0}
+        stats = {"orphaned": 0, "expired": 0, "excess": 0, "pool": 0, "total": 0}
 
+        stats["pool"] = self._cleanup_pool_slots(
+            max_age_days=float("inf") if force else _get_max_age_days()
+        )
         if not self.worktree_base_dir.exists():
+            stats["total"] = stats["pool"]
             return stats
 
         # Get registered worktrees (resolved paths for consistent comparison)
@@ -395,7 +457,9 @@ class PRWorktreeManager:
                 self.remove_worktree(wt.path)
                 stats["excess"] += 1
 
-        stats["total"] = stats["orphaned"] + stats["expired"] + stats["excess"]
+        stats["total"] = (
+            stats["orphaned"] + stats["expired"] + stats["excess"] + stats["pool"]
+        )
 
         if stats["total"] > 0:
             logger.info(
@@ -409,6 +473,18 @@ class PRWorktreeManager:
 
         return stats
 
+    def _cleanup_pool_slots(self, max_age_days: float) -> int:
+        """Remove idle pool slots older than max_age_days (in-use slots are kept)."""
+        if not self.pool_dir.exists():
+            return 0
+        try:
+            from .pr_worktree_pool import PRWorktreePool
+        except (ImportError, ValueError, SystemError):
+            from services.pr_worktree_pool import PRWorktreePool
+
+        pool = self._pool or PRWorktreePool(self.project_dir, self.pool_dir)
+        return pool.cleanup(max_age_days=max_age_days)
+
     def cleanup_all_worktrees(self) -> int:
         """
         Remove ALL PR worktrees (for testing or emergency cleanup).
@@ -416,11 +492,11 @@ class PRWorktreeManager:
         Returns:
             Number of worktrees removed
         """
+        count = self._cleanup_pool_slots(max_age_days=-1)
         if not self.worktree_base_dir.exists():
-            return 0
+            return count
 
         worktrees = self.get_worktree_info()
-        count = 0
 
         for wt in worktrees:
             logger.info(f"[WorktreeManager] Removing worktree: {wt.path.name}")
@@ -0,0 +1,448 @@
+"""
+PR Worktree Pool
+================
+
+Reusable PR review worktrees ("slots") that are reset to a new PR head
+instead of being created and removed for every review.
+
+Creating a fresh worktree checks out the full tree, which costs tens of
+seconds and a lot of disk on a large monorepo. A pooled slot is already
+checked out, so moving it to the next head with ``git checkout --detach``
+only rewrites files that differ between the two commits. All slots share
+the main repository's object store.
+
+Features:
+- Per-slot cross-process locks (several runner processes can share a pool)
+- LRU recycling: the least recently used free slot is reset to the new head;
+  a slot that last reviewed the same PR is preferred (smallest delta)
+- Optional cone-mode sparse-checkout limited to the directories of the
+  changed files and their related files (imports, tests, configs)
+- Age-based cleanup of idle slots
+
+Configuration (environment variables):
+    PR_WORKTREE_POOL_SIZE - maximum number of slots (default 4, 0 disables)
+    PR_WORKTREE_SPARSE    - "auto" (default), "always" or "never"; "auto"
+                            enables sparse-checkout when the repository tracks
+                            more than SPARSE_AUTO_THRESHOLD files
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from core.git_executable import get_isolated_git_env
+from core.git_prefetch import GitPrefetcher
+from core.sparse_worktree import cone_directories
+
+try:
+    from ..file_lock import FileLock, FileLockTimeout
+except (ImportError, ValueError, SystemError):
+    from file_lock import FileLock, FileLockTimeout
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_SLOT_MAX_AGE_DAYS = 7
+SPARSE_AUTO_THRESHOLD = 20000  # Tracked files before "auto" turns sparse on
+_ACQUIRE_POLL_SECONDS = 0.5
+
+
+def _get_pool_size() -> int:
+    """Get pool size setting, read at runtime for testability."""
+    try:
+        value = int(os.environ.get("PR_WORKTREE_POOL_SIZE", str(DEFAULT_POOL_SIZE)))
+        return value if value >= 0 else DEFAULT_POOL_SIZE
+    except (ValueError, TypeError):
+        return DEFAULT_POOL_SIZE
+
+
+def _get_sparse_mode() -> str:
+    """Get sparse-checkout mode setting, read at runtime for testability."""
+    mode = os.environ.get("PR_WORKTREE_SPARSE", "auto").strip().lower()
+    return mode if mode in ("auto", "always", "never") else "auto"
+
+
+@dataclass
+class SlotState:
+    """Persisted metadata for one pool slot."""
+
+    name: str
+    head_sha: str | None = None
+    pr_number: int | None = None
+    last_used: float = 0.0
+    sparse_dirs: list[str] | None = None
+    reuse_count: int = 0
+    created_at: float = field(default_factory=time.time)
+
+
+class _SlotLock:
+    """Non-blocking cross-process lock on a slot (held until release)."""
+
+    def __init__(self, slot_path: Path):
+        self._lock = FileLock(slot_path, timeout=0)
+        self._held = False
+
+    def try_acquire(self) -> bool:
+        try:
+            self._lock.__enter__()
+        except FileLockTimeout:
+            return False
+        self._held = True
+        return True
+
+    def release(self) -> None:
+        if self._held:
+            self._held = False
+            self._lock.__exit__(None, None, None)
+
+
+class PRWorktreePool:
+    """
+    Pool of reusable, per-slot locked review worktrees.
+
+    Usage:
+        pool = PRWorktreePool(project_dir, project_dir / POOL_DIR)
+        path = pool.acquire(head_sha, pr_number, sparse_paths=changed_files)
+        # (try_acquire() returns None instead of waiting when all slots are busy)
+        try:
+            ...  # review in path
+        finally:
+            pool.release(path)
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        pool_dir: Path,
+        max_slots: int | None = None,
+        sparse_mode: str | None = None,
+    ):
+        self.project_dir = Path(project_dir)
+        self.pool_dir = Path(pool_dir)
+        self.max_slots = max_slots if max_slots is not None else _get_pool_size()
+        self.sparse_mode = sparse_mode or _get_sparse_mode()
+        self._held: dict[Path, tuple[_SlotLock, SlotState]] = {}
+        self._tracked_file_count: int | None = None
+
+    # ------------------------------------------------------------------
+    # Git helpers
+    # ------------------------------------------------------------------
+
+    def _git(
+        self, args: list[str], cwd: Path | None = None, timeout: int = 120
+    ) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            ["git", *args],
+            cwd=cwd or self.project_dir,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env=get_isolated_git_env(),
+        )
+
+    def _ensure_commit(self, head_sha: str) -> None:
+        """Fetch head_sha only if the object is not already present locally."""
+        prefetcher = GitPrefetcher.for_repo(self.project_dir)
+        if not prefetcher.ensure_commits([head_sha]):
+            logger.warning(f"{head_sha} unavailable from origin (fork PR?), continuing")
+
+    def _use_sparse(self, sparse_paths: list[str] | None) -> bool:
+        if sparse_paths is None or self.sparse_mode == "never":
+            return False
+        if self.sparse_mode == "always":
+            return True
+        if self._tracked_file_count is None:
+            result = self._git(["ls-files", "-z"], timeout=60)
+            self._tracked_file_count = (
+                result.stdout.count("\0") if result.returncode == 0 else 0
+            )
+        return self._tracked_file_count > SPARSE_AUTO_THRESHOLD
+
+    # ------------------------------------------------------------------
+    # Slot metadata
+    # ------------------------------------------------------------------
+
+    def _state_file(self, name: str) -> Path:
+        return self.pool_dir / f"{name}.json"
+
+    def _load_state(self, name: str) -> SlotState:
+        try:
+            data = json.loads(self._state_file(name).read_text(encoding="utf-8"))
+            return SlotState(**data)
+        except (OSError, json.JSONDecodeError, TypeError):
+            return SlotState(name=name)
+
+    def _save_state(self, state: SlotState) -> None:
+        state_file = self._state_file(state.name)
+        tmp_file = state_file.with_suffix(".json.tmp")
+        tmp_file.write_text(json.dumps(asdict(state)), encoding="utf-8")
+        os.replace(tmp_file, state_file)
+
+    def get_slot_info(self) -> list[SlotState]:
+        """Metadata for all known slots, least recently used first."""
+        if not self.pool_dir.exists():
+            return []
+        states = [
+            self._load_state(state_file.stem)
+            for state_file in self.pool_dir.glob("slot-*.json")
+        ]
+        return sorted(states, key=lambda s: s.last_used)
+
+    # ------------------------------------------------------------------
+    # Checkout / release
+    # ------------------------------------------------------------------
+
+    def owns(self, worktree_path: Path) -> bool:
+        """True if the path is a slot currently checked out by this pool."""
+        return Path(worktree_path) in self._held
+
+    def _candidate_names(self, pr_number: int) -> list[str]:
+        states = self.get_slot_info()
+        # Same PR first (smallest checkout delta), then least recently used
+        same_pr = [s.name for s in states if s.pr_number == pr_number]
+        others = [s.name for s in states if s.pr_number != pr_number]
+        names = same_pr + others
+
+        existing = set(names)
+        for index in range(self.max_slots):
+            name = f"slot-{index}"
+            if name not in existing:
+                names.append(name)  # Not created yet
+        return names[: self.max_slots]
+
+    def _lock_slot(self, pr_number: int) -> tuple[_SlotLock, SlotState]:
+        for name in self._candidate_names(pr_number):
+            lock = _SlotLock(self.pool_dir / name)
+            if lock.try_acquire():
+                return lock, self._load_state(name)
+        raise BlockingIOError("All PR worktree pool slots are busy")
+
+    def try_acquire(
+        self,
+        head_sha: str,
+        pr_number: int,
+        sparse_paths: list[str] | None = None,
+    ) -> Path | None:
+        """
+        Check out a free slot at head_sha without waiting.
+
+        Args:
+            head_sha: Commit to check out (validated by the caller)
+            pr_number: PR number (used to prefer the slot that last reviewed it)
+            sparse_paths: Changed/related file paths; enables sparse-checkout
+                          of their directories when sparse mode applies
+
+        Returns:
+            Path to the checked-out slot, or None if every slot is busy
+
+        Raises:
+            RuntimeError: If the checkout fails
+        """
+        try:
+            lock, state = self._lock_slot(pr_number)
+        except BlockingIOError:
+            return None
+
+        slot_path = self.pool_dir / state.name
+        try:
+            sparse_dirs = (
+                cone_directories(sparse_paths)
+                if self._use_sparse(sparse_paths)
+                else None
+            )
+            reused, sparse_dirs = self._prepare_slot(
+                slot_path, state, head_sha, sparse_dirs
+            )
+        except BaseException:
+            lock.release()
+            raise
+
+        state.head_sha = head_sha
+        state.pr_number = pr_number
+        state.sparse_dirs = sparse_dirs
+        state.last_used = time.time()
+        if reused:
+            state.reuse_count += 1
+        self._save_state(state)
+        self._held[slot_path] = (lock, state)
+
+        logger.info(
+            f"[WorktreePool] {'Reused' if reused else 'Created'} {state.name} "
+            f"for PR #{pr_number} at {head_sha[:8]}"
+            + (f" (sparse: {len(sparse_dirs)} dirs)" if sparse_dirs else "")
+        )
+        return slot_path
+
+    def acquire(
+        self,
+        head_sha: str,
+        pr_number: int,
+        sparse_paths: list[str] | None = None,
+        timeout: float = 600.0,
+    ) -> Path:
+        """
+        Check out a slot at head_sha, waiting up to timeout for a free slot.
+
+        Raises:
+            RuntimeError: If no slot frees up in time or the checkout fails
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            slot_path = self.try_acquire(head_sha, pr_number, sparse_paths)
+            if slot_path is not None:
+                return slot_path
+            if time.monotonic() >= deadline:
+                raise RuntimeError(
+                    f"Timed out waiting for a free PR worktree slot "
+                    f"(pool size {self.max_slots})"
+                )
+            time.sleep(_ACQUIRE_POLL_SECONDS)
+
+    def _is_registered(self, slot_path: Path) -> bool:
+        return (slot_path / ".git").exists() and self._git(
+            ["rev-parse", "--git-dir"], cwd=slot_path, timeout=30
+        ).returncode == 0
+
+    def _scrub_slot(self, slot_path: Path) -> bool:
+        """Discard anything a previous review left behind in a slot."""
+        return all(
+            self._git(args, cwd=slot_path).returncode == 0
+            for args in (["reset", "--hard", "-q"], ["clean", "-fdq"])
+        )
+
+    def _disable_sparse(self, slot_path: Path) -> None:
+        """Switch a slot to a full checkout; a slot with an unknown cone is removed."""
+        result = self._git(["sparse-checkout", "disable"], cwd=slot_path)
+        if result.returncode != 0:
+            self._remove_slot(slot_path.name)
+            raise RuntimeError(
+                f"Failed to reset sparse-checkout in {slot_path.name}: "
+                f"{result.stderr.strip()}"
+            )
+
+    def _prepare_slot(
+        self,
+        slot_path: Path,
+        state: SlotState,
+        head_sha: str,
+        sparse_dirs: list[str] | None,
+    ) -> tuple[bool, list[str] | None]:
+        """
+        Reset a slot to head_sha.
+
+        Returns:
+            (True if an existing checkout was reused, the sparse directories
+            actually applied or None for a full checkout)
+        """
+        self._ensure_commit(head_sha)
+
+        reused = slot_path.exists() and self._is_registered(slot_path)
+        if reused and not self._scrub_slot(slot_path):
+            # A slot that cannot be cleaned is recreated rather than reused dirty
+            logger.warning(f"Could not clean {slot_path.name}, recreating it")
+            self._remove_slot(slot_path.name)
+            reused = False
+
+        if not reused:
+            if slot_path.exists():
+                shutil.rmtree(slot_path, ignore_errors=True)
+            self._git(["worktree", "prune"], timeout=30)
+            self.pool_dir.mkdir(parents=True, exist_ok=True)
+            result = self._git(
+                [
+                    "worktree",
+                    "add",
+                    "--detach",
+                    "--no-checkout",
+                    str(slot_path),
+                    head_sha,
+                ]
+            )
+            if result.returncode != 0:
+                shutil.rmtree(slot_path, ignore_errors=True)
+                raise RuntimeError(
+                    f"Failed to create worktree: {result.stderr.strip()}"
+                )
+
+        if sparse_dirs:
+            result = self._git(
+                ["sparse-checkout", "set", "--cone", *sparse_dirs], cwd=slot_path
+            )
+            if result.returncode != 0:
+                logger.warning(
+                    f"sparse-checkout failed in {slot_path.name}, using a full "
+                    f"checkout: {result.stderr.strip()}"
+                )
+                sparse_dirs = None
+                self._disable_sparse(slot_path)
+        elif reused and state.sparse_dirs:
+            self._disable_sparse(slot_path)
+
+        result = self._git(
+            ["checkout", "--detach", "--force", "-q", head_sha], cwd=slot_path
+        )
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"Failed to check out {head_sha} in {slot_path.name}: "
+                f"{result.stderr.strip()}"
+            )
+        return reused, sparse_dirs
+
+    def release(self, worktree_path: Path) -> None:
+        """Return a slot to the pool (the checkout is kept warm)."""
+        held = self._held.pop(Path(worktree_path), None)
+        if held is None:
+            return
+        lock, state = held
+        state.last_used = time.time()
+        self._save_state(state)
+        lock.release()
+
+    # ------------------------------------------------------------------
+    # Cleanup
+    # ------------------------------------------------------------------
+
+    def _remove_slot(self, name: str) -> None:
+        slot_path = self.pool_dir / name
+        result = self._git(
+            ["worktree", "remove", "--force", str(slot_path)], timeout=60
+        )
+        if result.returncode != 0 and slot_path.exists():
+            shutil.rmtree(slot_path, ignore_errors=True)
+            self._git(["worktree", "prune"], timeout=30)
+        self._state_file(name).unlink(missing_ok=True)
+
+    def cleanup(self, max_age_days: float = DEFAULT_SLOT_MAX_AGE_DAYS) -> int:
+        """Remove idle slots unused for longer than max_age_days (or over size)."""
+        removed = 0
+        now = time.time()
+        states = self.get_slot_info()
+        excess = max(0, len(states) - self.max_slots)
+
+        for index, state in enumerate(states):
+            expired = now - state.last_used > max_age_days * 86400
+            if not expired and index >= excess:
+                continue
+            lock = _SlotLock(self.pool_dir / state.name)
+            if not lock.try_acquire():
+                continue  # In use
+            try:
+                self._remove_slot(state.name)
+                removed += 1
+            finally:
+                lock.release()
+
+        if removed:
+            logger.info(f"[WorktreePool] Removed {removed} idle slot(s)")
+        return removed
+
+    def remove_all(self) -> int:
+        """Remove every free slot."""
+        return self.cleanup(max_age_days=-1)
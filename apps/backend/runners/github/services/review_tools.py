@@ -20,12 +20,14 @@ try:
     from ..context_gatherer import PRContext
     from ..models import PRReviewFinding, ReviewSeverity
     from .category_utils import map_category
+    from .client_pool import client_key, get_client_pool
 except (ImportError, ValueError, SystemError):
     from analysis.test_discovery import TestDiscovery
     from category_utils import map_category
     from context_gatherer import PRContext
     from core.client import create_client
     from models import PRReviewFinding, ReviewSeverity
+    from services.client_pool import client_key, get_client_pool
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +36,25 @@ logger = logging.getLogger(__name__)
 _map_category = map_category
 
 
+def _reviewer_client(project_root: Path, github_dir: Path, model: str):
+    """Check out a read-only pr_reviewer client from the shared pool."""
+    key = client_key(
+        model=model,
+        agent_type="pr_reviewer",
+        project_dir=project_root,
+        spec_dir=str(github_dir),
+    )
+    return get_client_pool().session(
+        key,
+        lambda: create_client(
+            project_dir=project_root,
+            spec_dir=github_dir,
+            model=model,
+            agent_type="pr_reviewer",  # Read-only - no bash, no edits
+        ),
+    )
+
+
 @dataclass
 class TestResult:
     """Result from test execution."""
@@ -124,16 +145,9 @@ async def spawn_security_review(
             project_dir.parent.parent if project_dir.name == "backend" else project_dir
         )
 
-        client = create_client(
-            project_dir=project_root,
-            spec_dir=github_dir,
-            model=model,
-            agent_type="pr_reviewer",  # Read-only - no bash, no edits
-        )
-
-        # Run review session
+        # Run review session on a pooled read-only client
         result_text = ""
-        async with client:
+        async with _reviewer_client(project_root, github_dir, model) as client:
             await client.query(full_prompt)
 
             async for msg in client.receive_response():
@@ -210,15 +224,8 @@ async def spawn_quality_review(
             project_dir.parent.parent if project_dir.name == "backend" else project_dir
         )
 
-        client = create_client(
-            project_dir=project_root,
-            spec_dir=github_dir,
-            model=model,
-            agent_type="pr_reviewer",  # Read-only - no bash, no edits
-        )
-
         result_text = ""
-        async with client:
+        async with _reviewer_client(project_root, github_dir, model) as client:
             await client.query(full_prompt)
 
             async for msg in client.receive_response():
@@ -305,15 +312,8 @@ Output findings in JSON format:
             project_dir.parent.parent if project_dir.name == "backend" else project_dir
         )
 
-        client = create_client(
-            project_dir=project_root,
-            spec_dir=github_dir,
-            model=model,
-            agent_type="pr_reviewer",  # Read-only - no bash, no edits
-        )
-
         result_text = ""
-        async with client:
+        async with _reviewer_client(project_root, github_dir, model) as client:
             await client.query(full_prompt)
 
             async for msg in client.receive_response():
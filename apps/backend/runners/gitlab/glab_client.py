@@ -3,21 +3,28 @@ GitLab API Client
 =================
 
 Client for GitLab API operations.
-Uses direct API calls with PRIVATE-TOKEN authentication.
+Uses direct API calls with PRIVATE-TOKEN authentication over a pooled
+keep-alive async transport (see http_transport.py).
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
-import time
+import re
 import urllib.parse
-import urllib.request
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any
 
+from core.http_utils import parse_retry_after
+
+try:
+    from .http_transport import DEFAULT_MAX_PER_HOST, AsyncHTTPTransport, HTTPResponse
+except ImportError:
+    # Fallback for direct script execution (not as a module)
+    from http_transport import DEFAULT_MAX_PER_HOST, AsyncHTTPTransport, HTTPResponse
+
 
 @dataclass
 class GitLabConfig:
@@ -43,6 +50,11 @@ VALID_ENDPOINT_PATTERNS = (
     "/issues/",
 )
 
+# Statuses worth retrying: rate limit and transient server errors
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+MAX_PAGES = 100  # Safety cap when following pagination
+_LINK_NEXT_PATTERN = re.compile(r'<([^>]+)>\s*;\s*rel="?next"?')
+
 
 def validate_endpoint(endpoint: str) -> None:
     """
@@ -71,18 +83,48 @@ def validate_endpoint(endpoint: str) -> None:
         )
 
 
+class GitLabAPIError(Exception):
+    """GitLab API returned an error status."""
+
+    def __init__(self, code: int, body: str = ""):
+        super().__init__(f"GitLab API error {code}: {body}")
+        self.code = code
+        self.body = body
+
+
 class GitLabClient:
-    """Client for GitLab API operations."""
+    """
+    Async client for GitLab API operations.
+
+    All API methods are coroutines sharing one keep-alive connection pool
+    with at most ``max_concurrency`` requests in flight per host. Call
+    close() (or use ``async with``) when done.
+    """
 
     def __init__(
         self,
         project_dir: Path,
         config: GitLabConfig,
         default_timeout: float = 30.0,
+        max_concurrency: int = DEFAULT_MAX_PER_HOST,
+        transport: AsyncHTTPTransport | None = None,
     ):
         self.project_dir = Path(project_dir)
         self.config = config
         self.default_timeout = default_timeout
+        self.transport = transport or AsyncHTTPTransport(
+            max_per_host=max_concurrency, timeout=default_timeout
+        )
+
+    async def __aenter__(self) -> GitLabClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        await self.transport.close()
 
     def _api_url(self, endpoint: str) -> str:
         """Build full API URL."""
@@ -91,103 +133,160 @@ class GitLabClient:
             endpoint = f"/{endpoint}"
         return f"{base}/api/v4{endpoint}"
 
-    def _fetch(
+    async def _request(
         self,
-        endpoint: str,
+        url: str,
         method: str = "GET",
         data: dict | None = None,
         timeout: float | None = None,
         max_retries: int = 3,
-    ) -> Any:
-        """Make an API request to GitLab with rate limit handling."""
-        validate_endpoint(endpoint)
-        url = self._api_url(endpoint)
+    ) -> HTTPResponse:
+        """Send one request, retrying rate limits and transient errors."""
         headers = {
             "PRIVATE-TOKEN": self.config.token,
             "Content-Type": "application/json",
         }
+        request_data = json.dumps(data).encode("utf-8") if data else None
 
-        request_data = None
-        if data:
-            request_data = json.dumps(data).encode("utf-8")
-
-        last_error = None
         for attempt in range(max_retries):
-            req = urllib.request.Request(
-                url,
-                data=request_data,
-                headers=headers,
-                method=method,
-            )
-
+            last_attempt = attempt == max_retries - 1
             try:
-                with urllib.request.urlopen(
-                    req, timeout=timeout or self.default_timeout
-                ) as response:
-                    if response.status == 204:
-                        return None
-                    response_body = response.read().decode("utf-8")
-                    try:
-                        return json.loads(response_body)
-                    except json.JSONDecodeError as e:
-                        raise Exception(
-                            f"Invalid JSON response from GitLab: {e}"
-                        ) from e
-            except urllib.error.HTTPError as e:
-                error_body = e.read().decode("utf-8") if e.fp else ""
-                last_error = e
-
-                # Handle rate limit (429) with exponential backoff
-                if e.code == 429:
-                    # Default to exponential backoff: 1s, 2s, 4s
+                response = await self.transport.request(
+                    method,
+                    url,
+                    body=request_data,
+                    headers=headers,
+                    timeout=timeout or self.default_timeout,
+                )
+            except OSError as e:
+                if last_attempt:
+                    raise
+                wait_time = 2**attempt
+                print(
+                    f"[GitLab] Connection error ({e}). Retrying in {wait_time}s "
+                    f"(attempt {attempt + 1}/{max_retries})...",
+                    flush=True,
+                )
+                await asyncio.sleep(wait_time)
+                continue
+
+            if response.status < 400:
+                return response
+
+            # Handle rate limit (429) and transient 5xx with backoff
+            if response.status in RETRYABLE_STATUSES and not last_attempt:
+                # Default to exponential backoff: 1s, 2s, 4s
+                wait_time = parse_retry_after(response.header("Retry-After"))
+                if wait_time is None:
                     wait_time = 2**attempt
-
-                    # Check for Retry-After header (can be integer seconds or HTTP-date)
-                    retry_after = e.headers.get("Retry-After")
-                    if retry_after:
-                        try:
-                            # Try parsing as integer seconds first
-                            wait_time = int(retry_after)
-                        except ValueError:
-                            # Try parsing as HTTP-date (e.g., "Wed, 21 Oct 2015 07:28:00 GMT")
-                            try:
-                                retry_date = parsedate_to_datetime(retry_after)
-                                now = datetime.now(timezone.utc)
-                                delta = (retry_date - now).total_seconds()
-                                wait_time = max(1, int(delta))  # At least 1 second
-                            except (ValueError, TypeError):
-                                # Parsing failed, keep exponential backoff default
-                                pass
-
-                    if attempt < max_retries - 1:
-                        print(
-                            f"[GitLab] Rate limited (429). Retrying in {wait_time}s "
-                            f"(attempt {attempt + 1}/{max_retries})...",
-                            flush=True,
-                        )
-                        time.sleep(wait_time)
-                        continue
-
-                raise Exception(f"GitLab API error {e.code}: {error_body}") from e
+                reason = "Rate limited" if response.status == 429 else "Server error"
+                print(
+                    f"[GitLab] {reason} ({response.status}). Retrying in "
+                    f"{wait_time:g}s (attempt {attempt + 1}/{max_retries})...",
+                    flush=True,
+                )
+                await asyncio.sleep(wait_time)
+                continue
+
+            raise GitLabAPIError(
+                response.status, response.body.decode("utf-8", errors="replace")
+            )
 
         # Should not reach here, but just in case
-        raise Exception(f"GitLab API error after {max_retries} retries") from last_error
+        raise GitLabAPIError(0, f"No response after {max_retries} retries")
 
-    def get_mr(self, mr_iid: int) -> dict:
+    @staticmethod
+    def _decode(response: HTTPResponse) -> Any:
+        if response.status == 204 or not response.body:
+            return None
+        try:
+            return json.loads(response.body.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise Exception(f"Invalid JSON response from GitLab: {e}") from e
+
+    @staticmethod
+    def _next_page_url(response: HTTPResponse, current_url: str) -> str | None:
+        """Next page URL from the Link header, falling back to X-Next-Page."""
+        link = response.header("Link")
+        if link:
+            match = _LINK_NEXT_PATTERN.search(link)
+            if match:
+                next_url = match.group(1)
+                # Never send the token to a host other than the instance
+                current_host = urllib.parse.urlsplit(current_url).netloc
+                if urllib.parse.urlsplit(next_url).netloc == current_host:
+                    return next_url
+                return None
+
+        next_page = (response.header("X-Next-Page") or "").strip()
+        if not next_page.isdigit():
+            return None
+        parts = urllib.parse.urlsplit(current_url)
+        query = dict(urllib.parse.parse_qsl(parts.query))
+        query["page"] = next_page
+        return urllib.parse.urlunsplit(
+            parts._replace(query=urllib.parse.urlencode(query))
+        )
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: dict | None = None,
+        timeout: float | None = None,
+        max_retries: int = 3,
+    ) -> Any:
+        """Make an API request to GitLab with rate limit handling."""
+        validate_endpoint(endpoint)
+        response = await self._request(
+            self._api_url(endpoint), method, data, timeout, max_retries
+        )
+        return self._decode(response)
+
+    async def _fetch_all(
+        self,
+        endpoint: str,
+        per_page: int = 100,
+        timeout: float | None = None,
+        max_retries: int = 3,
+    ) -> list:
+        """GET a list endpoint, following pagination (Link / X-Next-Page)."""
+        validate_endpoint(endpoint)
+        separator = "&" if "?" in endpoint else "?"
+        url = self._api_url(f"{endpoint}{separator}per_page={per_page}")
+
+        items: list = []
+        for _ in range(MAX_PAGES):
+            response = await self._request(
+                url, timeout=timeout, max_retries=max_retries
+            )
+            page = self._decode(response)
+            if isinstance(page, list):
+                items.extend(page)
+            elif page is not None:
+                items.append(page)
+
+            next_url = self._next_page_url(response, url)
+            if not next_url:
+                break
+            url = next_url
+        return items
+
+    async def get_mr(self, mr_iid: int) -> dict:
         """Get MR details."""
         encoded_project = encode_project_path(self.config.project)
-        return self._fetch(f"/projects/{encoded_project}/merge_requests/{mr_iid}")
+        return await self._fetch(f"/projects/{encoded_project}/merge_requests/{mr_iid}")
 
-    def get_mr_changes(self, mr_iid: int) -> dict:
+    async def get_mr_changes(self, mr_iid: int) -> dict:
         """Get MR changes (diff)."""
         encoded_project = encode_project_path(self.config.project)
-        return self._fetch(
+        return await self._fetch(
             f"/projects/{encoded_project}/merge_requests/{mr_iid}/changes"
         )
 
-    def get_mr_diff(self, mr_iid: int) -> str:
+    async def get_mr_diff(self, mr_iid: int) -> str:
         """Get the full diff for an MR."""
-        changes = self.get_mr_changes(mr_iid)
+        changes = await self.get_mr_changes(mr_iid)
         diffs = []
         for change in changes.get("changes", []):
             diff = change.get("diff", "")
@@ -195,50 +294,57 @@ class GitLabClient:
                 diffs.append(diff)
         return "\n".join(diffs)
 
-    def get_mr_commits(self, mr_iid: int) -> list[dict]:
-        """Get commits for an MR."""
+    async def get_mr_commits(self, mr_iid: int) -> list[dict]:
+        """Get commits for an MR (all pages)."""
         encoded_project = encode_project_path(self.config.project)
-        return self._fetch(
+        return await self._fetch_all(
             f"/projects/{encoded_project}/merge_requests/{mr_iid}/commits"
         )
 
-    def get_current_user(self) -> dict:
+    async def get_mr_discussions(self, mr_iid: int) -> list[dict]:
+        """Get discussion threads for an MR (all pages)."""
+        encoded_project = encode_project_path(self.config.project)
+        return await self._fetch_all(
+            f"/projects/{encoded_project}/merge_requests/{mr_iid}/discussions"
+        )
+
+    async def get_current_user(self) -> dict:
         """Get current authenticated user."""
-        return self._fetch("/user")
+        return await self._fetch("/user")
 
-    def post_mr_note(self, mr_iid: int, body: str) -> dict:
+    async def post_mr_note(self, mr_iid: int, body: str) -> dict:
         """Post a note (comment) to an MR."""
         encoded_project = encode_project_path(self.config.project)
-        return self._fetch(
+        return await self._fetch(
             f"/projects/{encoded_project}/merge_requests/{mr_iid}/notes",
             method="POST",
             data={"body": body},
         )
 
-    def approve_mr(self, mr_iid: int) -> dict:
+    async def approve_mr(self, mr_iid: int) -> dict:
         """Approve an MR."""
         encoded_project = encode_project_path(self.config.project)
-        return self._fetch(
+        return await self._fetch(
             f"/projects/{encoded_project}/merge_requests/{mr_iid}/approve",
             method="POST",
         )
 
-    def merge_mr(self, mr_iid: int, squash: bool = False) -> dict:
+    async def merge_mr(self, mr_iid: int, squash: bool = False) -> dict:
         """Merge an MR."""
         encoded_project = encode_project_path(self.config.project)
         data = {}
         if squash:
             data["squash"] = True
-        return self._fetch(
+        return await self._fetch(
             f"/projects/{encoded_project}/merge_requests/{mr_iid}/merge",
             method="PUT",
             data=data if data else None,
         )
 
-    def assign_mr(self, mr_iid: int, user_ids: list[int]) -> dict:
+    async def assign_mr(self, mr_iid: int, user_ids: list[int]) -> dict:
         """Assign users to an MR."""
         encoded_project = encode_project_path(self.config.project)
-        return self._fetch(
+        return await self._fetch(
             f"/projects/{encoded_project}/merge_requests/{mr_iid}",
             method="PUT",
             data={"assignee_ids": user_ids},
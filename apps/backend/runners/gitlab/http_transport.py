@@ -0,0 +1,280 @@
+"""
+Async HTTP Transport
+====================
+
+Pooled keep-alive HTTP transport for the GitLab API.
+
+Requests are made on persistent ``http.client`` connections (one TCP/TLS
+handshake per connection instead of per request) and executed in worker
+threads, so awaiting a request never blocks the event loop. A per-host
+semaphore bounds how many requests are in flight against one host, which
+is also the maximum number of pooled connections for it.
+
+No third-party HTTP library is required.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import http.client
+import select
+import ssl
+import urllib.parse
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+DEFAULT_MAX_PER_HOST = 8
+DEFAULT_TIMEOUT = 30.0
+
+# Errors that mean a pooled keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+# Methods that may be sent again after a stale connection error. Other
+# methods (POST/PUT notes, approvals, merges) may already have reached the
+# server, so they are only resent if the request was never written.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _can_resend(method: str, error: BaseException) -> bool:
+    return method.upper() in _IDEMPOTENT_METHODS or isinstance(
+        error, http.client.CannotSendRequest
+    )
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    """True if the server closed an idle connection (readable means EOF)."""
+    if conn.sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _close_after_worker(
+    worker: asyncio.Future, conn: http.client.HTTPConnection
+) -> None:
+    if not worker.cancelled():
+        worker.exception()  # Retrieve it so it is not reported as unhandled
+    conn.close()
+
+
+@dataclass
+class HTTPResponse:
+    """A fully read HTTP response."""
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    def header(self, name: str, default: str | None = None) -> str | None:
+        """Case-insensitive header lookup."""
+        return self.headers.get(name.lower(), default)
+
+
+@dataclass
+class TransportStats:
+    """Connection and request counters."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+    peak_in_flight: dict[str, int] = field(default_factory=dict)
+
+
+HostKey = tuple[str, str, int]
+
+
+class AsyncHTTPTransport:
+    """
+    Keep-alive connection pool with per-host concurrency limits.
+
+    Usage:
+        transport = AsyncHTTPTransport(max_per_host=8)
+        response = await transport.request("GET", "https://gitlab.com/api/v4/user")
+        await transport.close()
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        timeout: float = DEFAULT_TIMEOUT,
+        ssl_context: ssl.SSLContext | None = None,
+    ):
+        self.max_per_host = max(1, max_per_host)
+        self.timeout = timeout
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self.stats = TransportStats()
+        self._idle: dict[HostKey, list[http.client.HTTPConnection]] = defaultdict(list)
+        self._limits: dict[HostKey, asyncio.Semaphore] = {}
+        self._in_flight: dict[HostKey, int] = defaultdict(int)
+        self._closed = False
+
+    @staticmethod
+    def _host_key(url: str) -> tuple[HostKey, str]:
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        return (parts.scheme, parts.hostname, port), target
+
+    def _new_connection(
+        self, key: HostKey, timeout: float
+    ) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        self.stats.connections_opened += 1
+        if scheme == "https":
+            return http.client.HTTPSConnection(
+                host, port, timeout=timeout, context=self.ssl_context
+            )
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    @staticmethod
+    def _send(
+        conn: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        body: bytes | None,
+        headers: dict[str, str],
+    ) -> tuple[HTTPResponse, bool]:
+        """Blocking request on one connection; returns (response, reusable)."""
+        conn.request(method, target, body=body, headers=headers)
+        raw = conn.getresponse()
+        payload = raw.read()
+        response = HTTPResponse(
+            status=raw.status,
+            headers={k.lower(): v for k, v in raw.getheaders()},
+            body=payload,
+        )
+        return response, not raw.will_close
+
+    async def _send_in_thread(
+        self,
+        conn: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        body: bytes | None,
+        headers: dict[str, str],
+    ) -> tuple[HTTPResponse, bool]:
+        """
+        Run _send in a worker thread.
+
+        Cancelling the caller cannot stop the worker, which keeps using the
+        connection until the request finishes or times out; the connection
+        is closed only after that, instead of under the worker's feet.
+        """
+        worker = asyncio.ensure_future(
+            asyncio.to_thread(self._send, conn, method, target, body, headers)
+        )
+        try:
+            return await asyncio.shield(worker)
+        except asyncio.CancelledError:
+            worker.add_done_callback(lambda _: _close_after_worker(worker, conn))
+            raise
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> HTTPResponse:
+        """
+        Send a request and read the full response.
+
+        Raises:
+            OSError / http.client.HTTPException: On connection failures
+                (a stale pooled connection is retried once on a new one)
+        """
+        if self._closed:
+            raise RuntimeError("Transport is closed")
+
+        key, target = self._host_key(url)
+        limit = self._limits.get(key)
+        if limit is None:
+            limit = self._limits[key] = asyncio.Semaphore(self.max_per_host)
+
+        async with limit:
+            self._in_flight[key] += 1
+            host = key[1]
+            self.stats.peak_in_flight[host] = max(
+                self.stats.peak_in_flight.get(host, 0), self._in_flight[key]
+            )
+            try:
+                return await self._request_on_pool(
+                    key, method, target, body, headers or {}, timeout or self.timeout
+                )
+            finally:
+                self._in_flight[key] -= 1
+
+    async def _request_on_pool(
+        self,
+        key: HostKey,
+        method: str,
+        target: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> HTTPResponse:
+        self.stats.requests += 1
+        idle = self._idle[key]
+        while idle and _is_dropped(idle[-1]):
+            idle.pop().close()
+        reused = bool(idle)
+        conn = idle.pop() if reused else self._new_connection(key, timeout)
+        if reused:
+            self.stats.connections_reused += 1
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+
+        try:
+            response, reusable = await self._send_in_thread(
+                conn, method, target, body, headers
+            )
+        except asyncio.CancelledError:
+            raise  # Closed by _send_in_thread once the worker is done with it
+        except _STALE_CONNECTION_ERRORS as e:
+            conn.close()
+            if not reused or not _can_resend(method, e):
+                raise
+            # Server closed the idle keep-alive connection; retry once fresh
+            conn = self._new_connection(key, timeout)
+            try:
+                response, reusable = await self._send_in_thread(
+                    conn, method, target, body, headers
+                )
+            except asyncio.CancelledError:
+                raise
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()
+            raise
+
+        if reusable and not self._closed:
+            self._idle[key].append(conn)
+        else:
+            conn.close()
+        return response
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        self._closed = True
+        for connections in self._idle.values():
+            for conn in connections:
+                conn.close()
+        self._idle.clear()
@@ -237,6 +237,7 @@ class MRContext:
     total_additions: int = 0
     total_deletions: int = 0
     commits: list[dict] = field(default_factory=list)
+    discussions: list[dict] = field(default_factory=list)
     head_sha: str | None = None
 
 
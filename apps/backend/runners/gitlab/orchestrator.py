@@ -9,15 +9,15 @@ Main coordinator for GitLab automation workflows:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import traceback
-import urllib.error
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
 try:
-    from .glab_client import GitLabClient, GitLabConfig
+    from .glab_client import GitLabAPIError, GitLabClient, GitLabConfig
     from .models import (
         GitLabRunnerConfig,
         MergeVerdict,
@@ -27,7 +27,7 @@ try:
     from .services import MRReviewEngine
 except ImportError:
     # Fallback for direct script execution (not as a module)
-    from glab_client import GitLabClient, GitLabConfig
+    from glab_client import GitLabAPIError, GitLabClient, GitLabConfig
     from models import (
         GitLabRunnerConfig,
         MergeVerdict,
@@ -93,7 +93,7 @@ class GitLabOrchestrator:
             instance_url=config.instance_url,
         )
 
-        # Initialize client
+        # Initialize client (shares one keep-alive connection pool across MRs)
         self.client = GitLabClient(
             project_dir=self.project_dir,
             config=self.gitlab_config,
@@ -130,18 +130,22 @@ class GitLabOrchestrator:
         if self.progress_callback:
             self.progress_callback(callback)
 
+    async def close(self) -> None:
+        """Release pooled GitLab API connections."""
+        await self.client.close()
+
     async def _gather_mr_context(self, mr_iid: int) -> MRContext:
         """Gather context for an MR."""
         safe_print(f"[GitLab] Fetching MR !{mr_iid} data...")
 
-        # Get MR details
-        mr_data = self.client.get_mr(mr_iid)
-
-        # Get changes
-        changes_data = self.client.get_mr_changes(mr_iid)
-
-        # Get commits
-        commits = self.client.get_mr_commits(mr_iid)
+        # Fetch MR details, changes, commits and discussions concurrently;
+        # the client bounds in-flight requests per host
+        mr_data, changes_data, commits, discussions = await asyncio.gather(
+            self.client.get_mr(mr_iid),
+            self.client.get_mr_changes(mr_iid),
+            self.client.get_mr_commits(mr_iid),
+            self.client.get_mr_discussions(mr_iid),
+        )
 
         # Build diff from changes
         diffs = []
@@ -185,6 +189,7 @@ class GitLabOrchestrator:
             total_additions=total_additions,
             total_deletions=total_deletions,
             commits=commits,
+            discussions=discussions,
             head_sha=head_sha,
         )
 
@@ -264,7 +269,7 @@ class GitLabOrchestrator:
 
             return result
 
-        except urllib.error.HTTPError as e:
+        except GitLabAPIError as e:
             error_msg = f"GitLab API error {e.code}"
             if e.code == 401:
                 error_msg = "GitLab authentication failed. Check your token."
@@ -459,7 +464,7 @@ class GitLabOrchestrator:
 
             return result
 
-        except urllib.error.HTTPError as e:
+        except GitLabAPIError as e:
             error_msg = f"GitLab API error {e.code}"
             if e.code == 401:
                 error_msg = "GitLab authentication failed. Check your token."
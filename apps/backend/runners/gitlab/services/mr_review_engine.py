@@ -189,6 +189,22 @@ Provide your review in the following JSON format:
         )
         diff_content = sanitize_user_content(context.diff, max_length=50000)
 
+        # Unresolved reviewer threads, so the AI doesn't repeat open comments
+        open_threads = []
+        for discussion in context.discussions:
+            notes = [n for n in discussion.get("notes", []) if not n.get("system")]
+            if notes and notes[0].get("resolvable") and not notes[0].get("resolved"):
+                author = notes[0].get("author", {}).get("username", "unknown")
+                body = sanitize_user_content(notes[0].get("body", ""), max_length=500)
+                open_threads.append(f"- @{author}: {body}")
+        discussions_section = ""
+        if open_threads:
+            discussions_section = (
+                "\n### Open Discussions\n---USER CONTENT START---\n"
+                + "\n".join(open_threads[:20])
+                + "\n---USER CONTENT END---\n"
+            )
+
         # Wrap user-provided content in clear delimiters to prevent prompt injection
         # The AI should treat content between these markers as untrusted user input
         mr_context = f"""
@@ -210,7 +226,7 @@ Provide your review in the following JSON format:
 
 ### Files Changed
 {files_str}
-
+{discussions_section}
 ### Diff
 ---USER CONTENT START---
 ```diff
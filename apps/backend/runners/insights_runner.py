@@ -40,6 +40,7 @@ except ImportError:
     ClaudeSDKClient = None
 
 from core.auth import ensure_claude_code_oauth_token, get_auth_token
+from core.project_index import ProjectIndex
 from debug import (
     debug,
     debug_detailed,
@@ -55,11 +56,10 @@ def load_project_context(project_dir: str) -> str:
     context_parts = []
 
     # Load project index if available (from .auto-claude - the installed instance)
-    index_path = Path(project_dir) / ".auto-claude" / "project_index.json"
-    if index_path.exists():
+    project_index = ProjectIndex.for_project(Path(project_dir))
+    if project_index.exists():
         try:
-            with open(index_path, encoding="utf-8") as f:
-                index = json.load(f)
+            index = project_index.data()
             # Summarize the index for context
             summary = {
                 "project_root": index.get("project_root", ""),
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Plan Store Benchmark
+====================
+
+Compares the per-call cost of progress reads (count_subtasks +
+get_next_subtask) when re-parsing implementation_plan.json on every call
+against reads through the shared PlanStore, for several plan sizes.
+
+Plans are generated in a temporary directory.
+
+Usage:
+    cd apps/backend
+    python scripts/benchmark_plan_store.py
+    python scripts/benchmark_plan_store.py --sizes 50 500 5000 --calls 500
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the backend directory to the path so we can import modules
+SCRIPT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = SCRIPT_DIR.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from core.plan_store import PLAN_FILE, PlanStore  # noqa: E402
+
+
+def make_plan(subtasks: int, phases: int = 10) -> dict:
+    per_phase = max(1, subtasks // phases)
+    return {
+        "feature": "Benchmark",
+        "phases": [
+            {
+                "id": f"phase-{p}",
+                "name": f"Phase {p}",
+                "depends_on": [f"phase-{p - 1}"] if p > 1 else [],
+                "subtasks": [
+                    {
+                        "id": f"{p}.{s}",
+                        "description": f"Implement part {s} of phase {p} " * 4,
+                        "status": "completed" if p <= phases // 2 else "pending",
+                        "files_to_modify": [f"src/module_{p}/file_{s}.py"],
+                    }
+                    for s in range(per_phase)
+                ],
+            }
+            for p in range(1, phases + 1)
+        ],
+    }
+
+
+def uncached_reads(spec_dir: Path) -> None:
+    """What each progress helper did before: open + parse + scan."""
+    for _ in range(2):
+        with open(spec_dir / PLAN_FILE, encoding="utf-8") as f:
+            plan = json.load(f)
+        sum(
+            1
+            for phase in plan.get("phases", [])
+            for subtask in phase.get("subtasks", [])
+            if subtask.get("status") == "completed"
+        )
+
+
+def store_reads(spec_dir: Path) -> None:
+    store = PlanStore.for_spec(spec_dir)
+    store.aggregates()
+    store.next_subtask()
+
+
+def time_per_call(func, spec_dir: Path, calls: int) -> float:
+    func(spec_dir)  # Warm up
+    start = time.perf_counter()
+    for _ in range(calls):
+        func(spec_dir)
+    return (time.perf_counter() - start) / calls
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 500, 2000], help="Subtasks"
+    )
+    parser.add_argument("--calls", type=int, default=200, help="Calls per measurement")
+    args = parser.parse_args()
+
+    print(f"{'subtasks':>9} {'uncached us':>12} {'store us':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory(prefix="plan-bench-") as tmp:
+        for size in args.sizes:
+            spec_dir = Path(tmp) / f"spec-{size}"
+            spec_dir.mkdir()
+            (spec_dir / PLAN_FILE).write_text(
+                json.dumps(make_plan(size), indent=2), encoding="utf-8"
+            )
+            uncached = time_per_call(uncached_reads, spec_dir, args.calls)
+            cached = time_per_call(store_reads, spec_dir, args.calls)
+            print(
+                f"{size:>9} {uncached * 1e6:>12.1f} {cached * 1e6:>10.1f} "
+                f"{uncached / cached:>7.0f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Sparse Worktree Benchmark
+=========================
+
+Compares creation time and disk usage of a full spec worktree against a
+sparse one seeded from a spec's context.json (or explicit paths).
+
+Worktrees are created detached in a temporary directory and removed
+afterwards; the repository's branches are not touched.
+
+Usage:
+    cd apps/backend
+    python scripts/benchmark_sparse_worktree.py --repo /path/to/repo \\
+        --spec-dir /path/to/repo/.auto-claude/specs/001-feature
+
+    # Explicit seed paths instead of a spec
+    python scripts/benchmark_sparse_worktree.py --repo . --paths src/app.py docs/
+
+    # Average over several runs
+    python scripts/benchmark_sparse_worktree.py --repo . --paths src/ --runs 3
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the backend directory to the path so we can import modules
+SCRIPT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = SCRIPT_DIR.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from core.git_executable import run_git  # noqa: E402
+from core.sparse_worktree import (  # noqa: E402
+    apply_sparse_checkout,
+    collect_sparse_seed,
+    cone_directories,
+)
+
+
+def disk_usage(path: Path) -> tuple[int, int]:
+    """Return (bytes, files) of a worktree, excluding its .git file."""
+    total = files = 0
+    for root, dirs, filenames in os.walk(path):
+        dirs[:] = [d for d in dirs if d != ".git"]
+        for name in filenames:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+                files += 1
+            except OSError:
+                pass
+    return total, files
+
+
+def create_worktree(repo: Path, target: Path, sparse_dirs: list[str] | None) -> float:
+    """Create a detached worktree at HEAD and return the elapsed seconds."""
+    start = time.perf_counter()
+    args = ["worktree", "add", "--detach"]
+    if sparse_dirs:
+        args.append("--no-checkout")
+    result = run_git([*args, str(target), "HEAD"], cwd=repo, timeout=1800)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+    if sparse_dirs:
+        apply_sparse_checkout(target, sparse_dirs)
+    return time.perf_counter() - start
+
+
+def remove_worktree(repo: Path, target: Path) -> None:
+    run_git(["worktree", "remove", "--force", str(target)], cwd=repo, timeout=600)
+
+
+def benchmark(repo: Path, sparse_dirs: list[str], runs: int) -> dict[str, dict]:
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="sparse-bench-") as tmp:
+        for label, dirs in (("full", None), ("sparse", sparse_dirs)):
+            times = []
+            size = count = 0
+            for run in range(runs):
+                target = Path(tmp) / f"{label}-{run}"
+                try:
+                    times.append(create_worktree(repo, target, dirs))
+                    size, count = disk_usage(target)
+                finally:
+                    remove_worktree(repo, target)
+            results[label] = {
+                "seconds": sum(times) / len(times),
+                "bytes": size,
+                "files": count,
+            }
+    run_git(["worktree", "prune"], cwd=repo)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repo", type=Path, default=Path.cwd(), help="Git repository")
+    seed = parser.add_mutually_exclusive_group(required=True)
+    seed.add_argument("--spec-dir", type=Path, help="Spec directory with context.json")
+    seed.add_argument(
+        "--paths", nargs="+", help="Seed files or directories (dirs end with /)"
+    )
+    parser.add_argument(
+        "--runs", type=int, default=1, help="Runs per mode (default: 1)"
+    )
+    args = parser.parse_args()
+
+    repo = args.repo.resolve()
+    if args.spec_dir:
+        files, directories = collect_sparse_seed(repo, args.spec_dir.resolve())
+    else:
+        files = [p for p in args.paths if not p.endswith("/")]
+        directories = [p for p in args.paths if p.endswith("/")]
+    sparse_dirs = cone_directories(files, directories)
+    if not sparse_dirs:
+        print("Seed resolves to no directories; nothing to compare.")
+        return 1
+
+    print(f"Repository: {repo}")
+    print(f"Sparse cone: {len(sparse_dirs)} directories")
+    results = benchmark(repo, sparse_dirs, max(1, args.runs))
+
+    full, sparse = results["full"], results["sparse"]
+    print()
+    print(f"{'mode':<8} {'seconds':>9} {'MiB':>10} {'files':>9}")
+    for label, row in results.items():
+        print(
+            f"{label:<8} {row['seconds']:>9.2f} {row['bytes'] / 2**20:>10.1f} {row['files']:>9}"
+        )
+    if full["seconds"] and full["bytes"]:
+        print()
+        print(
+            f"sparse/full: time {sparse['seconds'] / full['seconds']:.0%}, "
+            f"disk {sparse['bytes'] / full['bytes']:.0%}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,384 @@
+"""
+Attempt Log
+===========
+
+Append-only log of subtask attempts with MinHash signatures of their
+approaches, and an in-memory index for near-duplicate lookup.
+
+Each attempt is one JSON line in memory/attempt_log.jsonl, so recording an
+attempt costs the same regardless of how long the build has been running.
+The index is rebuilt from the log on first use and then follows it by
+reading only the lines appended since (by any process).
+
+Approaches are compared by Jaccard similarity of their keywords. The
+index stores a MinHash signature per attempt and buckets it with LSH
+banding, so finding attempts with a similar approach - within a subtask or
+across all subtasks - only compares against the candidates sharing a band
+instead of every attempt in the history.
+
+Usage:
+    from services.attempt_log import AttemptLog
+
+    log = AttemptLog.for_memory_dir(spec_dir / "memory")
+    log.append("1.2", session=3, success=False, approach="retry with asyncio")
+    for record, similarity in log.similar("use asyncio", exclude_subtask="1.2"):
+        print(record.subtask_id, record.approach, similarity)
+"""
+
+import base64
+import hashlib
+import json
+import os
+import random
+import threading
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+LOG_FILE = "attempt_log.jsonl"
+
+# 16 bands of 4 rows: attempts with a similarity of 0.5 share a band with
+# ~65% probability, 0.7 with ~99%; candidates are then checked against
+# SIMILAR_APPROACH_THRESHOLD using the signature estimate
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SIMILAR_APPROACH_THRESHOLD = 0.5
+
+STOP_WORDS = frozenset(
+    {
+        "with",
+        "using",
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "trying",
+    }
+)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+Signature = tuple[int, ...]
+
+
+def approach_tokens(approach: str) -> frozenset[str]:
+    """Keywords of an approach description (lowercased, without stop words)."""
+    return frozenset(w for w in approach.lower().split() if w not in STOP_WORDS)
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    """Exact Jaccard similarity (0.0 when both sets are empty)."""
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+def minhash(tokens: frozenset[str]) -> Signature:
+    """MinHash signature of a token set (empty for no tokens)."""
+    if not tokens:
+        return ()
+    hashes = [
+        int.from_bytes(hashlib.blake2b(t.encode(), digest_size=8).digest(), "big")
+        for t in tokens
+    ]
+    return tuple(
+        min(((a * h + b) % _MERSENNE_PRIME) & 0xFFFFFFFF for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def estimate_similarity(a: Signature, b: Signature) -> float:
+    """Jaccard similarity estimated from two signatures."""
+    if not a or not b:
+        return 0.0
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def _encode_signature(signature: Signature) -> str:
+    return base64.b64encode(array("I", signature).tobytes()).decode("ascii")
+
+
+def _decode_signature(encoded: str) -> Signature:
+    values = array("I")
+    values.frombytes(base64.b64decode(encoded))
+    return tuple(values)
+
+
+@dataclass
+class AttemptRecord:
+    """One attempt at a subtask."""
+
+    subtask_id: str
+    session: int
+    timestamp: str
+    approach: str
+    success: bool
+    error: str | None
+    signature: Signature
+
+    def to_dict(self) -> dict:
+        """The attempt as stored in attempt_history.json."""
+        return {
+            "session": self.session,
+            "timestamp": self.timestamp,
+            "approach": self.approach,
+            "success": self.success,
+            "error": self.error,
+        }
+
+
+class AttemptLog:
+    """
+    Shared, append-only attempt history of one spec.
+
+    Records returned by attempts() and similar() are shared and must be
+    treated as read-only.
+    """
+
+    _logs: dict[Path, "AttemptLog"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, memory_dir: Path):
+        self.memory_dir = Path(memory_dir)
+        self.path = self.memory_dir / LOG_FILE
+        self._lock = threading.RLock()
+        self._reset_index()
+
+    @classmethod
+    def for_memory_dir(cls, memory_dir: Path) -> "AttemptLog":
+        """Get the shared log for a spec's memory directory."""
+        key = Path(memory_dir).resolve()
+        with cls._registry_lock:
+            log = cls._logs.get(key)
+            if log is None:
+                log = cls._logs[key] = cls(key)
+            return log
+
+    @classmethod
+    def clear_registry(cls) -> None:
+        """Forget all shared logs."""
+        with cls._registry_lock:
+            cls._logs.clear()
+
+    # -------------------------------------------------------------------------
+    # Index
+    # -------------------------------------------------------------------------
+
+    def _reset_index(self) -> None:
+        self._records: list[AttemptRecord | None] = []
+        self._by_subtask: dict[str, list[int]] = {}
+        self._buckets: dict[tuple[int, Signature], list[int]] = {}
+        self._offset = 0
+        self._inode: int | None = None
+
+    def _refresh(self) -> None:
+        """Apply lines appended since the last read. Caller holds the lock."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            if self._inode is not None:
+                self._reset_index()
+            return
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            # Replaced or truncated: rebuild from the start
+            self._reset_index()
+            self._inode = st.st_ino
+        if st.st_size == self._offset:
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        # Only consume complete lines; a concurrent append may be in flight
+        end = data.rfind(b"\n") + 1
+        self._offset += end
+        for line in data[:end].splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                continue  # Skip corrupt lines
+
+    def _apply(self, entry: dict) -> None:
+        subtask_id = str(entry["subtask_id"])
+        if entry.get("event") == "reset":
+            for i in self._by_subtask.pop(subtask_id, []):
+                self._records[i] = None
+            return
+
+        signature = entry.get("minhash")
+        record = AttemptRecord(
+            subtask_id=subtask_id,
+            session=entry.get("session", 0),
+            timestamp=entry.get("timestamp", ""),
+            approach=entry.get("approach", ""),
+            success=bool(entry.get("success")),
+            error=entry.get("error"),
+            signature=(
+                _decode_signature(signature)
+                if signature is not None
+                else minhash(approach_tokens(entry.get("approach", "")))
+            ),
+        )
+        index = len(self._records)
+        self._records.append(record)
+        self._by_subtask.setdefault(subtask_id, []).append(index)
+        for band in range(BANDS if record.signature else 0):
+            key = (band, record.signature[band * ROWS : (band + 1) * ROWS])
+            self._buckets.setdefault(key, []).append(index)
+
+    def _write(self, entries: list[dict]) -> None:
+        self.memory_dir.mkdir(parents=True, exist_ok=True)
+        lines = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _attempt_entry(
+        subtask_id: str,
+        session: int,
+        success: bool,
+        approach: str,
+        error: str | None,
+        timestamp: str | None,
+    ) -> dict:
+        signature = minhash(approach_tokens(approach))
+        return {
+            "subtask_id": subtask_id,
+            "session": session,
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "approach": approach,
+            "success": success,
+            "error": error,
+            "minhash": _encode_signature(signature) if signature else None,
+        }
+
+    def append(
+        self,
+        subtask_id: str,
+        session: int,
+        success: bool,
+        approach: str,
+        error: str | None = None,
+        timestamp: str | None = None,
+    ) -> None:
+        """Record an attempt."""
+        entry = self._attempt_entry(
+            subtask_id, session, success, approach, error, timestamp
+        )
+        with self._lock:
+            self._write([entry])
+            self._refresh()
+
+    def reset(self, subtask_id: str) -> None:
+        """Forget a subtask's attempts."""
+        with self._lock:
+            self._write([{"event": "reset", "subtask_id": subtask_id}])
+            self._refresh()
+
+    def import_history(self, subtasks: dict) -> None:
+        """
+        Create the log from an attempt_history.json "subtasks" dict.
+
+        Used once for spec directories recorded before the log existed;
+        does nothing if the log already exists.
+        """
+        with self._lock:
+            if self.path.exists():
+                return
+            entries = [
+                self._attempt_entry(
+                    subtask_id,
+                    attempt.get("session", 0),
+                    bool(attempt.get("success")),
+                    attempt.get("approach", ""),
+                    attempt.get("error"),
+                    attempt.get("timestamp"),
+                )
+                for subtask_id, data in subtasks.items()
+                for attempt in data.get("attempts", [])
+            ]
+            self._write(entries)
+            self._refresh()
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def attempts(self, subtask_id: str) -> list[AttemptRecord]:
+        """A subtask's attempts, oldest first."""
+        with self._lock:
+            self._refresh()
+            return [self._records[i] for i in self._by_subtask.get(subtask_id, [])]
+
+    def count(self, subtask_id: str) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._by_subtask.get(subtask_id, []))
+
+    def similar(
+        self,
+        approach: str | Signature,
+        subtask_id: str | None = None,
+        exclude_subtask: str | None = None,
+        failed_only: bool = True,
+        threshold: float = SIMILAR_APPROACH_THRESHOLD,
+    ) -> list[tuple[AttemptRecord, float]]:
+        """
+        Attempts with an approach similar to the given one.
+
+        Args:
+            approach: Approach description, or its signature
+            subtask_id: Only consider this subtask's attempts
+            exclude_subtask: Skip this subtask's attempts
+            failed_only: Skip successful attempts
+            threshold: Minimum estimated similarity
+
+        Returns:
+            (record, estimated similarity) pairs, most similar first
+        """
+        signature = (
+            minhash(approach_tokens(approach))
+            if isinstance(approach, str)
+            else approach
+        )
+        if not signature:
+            return []
+
+        with self._lock:
+            self._refresh()
+            candidates: set[int] = set()
+            for band in range(BANDS):
+                key = (band, signature[band * ROWS : (band + 1) * ROWS])
+                candidates.update(self._buckets.get(key, ()))
+
+            matches = []
+            for i in sorted(candidates):
+                record = self._records[i]
+                if record is None or (failed_only and record.success):
+                    continue
+                if subtask_id is not None and record.subtask_id != subtask_id:
+                    continue
+                if exclude_subtask is not None and record.subtask_id == exclude_subtask:
+                    continue
+                similarity = estimate_similarity(signature, record.signature)
+                if similarity >= threshold:
+                    matches.append((record, similarity))
+        matches.sort(key=lambda m: m[1], reverse=True)
+        return matches
@@ -22,6 +22,8 @@ import json
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from core.project_index import ProjectIndex
+
 
 @dataclass
 class ServiceContext:
@@ -51,10 +53,9 @@ class ServiceContextGenerator:
 
     def _load_project_index(self) -> dict:
         """Load project index from file (.auto-claude is the installed instance)."""
-        index_file = self.project_dir / ".auto-claude" / "project_index.json"
-        if index_file.exists():
-            with open(index_file, encoding="utf-8") as f:
-                return json.load(f)
+        index = ProjectIndex.for_project(self.project_dir)
+        if index.exists():
+            return index.data()
         return {"services": {}}
 
     def generate_for_service(self, service_name: str) -> ServiceContext:
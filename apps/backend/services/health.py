@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Service Health Prober
+=====================
+
+Async readiness probing for multi-service environments.
+
+All services are probed concurrently with exponential backoff (starting
+at ~50ms), so total startup time is bounded by the slowest dependency
+chain rather than the sum of every service's readiness time. Services
+only start probing once everything they depend on is ready.
+
+Probe kinds:
+- tcp: the port accepts a connection
+- http: GET on a URL returns an expected status (default 2xx/3xx)
+- command: a command exits with status 0
+
+Usage:
+    from services.health import HealthProbe, ServiceTarget, wait_for_services
+
+    results = await wait_for_services(
+        [
+            ServiceTarget("db", HealthProbe.tcp(5432)),
+            ServiceTarget("api", HealthProbe.http("http://localhost:8000/health"),
+                          depends_on=["db"]),
+        ],
+        timeout=60,
+    )
+    for name, result in results.items():
+        print(name, result.healthy, result.time_to_ready)
+"""
+
+import asyncio
+import shlex
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Any
+
+INITIAL_DELAY = 0.05  # First backoff interval in seconds
+MAX_DELAY = 2.0  # Backoff ceiling in seconds
+PROBE_TIMEOUT = 1.0  # Timeout for a single probe attempt in seconds
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+
+@dataclass
+class HealthProbe:
+    """
+    How to check that a service is ready.
+
+    Attributes:
+        kind: Probe kind (tcp, http, command)
+        host: Host for TCP probes
+        port: Port for TCP probes
+        url: URL for HTTP probes
+        command: Command for command probes
+        expected_status: HTTP statuses counted as healthy (empty = any < 400)
+        cwd: Working directory for command probes
+    """
+
+    kind: str
+    host: str = "localhost"
+    port: int | None = None
+    url: str | None = None
+    command: str | None = None
+    expected_status: tuple[int, ...] = ()
+    cwd: str | None = None
+
+    @classmethod
+    def tcp(cls, port: int, host: str = "localhost") -> "HealthProbe":
+        return cls(kind="tcp", host=host, port=port)
+
+    @classmethod
+    def http(cls, url: str, expected_status: tuple[int, ...] = ()) -> "HealthProbe":
+        return cls(kind="http", url=url, expected_status=expected_status)
+
+    @classmethod
+    def cmd(cls, command: str, cwd: str | None = None) -> "HealthProbe":
+        return cls(kind="command", command=command, cwd=cwd)
+
+    def describe(self) -> str:
+        if self.kind == "tcp":
+            return f"tcp {self.host}:{self.port}"
+        if self.kind == "http":
+            return f"http {self.url}"
+        return f"command {self.command}"
+
+
+@dataclass
+class ServiceTarget:
+    """
+    A service to wait for.
+
+    Attributes:
+        name: Name of the service
+        probe: Readiness probe (None = ready once its dependencies are)
+        depends_on: Names of services that must be ready first
+    """
+
+    name: str
+    probe: HealthProbe | None = None
+    depends_on: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ServiceHealthResult:
+    """
+    Readiness outcome for one service.
+
+    Attributes:
+        name: Name of the service
+        healthy: Whether the service became ready before the deadline
+        time_to_ready: Seconds from the start of waiting until ready
+        attempts: Number of probe attempts made
+        waited_on_dependencies: Seconds spent waiting for dependencies
+        error: Reason the service did not become ready
+    """
+
+    name: str
+    healthy: bool = False
+    time_to_ready: float | None = None
+    attempts: int = 0
+    waited_on_dependencies: float = 0.0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "healthy": self.healthy,
+            "time_to_ready": self.time_to_ready,
+            "attempts": self.attempts,
+            "waited_on_dependencies": self.waited_on_dependencies,
+            "error": self.error,
+        }
+
+
+# =============================================================================
+# PROBES
+# =============================================================================
+
+
+async def _probe_tcp(probe: HealthProbe, timeout: float) -> bool:
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(probe.host, probe.port), timeout
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
+def _http_status(url: str, timeout: float) -> int | None:
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except (OSError, ValueError):
+        return None
+
+
+async def _probe_http(probe: HealthProbe, timeout: float) -> bool:
+    status = await asyncio.to_thread(_http_status, probe.url, timeout)
+    if status is None:
+        return False
+    if probe.expected_status:
+        return status in probe.expected_status
+    return status < 400
+
+
+async def _probe_command(probe: HealthProbe, timeout: float) -> bool:
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *shlex.split(probe.command),
+            cwd=probe.cwd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except (OSError, ValueError):
+        return False
+    try:
+        return await asyncio.wait_for(proc.wait(), timeout) == 0
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return False
+
+
+_PROBES = {
+    "tcp": _probe_tcp,
+    "http": _probe_http,
+    "command": _probe_command,
+}
+
+
+async def check_once(probe: HealthProbe, timeout: float = PROBE_TIMEOUT) -> bool:
+    """Run a single probe attempt."""
+    handler = _PROBES.get(probe.kind)
+    if handler is None:
+        raise ValueError(f"Unknown probe kind: {probe.kind}")
+    return await handler(probe, timeout)
+
+
+# =============================================================================
+# WAITING
+# =============================================================================
+
+
+async def wait_for_services(
+    targets: list[ServiceTarget],
+    timeout: float,
+    initial_delay: float = INITIAL_DELAY,
+    max_delay: float = MAX_DELAY,
+    probe_timeout: float = PROBE_TIMEOUT,
+) -> dict[str, ServiceHealthResult]:
+    """
+    Wait for all services to become ready, probing them concurrently.
+
+    Dependencies on names that are not among the targets are ignored. A
+    service whose dependency fails (or that is part of a dependency cycle)
+    is reported unhealthy without being probed to the deadline.
+
+    Args:
+        targets: Services to wait for
+        timeout: Overall deadline in seconds
+        initial_delay: First backoff interval in seconds
+        max_delay: Backoff ceiling in seconds
+        probe_timeout: Timeout for a single probe attempt in seconds
+
+    Returns:
+        Per-service results keyed by service name
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    names = {target.name for target in targets}
+    ready: dict[str, asyncio.Event] = {name: asyncio.Event() for name in names}
+    results = {target.name: ServiceHealthResult(name=target.name) for target in targets}
+
+    def _blocked_by_cycle(name: str) -> bool:
+        seen: set[str] = set()
+        stack = [name]
+        while stack:
+            current = stack.pop()
+            for target in targets:
+                if target.name != current:
+                    continue
+                for dep in target.depends_on:
+                    if dep == name:
+                        return True
+                    if dep in names and dep not in seen:
+                        seen.add(dep)
+                        stack.append(dep)
+        return False
+
+    async def _run(target: ServiceTarget) -> None:
+        result = results[target.name]
+        if _blocked_by_cycle(target.name):
+            result.error = "Dependency cycle"
+            _finish(target.name)
+            return
+
+        # Wait for dependencies first
+        for dep in target.depends_on:
+            if dep not in ready:
+                continue
+            remaining = deadline - time.monotonic()
+            try:
+                await asyncio.wait_for(ready[dep].wait(), max(0.0, remaining))
+            except asyncio.TimeoutError:
+                result.error = f"Timed out waiting for dependency '{dep}'"
+                _finish(target.name)
+                return
+            if not results[dep].healthy:
+                result.error = f"Dependency '{dep}' did not become ready"
+                _finish(target.name)
+                return
+        result.waited_on_dependencies = time.monotonic() - start
+
+        if target.probe is None:
+            _mark_ready(target.name)
+            return
+
+        delay = initial_delay
+        while True:
+            result.attempts += 1
+            remaining = deadline - time.monotonic()
+            try:
+                healthy = await check_once(
+                    target.probe, max(0.01, min(probe_timeout, remaining))
+                )
+            except ValueError as e:
+                result.error = str(e)
+                break
+            if healthy:
+                _mark_ready(target.name)
+                return
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                result.error = (
+                    f"Not ready after {timeout:g}s ({target.probe.describe()})"
+                )
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+        _finish(target.name)
+
+    def _mark_ready(name: str) -> None:
+        results[name].healthy = True
+        results[name].time_to_ready = time.monotonic() - start
+        ready[name].set()
+
+    def _finish(name: str) -> None:
+        ready[name].set()
+
+    await asyncio.gather(*(_run(target) for target in targets))
+    return results
@@ -5,6 +5,7 @@ Service Orchestrator Module
 
 Orchestrates multi-service environments for testing.
 Handles docker-compose, monorepo service discovery, and health checks.
+Health checks run concurrently in dependency order (see services/health.py).
 
 The service orchestrator is used by:
 - QA Agent: To start services before integration/e2e tests
@@ -20,14 +21,30 @@ Usage:
         orchestrator.stop_services()
 """
 
+import asyncio
 import json
 import shlex
 import subprocess
-import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+try:
+    from .health import (
+        HealthProbe,
+        ServiceHealthResult,
+        ServiceTarget,
+        wait_for_services,
+    )
+except ImportError:
+    # Fallback for direct script execution (not as a module)
+    from health import (
+        HealthProbe,
+        ServiceHealthResult,
+        ServiceTarget,
+        wait_for_services,
+    )
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -46,6 +63,9 @@ class ServiceConfig:
         health_check_url: URL for health check
         startup_command: Command to start the service
         startup_timeout: Timeout in seconds for startup
+        health_check_type: Probe kind (tcp, http, command); inferred if None
+        health_check_command: Command that exits 0 once the service is ready
+        depends_on: Services that must be ready before this one is probed
     """
 
     name: str
@@ -55,6 +75,9 @@ class ServiceConfig:
     health_check_url: str | None = None
     startup_command: str | None = None
     startup_timeout: int = 120
+    health_check_type: str | None = None
+    health_check_command: str | None = None
+    depends_on: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -67,12 +90,14 @@ class OrchestrationResult:
         services_started: List of services that were started
         services_failed: List of services that failed to start
         errors: List of error messages
+        health: Per-service readiness results (including time-to-ready)
     """
 
     success: bool = False
     services_started: list[str] = field(default_factory=list)
     services_failed: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    health: dict[str, ServiceHealthResult] = field(default_factory=dict)
 
 
 # =============================================================================
@@ -101,6 +126,7 @@ class ServiceOrchestrator:
         self._compose_file: Path | None = None
         self._services: list[ServiceConfig] = []
         self._processes: dict[str, subprocess.Popen] = {}
+        self.last_health: dict[str, ServiceHealthResult] = {}
         self._discover_services()
 
     def _discover_services(self) -> None:
@@ -192,12 +218,20 @@ class ServiceOrchestrator:
                 if port:
                     health_url = f"http://localhost:{port}/health"
 
+                # depends_on is either a list or a mapping of name -> condition
+                depends_on = config.get("depends_on", [])
+                if isinstance(depends_on, dict):
+                    depends_on = list(depends_on)
+                elif not isinstance(depends_on, list):
+                    depends_on = []
+
                 self._services.append(
                     ServiceConfig(
                         name=name,
                         port=port,
                         type="docker",
                         health_check_url=health_url,
+                        depends_on=[str(dep) for dep in depends_on],
                     )
                 )
         except Exception:
@@ -315,7 +349,9 @@ class ServiceOrchestrator:
                 return result
 
             # Wait for health checks
-            if self._wait_for_health(timeout):
+            healthy = self._wait_for_health(timeout)
+            result.health = self.last_health
+            if healthy:
                 result.success = True
                 result.services_started = [s.name for s in self._services]
             else:
@@ -355,7 +391,9 @@ class ServiceOrchestrator:
 
         # Wait for services to be ready
         if result.services_started:
-            if self._wait_for_health(timeout):
+            healthy = self._wait_for_health(timeout)
+            result.health = self.last_health
+            if healthy:
                 result.success = True
             else:
                 result.errors.append("Services did not become healthy in time")
@@ -424,45 +462,78 @@ class ServiceOrchestrator:
 
         return None
 
-    def _wait_for_health(self, timeout: int) -> bool:
+    def _health_probe(self, service: ServiceConfig) -> HealthProbe | None:
+        """Build the readiness probe for a service (None = nothing to check)."""
+        kind = service.health_check_type
+        if kind is None:
+            if service.health_check_command:
+                kind = "command"
+            elif service.port:
+                # Discovered health URLs are guesses; a listening port is
+                # the only readiness signal every service gives
+                kind = "tcp"
+            else:
+                return None
+
+        if kind == "command" and service.health_check_command:
+            cwd = self.project_dir / service.path if service.path else self.project_dir
+            return HealthProbe.cmd(service.health_check_command, cwd=str(cwd))
+        if kind == "http" and service.health_check_url:
+            return HealthProbe.http(service.health_check_url)
+        if kind == "tcp" and service.port:
+            return HealthProbe.tcp(service.port)
+        return None
+
+    async def wait_for_health_async(
+        self, timeout: float
+    ) -> dict[str, ServiceHealthResult]:
         """
-        Wait for all services to become healthy.
+        Probe all services concurrently, in dependency order.
 
         Args:
             timeout: Maximum time to wait in seconds
 
         Returns:
-            True if all services became healthy
+            Per-service results keyed by service name
         """
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            all_healthy = True
-
-            for service in self._services:
-                if service.port:
-                    if not self._check_port(service.port):
-                        all_healthy = False
-                        break
-
-            if all_healthy:
-                return True
-
-            time.sleep(2)
+        targets = [
+            ServiceTarget(
+                name=service.name,
+                probe=self._health_probe(service),
+                depends_on=service.depends_on,
+            )
+            for service in self._services
+        ]
+        self.last_health = await wait_for_services(targets, timeout)
+        return self.last_health
 
-        return False
+    def _wait_for_health(self, timeout: int) -> bool:
+        """
+        Wait for all services to become healthy.
 
-    def _check_port(self, port: int) -> bool:
-        """Check if a port is responding."""
-        import socket
+        Args:
+            timeout: Maximum time to wait in seconds
 
+        Returns:
+            True if all services became healthy
+        """
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(1)
-                result = s.connect_ex(("localhost", port))
-                return result == 0
-        except Exception:
-            return False
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop and loop.is_running():
+            # Already in an async context - run in a new thread
+            import concurrent.futures
+
+            with concurrent.futures.ThreadPoolExecutor() as pool:
+                results = pool.submit(
+                    lambda: asyncio.run(self.wait_for_health_async(timeout))
+                ).result()
+        else:
+            results = asyncio.run(self.wait_for_health_async(timeout))
+
+        return all(result.healthy for result in results.values())
 
     def to_dict(self) -> dict[str, Any]:
         """Convert orchestration config to dictionary."""
@@ -477,6 +548,7 @@ class ServiceOrchestrator:
                     "port": s.port,
                     "type": s.type,
                     "health_check_url": s.health_check_url,
+                    "depends_on": s.depends_on,
                 }
                 for s in self._services
             ],
@@ -585,12 +657,21 @@ def main() -> None:
                         "success": result.success,
                         "services_started": result.services_started,
                         "errors": result.errors,
+                        "health": {
+                            name: health.to_dict()
+                            for name, health in result.health.items()
+                        },
                     },
                     indent=2,
                 )
             )
         else:
             print(f"Started: {result.services_started}")
+            for health in result.health.values():
+                if health.healthy:
+                    print(f"  {health.name}: ready in {health.time_to_ready:.2f}s")
+                else:
+                    print(f"  {health.name}: not ready ({health.error})")
             if result.errors:
                 print(f"Errors: {result.errors}")
     elif args.stop:
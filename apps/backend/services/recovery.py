@@ -11,6 +11,11 @@ Key Features:
 - Attempt history tracking across sessions
 - Smart retry with different approaches
 - Escalation to human when stuck
+
+Attempts are recorded in an append-only log with MinHash signatures of
+their approaches (see attempt_log.py). attempt_history.json keeps the
+statuses, stuck subtasks and the most recent attempts per subtask for
+agents and prompts to read.
 """
 
 import json
@@ -20,6 +25,33 @@ from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
+from .attempt_log import AttemptLog, approach_tokens, jaccard
+
+# Attempts per subtask kept in attempt_history.json (the log keeps all)
+HISTORY_ATTEMPTS = 10
+
+
+def _dumps_outline(value, levels: int, indent: str = "") -> str:
+    """
+    JSON with the outer `levels` of nesting indented like indent=2 and
+    anything deeper on one line.
+
+    json.dump(indent=2) runs the pure-Python encoder over every attempt;
+    this keeps the history readable (one attempt per line) while the C
+    encoder handles the attempts themselves.
+    """
+    if levels == 0 or not isinstance(value, (dict, list)) or not value:
+        return json.dumps(value)
+    inner = indent + "  "
+    if isinstance(value, dict):
+        items = [
+            f"{inner}{json.dumps(str(key))}: {_dumps_outline(v, levels - 1, inner)}"
+            for key, v in value.items()
+        ]
+        return "{\n" + ",\n".join(items) + f"\n{indent}}}"
+    items = [inner + _dumps_outline(v, levels - 1, inner) for v in value]
+    return "[\n" + ",\n".join(items) + f"\n{indent}]"
+
 
 class FailureType(Enum):
     """Types of failures that can occur during autonomous builds."""
@@ -76,6 +108,13 @@ class RecoveryManager:
         if not self.build_commits_file.exists():
             self._init_build_commits()
 
+        self.attempt_log = AttemptLog.for_memory_dir(self.memory_dir)
+        if not self.attempt_log.path.exists():
+            # Spec recorded before the attempt log existed
+            self.attempt_log.import_history(
+                self._load_attempt_history().get("subtasks", {})
+            )
+
     def _init_attempt_history(self) -> None:
         """Initialize the attempt history file."""
         initial_data = {
@@ -113,10 +152,10 @@ class RecoveryManager:
                 return json.load(f)
 
     def _save_attempt_history(self, data: dict) -> None:
-        """Save attempt history to JSON file."""
+        """Save attempt history to JSON file (one attempt per line)."""
         data["metadata"]["last_updated"] = datetime.now().isoformat()
         with open(self.attempt_history_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+            f.write(_dumps_outline(data, levels=4))
 
     def _load_build_commits(self) -> dict:
         """Load build commits from JSON file."""
@@ -193,9 +232,7 @@ class RecoveryManager:
         Returns:
             Number of attempts
         """
-        history = self._load_attempt_history()
-        subtask_data = history["subtasks"].get(subtask_id, {})
-        return len(subtask_data.get("attempts", []))
+        return self.attempt_log.count(subtask_id)
 
     def record_attempt(
         self,
@@ -215,21 +252,20 @@ class RecoveryManager:
             approach: Description of the approach taken
             error: Error message if failed
         """
+        self.attempt_log.append(subtask_id, session, success, approach, error)
+        attempts = self.attempt_log.attempts(subtask_id)
+
         history = self._load_attempt_history()
 
         # Initialize subtask entry if it doesn't exist
         if subtask_id not in history["subtasks"]:
             history["subtasks"][subtask_id] = {"attempts": [], "status": "pending"}
 
-        # Add the attempt
-        attempt = {
-            "session": session,
-            "timestamp": datetime.now().isoformat(),
-            "approach": approach,
-            "success": success,
-            "error": error,
-        }
-        history["subtasks"][subtask_id]["attempts"].append(attempt)
+        # Keep the most recent attempts; the log has the full history
+        history["subtasks"][subtask_id]["attempts"] = [
+            attempt.to_dict() for attempt in attempts[-HISTORY_ATTEMPTS:]
+        ]
+        history["subtasks"][subtask_id]["attempt_count"] = len(attempts)
 
         # Update status
         if success:
@@ -243,6 +279,10 @@ class RecoveryManager:
         """
         Detect if we're trying the same approach repeatedly.
 
+        The last 3 attempts are compared exactly; older failed attempts
+        are found through the attempt log's MinHash index, so a long retry
+        history does not make this slower.
+
         Args:
             subtask_id: ID of the subtask
             current_approach: Description of current approach
@@ -250,59 +290,38 @@ class RecoveryManager:
         Returns:
             True if this appears to be a circular fix attempt
         """
-        history = self._load_attempt_history()
-        subtask_data = history["subtasks"].get(subtask_id, {})
-        attempts = subtask_data.get("attempts", [])
+        attempts = self.attempt_log.attempts(subtask_id)
 
         if len(attempts) < 2:
             return False
 
         # Check if last 3 attempts used similar approaches
         # Simple similarity check: look for repeated keywords
-        recent_attempts = attempts[-3:] if len(attempts) >= 3 else attempts
+        recent_attempts = attempts[-3:]
 
         # Extract key terms from current approach (ignore common words)
-        stop_words = {
-            "with",
-            "using",
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "trying",
-        }
-        current_keywords = set(
-            word for word in current_approach.lower().split() if word not in stop_words
-        )
+        current_keywords = approach_tokens(current_approach)
 
         similar_count = 0
         for attempt in recent_attempts:
-            attempt_keywords = set(
-                word
-                for word in attempt["approach"].lower().split()
-                if word not in stop_words
+            # Jaccard similarity (intersection over union) of the keywords.
+            # If >30% of meaningful words overlap, consider it similar
+            # This catches key technical terms appearing repeatedly
+            # (e.g., "async await" across multiple attempts)
+            if jaccard(current_keywords, approach_tokens(attempt.approach)) > 0.3:
+                similar_count += 1
+
+        # Near-duplicates of the current approach that failed earlier on
+        recent_ids = {id(attempt) for attempt in recent_attempts}
+        similar_count += sum(
+            1
+            for attempt, _ in self.attempt_log.similar(
+                current_approach, subtask_id=subtask_id
             )
+            if id(attempt) not in recent_ids
+        )
 
-            # Calculate Jaccard similarity (intersection over union)
-            overlap = len(current_keywords & attempt_keywords)
-            total = len(current_keywords | attempt_keywords)
-
-            if total > 0:
-                similarity = overlap / total
-                # If >30% of meaningful words overlap, consider it similar
-                # This catches key technical terms appearing repeatedly
-                # (e.g., "async await" across multiple attempts)
-                if similarity > 0.3:
-                    similar_count += 1
-
-        # If 2+ recent attempts were similar to current approach, it's circular
+        # If 2+ attempts were similar to current approach, it's circular
         return similar_count >= 2
 
     def determine_recovery_action(
@@ -488,9 +507,11 @@ class RecoveryManager:
             Subtask history dict with attempts
         """
         history = self._load_attempt_history()
-        return history["subtasks"].get(
-            subtask_id, {"attempts": [], "status": "pending"}
-        )
+        subtask_data = history["subtasks"].get(subtask_id, {})
+        return {
+            "attempts": [a.to_dict() for a in self.attempt_log.attempts(subtask_id)],
+            "status": subtask_data.get("status", "pending"),
+        }
 
     def get_recovery_hints(self, subtask_id: str) -> list[str]:
         """
@@ -519,6 +540,18 @@ class RecoveryManager:
             if attempt.get("error"):
                 hints.append(f"  Error: {attempt['error'][:100]}")
 
+        # Surface the same failed approach in other subtasks
+        last_failed = next((a for a in reversed(attempts) if not a["success"]), None)
+        if last_failed:
+            elsewhere = self.attempt_log.similar(
+                last_failed["approach"], exclude_subtask=subtask_id
+            )
+            for attempt, _ in elsewhere[:2]:
+                hints.append(
+                    f"A similar approach also failed in subtask "
+                    f"{attempt.subtask_id}: {attempt.approach[:100]}"
+                )
+
         # Add guidance
         if len(attempts) >= 2:
             hints.append(
@@ -543,6 +576,7 @@ class RecoveryManager:
         Args:
             subtask_id: ID of the subtask to reset
         """
+        self.attempt_log.reset(subtask_id)
         history = self._load_attempt_history()
 
         # Clear attempt history
@@ -7,12 +7,13 @@ Project structure analysis and indexing.
 
 from __future__ import annotations
 
-import json
 import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+from core.project_index import ProjectIndex
+
 
 def run_discovery_script(
     project_dir: Path,
@@ -64,13 +65,12 @@ def run_discovery_script(
 
 def get_project_index_stats(spec_dir: Path) -> dict:
     """Get statistics from project index if available."""
-    spec_index = spec_dir / "project_index.json"
-    if not spec_index.exists():
+    index = ProjectIndex.for_file(spec_dir / "project_index.json")
+    if not index.exists():
         return {}
 
     try:
-        with open(spec_index, encoding="utf-8") as f:
-            index_data = json.load(f)
+        index_data = index.data()
 
         # Support both old and new analyzer formats
         file_count = 0
@@ -7,16 +7,34 @@ Refactored spec creation pipeline with modular components.
 Components:
 - models: Data structures and utility functions
 - agent_runner: Agent execution logic
+- graph: Phase dependency graph, concurrent scheduler and resume journal
 - orchestrator: Main SpecOrchestrator class
 """
 
+from typing import Any
+
 from init import init_auto_claude_dir
 
 from .models import get_specs_dir
-from .orchestrator import SpecOrchestrator
 
 __all__ = [
     "SpecOrchestrator",
     "get_specs_dir",
     "init_auto_claude_dir",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import of SpecOrchestrator.
+
+    The orchestrator pulls in the agent runner and core.client (and with it
+    the Claude SDK); callers that only need get_specs_dir, such as quick
+    CLI commands, should not pay for that import.
+    """
+    if name == "SpecOrchestrator":
+        from .orchestrator import SpecOrchestrator
+
+        # Cache in globals so subsequent accesses bypass __getattr__
+        globals()["SpecOrchestrator"] = SpecOrchestrator
+        return SpecOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,254 @@
+"""
+Spec Phase Graph
+================
+
+Dependency graph, concurrent scheduler and completion journal for the spec
+creation phases.
+
+Each phase declares the spec files it reads and writes (PHASE_IO). A phase
+depends on every earlier phase whose outputs it reads or writes, or whose
+inputs it overwrites, so e.g. historical_context, research and context
+(which only read requirements.json) run concurrently, while spec_writing
+waits for all of them. Phases without a declaration are barriers.
+
+The journal (pipeline_journal.json in the spec dir) records completed
+phases and their summaries, so an interrupted pipeline resumes after the
+last completed phase instead of starting over.
+"""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from core.file_utils import write_json_atomic
+
+from ..phases import PhaseResult
+
+JOURNAL_FILE = "pipeline_journal.json"
+JOURNAL_VERSION = 1
+
+
+@dataclass(frozen=True)
+class PhaseIO:
+    """Spec files a phase reads and writes."""
+
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+
+
+PHASE_IO: dict[str, PhaseIO] = {
+    "discovery": PhaseIO(outputs=("project_index.json",)),
+    "requirements": PhaseIO(
+        inputs=("project_index.json",), outputs=("requirements.json",)
+    ),
+    "complexity_assessment": PhaseIO(
+        inputs=("requirements.json", "project_index.json"),
+        outputs=("complexity_assessment.json",),
+    ),
+    "historical_context": PhaseIO(
+        inputs=("requirements.json",), outputs=("graph_hints.json",)
+    ),
+    "research": PhaseIO(inputs=("requirements.json",), outputs=("research.json",)),
+    "context": PhaseIO(
+        inputs=("requirements.json", "project_index.json"), outputs=("context.json",)
+    ),
+    "spec_writing": PhaseIO(
+        inputs=(
+            "requirements.json",
+            "project_index.json",
+            "context.json",
+            "research.json",
+            "graph_hints.json",
+        ),
+        outputs=("spec.md",),
+    ),
+    "self_critique": PhaseIO(
+        inputs=("spec.md", "research.json", "requirements.json", "context.json"),
+        outputs=("spec.md", "critique_report.json"),
+    ),
+    "quick_spec": PhaseIO(
+        inputs=("requirements.json", "project_index.json", "graph_hints.json"),
+        outputs=("spec.md", "implementation_plan.json"),
+    ),
+    "planning": PhaseIO(
+        inputs=(
+            "spec.md",
+            "requirements.json",
+            "project_index.json",
+            "context.json",
+            "complexity_assessment.json",
+        ),
+        outputs=("implementation_plan.json",),
+    ),
+    "validation": PhaseIO(
+        inputs=(
+            "spec.md",
+            "requirements.json",
+            "context.json",
+            "implementation_plan.json",
+        ),
+        # The validation fixer may rewrite any of its inputs
+        outputs=("spec.md", "context.json", "implementation_plan.json"),
+    ),
+}
+
+
+def phase_dependencies(
+    phase_names: list[str], phase_io: dict[str, PhaseIO] | None = None
+) -> dict[str, set[str]]:
+    """
+    Direct dependencies of each phase, given the phases' run order.
+
+    Args:
+        phase_names: Phases in their sequential order
+        phase_io: File declarations (defaults to PHASE_IO)
+
+    Returns:
+        Dict mapping each phase to the earlier phases it must wait for
+    """
+    phase_io = PHASE_IO if phase_io is None else phase_io
+    deps: dict[str, set[str]] = {}
+    for i, name in enumerate(phase_names):
+        io = phase_io.get(name)
+        deps[name] = set()
+        for earlier in phase_names[:i]:
+            earlier_io = phase_io.get(earlier)
+            if io is None or earlier_io is None:
+                deps[name].add(earlier)
+                continue
+            reads_output = set(io.inputs) & set(earlier_io.outputs)
+            overwrites = set(io.outputs) & set(earlier_io.outputs + earlier_io.inputs)
+            if reads_output or overwrites:
+                deps[name].add(earlier)
+    return deps
+
+
+def phase_ancestors(deps: dict[str, set[str]], name: str) -> set[str]:
+    """All phases `name` transitively depends on."""
+    seen: set[str] = set()
+    stack = list(deps.get(name, ()))
+    while stack:
+        phase = stack.pop()
+        if phase not in seen:
+            seen.add(phase)
+            stack.extend(deps.get(phase, ()))
+    return seen
+
+
+async def run_phase_graph(
+    phase_names: list[str],
+    run_phase: Callable[[str], Awaitable[PhaseResult]],
+    deps: dict[str, set[str]] | None = None,
+) -> list[PhaseResult]:
+    """
+    Run phases as soon as their dependencies have succeeded.
+
+    After a phase fails no new phases are started; phases already running
+    are allowed to finish.
+
+    Args:
+        phase_names: Phases in their sequential order
+        run_phase: Async callable running one phase by name
+        deps: Dependencies (defaults to phase_dependencies(phase_names))
+
+    Returns:
+        Results of the phases that ran, in completion order
+    """
+    deps = phase_dependencies(phase_names) if deps is None else deps
+    done: set[str] = set()
+    pending = list(phase_names)
+    running: dict[asyncio.Task, str] = {}
+    results: list[PhaseResult] = []
+    failed = False
+
+    try:
+        while pending or running:
+            if not failed:
+                for name in [n for n in pending if deps.get(n, set()) <= done]:
+                    pending.remove(name)
+                    running[asyncio.ensure_future(run_phase(name))] = name
+            if not running:
+                break
+            finished, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in finished:
+                name = running.pop(task)
+                result = task.result()
+                results.append(result)
+                if result.success:
+                    done.add(name)
+                else:
+                    failed = True
+    finally:
+        for task in running:
+            task.cancel()
+        # Let cancelled phases finish their cleanup before returning
+        await asyncio.gather(*running, return_exceptions=True)
+    return results
+
+
+class PhaseJournal:
+    """
+    Completed phases of one spec's pipeline, persisted in the spec dir.
+
+    A phase counts as completed only if its recorded output files still
+    exist; phases without output files (such as validation) always re-run.
+    """
+
+    def __init__(self, spec_dir: Path):
+        self.spec_dir = Path(spec_dir)
+        self._data = self._load()
+
+    @property
+    def path(self) -> Path:
+        return self.spec_dir / JOURNAL_FILE
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == JOURNAL_VERSION:
+                return data
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {"version": JOURNAL_VERSION, "phases": {}, "summaries": {}}
+
+    def is_completed(self, phase_name: str) -> bool:
+        entry = self._data["phases"].get(phase_name)
+        if not entry or not entry.get("output_files"):
+            return False
+        return all((self.spec_dir / f).exists() for f in entry["output_files"])
+
+    def completed(self, phase_names: list[str]) -> set[str]:
+        return {name for name in phase_names if self.is_completed(name)}
+
+    def result(self, phase_name: str) -> PhaseResult:
+        """A PhaseResult for a journaled phase (for summaries and display)."""
+        entry = self._data["phases"][phase_name]
+        files = [str(self.spec_dir / f) for f in entry["output_files"]]
+        return PhaseResult(phase_name, True, files, [], entry.get("retries", 0))
+
+    def record(self, result: PhaseResult) -> None:
+        """Record a successful phase."""
+        if not result.success:
+            return
+        self._data["phases"][result.phase] = {
+            "completed_at": datetime.now().isoformat(),
+            "output_files": [Path(f).name for f in result.output_files],
+            "retries": result.retries,
+        }
+        self._save()
+
+    def summaries(self) -> dict[str, str]:
+        return dict(self._data["summaries"])
+
+    def record_summary(self, phase_name: str, summary: str) -> None:
+        self._data["summaries"][phase_name] = summary
+        self._save()
+
+    def _save(self) -> None:
+        if self.spec_dir.exists():
+            write_json_atomic(self.path, self._data)
@@ -3,13 +3,21 @@ Spec Orchestrator
 =================
 
 Main orchestration logic for spec creation with dynamic complexity adaptation.
+
+Discovery, requirements and the complexity assessment run in sequence; the
+phases the assessment selects then run as a dependency graph (see graph.py),
+so independent phases overlap. Phase summaries are produced in the
+background and only awaited by phases that depend on them, when they build
+their agent prompt.
 """
 
+import asyncio
 import json
 from collections.abc import Callable
 from pathlib import Path
 
 from analysis.analyzers import analyze_project
+from core.project_index import ProjectIndex
 from core.workspace.models import SpecNumberLock
 from phase_config import get_thinking_budget
 from prompts_pkg.project_context import should_refresh_project_index
@@ -38,6 +46,7 @@ from ..compaction import (
 )
 from ..validate_pkg.spec_validator import SpecValidator
 from .agent_runner import AgentRunner
+from .graph import PhaseJournal, phase_ancestors, phase_dependencies, run_phase_graph
 from .models import (
     PHASE_DISPLAY,
     cleanup_orphaned_pending_folders,
@@ -112,6 +121,11 @@ class SpecOrchestrator:
         # Phase summaries for conversation compaction
         # Stores summaries from completed phases to provide context to subsequent phases
         self._phase_summaries: dict[str, str] = {}
+        # Background summarization tasks, and each phase's upstream phases
+        # (whose summaries its prompt includes; unknown phases wait for all)
+        self._summary_tasks: dict[str, asyncio.Task] = {}
+        self._phase_ancestors: dict[str, set[str]] = {}
+        self._journal = PhaseJournal(self.spec_dir)
 
     def _get_agent_runner(self) -> AgentRunner:
         """Get or create the agent runner.
@@ -150,7 +164,7 @@ class SpecOrchestrator:
         thinking_budget = get_thinking_budget(self.thinking_level)
 
         # Format prior phase summaries for context
-        prior_summaries = format_phase_summaries(self._phase_summaries)
+        prior_summaries = format_phase_summaries(await self._summaries_for(phase_name))
 
         return await runner.run_agent(
             prompt_file,
@@ -160,19 +174,24 @@ class SpecOrchestrator:
             prior_phase_summaries=prior_summaries if prior_summaries else None,
         )
 
-    async def _store_phase_summary(self, phase_name: str) -> None:
-        """Summarize and store phase output for subsequent phases.
+    def _start_phase_summary(self, phase_name: str) -> None:
+        """Start summarizing a completed phase in the background.
+
+        The outputs are read right away, so later phases rewriting the same
+        files do not change what is summarized.
 
         Args:
             phase_name: Name of the completed phase
         """
-        try:
-            # Gather outputs from this phase
-            phase_output = gather_phase_outputs(self.spec_dir, phase_name)
-            if not phase_output:
-                return
+        phase_output = gather_phase_outputs(self.spec_dir, phase_name)
+        if not phase_output:
+            return
+        self._summary_tasks[phase_name] = asyncio.create_task(
+            self._summarize_phase(phase_name, phase_output)
+        )
 
-            # Summarize the output
+    async def _summarize_phase(self, phase_name: str, phase_output: str) -> None:
+        try:
             # Use sonnet shorthand - will resolve via API Profile if configured
             summary = await summarize_phase_output(
                 phase_name,
@@ -183,11 +202,41 @@ class SpecOrchestrator:
 
             if summary:
                 self._phase_summaries[phase_name] = summary
+                self._journal.record_summary(phase_name, summary)
 
         except Exception as e:
             # Don't fail the pipeline if summarization fails
             print_status(f"Phase summarization skipped: {e}", "warning")
 
+    async def _summaries_for(self, phase_name: str | None) -> dict[str, str]:
+        """Summaries of the phases upstream of phase_name, once available.
+
+        Args:
+            phase_name: Phase building its prompt (None or unknown: all phases)
+
+        Returns:
+            Dict of phase name to summary, in completion order
+        """
+        upstream = self._phase_ancestors.get(phase_name)
+        waiting = [
+            task
+            for name, task in self._summary_tasks.items()
+            if upstream is None or name in upstream
+        ]
+        if waiting:
+            await asyncio.gather(*waiting)
+        return {
+            name: summary
+            for name, summary in self._phase_summaries.items()
+            if upstream is None or name in upstream
+        }
+
+    async def _drain_phase_summaries(self) -> None:
+        """Wait for outstanding summaries at the end of a run."""
+        tasks = list(self._summary_tasks.values())
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def _ensure_fresh_project_index(self) -> None:
         """Ensure project_index.json is up-to-date before spec creation.
 
@@ -261,18 +310,32 @@ class SpecOrchestrator:
 
         results = []
         phase_num = 0
+        # Summaries of phases completed by an earlier, interrupted run
+        self._phase_summaries.update(self._journal.summaries())
 
-        def run_phase(name: str, phase_fn: Callable) -> phases.PhaseResult:
+        async def run_phase(
+            name: str, phase_fn: Callable, journaled: bool = True
+        ) -> phases.PhaseResult:
             """Run a phase with proper numbering and display.
 
+            Phases recorded in the journal are not run again. A successful
+            phase is journaled and its summary started in the background.
+
             Args:
                 name: The phase name
                 phase_fn: The phase function to execute
+                journaled: Whether to skip/record the phase via the journal
 
             Returns:
                 The phase result
             """
             nonlocal phase_num
+            if journaled and self._journal.is_completed(name):
+                print_status(f"Phase '{name}' already completed, skipping", "success")
+                if name not in self._phase_summaries:
+                    self._start_phase_summary(name)
+                return self._journal.result(name)
+
             phase_num += 1
             display_name, display_icon = PHASE_DISPLAY.get(
                 name, (name.upper(), Icons.GEAR)
@@ -281,9 +344,16 @@ class SpecOrchestrator:
             task_logger.log(
                 f"Starting phase {phase_num}: {display_name}", LogEntryType.INFO
             )
-            return phase_fn()
+            result = await phase_fn()
+            if result.success:
+                if journaled:
+                    self._journal.record(result)
+                # Store summary for subsequent phases (compaction)
+                self._start_phase_summary(name)
+            return result
 
         # === PHASE 1: DISCOVERY ===
+        self._phase_ancestors = {"discovery": set(), "requirements": {"discovery"}}
         result = await run_phase("discovery", phase_executor.phase_discovery)
         results.append(result)
         if not result.success:
@@ -291,9 +361,8 @@ class SpecOrchestrator:
             task_logger.end_phase(
                 LogPhase.PLANNING, success=False, message="Discovery failed"
             )
+            await self._drain_phase_summaries()
             return False
-        # Store summary for subsequent phases (compaction)
-        await self._store_phase_summary("discovery")
 
         # === PHASE 2: REQUIREMENTS GATHERING ===
         result = await run_phase(
@@ -307,9 +376,8 @@ class SpecOrchestrator:
                 success=False,
                 message="Requirements gathering failed",
             )
+            await self._drain_phase_summaries()
             return False
-        # Store summary for subsequent phases (compaction)
-        await self._store_phase_summary("requirements")
 
         # Rename spec folder with better name from requirements
         rename_spec_dir_from_requirements(self.spec_dir)
@@ -325,9 +393,11 @@ class SpecOrchestrator:
         await self._create_linear_task_if_enabled()
 
         # === PHASE 3: AI COMPLEXITY ASSESSMENT ===
+        # Not journaled: the assessment decides which phases follow
         result = await run_phase(
             "complexity_assessment",
             lambda: self._phase_complexity_assessment_with_requirements(),
+            journaled=False,
         )
         results.append(result)
         if not result.success:
@@ -335,6 +405,7 @@ class SpecOrchestrator:
             task_logger.end_phase(
                 LogPhase.PLANNING, success=False, message="Complexity assessment failed"
             )
+            await self._drain_phase_summaries()
             return False
 
         # Map of all available phases
@@ -351,9 +422,14 @@ class SpecOrchestrator:
 
         # Get remaining phases to run based on complexity
         all_phases_to_run = self.assessment.phases_to_run()
-        phases_to_run = [
-            p for p in all_phases_to_run if p not in ["discovery", "requirements"]
-        ]
+        phases_to_run = []
+        for phase_name in all_phases_to_run:
+            if phase_name in ["discovery", "requirements"]:
+                continue
+            if phase_name not in all_phases:
+                print_status(f"Unknown phase: {phase_name}, skipping", "warning")
+                continue
+            phases_to_run.append(phase_name)
 
         print()
         print(
@@ -362,43 +438,48 @@ class SpecOrchestrator:
         print(f"  {muted('Remaining phases:')} {', '.join(phases_to_run)}")
         print()
 
+        # Independent phases run concurrently; each phase's prompt includes
+        # the summaries of the phases it depends on
         phases_executed = ["discovery", "requirements", "complexity_assessment"]
+        deps = phase_dependencies(phases_to_run)
         for phase_name in phases_to_run:
-            if phase_name not in all_phases:
-                print_status(f"Unknown phase: {phase_name}, skipping", "warning")
-                continue
-
-            result = await run_phase(phase_name, all_phases[phase_name])
-            results.append(result)
-            phases_executed.append(phase_name)
+            self._phase_ancestors[phase_name] = set(phases_executed) | phase_ancestors(
+                deps, phase_name
+            )
+        graph_results = await run_phase_graph(
+            phases_to_run,
+            lambda name: run_phase(name, all_phases[name]),
+            deps,
+        )
+        results.extend(graph_results)
+        phases_executed.extend(r.phase for r in graph_results)
 
-            # Store summary for subsequent phases (compaction)
-            if result.success:
-                await self._store_phase_summary(phase_name)
+        failed = [r for r in graph_results if not r.success]
+        for result in failed:
+            print()
+            print_status(
+                f"Phase '{result.phase}' failed after {result.retries} retries",
+                "error",
+            )
+            print(f"  {muted('Errors:')}")
+            for err in result.errors:
+                print(f"    {icon(Icons.ARROW_RIGHT)} {err}")
+            task_logger.log(
+                f"Phase '{result.phase}' failed: {'; '.join(result.errors)}",
+                LogEntryType.ERROR,
+            )
+        if failed:
+            print()
+            print_status("Spec creation incomplete. Fix errors and retry.", "warning")
+            task_logger.end_phase(
+                LogPhase.PLANNING,
+                success=False,
+                message=f"Phase {failed[0].phase} failed",
+            )
+            await self._drain_phase_summaries()
+            return False
 
-            if not result.success:
-                print()
-                print_status(
-                    f"Phase '{phase_name}' failed after {result.retries} retries",
-                    "error",
-                )
-                print(f"  {muted('Errors:')}")
-                for err in result.errors:
-                    print(f"    {icon(Icons.ARROW_RIGHT)} {err}")
-                print()
-                print_status(
-                    "Spec creation incomplete. Fix errors and retry.", "warning"
-                )
-                task_logger.log(
-                    f"Phase '{phase_name}' failed: {'; '.join(result.errors)}",
-                    LogEntryType.ERROR,
-                )
-                task_logger.end_phase(
-                    LogPhase.PLANNING,
-                    success=False,
-                    message=f"Phase {phase_name} failed",
-                )
-                return False
+        await self._drain_phase_summaries()
 
         # Summary
         self._print_completion_summary(results, phases_executed)
@@ -578,11 +659,8 @@ class SpecOrchestrator:
         Returns:
             The complexity assessment
         """
-        project_index = {}
         auto_build_index = self.project_dir / "auto-claude" / "project_index.json"
-        if auto_build_index.exists():
-            with open(auto_build_index, encoding="utf-8") as f:
-                project_index = json.load(f)
+        project_index = ProjectIndex.for_file(auto_build_index).data()
 
         analyzer = complexity.ComplexityAnalyzer(project_index)
         return analyzer.analyze(self.task_description or "")
@@ -3,16 +3,34 @@ Status Management
 ==================
 
 Build status tracking and status file management for ccstatusline integration.
+
+Besides the JSON status file, every write also stores the status line output
+pre-rendered in each format (see RENDERED_DIR), so ui/statusline.py can print
+it without importing this package or parsing JSON. A build can additionally
+serve the rendered strings over a Unix domain socket
+(AUTO_CLAUDE_STATUS_SOCKET=1).
 """
 
 import json
+import os
 import threading
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
+from .capabilities import supports_unicode
 from .colors import warning
+from .icons import Icons
+
+# Pre-rendered status line output, relative to the project dir (inside the
+# gitignored .auto-claude/ dir). Each file holds the spec name on its first
+# line and the rendered text after it. ui/statusline.py reads these paths
+# without importing this module, so keep the two in sync.
+RENDERED_DIR = Path(".auto-claude") / "statusline"
+RENDERED_FORMATS = ("compact", "compact.ascii", "full", "json")
+STATUS_SOCKET_NAME = "status.sock"
+STATUS_SOCKET_ENV_VAR = "AUTO_CLAUDE_STATUS_SOCKET"
 
 
 class BuildState(Enum):
@@ -102,6 +120,110 @@ class BuildStatus:
         )
 
 
+def render_compact(status: BuildStatus, unicode: bool | None = None) -> str:
+    """Render status as a compact single line for a status bar.
+
+    Args:
+        status: Status to render
+        unicode: Use Unicode icons (default: detect from the terminal)
+    """
+    if not status.active:
+        return ""
+    if unicode is None:
+        unicode = supports_unicode()
+
+    def icon(icon_tuple: tuple[str, str]) -> str:
+        return icon_tuple[0] if unicode else icon_tuple[1]
+
+    parts = []
+
+    # Subtasks progress
+    if status.subtasks_total > 0:
+        subtask_icon = icon(Icons.SUBTASK)
+        parts.append(
+            f"{subtask_icon} {status.subtasks_completed}/{status.subtasks_total}"
+        )
+
+    # Current phase
+    if status.phase_current:
+        phase_icon = icon(Icons.PHASE)
+        phase_status = (
+            icon(Icons.ARROW_RIGHT) if status.state == BuildState.BUILDING else ""
+        )
+        parts.append(f"{phase_icon} {status.phase_current} {phase_status}".strip())
+
+    # Workers (only in parallel mode)
+    if status.workers_max > 1:
+        worker_icon = icon(Icons.WORKER)
+        parts.append(f"{worker_icon}{status.workers_active}")
+
+    # Percentage
+    if status.subtasks_total > 0:
+        pct = int(100 * status.subtasks_completed / status.subtasks_total)
+        parts.append(f"{pct}%")
+
+    # State prefix for special states
+    state_prefix = ""
+    if status.state == BuildState.PAUSED:
+        state_prefix = icon(Icons.PAUSE) + " "
+    elif status.state == BuildState.COMPLETE:
+        state_prefix = icon(Icons.SUCCESS) + " "
+    elif status.state == BuildState.ERROR:
+        state_prefix = icon(Icons.ERROR) + " "
+
+    separator = " │ " if unicode else " | "
+    return state_prefix + separator.join(parts)
+
+
+def render_full(status: BuildStatus) -> str:
+    """Render status with more detail."""
+    if not status.active:
+        return "No active build"
+
+    lines = []
+    lines.append(f"Spec: {status.spec}")
+    lines.append(f"State: {status.state.value}")
+
+    if status.subtasks_total > 0:
+        pct = int(100 * status.subtasks_completed / status.subtasks_total)
+        lines.append(
+            f"Progress: {status.subtasks_completed}/{status.subtasks_total} subtasks ({pct}%)"
+        )
+
+        if status.subtasks_in_progress > 0:
+            lines.append(f"In Progress: {status.subtasks_in_progress}")
+        if status.subtasks_failed > 0:
+            lines.append(f"Failed: {status.subtasks_failed}")
+
+    if status.phase_current:
+        lines.append(
+            f"Phase: {status.phase_current} ({status.phase_id}/{status.phase_total})"
+        )
+
+    if status.workers_max > 1:
+        lines.append(f"Workers: {status.workers_active}/{status.workers_max}")
+
+    if status.session_number > 0:
+        lines.append(f"Session: {status.session_number}")
+
+    return "\n".join(lines)
+
+
+def render_json(status: BuildStatus) -> str:
+    """Render status as JSON."""
+    return json.dumps(status.to_dict(), indent=2)
+
+
+def render_all(status: BuildStatus) -> dict[str, str]:
+    """Render status in every RENDERED_FORMATS format."""
+    return {
+        "compact": render_compact(status, unicode=True),
+        "compact.ascii": render_compact(status, unicode=False),
+        "full": render_full(status),
+        "json": render_json(status),
+    }
+
+
 class StatusManager:
     """Manages the .auto-claude-status file for ccstatusline integration."""
 
@@ -111,7 +233,12 @@ class StatusManager:
     def __init__(self, project_dir: Path):
         self.project_dir = Path(project_dir)
         self.status_file = self.project_dir / ".auto-claude-status"
+        self.rendered_dir = self.project_dir / RENDERED_DIR
         self._status = BuildStatus()
+        # (spec, {format: text}) of the last write, served by the socket
+        self._rendered: tuple[str, dict[str, str]] | None = None
+        self._socket_server = None
+        self._socket_inode: int | None = None
         self._write_pending = False
         self._write_timer: threading.Timer | None = None
         self._write_lock = threading.Lock()  # Protects _write_pending and _write_timer
@@ -131,7 +258,6 @@ class StatusManager:
 
     def _do_write(self) -> None:
         """Perform the actual file write."""
-        import os
         import time
 
         debug = os.environ.get("DEBUG", "").lower() in ("true", "1")
@@ -148,6 +274,7 @@ class StatusManager:
         try:
             with open(self.status_file, "w", encoding="utf-8") as f:
                 json.dump(status_dict, f, indent=2)
+            self._write_rendered(status_dict)
 
             if debug:
                 write_duration = (time.time() - write_start) * 1000
@@ -157,10 +284,101 @@ class StatusManager:
         except OSError as e:
             print(warning(f"Could not write status file: {e}"))
 
+    def _write_rendered(self, status_dict: dict) -> None:
+        """Store the status line output pre-rendered in every format.
+
+        Written after the status file, so a rendered file older than the
+        status file is known to be stale.
+        """
+        spec = status_dict.get("spec", "")
+        rendered = render_all(BuildStatus.from_dict(status_dict))
+        with self._write_lock:
+            self._rendered = (spec, rendered)
+
+        self.rendered_dir.mkdir(parents=True, exist_ok=True)
+        for fmt, text in rendered.items():
+            path = self.rendered_dir / fmt
+            tmp_path = self.rendered_dir / f".{fmt}.{os.getpid()}.tmp"
+            tmp_path.write_text(f"{spec}\n{text}", encoding="utf-8")
+            os.replace(tmp_path, path)
+
+    def start_socket_server(self, force: bool = False) -> bool:
+        """Serve the rendered status over a Unix domain socket.
+
+        Clients send a format name (see RENDERED_FORMATS) and a newline and
+        get back the spec name, a newline and the rendered text. Only runs
+        when AUTO_CLAUDE_STATUS_SOCKET is enabled, unless forced.
+
+        Returns:
+            True if the server is running
+        """
+        import socket
+
+        if self._socket_server is not None:
+            return True
+        enabled = os.environ.get(STATUS_SOCKET_ENV_VAR, "").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        if not (enabled or force) or not hasattr(socket, "AF_UNIX"):
+            return False
+
+        import atexit
+        import socketserver
+
+        manager = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                fmt = self.rfile.readline(64).decode("ascii", "replace").strip()
+                spec, rendered = manager._current_rendered()
+                if fmt in rendered:
+                    self.wfile.write(f"{spec}\n{rendered[fmt]}".encode())
+
+        socket_path = self.rendered_dir / STATUS_SOCKET_NAME
+        try:
+            self.rendered_dir.mkdir(parents=True, exist_ok=True)
+            # A socket left behind by a build that did not exit cleanly
+            socket_path.unlink(missing_ok=True)
+            server = socketserver.ThreadingUnixStreamServer(str(socket_path), Handler)
+        except OSError as e:
+            # E.g. the socket path exceeds the platform's length limit
+            print(warning(f"Could not start status socket: {e}"))
+            return False
+
+        server.daemon_threads = True
+        self._socket_server = server
+        self._socket_inode = socket_path.stat().st_ino
+        threading.Thread(
+            target=server.serve_forever, name="status-socket", daemon=True
+        ).start()
+        atexit.register(self.stop_socket_server)
+        return True
+
+    def stop_socket_server(self) -> None:
+        """Stop the status socket server and remove its socket file."""
+        server, self._socket_server = self._socket_server, None
+        if server is None:
+            return
+        server.shutdown()
+        server.server_close()
+        socket_path = self.rendered_dir / STATUS_SOCKET_NAME
+        try:
+            # Leave the socket alone if another build has replaced it
+            if socket_path.stat().st_ino == self._socket_inode:
+                socket_path.unlink()
+        except OSError:
+            pass
+
+    def _current_rendered(self) -> tuple[str, dict[str, str]]:
+        with self._write_lock:
+            if self._rendered is None:
+                self._rendered = (self._status.spec, render_all(self._status))
+            return self._rendered
+
     def _schedule_write(self) -> None:
         """Schedule a debounced write to batch multiple updates."""
-        import os
-
         debug = os.environ.get("DEBUG", "").lower() in ("true", "1")
 
         with self._write_lock:
@@ -230,6 +448,7 @@ class StatusManager:
             self._status.state = state
             self._status.session_started = datetime.now().isoformat()
         self.write(immediate=True)
+        self.start_socket_server()
 
     def set_inactive(self) -> None:
         """Mark build as inactive. Writes immediately for visibility."""
@@ -237,6 +456,7 @@ class StatusManager:
             self._status.active = False
             self._status.state = BuildState.IDLE
         self.write(immediate=True)
+        self.stop_socket_server()
 
     def update_subtasks(
         self,
@@ -288,8 +508,11 @@ class StatusManager:
                 self._write_timer = None
             self._write_pending = False
 
-        if self.status_file.exists():
+        self.stop_socket_server()
+        for path in [self.status_file] + [
+            self.rendered_dir / fmt for fmt in RENDERED_FORMATS
+        ]:
             try:
-                self.status_file.unlink()
+                path.unlink()
             except OSError:
                 pass
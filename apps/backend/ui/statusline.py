@@ -29,141 +29,206 @@ ccstatusline Configuration:
             }
         ]
     }
+
+Performance:
+    Shell prompts and tmux run this on every render. When a build has
+    written the pre-rendered status (ui/status.py, RENDERED_DIR), main()
+    prints it using only os and sys: no UI package import, no JSON parsing.
+    Anything else (--help, a stale or missing rendered file, a spec filter
+    with --format json) falls back to reading and formatting the status
+    file.
 """
 
-import argparse
-import json
+import os
 import sys
-from pathlib import Path
 
-# Add auto-claude to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Mirrors ui/status.py (RENDERED_DIR, STATUS_SOCKET_NAME); not imported so
+# the fast path stays free of the UI package
+STATUS_FILE = ".auto-claude-status"
+RENDERED_DIR = os.path.join(".auto-claude", "statusline")
+STATUS_SOCKET_NAME = "status.sock"
+FORMATS = ("compact", "full", "json")
+
+# Output for a project without a status file, or a non-matching --spec
+_INACTIVE_OUTPUT = {"compact": "", "full": "No active build"}
+
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-from ui import (
-    BuildState,
-    BuildStatus,
-    Icons,
-    StatusManager,
-    icon,
-    supports_unicode,
-)
 
+def _find_root(cwd: str) -> str:
+    """Closest directory at or above cwd with .auto-claude or a status file."""
+    directory = cwd
+    while True:
+        if os.path.exists(os.path.join(directory, ".auto-claude")):
+            return directory
+        if os.path.exists(os.path.join(directory, STATUS_FILE)):
+            return directory
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return cwd
+        directory = parent
 
-def find_project_root() -> Path:
+
+def find_project_root():
     """Find the project root by looking for .auto-claude or .auto-claude-status."""
-    cwd = Path.cwd()
+    from pathlib import Path
 
-    # Check current directory - prioritize .auto-claude (installed instance)
-    if (cwd / ".auto-claude").exists():
-        return cwd
-    if (cwd / ".auto-claude-status").exists():
-        return cwd
+    return Path(_find_root(os.getcwd()))
 
-    # Walk up to find project root
-    for parent in cwd.parents:
-        if (parent / ".auto-claude").exists():
-            return parent
-        if (parent / ".auto-claude-status").exists():
-            return parent
 
-    return cwd
+def _parse_fast_args(argv: list[str]) -> tuple[str, str | None, str | None] | None:
+    """(format, spec, project_dir) for simple argument lists, else None."""
+    options = {"format": "compact", "spec": None, "project_dir": None}
+    names = {
+        "--format": "format",
+        "-f": "format",
+        "--spec": "spec",
+        "-s": "spec",
+        "--project-dir": "project_dir",
+        "-p": "project_dir",
+    }
+    i = 0
+    while i < len(argv):
+        flag, eq, value = argv[i].partition("=")
+        if flag not in names:
+            return None
+        if not eq:
+            i += 1
+            if i == len(argv):
+                return None
+            value = argv[i]
+        options[names[flag]] = value
+        i += 1
+    if options["format"] not in FORMATS:
+        return None
+    return options["format"], options["spec"], options["project_dir"]
+
+
+def _unicode_output() -> bool:
+    """Same test as ui.capabilities.supports_unicode()."""
+    fancy = os.environ.get("ENABLE_FANCY_UI", "true").lower()
+    if fancy not in ("true", "1", "yes", "on"):
+        return False
+    encoding = getattr(sys.stdout, "encoding", "") or ""
+    return encoding.lower() in ("utf-8", "utf8")
+
+
+def _query_socket(rendered_dir: str, variant: str) -> str | None:
+    socket_path = os.path.join(rendered_dir, STATUS_SOCKET_NAME)
+    if not os.path.exists(socket_path):
+        return None
+    import socket
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.2)
+            sock.connect(socket_path)
+            sock.sendall(f"{variant}\n".encode())
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+    except OSError:
+        return None
+    return b"".join(chunks).decode("utf-8") if chunks else None
+
+
+def _read_rendered_file(
+    rendered_dir: str, variant: str, status_mtime: int
+) -> str | None:
+    path = os.path.join(rendered_dir, variant)
+    try:
+        if os.stat(path).st_mtime_ns < status_mtime:
+            # Status file rewritten without re-rendering (older writer)
+            return None
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def read_prerendered(
+    fmt: str, spec: str | None = None, project_dir: str | None = None
+) -> str | None:
+    """
+    The status line output from the pre-rendered status, without parsing it.
+
+    Args:
+        fmt: Output format (compact, full or json)
+        spec: Only report a build whose spec name contains this
+        project_dir: Project directory (default: auto-detect)
+
+    Returns:
+        The text to print ("" for nothing), or None if the slow path must
+        read and format the status file
+    """
+    root = project_dir or _find_root(os.getcwd())
+    try:
+        status_mtime = os.stat(os.path.join(root, STATUS_FILE)).st_mtime_ns
+    except OSError:
+        # No build has written a status here
+        return _INACTIVE_OUTPUT.get(fmt)
+
+    variant = fmt
+    if fmt == "compact" and not _unicode_output():
+        variant = "compact.ascii"
+    rendered_dir = os.path.join(root, RENDERED_DIR)
+    text = _query_socket(rendered_dir, variant)
+    if text is None:
+        text = _read_rendered_file(rendered_dir, variant, status_mtime)
+    if text is None:
+        return None
+
+    status_spec, _, output = text.partition("\n")
+    if spec and status_spec and spec not in status_spec:
+        # Spec doesn't match, treat as inactive
+        return _INACTIVE_OUTPUT.get(fmt)
+    return output
 
 
-def format_compact(status: BuildStatus) -> str:
+def format_compact(status) -> str:
     """Format status as compact single line for status bar."""
-    if not status.active:
-        return ""
-
-    parts = []
-
-    # State indicator
-    state_icons = {
-        BuildState.PLANNING: ("", "P"),
-        BuildState.BUILDING: (icon(Icons.LIGHTNING), "B"),
-        BuildState.QA: ("", "Q"),
-        BuildState.PAUSED: (icon(Icons.PAUSE), "||"),
-        BuildState.COMPLETE: (icon(Icons.SUCCESS), "OK"),
-        BuildState.ERROR: (icon(Icons.ERROR), "ERR"),
-    }
+    from ui.status import render_compact
+
+    return render_compact(status)
+
 
-    # Subtasks progress
-    if status.subtasks_total > 0:
-        subtask_icon = icon(Icons.SUBTASK)
-        parts.append(
-            f"{subtask_icon} {status.subtasks_completed}/{status.subtasks_total}"
-        )
-
-    # Current phase
-    if status.phase_current:
-        phase_icon = icon(Icons.PHASE)
-        phase_status = (
-            icon(Icons.ARROW_RIGHT) if status.state == BuildState.BUILDING else ""
-        )
-        parts.append(f"{phase_icon} {status.phase_current} {phase_status}".strip())
-
-    # Workers (only in parallel mode)
-    if status.workers_max > 1:
-        worker_icon = icon(Icons.WORKER)
-        parts.append(f"{worker_icon}{status.workers_active}")
-
-    # Percentage
-    if status.subtasks_total > 0:
-        pct = int(100 * status.subtasks_completed / status.subtasks_total)
-        parts.append(f"{pct}%")
-
-    # State prefix for special states
-    state_prefix = ""
-    if status.state == BuildState.PAUSED:
-        state_prefix = icon(Icons.PAUSE) + " "
-    elif status.state == BuildState.COMPLETE:
-        state_prefix = icon(Icons.SUCCESS) + " "
-    elif status.state == BuildState.ERROR:
-        state_prefix = icon(Icons.ERROR) + " "
-
-    separator = " │ " if supports_unicode() else " | "
-    return state_prefix + separator.join(parts)
-
-
-def format_full(status: BuildStatus) -> str:
+def format_full(status) -> str:
     """Format status with more detail."""
-    if not status.active:
-        return "No active build"
+    from ui.status import render_full
 
-    lines = []
-    lines.append(f"Spec: {status.spec}")
-    lines.append(f"State: {status.state.value}")
+    return render_full(status)
 
-    if status.subtasks_total > 0:
-        pct = int(100 * status.subtasks_completed / status.subtasks_total)
-        lines.append(
-            f"Progress: {status.subtasks_completed}/{status.subtasks_total} subtasks ({pct}%)"
-        )
 
-        if status.subtasks_in_progress > 0:
-            lines.append(f"In Progress: {status.subtasks_in_progress}")
-        if status.subtasks_failed > 0:
-            lines.append(f"Failed: {status.subtasks_failed}")
+def format_json(status) -> str:
+    """Format status as JSON."""
+    from ui.status import render_json
 
-    if status.phase_current:
-        lines.append(
-            f"Phase: {status.phase_current} ({status.phase_id}/{status.phase_total})"
-        )
+    return render_json(status)
 
-    if status.workers_max > 1:
-        lines.append(f"Workers: {status.workers_active}/{status.workers_max}")
 
-    if status.session_number > 0:
-        lines.append(f"Session: {status.session_number}")
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
 
-    return "\n".join(lines)
+    fast_args = _parse_fast_args(argv)
+    if fast_args is not None:
+        output = read_prerendered(*fast_args)
+        if output is not None:
+            if output:
+                print(output)
+            return
 
+    _main_slow(argv)
 
-def format_json(status: BuildStatus) -> str:
-    """Format status as JSON."""
-    return json.dumps(status.to_dict(), indent=2)
 
+def _main_slow(argv: list[str]) -> None:
+    """Parse arguments fully, then read and format the status file."""
+    import argparse
+    from pathlib import Path
+
+    if _BACKEND_DIR not in sys.path:
+        sys.path.insert(0, _BACKEND_DIR)
+    from ui.status import BuildStatus, StatusManager
 
-def main():
     parser = argparse.ArgumentParser(
         description="Status line provider for ccstatusline",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -201,7 +266,7 @@ Examples:
         help="Project directory (default: auto-detect)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Find project root
     project_dir = args.project_dir or find_project_root()
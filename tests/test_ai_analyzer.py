@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Tests for the AI Analyzer Runner
+================================
+
+Covers concurrent analyzer execution and the per-analyzer result cache,
+using a fake query client that sleeps and counts calls instead of talking
+to Claude.
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+from runners.ai_analyzer.analyzers import AnalyzerFactory
+from runners.ai_analyzer.models import AnalyzerType
+from runners.ai_analyzer.runner import AIAnalyzerRunner
+
+QUERY_SECONDS = 0.05
+
+PROJECT_INDEX = {
+    "services": {
+        "api": {
+            "api": {
+                "routes": [
+                    {"methods": ["GET"], "path": "/users", "file": "users.py"},
+                ]
+            },
+            "database": {"models": {"User": {}}},
+        }
+    }
+}
+
+
+class FakeClient:
+    """Stands in for ClaudeAnalysisClient; records every query."""
+
+    calls: list[str] = []
+    active = 0
+    max_active = 0
+    fail_on: set[str] = set()
+
+    def __init__(self, project_dir: Path):
+        self.project_dir = project_dir
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.calls = []
+        cls.active = 0
+        cls.max_active = 0
+        cls.fail_on = set()
+
+    async def run_analysis_query(self, prompt: str) -> str:
+        cls = type(self)
+        name = _analyzer_for_prompt(prompt)
+        cls.calls.append(name)
+        cls.active += 1
+        cls.max_active = max(cls.max_active, cls.active)
+        try:
+            await asyncio.sleep(QUERY_SECONDS)
+            if name in cls.fail_on:
+                raise RuntimeError(f"{name} failed")
+            return json.dumps({"score": 70, "analyzer": name})
+        finally:
+            cls.active -= 1
+
+
+def _analyzer_for_prompt(prompt: str) -> str:
+    for name in AnalyzerType.all_analyzers():
+        if AnalyzerFactory.create(name, PROJECT_INDEX).get_prompt() == prompt:
+            return name
+    return "unknown"
+
+
+@pytest.fixture
+def fake_client():
+    FakeClient.reset()
+    yield FakeClient
+    FakeClient.reset()
+
+
+def _runner(project_dir: Path, index=None, **kwargs) -> AIAnalyzerRunner:
+    return AIAnalyzerRunner(
+        project_dir, index or PROJECT_INDEX, client_factory=FakeClient, **kwargs
+    )
+
+
+class TestConcurrentAnalyzers:
+    async def test_runs_all_analyzers_concurrently(self, temp_dir, fake_client):
+        runner = _runner(temp_dir, max_concurrency=3)
+
+        start = time.perf_counter()
+        insights = await runner.run_full_analysis()
+        elapsed = time.perf_counter() - start
+
+        analyzers = AnalyzerType.all_analyzers()
+        assert sorted(fake_client.calls) == sorted(analyzers)
+        assert fake_client.max_active == 3
+        # 6 analyzers, 3 at a time: two rounds instead of six
+        assert elapsed < QUERY_SECONDS * len(analyzers)
+        for name in analyzers:
+            assert insights[name]["analyzer"] == name
+        assert insights["overall_score"] == 70
+
+    async def test_concurrency_of_one_is_sequential(self, temp_dir, fake_client):
+        await _runner(temp_dir, max_concurrency=1).run_full_analysis(
+            selected_analyzers=["security", "performance"]
+        )
+
+        assert fake_client.max_active == 1
+        assert fake_client.calls == ["security", "performance"]
+
+
+class TestPerAnalyzerCache:
+    async def test_second_run_uses_cache(self, temp_dir, fake_client):
+        await _runner(temp_dir).run_full_analysis()
+        fake_client.calls.clear()
+
+        insights = await _runner(temp_dir).run_full_analysis()
+
+        assert fake_client.calls == []
+        assert insights["security"]["analyzer"] == "security"
+        assert insights["overall_score"] == 70
+
+    async def test_skip_cache_requeries(self, temp_dir, fake_client):
+        await _runner(temp_dir).run_full_analysis(selected_analyzers=["security"])
+        fake_client.calls.clear()
+
+        await _runner(temp_dir).run_full_analysis(
+            skip_cache=True, selected_analyzers=["security"]
+        )
+
+        assert fake_client.calls == ["security"]
+
+    async def test_changed_inputs_requery_only_affected_analyzers(
+        self, temp_dir, fake_client
+    ):
+        selected = ["code_relationships", "security"]
+        await _runner(temp_dir).run_full_analysis(selected_analyzers=selected)
+        fake_client.calls.clear()
+
+        # code_relationships only reads the first service; security keys on
+        # all services
+        index = json.loads(json.dumps(PROJECT_INDEX))
+        index["services"]["worker"] = {"language": "python"}
+        await _runner(temp_dir, index).run_full_analysis(selected_analyzers=selected)
+        assert fake_client.calls == ["security"]
+        fake_client.calls.clear()
+
+        index["services"]["api"]["api"]["routes"].append(
+            {"methods": ["POST"], "path": "/users", "file": "users.py"}
+        )
+        await _runner(temp_dir, index).run_full_analysis(selected_analyzers=selected)
+        # "unknown": the prompt now lists the new route
+        assert sorted(fake_client.calls) == ["security", "unknown"]
+
+    async def test_analyzer_version_invalidates_cache(
+        self, temp_dir, fake_client, monkeypatch
+    ):
+        await _runner(temp_dir).run_full_analysis(selected_analyzers=["security"])
+        fake_client.calls.clear()
+
+        security_class = AnalyzerFactory.ANALYZER_CLASSES["security"]
+        monkeypatch.setattr(security_class, "VERSION", security_class.VERSION + 1)
+        await _runner(temp_dir).run_full_analysis(selected_analyzers=["security"])
+
+        assert fake_client.calls == ["security"]
+
+    async def test_finished_analyzers_persist_when_one_fails(
+        self, temp_dir, fake_client
+    ):
+        fake_client.fail_on = {"performance"}
+        insights = await _runner(temp_dir).run_full_analysis(
+            selected_analyzers=["security", "performance"]
+        )
+        assert "error" in insights["performance"]
+
+        fake_client.fail_on = set()
+        fake_client.calls.clear()
+        await _runner(temp_dir).run_full_analysis(
+            selected_analyzers=["security", "performance"]
+        )
+
+        # Errors are not cached; the successful analyzer is
+        assert fake_client.calls == ["performance"]
+
+    async def test_interrupted_run_keeps_finished_analyzers(
+        self, temp_dir, fake_client
+    ):
+        runner = _runner(temp_dir, max_concurrency=1)
+        task = asyncio.create_task(
+            runner.run_full_analysis(selected_analyzers=["security", "performance"])
+        )
+        while fake_client.calls != ["security", "performance"]:
+            await asyncio.sleep(0.005)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        fake_client.calls.clear()
+        await _runner(temp_dir).run_full_analysis(
+            selected_analyzers=["security", "performance"]
+        )
+
+        assert fake_client.calls == ["performance"]
+
+    def test_corrupt_entry_is_a_miss(self, temp_dir):
+        manager = _runner(temp_dir).cache_manager
+        manager.save_analyzer_result("security", "k1", {"score": 1})
+        assert manager.get_analyzer_result("security", "k1") == {"score": 1}
+        assert manager.get_analyzer_result("security", "k2") is None
+
+        (manager.analyzer_cache_dir / "security.json").write_text("{not json")
+        assert manager.get_analyzer_result("security", "k1") is None
+
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Tests for the Attempt Log
+=========================
+
+Covers services/attempt_log.py (MinHash signatures, LSH lookup, the
+append-only log and its in-memory index) and how RecoveryManager uses it.
+The property tests check MinHash answers against exact Jaccard similarity
+on seeded random approaches.
+"""
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+from services.attempt_log import (
+    SIMILAR_APPROACH_THRESHOLD,
+    AttemptLog,
+    approach_tokens,
+    estimate_similarity,
+    jaccard,
+    minhash,
+)
+from services.recovery import HISTORY_ATTEMPTS, RecoveryManager
+
+VOCABULARY = [f"term{i}" for i in range(400)]
+
+
+def random_pairs(seed: int, count: int) -> list[tuple[str, str]]:
+    """Approach pairs sharing a random fraction of their keywords."""
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(count):
+        words = rng.sample(VOCABULARY, rng.randint(12, 40))
+        shared = rng.randint(0, len(words) // 2)
+        a = words[: len(words) // 2]
+        b = words[: shared] + words[len(words) // 2 :][: len(a) - shared]
+        pairs.append((" ".join(a), " ".join(b)))
+    return pairs
+
+
+@pytest.fixture
+def memory_dir(temp_dir: Path):
+    yield temp_dir / "memory"
+    AttemptLog.clear_registry()
+
+
+class TestMinHashProperties:
+    def test_estimate_tracks_exact_jaccard(self):
+        errors = []
+        for a, b in random_pairs(seed=1, count=300):
+            exact = jaccard(approach_tokens(a), approach_tokens(b))
+            estimate = estimate_similarity(
+                minhash(approach_tokens(a)), minhash(approach_tokens(b))
+            )
+            errors.append(abs(estimate - exact))
+
+        assert max(errors) < 0.25
+        assert sum(errors) / len(errors) < 0.06
+
+    def test_lookup_agrees_with_exact_jaccard(self, memory_dir: Path):
+        log = AttemptLog(memory_dir)
+        pairs = random_pairs(seed=2, count=200)
+        for i, (stored, _) in enumerate(pairs):
+            log.append(f"subtask-{i}", 1, False, stored)
+
+        for i, (stored, query) in enumerate(pairs):
+            exact = jaccard(approach_tokens(stored), approach_tokens(query))
+            found = {r.subtask_id for r, _ in log.similar(query)}
+            if exact >= 0.8:
+                assert f"subtask-{i}" in found
+            # No false positives far below the threshold, for any stored attempt
+            for j, (other, _) in enumerate(pairs):
+                if jaccard(approach_tokens(other), approach_tokens(query)) < 0.2:
+                    assert f"subtask-{j}" not in found
+
+    def test_identical_and_disjoint(self):
+        tokens = approach_tokens("retry the websocket handshake with backoff")
+        assert estimate_similarity(minhash(tokens), minhash(tokens)) == 1.0
+        assert (
+            estimate_similarity(minhash(tokens), minhash(approach_tokens("x y z")))
+            < SIMILAR_APPROACH_THRESHOLD
+        )
+        assert minhash(approach_tokens("the and with")) == ()
+
+
+class TestAttemptLog:
+    def test_rebuilds_index_from_log(self, memory_dir: Path):
+        log = AttemptLog(memory_dir)
+        log.append("1.1", 1, False, "mock redis client in tests", "boom")
+        log.append("1.1", 2, True, "use fakeredis fixture")
+
+        reloaded = AttemptLog(memory_dir)
+
+        assert [a.approach for a in reloaded.attempts("1.1")] == [
+            "mock redis client in tests",
+            "use fakeredis fixture",
+        ]
+        assert reloaded.attempts("1.1")[0].error == "boom"
+        assert reloaded.similar("mock redis client in tests")[0][1] == 1.0
+
+    def test_follows_appends_from_other_instances(self, memory_dir: Path):
+        reader, writer = AttemptLog(memory_dir), AttemptLog(memory_dir)
+        assert reader.count("1.1") == 0
+
+        writer.append("1.1", 1, False, "first approach")
+        with open(memory_dir / "attempt_log.jsonl", "a") as f:
+            f.write('{"subtask_id": "1.1", "approach": "partial')
+
+        assert reader.count("1.1") == 1
+
+    def test_reset_and_corrupt_lines(self, memory_dir: Path):
+        log = AttemptLog(memory_dir)
+        log.append("1.1", 1, False, "patch the config loader")
+        with open(log.path, "a") as f:
+            f.write("not json\n")
+        log.append("1.2", 1, False, "patch the config loader")
+        log.reset("1.1")
+
+        reloaded = AttemptLog(memory_dir)
+        assert reloaded.count("1.1") == 0
+        assert [r.subtask_id for r, _ in reloaded.similar("patch config loader")] == [
+            "1.2"
+        ]
+
+    def test_log_lines_are_constant_size(self, memory_dir: Path):
+        log = AttemptLog(memory_dir)
+        sizes = []
+        for i in range(50):
+            before = log.path.stat().st_size if log.path.exists() else 0
+            log.append("1.1", i, False, "retry the migration script", "error")
+            sizes.append(log.path.stat().st_size - before)
+
+        assert max(sizes) - min(sizes) <= 4  # Only the session number grows
+
+
+class TestRecoveryManagerIntegration:
+    def test_history_file_is_bounded(self, temp_dir: Path):
+        manager = RecoveryManager(temp_dir / "spec", temp_dir)
+        for i in range(HISTORY_ATTEMPTS + 5):
+            manager.record_attempt("1.1", i, False, f"approach number {i}", "err")
+
+        history = json.loads(
+            (temp_dir / "spec" / "memory" / "attempt_history.json").read_text()
+        )
+        entry = history["subtasks"]["1.1"]
+        assert len(entry["attempts"]) == HISTORY_ATTEMPTS
+        assert entry["attempt_count"] == HISTORY_ATTEMPTS + 5
+        assert manager.get_attempt_count("1.1") == HISTORY_ATTEMPTS + 5
+        assert len(manager.get_subtask_history("1.1")["attempts"]) == (
+            HISTORY_ATTEMPTS + 5
+        )
+
+    def test_prompt_readers_use_attempt_count(self, temp_dir: Path):
+        from analysis.insight_extractor import _format_attempt_history
+        from prompts_pkg.prompts import _get_recovery_context
+
+        spec_dir = temp_dir / "spec"
+        manager = RecoveryManager(spec_dir, temp_dir)
+        for i in range(HISTORY_ATTEMPTS + 5):
+            manager.record_attempt("1.1", i, False, f"approach number {i}", "err")
+
+        total = HISTORY_ATTEMPTS + 5
+        assert f"- 1.1: {total} attempts" in _get_recovery_context(spec_dir)
+        recent = [{"approach": "a", "success": False}] * HISTORY_ATTEMPTS
+        formatted = _format_attempt_history(recent, total)
+        assert formatted.startswith("**Attempt 6** (FAILED)")
+        assert f"**Attempt {total}**" in formatted
+
+    def test_older_duplicates_count_as_circular(self, temp_dir: Path):
+        manager = RecoveryManager(temp_dir / "spec", temp_dir)
+        approach = "regenerate prisma client and rerun migrations"
+        manager.record_attempt("1.1", 1, False, approach, "err")
+        manager.record_attempt("1.1", 2, False, approach, "err")
+        for i in range(3):
+            manager.record_attempt("1.1", 3 + i, False, f"unrelated idea {i}", "err")
+
+        assert manager.is_circular_fix("1.1", approach)
+        assert not manager.is_circular_fix("1.1", "switch the orm to sqlalchemy")
+
+    def test_hints_mention_failures_elsewhere(self, temp_dir: Path):
+        manager = RecoveryManager(temp_dir / "spec", temp_dir)
+        approach = "pin node version to 18 in the docker image"
+        manager.record_attempt("2.1", 1, False, approach, "still failing")
+        manager.record_attempt("3.4", 1, False, approach, "same error")
+
+        hints = manager.get_recovery_hints("3.4")
+
+        assert any("also failed in subtask 2.1" in hint for hint in hints)
+
+    def test_imports_existing_history(self, temp_dir: Path):
+        memory = temp_dir / "spec" / "memory"
+        memory.mkdir(parents=True)
+        attempt = {
+            "session": 1,
+            "timestamp": "2024-01-01T00:00:00",
+            "approach": "legacy approach",
+            "success": False,
+            "error": "old",
+        }
+        (memory / "attempt_history.json").write_text(
+            json.dumps(
+                {
+                    "subtasks": {"1.1": {"attempts": [attempt], "status": "failed"}},
+                    "stuck_subtasks": [],
+                    "metadata": {"created_at": "", "last_updated": ""},
+                }
+            )
+        )
+
+        manager = RecoveryManager(temp_dir / "spec", temp_dir)
+
+        assert manager.get_attempt_count("1.1") == 1
+        assert manager.get_subtask_history("1.1") == {
+            "attempts": [attempt],
+            "status": "failed",
+        }
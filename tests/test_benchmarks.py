@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tests for the Benchmark Suite
+=============================
+
+Tests apps/backend/benchmarks:
+- deterministic synthetic repositories
+- the harness and every hot-path benchmark on a tiny repository
+- baseline comparison and regression gating
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from benchmarks import (
+    Benchmark,
+    RepoSpec,
+    build_repo,
+    build_results,
+    compare_results,
+    has_regressions,
+    run_benchmark,
+    write_results,
+)
+from benchmarks.__main__ import main as bench_main
+from benchmarks.suite import build_suite
+
+TINY = RepoSpec(
+    services=3, files_per_service=3, lines_per_file=20, commits=3, worktrees=3
+)
+
+
+def _head(repo: Path) -> str:
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _results(**medians: float) -> dict:
+    return {
+        "schema": 1,
+        "results": {name: {"median": median} for name, median in medians.items()},
+    }
+
+
+class TestSyntheticRepo:
+    """Tests for synthetic repository generation."""
+
+    def test_deterministic(self, temp_dir: Path):
+        a = build_repo(temp_dir / "a", TINY)
+        b = build_repo(temp_dir / "b", TINY)
+
+        def files(root: Path) -> list[tuple[Path, str]]:
+            return sorted(
+                (p.relative_to(root), p.read_text())
+                for p in root.rglob("*")
+                if p.is_file() and ".git" not in p.parts
+            )
+
+        assert files(a) == files(b)
+        assert _head(a) == _head(b)
+
+    def test_shape(self, temp_dir: Path):
+        repo = build_repo(temp_dir / "repo", TINY)
+        services = sorted((repo / "services").iterdir())
+
+        assert len(services) == 3
+        assert (services[0] / "requirements.txt").exists()
+        assert (services[1] / "package.json").exists()
+        assert (services[2] / "go.mod").exists()
+        assert len(list((services[0] / "src").glob("*.py"))) == 3
+        log = subprocess.run(
+            ["git", "log", "--oneline"], cwd=repo, capture_output=True, text=True
+        )
+        assert len(log.stdout.splitlines()) == 3
+
+
+class TestSuite:
+    """Every hot path runs on a tiny repository without the SDK."""
+
+    def test_all_benchmarks_run(self, temp_dir: Path):
+        repo = build_repo(temp_dir / "repo", TINY)
+        benchmarks = build_suite(repo, TINY, temp_dir / "work")
+
+        results = [run_benchmark(b, warmup=0, repeat=1) for b in benchmarks]
+
+        assert [r.error for r in results] == [None] * len(results)
+        assert {r.name for r in results} >= {
+            "context.search_service",
+            "analysis.project_scan",
+            "project.compute_project_hash",
+            "security.bash_security_hook",
+            "security.scan_content",
+            "github.content_sanitizer",
+            "merge.simple_3way_merge",
+            "merge.semantic_parser",
+            "merge.semantic_regex",
+            "merge.semantic_cached",
+            "github.duplicates_similarity",
+            "task_logger.add_entry",
+            "spec_sync.session",
+            "spec_sync.unchanged",
+            "project_index.json_load",
+            "project_index.cached",
+            "project_index.sidecar",
+            "recovery.record_attempt",
+            "worktree.list_all_worktrees",
+            "worktree.list_all_worktrees_cached",
+        }
+
+    def test_harness_records_errors(self):
+        def broken():
+            raise RuntimeError("boom")
+
+        result = run_benchmark(Benchmark("broken", broken))
+        assert result.error == "RuntimeError: boom"
+        assert result.samples == 0
+
+    def test_harness_stats(self):
+        calls = []
+        result = run_benchmark(
+            Benchmark("noop", lambda: calls.append(1), inner_loops=4),
+            warmup=2,
+            repeat=5,
+        )
+        assert len(calls) == 2 + 5 * 4
+        assert result.samples == 5
+        assert result.min <= result.median <= result.p95
+        assert "times" not in build_results([result], {})["results"]["noop"]
+
+
+class TestCompare:
+    """Tests for baseline comparison."""
+
+    def test_statuses(self):
+        baseline = _results(steady=1.0, slower=1.0, faster=1.0, gone=1.0)
+        current = _results(steady=1.1, slower=1.5, faster=0.5, added=1.0)
+
+        statuses = {c.name: c.status for c in compare_results(baseline, current, 0.2)}
+
+        assert statuses == {
+            "steady": "ok",
+            "slower": "regression",
+            "faster": "improved",
+            "gone": "missing",
+            "added": "new",
+        }
+
+    def test_errors_fail_the_gate(self):
+        current = {"schema": 1, "results": {"x": {"median": 0.0, "error": "boom"}}}
+        comparisons = compare_results(_results(x=1.0), current)
+        assert has_regressions(comparisons)
+        assert not has_regressions(compare_results(_results(x=1.0), _results(x=1.0)))
+
+    @pytest.mark.parametrize(("median", "exit_code"), [(1.05, 0), (2.0, 1)])
+    def test_cli_exit_code(self, temp_dir: Path, median: float, exit_code: int):
+        write_results(temp_dir / "base.json", _results(x=1.0))
+        write_results(temp_dir / "cur.json", _results(x=median))
+
+        code = bench_main(
+            ["compare", str(temp_dir / "base.json"), str(temp_dir / "cur.json")]
+        )
+        assert code == exit_code
+
+    def test_cli_rejects_unknown_schema(self, temp_dir: Path):
+        (temp_dir / "base.json").write_text(json.dumps({"schema": 99}))
+        write_results(temp_dir / "cur.json", _results(x=1.0))
+
+        code = bench_main(
+            ["compare", str(temp_dir / "base.json"), str(temp_dir / "cur.json")]
+        )
+        assert code == 2
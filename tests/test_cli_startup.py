@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for CLI Startup Cost
+==========================
+
+Runs lightweight run.py commands under ``python -X importtime`` and checks
+that they stay within an import budget and never load the agent SDK, the
+memory integrations, the merge system or the GitHub runners.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+RUN_PY = Path(__file__).parent.parent / "apps" / "backend" / "run.py"
+
+# Generous ceilings: lightweight commands import ~180-290 modules today;
+# the full agent stack pulls in well over twice that
+MAX_MODULES = 400
+MAX_IMPORT_SECONDS = 2.0
+
+HEAVY_PACKAGES = (
+    "claude_agent_sdk",
+    "graphiti_core",
+    "integrations.graphiti",
+    "merge",
+    "runners",
+    "agents",
+    "prompts_pkg",
+    "qa.loop",
+)
+
+LIGHT_COMMANDS = [
+    ["--list"],
+    ["--spec", "001", "--qa-status"],
+    ["--spec", "001", "--review-status"],
+    ["--spec", "001", "--profile"],
+    ["--list-worktrees"],
+    ["--batch-status"],
+]
+
+
+def _parse_importtime(stderr: str) -> list[tuple[str, int]]:
+    """(module, self microseconds) for every ``import time:`` line."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:") :].split("|", 2)
+        modules.append((name.strip(), int(self_us)))
+    return modules
+
+
+def _is_heavy(module: str) -> bool:
+    return any(
+        module == package or module.startswith(package + ".")
+        for package in HEAVY_PACKAGES
+    )
+
+
+@pytest.fixture
+def cli_project(temp_git_repo: Path) -> Path:
+    spec_dir = temp_git_repo / ".auto-claude" / "specs" / "001-demo"
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "spec.md").write_text("# Demo\n")
+    return temp_git_repo
+
+
+@pytest.mark.parametrize("args", LIGHT_COMMANDS, ids=lambda a: " ".join(a))
+def test_light_command_import_budget(cli_project: Path, args: list[str]):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(RUN_PY), *args],
+        cwd=cli_project,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    modules = _parse_importtime(result.stderr)
+
+    assert modules, result.stderr
+    heavy = sorted({name for name, _ in modules if _is_heavy(name)})
+    assert heavy == []
+    assert len(modules) <= MAX_MODULES
+    assert sum(us for _, us in modules) / 1e6 <= MAX_IMPORT_SECONDS
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   _io\n"
+        "import time:      2500 |       2620 | merge.types\n"
+        "Some other warning\n"
+    )
+    assert _parse_importtime(stderr) == [("_io", 120), ("merge.types", 2500)]
+    assert _is_heavy("merge.types")
+    assert not _is_heavy("merged_view")
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Tests for the Dependency Cache
+==============================
+
+Covers core/dependency_cache.py with synthetic package roots: discovery of
+roots from the project index, lockfile-keyed snapshots, copy-on-write
+placement into worktrees and the symlink fallback.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from core import dependency_cache
+from core.dependency_cache import (
+    SNAPSHOTS_PER_TREE,
+    DependencyCache,
+    discover_package_roots,
+)
+from core.project_index import ProjectIndex
+
+LOCKFILES = {
+    "package-lock.json": '{"lockfileVersion": 3}',
+    "services/api/requirements.txt": "fastapi==0.110.0\n",
+}
+
+
+def write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def project(temp_dir: Path) -> Path:
+    """A monorepo with installed node workspaces and a Python service."""
+    project = temp_dir / "project"
+    for name, content in LOCKFILES.items():
+        write(project / name, content)
+    write(project / "node_modules" / "left-pad" / "index.js", "module.exports = 1")
+    os.symlink("../left-pad/index.js", _mkparent(project / "node_modules/.bin/pad"))
+    write(project / "apps/frontend/node_modules/react/index.js", "react")
+    write(project / "packages/ui/node_modules/clsx/index.js", "clsx")
+    write(
+        project / "services/api/.venv/lib/python3.12/site-packages/fastapi.py",
+        "app = None",
+    )
+    write(
+        project / ".auto-claude" / "project_index.json",
+        json.dumps(
+            {
+                "services": {
+                    "ui": {"path": str(project / "packages" / "ui")},
+                    "api": {"path": "services/api"},
+                    "outside": {"path": str(temp_dir)},
+                }
+            }
+        ),
+    )
+    yield project
+    ProjectIndex.invalidate()
+
+
+def _mkparent(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def make_worktree(project: Path, path: Path, lockfiles: dict | None = None) -> Path:
+    """A checkout of the project's lockfiles that ignores installed trees."""
+    path.mkdir(parents=True)
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    write(path / ".gitignore", "node_modules/\n.venv/\n")
+    for name, content in (lockfiles or LOCKFILES).items():
+        write(path / name, content)
+    (path / "apps" / "frontend").mkdir(parents=True)
+    (path / "packages" / "ui").mkdir(parents=True)
+    return path
+
+
+def snapshots(project: Path) -> list[Path]:
+    return sorted((project / ".auto-claude" / "dependency-cache").glob("*/*/*"))
+
+
+class TestDiscovery:
+    def test_roots_from_project_index(self, project: Path):
+        assert discover_package_roots(project) == [
+            ".",
+            "apps/frontend",
+            "packages/ui",
+            "services/api",
+        ]
+
+    def test_installed_trees_use_nearest_lockfile(self, project: Path):
+        trees = {t.path: t.lockfile for t in DependencyCache(project).installed_trees()}
+
+        assert trees == {
+            "node_modules": "package-lock.json",
+            "apps/frontend/node_modules": "package-lock.json",
+            "packages/ui/node_modules": "package-lock.json",
+            "services/api/.venv": "services/api/requirements.txt",
+        }
+
+
+class TestMaterialize:
+    def test_clones_every_tree(self, project: Path, temp_dir: Path):
+        worktree = make_worktree(project, temp_dir / "wt1")
+
+        placed = DependencyCache(project).materialize(worktree)
+
+        assert {p.path for p in placed} == {
+            "node_modules",
+            "apps/frontend/node_modules",
+            "packages/ui/node_modules",
+            "services/api/.venv",
+        }
+        assert {p.method for p in placed} <= {"reflink", "hardlink"}
+        assert (worktree / "node_modules/left-pad/index.js").read_text() == (
+            "module.exports = 1"
+        )
+        assert os.readlink(worktree / "node_modules/.bin/pad") == "../left-pad/index.js"
+        assert not (worktree / "node_modules").is_symlink()
+
+    def test_worktree_changes_do_not_reach_shared_copies(
+        self, project: Path, temp_dir: Path
+    ):
+        worktree = make_worktree(project, temp_dir / "wt1")
+        DependencyCache(project).materialize(worktree)
+        modules = worktree / "node_modules"
+
+        # What a package manager does: add, remove and replace files
+        write(modules / "new-pkg" / "index.js", "new")
+        (modules / "left-pad" / "index.js").unlink()
+        frontend = worktree / "apps/frontend/node_modules"
+        write(frontend / "react.tmp", "replaced")
+        os.replace(frontend / "react.tmp", frontend / "react" / "index.js")
+
+        other = make_worktree(project, temp_dir / "wt2")
+        DependencyCache(project).materialize(other)
+
+        for tree in (project / "node_modules", other / "node_modules"):
+            assert (tree / "left-pad" / "index.js").read_text() == "module.exports = 1"
+            assert not (tree / "new-pkg").exists()
+        react = project / "apps/frontend/node_modules/react/index.js"
+        assert react.read_text() == "react"
+
+    def test_snapshot_reused_until_lockfile_changes(
+        self, project: Path, temp_dir: Path
+    ):
+        cache = DependencyCache(project)
+        cache.materialize(make_worktree(project, temp_dir / "wt1"))
+        first = snapshots(project)
+
+        # Package managers replace files rather than writing them in place
+        write(project / "node_modules" / "left-pad" / "index.tmp", "changed")
+        os.replace(
+            project / "node_modules" / "left-pad" / "index.tmp",
+            project / "node_modules" / "left-pad" / "index.js",
+        )
+        cache.materialize(make_worktree(project, temp_dir / "wt2"))
+
+        assert snapshots(project) == first
+        assert (temp_dir / "wt2/node_modules/left-pad/index.js").read_text() == (
+            "module.exports = 1"
+        )
+
+        lockfiles = {**LOCKFILES, "package-lock.json": '{"lockfileVersion": 4}'}
+        write(project / "package-lock.json", lockfiles["package-lock.json"])
+        cache.materialize(make_worktree(project, temp_dir / "wt3", lockfiles))
+
+        assert len(snapshots(project)) == len(first) + 3  # Three node trees
+        assert (temp_dir / "wt3/node_modules/left-pad/index.js").read_text() == (
+            "changed"
+        )
+
+    def test_changed_lockfile_in_worktree_is_left_to_install(
+        self, project: Path, temp_dir: Path
+    ):
+        lockfiles = {**LOCKFILES, "package-lock.json": '{"changed": true}'}
+        worktree = make_worktree(project, temp_dir / "wt1", lockfiles)
+
+        placed = DependencyCache(project).materialize(worktree)
+
+        assert [p.path for p in placed] == ["services/api/.venv"]
+        assert not (worktree / "node_modules").exists()
+
+    def test_capture_shares_trees_installed_in_a_worktree(
+        self, project: Path, temp_dir: Path
+    ):
+        lockfiles = {**LOCKFILES, "package-lock.json": '{"changed": true}'}
+        installed = make_worktree(project, temp_dir / "wt1", lockfiles)
+        write(installed / "node_modules" / "left-pad" / "index.js", "v2")
+        cache = DependencyCache(project)
+
+        assert len(cache.capture(installed)) == 1  # Only node_modules installed
+
+        worktree = make_worktree(project, temp_dir / "wt2", lockfiles)
+        cache.materialize(worktree)
+        assert (worktree / "node_modules/left-pad/index.js").read_text() == "v2"
+
+    def test_existing_and_tracked_targets_are_skipped(
+        self, project: Path, temp_dir: Path
+    ):
+        worktree = make_worktree(project, temp_dir / "wt1")
+        write(worktree / "node_modules" / "mine.js", "keep")
+        write(worktree / ".gitignore", "node_modules/\n")  # .venv not ignored
+
+        placed = DependencyCache(project).materialize(worktree)
+
+        assert "node_modules" not in {p.path for p in placed}
+        assert "services/api/.venv" not in {p.path for p in placed}
+        assert list((worktree / "node_modules").iterdir()) == [
+            worktree / "node_modules" / "mine.js"
+        ]
+
+    def test_editable_installs_are_not_shared(self, project: Path, temp_dir: Path):
+        site = project / "services/api/.venv/lib/python3.12/site-packages"
+        write(site / "__editable__.api.pth", str(project / "services" / "api"))
+        worktree = make_worktree(project, temp_dir / "wt1")
+
+        placed = DependencyCache(project).materialize(worktree)
+
+        assert "services/api/.venv" not in {p.path for p in placed}
+        assert not (worktree / "services/api/.venv").exists()
+
+    def test_falls_back_to_symlink(self, project: Path, temp_dir: Path, monkeypatch):
+        def unsupported(*args, **kwargs):
+            raise OSError("cross-device link")
+
+        monkeypatch.setattr(dependency_cache, "_reflink", unsupported)
+        monkeypatch.setattr(dependency_cache.os, "link", unsupported)
+        monkeypatch.setattr(dependency_cache.shutil, "copy2", unsupported)
+        worktree = make_worktree(project, temp_dir / "wt1")
+
+        placed = DependencyCache(project).materialize(worktree)
+
+        assert {p.method for p in placed} == {"symlink"}
+        assert (worktree / "node_modules").resolve() == (
+            project / "node_modules"
+        ).resolve()
+        assert snapshots(project) == []
+        # A shared venv would install into the project's: the worktree
+        # installs its own instead
+        assert "services/api/.venv" not in {p.path for p in placed}
+        assert not (worktree / "services/api/.venv").exists()
+
+    def test_snapshot_is_a_copy_without_reflinks(
+        self, project: Path, temp_dir: Path, monkeypatch
+    ):
+        def unsupported(*args, **kwargs):
+            raise OSError("not supported")
+
+        monkeypatch.setattr(dependency_cache, "_reflink", unsupported)
+        worktree = make_worktree(project, temp_dir / "wt1")
+
+        placed = DependencyCache(project).materialize(worktree)
+
+        assert {p.method for p in placed} == {"hardlink"}
+        live = project / "node_modules/left-pad/index.js"
+        cloned = worktree / "node_modules/left-pad/index.js"
+        # The worktree shares the snapshot's files, never the live tree's
+        assert cloned.stat().st_ino != live.stat().st_ino
+        assert live.stat().st_nlink == 1
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX venv layout")
+    def test_cloned_venv_runs_from_the_worktree(self, project: Path, temp_dir: Path):
+        venv = project / "services/api/.venv"
+        dependency_cache._remove(venv)
+        subprocess.run(
+            [sys.executable, "-m", "venv", "--without-pip", str(venv)], check=True
+        )
+        # A console script as pip writes it: absolute shebang into the venv
+        script = venv / "bin" / "where"
+        script.write_text(
+            f"#!{venv}/bin/python\nimport sys\nprint(sys.prefix)\n",
+            encoding="utf-8",
+        )
+        script.chmod(0o755)
+        activate = (venv / "bin" / "activate").read_text(encoding="utf-8")
+        worktree = make_worktree(project, temp_dir / "wt1")
+
+        placed = DependencyCache(project).materialize(worktree)
+
+        assert "services/api/.venv" in {p.path for p in placed}
+        cloned = worktree / "services/api/.venv"
+        for command in (
+            [str(cloned / "bin" / "where")],
+            [str(cloned / "bin" / "python"), "-c", "import sys; print(sys.prefix)"],
+        ):
+            output = subprocess.run(
+                command, capture_output=True, text=True, check=True
+            ).stdout
+            assert Path(output.strip()).resolve() == cloned.resolve()
+        assert str(cloned) in (cloned / "bin" / "activate").read_text(encoding="utf-8")
+        # The project's venv is untouched
+        assert (venv / "bin" / "activate").read_text(encoding="utf-8") == activate
+        assert str(venv) in script.read_text(encoding="utf-8")
+
+
+class TestPruning:
+    def test_keeps_recent_snapshots(self, project: Path, temp_dir: Path):
+        cache = DependencyCache(project)
+        for version in range(SNAPSHOTS_PER_TREE + 2):
+            write(project / "services/api/requirements.txt", f"fastapi=={version}\n")
+            cache.capture(project)
+
+        venv_snapshots = [s for s in snapshots(project) if "python" in str(s)]
+        assert len(venv_snapshots) == SNAPSHOTS_PER_TREE
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Tests for the Discovery Cache
+=============================
+
+Covers analysis/discovery_cache.py and its use by TestDiscovery and
+CIDiscovery: results are reused across instances (processes) until a file
+discovery reads changes, and the cache can be bypassed.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from analysis import discovery_cache
+from analysis.ci_discovery import CIDiscovery
+from analysis.discovery_cache import (
+    NO_CACHE_ENV_VAR,
+    DiscoveryCache,
+    fingerprint,
+)
+from analysis.test_discovery import TestDiscovery
+
+WORKFLOW = """name: CI
+on: push
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    steps:
+      - run: pytest --cov
+"""
+
+
+@pytest.fixture
+def project(temp_dir: Path, monkeypatch) -> Path:
+    """A Python + JS project with tests and a GitHub Actions workflow."""
+    monkeypatch.delenv(NO_CACHE_ENV_VAR, raising=False)
+    (temp_dir / "package.json").write_text(
+        json.dumps({"devDependencies": {"vitest": "^1.0.0"}})
+    )
+    (temp_dir / "vitest.config.ts").write_text("export default {}")
+    (temp_dir / "pytest.ini").write_text("[pytest]\n")
+    (temp_dir / "tests").mkdir()
+    (temp_dir / "tests" / "test_app.py").write_text("def test_ok(): pass\n")
+    (temp_dir / "src").mkdir()
+    (temp_dir / "src" / "app.py").write_text("print('hi')\n")
+    workflows = temp_dir / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    (workflows / "ci.yml").write_text(WORKFLOW)
+    return temp_dir
+
+
+def touch(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def count_scans(monkeypatch, cls, method: str) -> list[int]:
+    """Count calls of a (fresh) discovery's expensive method."""
+    calls = []
+    original = getattr(cls, method)
+
+    def counting(self, *args, **kwargs):
+        calls.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(cls, method, counting)
+    return calls
+
+
+class TestTestDiscoveryCache:
+    def test_reused_across_instances(self, project: Path, monkeypatch):
+        first = TestDiscovery().discover(project)
+        scans = count_scans(monkeypatch, TestDiscovery, "_has_test_files")
+
+        second = TestDiscovery().discover(project)
+
+        assert scans == []
+        assert TestDiscovery().to_dict(second) == TestDiscovery().to_dict(first)
+        assert (project / ".auto-claude" / "cache" / "test_discovery.json").exists()
+
+    def test_unrelated_file_does_not_invalidate(self, project: Path, monkeypatch):
+        TestDiscovery().discover(project)
+        scans = count_scans(monkeypatch, TestDiscovery, "_has_test_files")
+
+        (project / "src" / "app.py").write_text("print('changed')\n")
+        touch(project / "src" / "app.py")
+        touch(project / "package.json")
+        (project / "tests" / "__pycache__").mkdir()
+
+        TestDiscovery().discover(project)
+        assert scans == []
+
+    def test_editing_config_invalidates(self, project: Path):
+        assert TestDiscovery().discover(project).frameworks[0].name == "vitest"
+
+        (project / "package.json").write_text(
+            json.dumps({"devDependencies": {"jest": "^29.0.0"}})
+        )
+
+        result = TestDiscovery().discover(project)
+        assert [f.name for f in result.frameworks] == ["jest", "pytest"]
+
+    def test_test_directory_listing_invalidates(self, project: Path):
+        TestDiscovery().discover(project)
+
+        (project / "__tests__").mkdir()
+        (project / "__tests__" / "app.test.ts").write_text("")
+
+        result = TestDiscovery().discover(project)
+        assert "__tests__" in result.test_directories
+
+    def test_lockfile_existence_invalidates(self, project: Path):
+        assert TestDiscovery().discover(project).package_manager == ""
+
+        (project / "pnpm-lock.yaml").write_text("")
+
+        assert TestDiscovery().discover(project).package_manager == "pnpm"
+
+    def test_no_tests_is_not_persisted(self, temp_dir: Path, monkeypatch):
+        monkeypatch.delenv(NO_CACHE_ENV_VAR, raising=False)
+        (temp_dir / "pytest.ini").write_text("[pytest]\n")
+        assert not TestDiscovery().discover(temp_dir).has_tests
+
+        (temp_dir / "src").mkdir()
+        (temp_dir / "src" / "test_colocated.py").write_text("")
+
+        assert TestDiscovery().discover(temp_dir).has_tests
+
+    def test_no_cache(self, project: Path, monkeypatch):
+        TestDiscovery().discover(project)
+        scans = count_scans(monkeypatch, TestDiscovery, "_has_test_files")
+
+        TestDiscovery(use_cache=False).discover(project)
+        monkeypatch.setenv(NO_CACHE_ENV_VAR, "true")
+        TestDiscovery().discover(project)
+
+        assert len(scans) == 2
+
+
+class TestCIDiscoveryCache:
+    def test_reused_until_workflow_changes(self, project: Path, monkeypatch):
+        first = CIDiscovery().discover(project)
+        assert first.coverage_command == "pytest --cov"
+        scans = count_scans(monkeypatch, CIDiscovery, "_parse_github_actions")
+
+        touch(project / ".github" / "workflows" / "ci.yml")
+        touch(project / "package.json")
+        cached = CIDiscovery().discover(project)
+        assert scans == []
+        assert CIDiscovery().to_dict(cached) == CIDiscovery().to_dict(first)
+
+        (project / ".github" / "workflows" / "e2e.yaml").write_text(
+            WORKFLOW.replace("pytest --cov", "npx playwright test")
+        )
+        result = CIDiscovery().discover(project)
+        assert scans == [1]
+        assert result.test_commands["e2e"] == "npx playwright test"
+
+    def test_no_ci_is_cached(self, temp_dir: Path, monkeypatch):
+        monkeypatch.delenv(NO_CACHE_ENV_VAR, raising=False)
+        assert CIDiscovery().discover(temp_dir) is None
+
+        (temp_dir / "Jenkinsfile").write_text("stage('Test') { sh 'make test' }")
+
+        assert CIDiscovery().discover(temp_dir).ci_system == "jenkins"
+
+
+class TestDiscoveryCacheFile:
+    def test_schema_bump_invalidates(self, temp_dir: Path, monkeypatch):
+        fp = fingerprint(temp_dir, manifests=["package.json"])
+        DiscoveryCache(temp_dir, "demo", 1).store(fp, {"value": 1})
+
+        assert DiscoveryCache(temp_dir, "demo", 1).load(fp) == {"value": 1}
+        assert DiscoveryCache(temp_dir, "demo", 2).load(fp) is None
+        monkeypatch.setattr(discovery_cache, "CACHE_FORMAT", 99)
+        assert DiscoveryCache(temp_dir, "demo", 1).load(fp) is None
+
+    def test_corrupt_file_is_a_miss(self, temp_dir: Path):
+        cache = DiscoveryCache(temp_dir, "demo", 1)
+        cache.path.parent.mkdir(parents=True)
+        cache.path.write_text("{not json")
+
+        assert cache.load("anything") is None
+
+    def test_fingerprint_inputs(self, temp_dir: Path):
+        (temp_dir / "a.json").write_text("1")
+
+        base = fingerprint(temp_dir, manifests=["a.json"], markers=["b.lock"])
+        (temp_dir / "b.lock").write_text("")
+        with_marker = fingerprint(temp_dir, manifests=["a.json"], markers=["b.lock"])
+        (temp_dir / "b.lock").write_text("marker content is ignored")
+        same = fingerprint(temp_dir, manifests=["a.json"], markers=["b.lock"])
+        (temp_dir / "a.json").write_text("2")
+        edited = fingerprint(temp_dir, manifests=["a.json"], markers=["b.lock"])
+
+        assert base != with_marker
+        assert same == with_marker
+        assert edited != with_marker
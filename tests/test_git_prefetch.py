@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Tests for the Git Prefetch Service
+==================================
+
+Covers core/git_prefetch.py against a local bare repository acting as the
+remote: prefetching branches and PR refs into refs/prefetch/*, fetching
+only truly missing commits, maintenance and the background schedule.
+"""
+
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+from core import git_prefetch
+from core.git_prefetch import (
+    PREFETCH_ENV_VAR,
+    GitPrefetcher,
+    branch_prefetch_ref,
+    pr_prefetch_ref,
+)
+
+
+def git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+
+def commit(repo: Path, name: str, content: str) -> str:
+    (repo / name).write_text(content)
+    git(repo, "add", name)
+    git(repo, "commit", "-q", "-m", f"Update {name}")
+    return git(repo, "rev-parse", "HEAD")
+
+
+def ref(repo: Path, name: str) -> str | None:
+    result = subprocess.run(
+        ["git", "rev-parse", "--verify", "-q", name],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip() or None
+
+
+@pytest.fixture
+def remote(temp_dir: Path, monkeypatch):
+    """A bare remote, a contributor clone pushing to it and a local clone."""
+    for key, value in {
+        "GIT_AUTHOR_NAME": "Test User",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test User",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+    }.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.delenv(PREFETCH_ENV_VAR, raising=False)
+
+    origin = temp_dir / "origin.git"
+    git(temp_dir, "init", "-q", "--bare", "-b", "main", str(origin))
+    upstream = temp_dir / "upstream"
+    git(temp_dir, "clone", "-q", str(origin), str(upstream))
+    git(upstream, "checkout", "-q", "-b", "main")
+    commit(upstream, "README.md", "v1")
+    git(upstream, "push", "-q", "origin", "main")
+
+    local = temp_dir / "local"
+    git(temp_dir, "clone", "-q", str(origin), str(local))
+    yield origin, upstream, local
+    GitPrefetcher.reset()
+
+
+def push_pr(upstream: Path, pr_number: int, content: str) -> str:
+    """Push a commit only reachable from refs/pull/<n>/head, like a fork PR."""
+    git(upstream, "checkout", "-q", "--detach", "main")
+    sha = commit(upstream, "feature.txt", content)
+    git(upstream, "push", "-q", "origin", f"HEAD:refs/pull/{pr_number}/head")
+    git(upstream, "checkout", "-q", "main")
+    return sha
+
+
+def count_fetches(monkeypatch) -> list[list[str]]:
+    fetches = []
+    run_git = git_prefetch.run_git
+
+    def counting(args, *rest, **kwargs):
+        if args[0] == "fetch":
+            fetches.append(args)
+        return run_git(args, *rest, **kwargs)
+
+    monkeypatch.setattr(git_prefetch, "run_git", counting)
+    return fetches
+
+
+class TestPrefetch:
+    def test_prefetches_branches_and_prs(self, remote):
+        _, upstream, local = remote
+        main = commit(upstream, "README.md", "v2")
+        git(upstream, "push", "-q", "origin", "main")
+        pr = push_pr(upstream, 7, "feature")
+        prefetcher = GitPrefetcher(local)
+        prefetcher.watch_prs([7])
+
+        assert prefetcher.prefetch() == {"origin": True, "origin#7": True}
+
+        assert ref(local, branch_prefetch_ref("origin", "main")) == main
+        assert ref(local, pr_prefetch_ref("origin", 7)) == pr
+        # Remote-tracking refs and FETCH_HEAD are left alone
+        assert ref(local, "refs/remotes/origin/main") != main
+        assert not (local / ".git" / "FETCH_HEAD").exists()
+
+    def test_missing_pr_ref_does_not_block_the_rest(self, remote):
+        _, upstream, local = remote
+        pr = push_pr(upstream, 7, "feature")
+        prefetcher = GitPrefetcher(local)
+        prefetcher.watch_prs([7, 8])
+
+        results = prefetcher.prefetch()
+
+        assert results == {"origin": True, "origin#7": True, "origin#8": False}
+        assert ref(local, pr_prefetch_ref("origin", 7)) == pr
+
+    def test_deleted_branches_are_pruned(self, remote):
+        _, upstream, local = remote
+        git(upstream, "push", "-q", "origin", "main:topic")
+        prefetcher = GitPrefetcher(local)
+        prefetcher.prefetch()
+        assert ref(local, branch_prefetch_ref("origin", "topic"))
+
+        git(upstream, "push", "-q", "origin", ":topic")
+        prefetcher.prefetch()
+
+        assert ref(local, branch_prefetch_ref("origin", "topic")) is None
+
+    def test_unwatch_pr_drops_its_ref(self, remote):
+        _, upstream, local = remote
+        push_pr(upstream, 7, "feature")
+        prefetcher = GitPrefetcher(local)
+        prefetcher.watch_prs([7])
+        prefetcher.prefetch()
+
+        prefetcher.unwatch_pr(7)
+
+        assert prefetcher.watched_prs() == {}
+        assert ref(local, pr_prefetch_ref("origin", 7)) is None
+
+
+class TestEnsureCommits:
+    def test_present_commits_do_not_fetch(self, remote, monkeypatch):
+        _, upstream, local = remote
+        pr = push_pr(upstream, 7, "feature")
+        prefetcher = GitPrefetcher(local)
+        prefetcher.watch_prs([7])
+        prefetcher.prefetch()
+        fetches = count_fetches(monkeypatch)
+
+        head = git(local, "rev-parse", "HEAD")
+        assert prefetcher.ensure_commits([pr, head])
+        assert fetches == []
+
+    def test_missing_commit_is_fetched(self, remote, monkeypatch):
+        _, upstream, local = remote
+        pr = push_pr(upstream, 7, "feature")
+        prefetcher = GitPrefetcher(local)
+        fetches = count_fetches(monkeypatch)
+
+        assert not prefetcher.has_commit(pr)
+        assert prefetcher.ensure_commits([pr])
+        assert prefetcher.ensure_commits([pr])
+
+        assert len(fetches) == 1
+        assert prefetcher.has_commit(pr)
+
+    def test_falls_back_to_refspecs(self, remote, monkeypatch):
+        _, upstream, local = remote
+        pr = push_pr(upstream, 7, "feature")
+        prefetcher = GitPrefetcher(local)
+        run_git = git_prefetch.run_git
+
+        def refuse_sha_wants(args, *rest, **kwargs):
+            if args[0] == "fetch" and pr in args:
+                return subprocess.CompletedProcess(args, 128, "", "not our ref")
+            return run_git(args, *rest, **kwargs)
+
+        monkeypatch.setattr(git_prefetch, "run_git", refuse_sha_wants)
+
+        assert prefetcher.ensure_commits([pr], refspecs=["refs/pull/7/head:refs/pr/7"])
+        assert ref(local, "refs/pr/7") == pr
+
+    def test_unavailable_commit(self, remote):
+        _, _, local = remote
+
+        assert not GitPrefetcher(local).ensure_commits(["0" * 40])
+
+
+class TestMaintenance:
+    def test_packs_objects_and_writes_indexes(self, remote):
+        _, upstream, local = remote
+        pr = push_pr(upstream, 7, "feature")
+        prefetcher = GitPrefetcher(local)
+        prefetcher.watch_prs([7])
+        prefetcher.prefetch()
+        assert prefetcher.maintenance_due()
+
+        assert prefetcher.maintain()
+
+        objects = local / ".git" / "objects"
+        assert "count: 0" in git(local, "count-objects", "-v")  # All packed
+        assert prefetcher.has_commit(pr)
+        assert git(local, "fsck", "--connectivity-only") == ""
+        assert list((objects / "info" / "commit-graphs").glob("*.graph"))
+        assert (objects / "pack" / "multi-pack-index").exists()
+        assert not prefetcher.maintenance_due()
+        # Other processes see the stamp too
+        assert not GitPrefetcher(local).maintenance_due()
+        assert GitPrefetcher(local).maintenance_due(interval=0)
+
+
+class TestSchedule:
+    def test_background_rounds(self, remote):
+        _, upstream, local = remote
+        pr = push_pr(upstream, 7, "feature")
+        prefetcher = GitPrefetcher.for_repo(local)
+        assert GitPrefetcher.for_repo(local / ".") is prefetcher
+        prefetcher.watch_prs([7])
+
+        assert prefetcher.start(interval=0.05)
+        deadline = time.monotonic() + 30
+        while ref(local, pr_prefetch_ref("origin", 7)) is None:
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+        prefetcher.stop()
+
+        assert not prefetcher.running
+        assert prefetcher.has_commit(pr)
+
+    def test_disabled(self, remote, monkeypatch):
+        _, _, local = remote
+        monkeypatch.setenv(PREFETCH_ENV_VAR, "off")
+
+        prefetcher = GitPrefetcher(local)
+
+        assert not prefetcher.start()
+        assert not prefetcher.running
@@ -199,6 +199,13 @@ class TestReviewedCommits:
         assert mock_bot_detector.has_reviewed_commit(123, "xyz789") is False
         assert mock_bot_detector.has_reviewed_commit(999, "abc123") is False
 
+    def test_has_reviewed_pr(self, mock_bot_detector):
+        """Test checking if any commit of a PR was reviewed."""
+        mock_bot_detector.state.reviewed_commits["123"] = ["abc123"]
+
+        assert mock_bot_detector.has_reviewed_pr(123) is True
+        assert mock_bot_detector.has_reviewed_pr(999) is False
+
     def test_mark_reviewed(self, mock_bot_detector, temp_state_dir):
         """Test marking PR as reviewed."""
         mock_bot_detector.mark_reviewed(123, "abc123")
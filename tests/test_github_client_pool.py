@@ -0,0 +1,237 @@
+"""
+Tests for the SDK Client Pool
+=============================
+
+Tests checkout/reuse, session ids, eviction and bounded size using fake
+SDK clients (no CLI subprocess).
+"""
+
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_path = Path(__file__).parent.parent / "apps" / "backend"
+module_path = backend_path / "runners" / "github" / "services" / "client_pool.py"
+
+# Load module directly without importing parent packages
+spec = importlib.util.spec_from_file_location("client_pool", module_path)
+client_pool = importlib.util.module_from_spec(spec)
+sys.modules["client_pool"] = client_pool
+spec.loader.exec_module(client_pool)
+
+SDKClientPool = client_pool.SDKClientPool
+client_key = client_pool.client_key
+
+
+class FakeClient:
+    """Minimal stand-in for ClaudeSDKClient."""
+
+    instances: list["FakeClient"] = []
+
+    def __init__(self):
+        self.connected = False
+        self.closed = False
+        self.session_ids: list[str] = []
+        # Like the CLI, the transcript survives new session ids
+        self.transcript: list[str] = []
+        self.seen: list[list[str]] = []  # Transcript visible to each query
+        self.fail_clear = False
+        FakeClient.instances.append(self)
+
+    async def __aenter__(self):
+        self.connected = True
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+        return False
+
+    async def query(self, prompt, session_id="default"):
+        if prompt == client_pool.CLEAR_COMMAND:
+            if self.fail_clear:
+                raise RuntimeError("clear failed")
+            self.transcript = []
+            return
+        self.session_ids.append(session_id)
+        self.seen.append(list(self.transcript))
+        self.transcript.append(prompt)
+
+    async def receive_response(self):
+        for message in ("assistant", "result"):
+            await asyncio.sleep(0)
+            yield message
+
+
+@pytest.fixture(autouse=True)
+def reset_instances():
+    FakeClient.instances = []
+
+
+async def _review(pool, key, drain=True):
+    async with pool.session(key, FakeClient) as client:
+        async with client:  # existing call sites keep their async with
+            await client.query("review")
+            if drain:
+                return [m async for m in client.receive_response()]
+            return None
+
+
+class TestClientKey:
+    def test_same_options_same_key(self, tmp_path):
+        a = client_key("sonnet", "pr_reviewer", tmp_path, thinking_budget=5000)
+        b = client_key("sonnet", "pr_reviewer", tmp_path, thinking_budget=5000)
+        assert a == b
+
+    def test_options_change_key(self, tmp_path):
+        a = client_key("sonnet", "pr_reviewer", tmp_path, thinking_budget=5000)
+        b = client_key("sonnet", "pr_reviewer", tmp_path, thinking_budget=10000)
+        c = client_key("opus", "pr_reviewer", tmp_path, thinking_budget=5000)
+        assert len({a, b, c}) == 3
+
+    def test_toolless_client_has_no_working_dir(self):
+        assert client_key("sonnet", "followup", None)[2] == ""
+
+
+class TestSDKClientPool:
+    async def test_reuses_warm_client(self, tmp_path):
+        pool = SDKClientPool(max_size=2)
+        key = client_key("sonnet", "pr_reviewer", tmp_path)
+
+        for _ in range(3):
+            assert await _review(pool, key) == ["assistant", "result"]
+
+        assert len(FakeClient.instances) == 1
+        assert pool.metrics.created == 1
+        assert pool.metrics.reused == 2
+        assert pool.metrics.idle == 1
+        await pool.close()
+        assert FakeClient.instances[0].closed
+
+    async def test_each_checkout_passes_a_new_session_id(self, tmp_path):
+        pool = SDKClientPool(max_size=1)
+        key = client_key("sonnet", "pr_reviewer", tmp_path)
+
+        await _review(pool, key)
+        await _review(pool, key)
+
+        session_ids = FakeClient.instances[0].session_ids
+        assert len(session_ids) == 2
+        assert session_ids[0] != session_ids[1]
+        await pool.close()
+
+    async def test_second_checkout_does_not_see_first_conversation(self, tmp_path):
+        pool = SDKClientPool(max_size=1)
+        key = client_key("sonnet", "pr_reviewer", tmp_path)
+
+        async with pool.session(key, FakeClient) as client:
+            await client.query("review PR 1")
+            [m async for m in client.receive_response()]
+        async with pool.session(key, FakeClient) as client:
+            await client.query("review PR 2")
+            [m async for m in client.receive_response()]
+
+        (fake,) = FakeClient.instances
+        assert fake.seen == [[], []]
+        assert fake.transcript == ["review PR 2"]
+        await pool.close()
+
+    async def test_client_that_cannot_be_cleared_is_replaced(self, tmp_path):
+        pool = SDKClientPool(max_size=1)
+        key = client_key("sonnet", "pr_reviewer", tmp_path)
+
+        await _review(pool, key)
+        FakeClient.instances[0].fail_clear = True
+        await _review(pool, key)
+
+        assert len(FakeClient.instances) == 2
+        assert FakeClient.instances[0].closed
+        assert FakeClient.instances[1].seen == [[]]
+        assert pool.metrics.clear_failures == 1
+        assert pool._live == 1
+        await pool.close()
+
+    async def test_undrained_client_is_discarded(self, tmp_path):
+        pool = SDKClientPool(max_size=2)
+        key = client_key("sonnet", "pr_reviewer", tmp_path)
+
+        await _review(pool, key, drain=False)
+        assert FakeClient.instances[0].closed
+        assert pool.metrics.discarded == 1
+
+        await _review(pool, key)
+        assert len(FakeClient.instances) == 2
+        await pool.close()
+
+    async def test_failed_checkout_is_discarded(self, tmp_path):
+        pool = SDKClientPool(max_size=2)
+        key = client_key("sonnet", "pr_reviewer", tmp_path)
+
+        with pytest.raises(RuntimeError):
+            async with pool.session(key, FakeClient):
+                raise RuntimeError("stream failed")
+
+        assert FakeClient.instances[0].closed
+        assert pool.metrics.in_use == 0
+        assert pool.metrics.idle == 0
+
+    async def test_max_uses_recycles_client(self, tmp_path):
+        pool = SDKClientPool(max_size=1, max_uses=2)
+        key = client_key("sonnet", "pr_reviewer", tmp_path)
+
+        for _ in range(3):
+            await _review(pool, key)
+
+        assert len(FakeClient.instances) == 2
+        await pool.close()
+
+    async def test_full_pool_evicts_idle_client_of_other_key(self, tmp_path):
+        pool = SDKClientPool(max_size=1)
+
+        await _review(pool, client_key("sonnet", "pr_reviewer", tmp_path))
+        await _review(pool, client_key("opus", "pr_reviewer", tmp_path))
+
+        assert FakeClient.instances[0].closed
+        assert pool.metrics.evicted == 1
+        await pool.close()
+
+    async def test_concurrent_checkouts_are_bounded(self, tmp_path):
+        pool = SDKClientPool(max_size=2)
+        key = client_key("sonnet", "pr_reviewer", tmp_path)
+        peak = 0
+
+        async def review():
+            nonlocal peak
+            async with pool.session(key, FakeClient) as client:
+                peak = max(peak, pool.metrics.in_use)
+                await client.query("review")
+                await asyncio.sleep(0.01)
+                [m async for m in client.receive_response()]
+
+        await asyncio.gather(*(review() for _ in range(6)))
+
+        assert peak == 2
+        assert len(FakeClient.instances) == 2
+        assert pool.metrics.waits > 0
+        await pool.close()
+
+    async def test_disabled_pool_creates_fresh_clients(self, tmp_path):
+        pool = SDKClientPool(max_size=0)
+        key = client_key("sonnet", "pr_reviewer", tmp_path)
+
+        await _review(pool, key)
+        await _review(pool, key)
+
+        assert len(FakeClient.instances) == 2
+        assert all(c.closed for c in FakeClient.instances)
+
+    async def test_pool_size_from_env(self, monkeypatch):
+        monkeypatch.delenv("GITHUB_SDK_CLIENT_POOL_SIZE", raising=False)
+        assert client_pool.get_client_pool().max_size == client_pool.DEFAULT_POOL_SIZE
+        await client_pool.close_client_pool()
+
+        monkeypatch.setenv("GITHUB_SDK_CLIENT_POOL_SIZE", "0")
+        assert not client_pool.get_client_pool().enabled
+        await client_pool.close_client_pool()
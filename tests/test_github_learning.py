@@ -0,0 +1,231 @@
+"""
+Tests for Learning Loop & Outcome Tracking
+==========================================
+
+Tests that LearningTracker's incrementally maintained aggregates match a
+full scan over the stored outcomes, and that storage is append-only.
+"""
+
+import json
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from learning import (
+    AuthorResponse,
+    LearningTracker,
+    OutcomeType,
+    PredictionType,
+    ReviewOutcome,
+)
+
+
+def _brute_force_accuracy(outcomes, repo=None, since=None, prediction_type=None):
+    """Reference implementation: scan every outcome."""
+    result = {"total": 0, "correct": 0, "incorrect": 0, "pending": 0}
+    for outcome in outcomes:
+        if repo and outcome.repo != repo:
+            continue
+        if since and outcome.created_at < since:
+            continue
+        if prediction_type and outcome.prediction != prediction_type:
+            continue
+        result["total"] += 1
+        if not outcome.is_complete:
+            result["pending"] += 1
+        elif outcome.was_correct is True:
+            result["correct"] += 1
+        elif outcome.was_correct is False:
+            result["incorrect"] += 1
+    return result
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return LearningTracker(state_dir=tmp_path / "github")
+
+
+def _populate(tracker, count=200, seed=7):
+    """Record a deterministic mix of predictions spread over 60 days."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    repos = ["owner/a", "owner/b"]
+    predictions = list(PredictionType)
+    outcomes = list(OutcomeType)
+
+    for i in range(count):
+        repo = rng.choice(repos)
+        review_id = f"review-{i}"
+        recorded = tracker.record_prediction(
+            repo=repo,
+            review_id=review_id,
+            prediction=rng.choice(predictions),
+            file_types=rng.sample(["py", "ts", "md"], k=2),
+            categories=[rng.choice(["security", "bug", "style"])],
+            change_size=rng.choice(["small", "medium", "large"]),
+        )
+        # Backdate while keeping the aggregates consistent
+        tracker._apply_to_aggregates(recorded, -1)
+        recorded.created_at = now - timedelta(hours=rng.randint(0, 24 * 60))
+        tracker._apply_to_aggregates(recorded, 1)
+
+        if rng.random() < 0.7:
+            tracker.record_outcome(
+                repo=repo,
+                review_id=review_id,
+                outcome=rng.choice(outcomes),
+                time_to_outcome=timedelta(hours=rng.randint(1, 48)),
+            )
+
+
+class TestIncrementalAggregates:
+    """Aggregates must match a full scan."""
+
+    @pytest.mark.parametrize("repo", [None, "owner/a"])
+    @pytest.mark.parametrize("days", [None, 7, 30])
+    def test_accuracy_matches_full_scan(self, tracker, repo, days):
+        _populate(tracker)
+        since = datetime.now(timezone.utc) - timedelta(days=days) if days else None
+
+        stats = tracker.get_accuracy(repo, since=since)
+        expected = _brute_force_accuracy(
+            tracker._outcomes.values(), repo=repo, since=since
+        )
+
+        assert stats.total_predictions == expected["total"]
+        assert stats.correct_predictions == expected["correct"]
+        assert stats.incorrect_predictions == expected["incorrect"]
+        assert stats.pending_outcomes == expected["pending"]
+
+    def test_accuracy_by_prediction_type(self, tracker):
+        _populate(tracker)
+        stats = tracker.get_accuracy(prediction_type=PredictionType.REVIEW_APPROVE)
+        expected = _brute_force_accuracy(
+            tracker._outcomes.values(), prediction_type=PredictionType.REVIEW_APPROVE
+        )
+        assert stats.total_predictions == expected["total"]
+        assert set(stats.by_type) <= {PredictionType.REVIEW_APPROVE.value}
+
+    def test_rerecording_outcome_does_not_double_count(self, tracker):
+        tracker.record_prediction("owner/a", "r1", PredictionType.REVIEW_APPROVE)
+        tracker.record_outcome("owner/a", "r1", OutcomeType.CLOSED)
+        tracker.record_outcome(
+            "owner/a", "r1", OutcomeType.MERGED, time_to_outcome=timedelta(hours=4)
+        )
+
+        stats = tracker.get_accuracy("owner/a")
+        assert stats.total_predictions == 1
+        assert stats.correct_predictions == 1
+        assert stats.incorrect_predictions == 0
+        assert stats.pending_outcomes == 0
+        assert stats.avg_time_to_merge == timedelta(hours=4)
+
+    def test_pending_outcomes_tracked(self, tracker):
+        tracker.record_prediction("owner/a", "r1", PredictionType.TRIAGE_BUG)
+        tracker.record_prediction("owner/b", "r2", PredictionType.TRIAGE_BUG)
+        assert [o.review_id for o in tracker.get_pending_outcomes()] == ["r1", "r2"]
+
+        tracker.record_outcome("owner/a", "r1", OutcomeType.CONFIRMED)
+        assert [o.review_id for o in tracker.get_pending_outcomes()] == ["r2"]
+        assert tracker.get_pending_outcomes("owner/a") == []
+
+    def test_detect_patterns_matches_full_scan(self, tracker):
+        _populate(tracker, count=300)
+        patterns = {p.pattern_id: p for p in tracker.detect_patterns(min_sample_size=5)}
+
+        counts = {}
+        for outcome in tracker._outcomes.values():
+            if not outcome.is_complete or outcome.was_correct is None:
+                continue
+            for file_type in outcome.file_types:
+                counts.setdefault(f"file_type_{file_type}", []).append(
+                    outcome.was_correct
+                )
+
+        for pattern_id, results in counts.items():
+            if len(results) < 5:
+                continue
+            assert patterns[pattern_id].sample_size == len(results)
+            assert patterns[pattern_id].accuracy == pytest.approx(
+                sum(results) / len(results)
+            )
+
+    def test_dashboard_data(self, tracker):
+        _populate(tracker, count=50)
+        data = tracker.get_dashboard_data("owner/a")
+        assert data["all_time"]["total_predictions"] == sum(
+            1 for o in tracker._outcomes.values() if o.repo == "owner/a"
+        )
+        assert len(data["recent_outcomes"]) <= 10
+
+
+class TestAppendOnlyStorage:
+    """Outcomes are persisted as an append-only log."""
+
+    def test_each_event_appends_one_line(self, tracker):
+        tracker.record_prediction("owner/a", "r1", PredictionType.REVIEW_APPROVE)
+        log = tracker._get_outcomes_file("owner/a")
+        assert len(log.read_text().splitlines()) == 1
+
+        tracker.record_outcome(
+            "owner/a", "r1", OutcomeType.MERGED, author_response=AuthorResponse.THANKED
+        )
+        lines = log.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["actual_outcome"] is None
+        assert json.loads(lines[1])["actual_outcome"] == "merged"
+
+    def test_reload_rebuilds_aggregates(self, tmp_path):
+        state_dir = tmp_path / "github"
+        tracker = LearningTracker(state_dir=state_dir)
+        _populate(tracker, count=40)
+        # Backdated created_at values are not persisted; compare on a fresh
+        # tracker built from the log against a scan of what it loaded.
+        reloaded = LearningTracker(state_dir=state_dir)
+
+        assert len(reloaded._outcomes) == 40
+        expected = _brute_force_accuracy(reloaded._outcomes.values())
+        stats = reloaded.get_accuracy()
+        assert stats.total_predictions == expected["total"]
+        assert stats.correct_predictions == expected["correct"]
+        assert stats.pending_outcomes == expected["pending"]
+
+    def test_torn_trailing_line_is_ignored(self, tracker, tmp_path):
+        tracker.record_prediction("owner/a", "r1", PredictionType.REVIEW_APPROVE)
+        log = tracker._get_outcomes_file("owner/a")
+        with open(log, "a", encoding="utf-8") as f:
+            f.write('{"review_id": "r2", "repo"')
+
+        reloaded = LearningTracker(state_dir=tracker.state_dir)
+        assert list(reloaded._outcomes) == ["r1"]
+
+    def test_legacy_json_file_is_loaded(self, tmp_path):
+        learning_dir = tmp_path / "github" / "learning"
+        learning_dir.mkdir(parents=True)
+        legacy = ReviewOutcome(
+            review_id="old",
+            repo="owner/a",
+            pr_number=1,
+            prediction=PredictionType.REVIEW_APPROVE,
+            findings_count=0,
+            high_severity_count=0,
+        )
+        (learning_dir / "owner_a_outcomes.json").write_text(
+            json.dumps({"repo": "owner/a", "outcomes": [legacy.to_dict()]})
+        )
+
+        tracker = LearningTracker(state_dir=tmp_path / "github")
+        assert tracker.get_accuracy("owner/a").pending_outcomes == 1
+
+        tracker.record_outcome("owner/a", "old", OutcomeType.MERGED)
+        reloaded = LearningTracker(state_dir=tmp_path / "github")
+        assert reloaded.get_accuracy("owner/a").correct_predictions == 1
@@ -0,0 +1,191 @@
+"""
+Tests for the PR Worktree Pool
+==============================
+
+Tests slot reuse across PR heads, LRU/same-PR slot selection, per-slot
+locking and sparse-checkout against a real temporary git repository.
+"""
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_path = Path(__file__).parent.parent / "apps" / "backend"
+github_path = backend_path / "runners" / "github"
+module_path = github_path / "services" / "pr_worktree_pool.py"
+if str(github_path) not in sys.path:
+    sys.path.insert(0, str(github_path))
+
+# Load module directly without importing parent packages
+spec = importlib.util.spec_from_file_location("pr_worktree_pool", module_path)
+pr_worktree_pool = importlib.util.module_from_spec(spec)
+sys.modules["pr_worktree_pool"] = pr_worktree_pool
+spec.loader.exec_module(pr_worktree_pool)
+
+PRWorktreePool = pr_worktree_pool.PRWorktreePool
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+
+def _commit(repo: Path, files: dict[str, str], message: str) -> str:
+    for name, content in files.items():
+        path = repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+    return _git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Temporary repository with two commits."""
+    for key in (
+        "GIT_DIR",
+        "GIT_WORK_TREE",
+        "GIT_INDEX_FILE",
+        "GIT_OBJECT_DIRECTORY",
+        "GIT_ALTERNATE_OBJECT_DIRECTORIES",
+    ):
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setenv("GIT_AUTHOR_NAME", "Test User")
+    monkeypatch.setenv("GIT_AUTHOR_EMAIL", "test@example.com")
+    monkeypatch.setenv("GIT_COMMITTER_NAME", "Test User")
+    monkeypatch.setenv("GIT_COMMITTER_EMAIL", "test@example.com")
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+    _git(repo_dir, "init", "-q")
+    first = _commit(
+        repo_dir,
+        {"README.md": "v1", "src/app.py": "v1", "docs/guide.md": "guide"},
+        "first",
+    )
+    second = _commit(repo_dir, {"src/app.py": "v2"}, "second")
+    return repo_dir, first, second
+
+
+def _pool(repo_dir: Path, **kwargs) -> PRWorktreePool:
+    kwargs.setdefault("max_slots", 2)
+    kwargs.setdefault("sparse_mode", "never")
+    return PRWorktreePool(repo_dir, repo_dir / ".pool", **kwargs)
+
+
+class TestPRWorktreePool:
+    def test_reuses_slot_for_new_head(self, repo):
+        repo_dir, first, second = repo
+        pool = _pool(repo_dir)
+
+        path = pool.acquire(first, 1)
+        assert (path / "src" / "app.py").read_text() == "v1"
+        (path / "scratch.txt").write_text("left behind")
+        pool.release(path)
+
+        reused = pool.acquire(second, 1)
+        assert reused == path
+        assert (reused / "src" / "app.py").read_text() == "v2"
+        assert not (reused / "scratch.txt").exists()
+        pool.release(reused)
+
+        [state] = pool.get_slot_info()
+        assert state.head_sha == second
+        assert state.reuse_count == 1
+
+    def test_slot_that_cannot_be_cleaned_is_recreated(self, repo):
+        repo_dir, first, second = repo
+        pool = _pool(repo_dir)
+
+        path = pool.acquire(first, 1)
+        (path / "scratch.txt").write_text("left behind")
+        pool.release(path)
+        # A stale index lock makes `reset --hard` fail
+        git_dir = Path(_git(path, "rev-parse", "--absolute-git-dir"))
+        (git_dir / "index.lock").write_text("")
+
+        reused = pool.acquire(second, 1)
+        assert reused == path
+        assert (reused / "src" / "app.py").read_text() == "v2"
+        assert not (reused / "scratch.txt").exists()
+        pool.release(reused)
+
+        [state] = pool.get_slot_info()
+        assert state.reuse_count == 0
+
+    def test_busy_slot_is_not_shared(self, repo):
+        repo_dir, first, second = repo
+        pool = _pool(repo_dir)
+        other_process = _pool(repo_dir)
+
+        path_a = pool.acquire(first, 1)
+        path_b = other_process.acquire(second, 2)
+        assert path_a != path_b
+        assert other_process.try_acquire(first, 3) is None  # Pool is full
+
+        pool.release(path_a)
+        assert other_process.try_acquire(first, 3) == path_a
+
+    def test_prefers_slot_of_same_pr(self, repo):
+        repo_dir, first, second = repo
+        pool = _pool(repo_dir)
+
+        path_a = pool.acquire(first, 1)
+        path_b = pool.acquire(first, 2)
+        pool.release(path_b)
+        pool.release(path_a)  # slot A is now the most recently used
+
+        assert pool.acquire(second, 2) == path_b
+
+    def test_sparse_checkout_limits_tree(self, repo):
+        repo_dir, first, second = repo
+        pool = _pool(repo_dir, sparse_mode="always")
+
+        path = pool.acquire(second, 1, sparse_paths=["src/app.py"])
+        assert (path / "src" / "app.py").exists()
+        assert (path / "README.md").exists()  # cone mode keeps root files
+        assert not (path / "docs").exists()
+        pool.release(path)
+
+        full = pool.acquire(first, 1)
+        assert full == path
+        assert (full / "docs" / "guide.md").exists()
+
+    def test_failed_sparse_checkout_falls_back_to_full(self, repo, monkeypatch):
+        repo_dir, _, second = repo
+        pool = _pool(repo_dir, sparse_mode="always")
+        run_git = pool._git
+
+        def failing_sparse_set(args, *rest, **kwargs):
+            if args[:2] == ["sparse-checkout", "set"]:
+                return subprocess.CompletedProcess(args, 128, "", "cone failed")
+            return run_git(args, *rest, **kwargs)
+
+        monkeypatch.setattr(pool, "_git", failing_sparse_set)
+
+        path = pool.acquire(second, 1, sparse_paths=["src/app.py"])
+        assert (path / "docs" / "guide.md").exists()
+        pool.release(path)
+
+        [state] = pool.get_slot_info()
+        assert not state.sparse_dirs
+
+    def test_cleanup_removes_idle_slots(self, repo):
+        repo_dir, first, _ = repo
+        pool = _pool(repo_dir)
+
+        busy = pool.acquire(first, 1)
+        idle = pool.acquire(first, 2)
+        pool.release(idle)
+
+        assert pool.remove_all() == 1
+        assert busy.exists()
+        assert not idle.exists()
+        assert len(pool.get_slot_info()) == 1
@@ -0,0 +1,245 @@
+"""
+Tests for the Multi-PR Review Scheduler
+=======================================
+
+Tests priority ordering, concurrency limits, head-SHA dedupe and budget
+handling using a fake review function.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from rate_limiter import TokenBucket
+from review_scheduler import (
+    ReviewPriorityPolicy,
+    ReviewRequest,
+    ReviewScheduler,
+    ReviewSchedulerConfig,
+)
+
+
+class FakeRateLimiter:
+    def __init__(self, tokens=5000, budget_ok=True):
+        self.github_bucket = TokenBucket(capacity=5000, refill_rate=1000.0)
+        self.github_bucket.tokens = tokens
+        self.budget_ok = budget_ok
+
+    def check_cost_available(self):
+        if self.budget_ok:
+            return True, "budget remaining"
+        return False, "Cost budget exceeded"
+
+
+class FakeBotDetector:
+    def __init__(self, reviewed=None):
+        self.reviewed = reviewed or {}
+
+    def has_reviewed_commit(self, pr_number, commit_sha):
+        return commit_sha in self.reviewed.get(pr_number, [])
+
+
+class FakeReviewer:
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.order = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, request):
+        self.order.append(request.pr_number)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return f"reviewed-{request.pr_number}@{request.head_sha}"
+
+
+def _config(max_concurrent=2, **kwargs):
+    return ReviewSchedulerConfig(
+        max_concurrent=max_concurrent, worktree_slots=10, cpu_slots=10, **kwargs
+    )
+
+
+class TestPriority:
+    def test_new_commits_and_labels_raise_priority(self):
+        policy = ReviewPriorityPolicy()
+        plain = ReviewRequest(pr_number=1, head_sha="a")
+        followup = ReviewRequest(pr_number=2, head_sha="b", has_new_commits=True)
+        urgent = ReviewRequest(pr_number=3, head_sha="c", labels=["urgent"])
+        wip = ReviewRequest(pr_number=4, head_sha="d", labels=["WIP"])
+
+        assert policy.score(followup) > policy.score(urgent) > policy.score(plain)
+        assert policy.score(wip) < policy.score(plain)
+
+    def test_smaller_prs_and_green_ci_first(self):
+        policy = ReviewPriorityPolicy()
+        small = ReviewRequest(pr_number=1, head_sha="a", additions=10)
+        large = ReviewRequest(pr_number=2, head_sha="b", additions=4000)
+        green = ReviewRequest(pr_number=3, head_sha="c", ci_status="success")
+        red = ReviewRequest(pr_number=4, head_sha="d", ci_status="failure")
+
+        assert policy.score(small) > policy.score(large)
+        assert policy.score(green) > policy.score(red)
+
+    def test_from_pr_data(self):
+        request = ReviewRequest.from_pr_data(
+            {
+                "number": 42,
+                "headRefOid": "abc123",
+                "additions": 10,
+                "deletions": 5,
+                "labels": [{"name": "security"}],
+                "statusCheckRollup": [
+                    {"status": "COMPLETED", "conclusion": "SUCCESS"},
+                    {"status": "IN_PROGRESS", "conclusion": ""},
+                ],
+            }
+        )
+        assert request.pr_number == 42
+        assert request.size == 15
+        assert request.labels == ["security"]
+        assert request.ci_status == "pending"
+
+
+class TestReviewScheduler:
+    async def test_runs_in_priority_order(self):
+        reviewer = FakeReviewer()
+        scheduler = ReviewScheduler(reviewer, FakeRateLimiter(), config=_config(1))
+        scheduler.submit(ReviewRequest(pr_number=1, head_sha="a", additions=3000))
+        scheduler.submit(ReviewRequest(pr_number=2, head_sha="b", labels=["urgent"]))
+        scheduler.submit(ReviewRequest(pr_number=3, head_sha="c"))
+
+        results = await scheduler.run_until_empty()
+
+        assert reviewer.order == [2, 3, 1]
+        assert set(results) == {1, 2, 3}
+
+    async def test_concurrency_is_bounded(self):
+        reviewer = FakeReviewer()
+        scheduler = ReviewScheduler(reviewer, FakeRateLimiter(), config=_config(3))
+        for pr in range(10):
+            scheduler.submit(ReviewRequest(pr_number=pr, head_sha=f"sha{pr}"))
+
+        await scheduler.run_until_empty()
+
+        assert reviewer.peak == 3
+        assert scheduler.metrics.completed == 10
+        assert scheduler.metrics.peak_in_flight == 3
+        assert scheduler.metrics.queue_depth == 0
+
+    async def test_worktree_slots_cap_concurrency(self):
+        reviewer = FakeReviewer()
+        config = ReviewSchedulerConfig(max_concurrent=8, worktree_slots=2, cpu_slots=8)
+        scheduler = ReviewScheduler(reviewer, FakeRateLimiter(), config=config)
+        for pr in range(6):
+            scheduler.submit(ReviewRequest(pr_number=pr, head_sha=f"sha{pr}"))
+
+        await scheduler.run_until_empty()
+        assert reviewer.peak == 2
+
+    async def test_dedupes_reviewed_and_queued_shas(self):
+        detector = FakeBotDetector(reviewed={1: ["old"]})
+        scheduler = ReviewScheduler(
+            FakeReviewer(), FakeRateLimiter(), detector, config=_config()
+        )
+
+        assert scheduler.submit(ReviewRequest(pr_number=1, head_sha="old")) is False
+        assert scheduler.submit(ReviewRequest(pr_number=2, head_sha="x")) is True
+        assert scheduler.submit(ReviewRequest(pr_number=2, head_sha="x")) is False
+        assert scheduler.submit(
+            ReviewRequest(pr_number=1, head_sha="old", force=True)
+        ) is True
+        assert scheduler.metrics.deduped == 2
+        assert scheduler.queue_depth == 2
+
+    async def test_newer_head_supersedes_queued_request(self):
+        reviewer = FakeReviewer()
+        scheduler = ReviewScheduler(reviewer, FakeRateLimiter(), config=_config(1))
+        scheduler.submit(ReviewRequest(pr_number=7, head_sha="first"))
+        scheduler.submit(ReviewRequest(pr_number=7, head_sha="second"))
+
+        results = await scheduler.run_until_empty()
+
+        assert reviewer.order == [7]
+        assert results[7] == "reviewed-7@second"
+        assert scheduler.metrics.superseded == 1
+
+    async def test_failed_review_is_recorded(self):
+        async def failing(request):
+            raise RuntimeError("boom")
+
+        scheduler = ReviewScheduler(failing, FakeRateLimiter(), config=_config())
+        scheduler.submit(ReviewRequest(pr_number=1, head_sha="a"))
+
+        await scheduler.run_until_empty()
+        assert scheduler.metrics.failed == 1
+        assert isinstance(scheduler.errors[1], RuntimeError)
+
+    async def test_cost_budget_exhausted_leaves_queue(self):
+        reviewer = FakeReviewer()
+        scheduler = ReviewScheduler(
+            reviewer, FakeRateLimiter(budget_ok=False), config=_config()
+        )
+        scheduler.submit(ReviewRequest(pr_number=1, head_sha="a"))
+
+        await scheduler.run_until_empty()
+        assert reviewer.order == []
+        assert scheduler.queue_depth == 1
+        assert scheduler.skipped == {1: "Cost budget exceeded"}
+
+    async def test_budget_running_out_reports_remaining_prs(self):
+        limiter = FakeRateLimiter()
+
+        async def spend_budget(request):
+            limiter.budget_ok = False
+            return "reviewed"
+
+        scheduler = ReviewScheduler(
+            spend_budget, limiter, config=_config(max_concurrent=1)
+        )
+        for pr_number in (1, 2, 3):
+            scheduler.submit(ReviewRequest(pr_number=pr_number, head_sha="a"))
+
+        results = await scheduler.run_until_empty()
+
+        assert len(results) == 1
+        assert set(scheduler.skipped) == {1, 2, 3} - set(results)
+        assert set(scheduler.skipped.values()) == {"Cost budget exceeded"}
+
+    async def test_waits_for_github_tokens(self):
+        reviewer = FakeReviewer(delay=0)
+        limiter = FakeRateLimiter(tokens=0)
+        scheduler = ReviewScheduler(
+            reviewer, limiter, config=_config(github_reserve=20)
+        )
+        scheduler.submit(ReviewRequest(pr_number=1, head_sha="a"))
+
+        await scheduler.run_until_empty()
+        assert reviewer.order == [1]
+        assert scheduler.metrics.budget_pauses >= 1
+
+    async def test_serve_processes_late_submissions(self):
+        reviewer = FakeReviewer(delay=0.01)
+        scheduler = ReviewScheduler(reviewer, FakeRateLimiter(), config=_config())
+        server = asyncio.create_task(scheduler.serve())
+
+        scheduler.submit(ReviewRequest(pr_number=1, head_sha="a"))
+        await asyncio.sleep(0.05)
+        scheduler.submit(ReviewRequest(pr_number=2, head_sha="b"))
+        await asyncio.sleep(0.05)
+        scheduler.stop()
+        await asyncio.wait_for(server, timeout=1)
+
+        assert sorted(reviewer.order) == [1, 2]
+        metrics = scheduler.metrics.to_dict()
+        assert metrics["completed"] == 2
+        assert metrics["queue_wait_p50"] is not None
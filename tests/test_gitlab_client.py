@@ -0,0 +1,293 @@
+"""
+Tests for the GitLab API Client
+===============================
+
+Runs GitLabClient and the orchestrator's MR context gathering against a
+local stub HTTP server that counts TCP connections, to verify keep-alive
+reuse, pagination, Retry-After handling and concurrent fan-out.
+"""
+
+import asyncio
+import http.client
+import importlib
+import importlib.util
+import json
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+# Load the gitlab runner as a package without running its __init__ (CLI imports)
+_gitlab_dir = Path(__file__).parent.parent / "apps" / "backend" / "runners" / "gitlab"
+_spec = importlib.util.spec_from_file_location(
+    "gitlab_runner", _gitlab_dir / "__init__.py", submodule_search_locations=[str(_gitlab_dir)]
+)
+sys.modules.setdefault("gitlab_runner", importlib.util.module_from_spec(_spec))
+
+glab_client = importlib.import_module("gitlab_runner.glab_client")
+http_transport = importlib.import_module("gitlab_runner.http_transport")
+orchestrator_module = importlib.import_module("gitlab_runner.orchestrator")
+models = importlib.import_module("gitlab_runner.models")
+
+GitLabAPIError = glab_client.GitLabAPIError
+GitLabClient = glab_client.GitLabClient
+GitLabConfig = glab_client.GitLabConfig
+GitLabOrchestrator = orchestrator_module.GitLabOrchestrator
+
+LATENCY = 0.05  # Simulated server latency per request
+
+
+class StubGitLab(ThreadingHTTPServer):
+    """Minimal GitLab API stub that counts connections."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.connections = 0
+        self.requests: list[str] = []
+        self.rate_limit_next = 0
+        self._lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self._lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server: StubGitLab = self.server
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        with server._lock:
+            server.requests.append(self.path)
+            rate_limited = server.rate_limit_next > 0
+            if rate_limited:
+                server.rate_limit_next -= 1
+        if rate_limited:
+            self._send(429, {"message": "slow down"}, {"Retry-After": "0"})
+            return
+
+        time.sleep(LATENCY)
+        segments = parts.path.split("/")
+        # /api/v4/projects/<project>/merge_requests/<iid>[/<resource>]
+        iid = int(segments[6])
+        resource = segments[7] if len(segments) > 7 else ""
+        page = int(query.get("page", ["1"])[0])
+
+        if resource == "":
+            self._send(200, {"iid": iid, "title": f"MR {iid}", "sha": f"sha{iid}"})
+        elif resource == "changes":
+            self._send(
+                200,
+                {"changes": [{"new_path": "a.py", "old_path": "a.py", "diff": "+x\n-y"}]},
+            )
+        elif resource == "commits":
+            # Paginated via X-Next-Page
+            headers = {"X-Next-Page": "2"} if page == 1 else {"X-Next-Page": ""}
+            self._send(200, [{"id": f"c{iid}-{page}"}], headers)
+        elif resource == "discussions":
+            # Paginated via Link header
+            headers = {}
+            if page == 1:
+                next_url = f"{server.url}{parts.path}?per_page=100&page=2"
+                headers["Link"] = f'<{next_url}>; rel="next"'
+            self._send(200, [{"id": f"d{iid}-{page}", "notes": []}], headers)
+        else:
+            self._send(404, {"message": "404 Not Found"})
+
+
+@pytest.fixture
+def stub_server():
+    server = StubGitLab()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _config(server: StubGitLab) -> GitLabConfig:
+    return GitLabConfig(token="test-token", project="group/project", instance_url=server.url)
+
+
+class TestGitLabClient:
+    async def test_reuses_keepalive_connection(self, stub_server, tmp_path):
+        async with GitLabClient(tmp_path, _config(stub_server)) as client:
+            for iid in range(1, 6):
+                assert (await client.get_mr(iid))["iid"] == iid
+
+        assert stub_server.connections == 1
+        assert client.transport.stats.connections_reused == 4
+
+    async def test_follows_pagination(self, stub_server, tmp_path):
+        async with GitLabClient(tmp_path, _config(stub_server)) as client:
+            commits = await client.get_mr_commits(7)
+            discussions = await client.get_mr_discussions(7)
+
+        assert [c["id"] for c in commits] == ["c7-1", "c7-2"]
+        assert [d["id"] for d in discussions] == ["d7-1", "d7-2"]
+
+    async def test_retries_after_rate_limit(self, stub_server, tmp_path):
+        stub_server.rate_limit_next = 2
+        async with GitLabClient(tmp_path, _config(stub_server)) as client:
+            assert (await client.get_mr(3))["iid"] == 3
+        assert len(stub_server.requests) == 3
+
+    async def test_error_status_raises(self, stub_server, tmp_path):
+        async with GitLabClient(tmp_path, _config(stub_server)) as client:
+            with pytest.raises(GitLabAPIError) as exc_info:
+                await client._fetch("/projects/group%2Fproject/merge_requests/1/unknown")
+        assert exc_info.value.code == 404
+
+    def test_retry_after_parsing(self):
+        assert glab_client.parse_retry_after("5") == 5.0
+        assert glab_client.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 1.0
+        assert glab_client.parse_retry_after("garbage") is None
+
+
+class TestTransportCancellation:
+    async def test_connection_is_closed_after_the_worker_returns(self):
+        transport = http_transport.AsyncHTTPTransport()
+        release = threading.Event()
+        events = []
+
+        class FakeConnection:
+            sock = None
+
+            def close(self):
+                events.append("close")
+
+        def send(conn, *args):
+            release.wait(5)
+            events.append("sent")
+            return http_transport.HTTPResponse(200, {}, b""), True
+
+        transport._new_connection = lambda key, timeout: FakeConnection()
+        transport._send = send
+
+        task = asyncio.create_task(transport.request("GET", "http://127.0.0.1/x"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert events == []  # Still in use by the worker
+
+        release.set()
+        for _ in range(100):
+            if len(events) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert events == ["sent", "close"]
+        await transport.close()
+
+
+class TestTransportStaleConnections:
+    """Retries on reused keep-alive connections must not repeat writes."""
+
+    @pytest.fixture
+    def transport(self):
+        transport = http_transport.AsyncHTTPTransport()
+        peers = []
+        sent = []
+
+        class FakeConnection:
+            def __init__(self, fresh):
+                self.fresh = fresh
+                self.sock, peer = socket.socketpair()
+                peers.append(peer)
+
+            def close(self):
+                self.sock.close()
+
+        def send(conn, method, *args):
+            sent.append((method, conn.fresh))
+            if not conn.fresh:
+                raise http.client.RemoteDisconnected("closed")
+            return http_transport.HTTPResponse(200, {}, b""), False
+
+        transport._new_connection = lambda key, timeout: FakeConnection(True)
+        transport._send = send
+        key, _ = transport._host_key("http://127.0.0.1/x")
+        transport._idle[key].append(FakeConnection(False))
+        yield transport, sent, peers
+        for peer in peers:
+            peer.close()
+
+    async def test_idempotent_request_is_retried(self, transport):
+        transport, sent, _ = transport
+
+        await transport.request("GET", "http://127.0.0.1/x")
+
+        assert sent == [("GET", False), ("GET", True)]
+
+    async def test_write_is_not_resent(self, transport):
+        transport, sent, _ = transport
+
+        with pytest.raises(http.client.RemoteDisconnected):
+            await transport.request("POST", "http://127.0.0.1/x", body=b"note")
+
+        assert sent == [("POST", False)]
+
+    async def test_connection_closed_by_server_is_not_reused(self, transport):
+        transport, sent, peers = transport
+        peers[0].close()  # Server closed the idle connection
+
+        await transport.request("POST", "http://127.0.0.1/x", body=b"note")
+
+        assert sent == [("POST", True)]
+
+
+class TestConcurrentMRContext:
+    async def test_gathers_many_mrs_concurrently(self, stub_server, tmp_path):
+        config = models.GitLabRunnerConfig(
+            token="test-token", project="group/project", instance_url=stub_server.url
+        )
+        orchestrator = GitLabOrchestrator(project_dir=tmp_path, config=config)
+        mr_count = 6
+
+        start = time.perf_counter()
+        try:
+            contexts = await asyncio.gather(
+                *(orchestrator._gather_mr_context(iid) for iid in range(1, mr_count + 1))
+            )
+        finally:
+            await orchestrator.close()
+        elapsed = time.perf_counter() - start
+
+        assert [c.head_sha for c in contexts] == [f"sha{i}" for i in range(1, mr_count + 1)]
+        assert len(contexts[0].commits) == 2
+        assert len(contexts[0].discussions) == 2
+        assert contexts[0].total_additions == 1
+
+        # 6 requests per MR; sequential would take 36 * LATENCY
+        sequential = mr_count * 6 * LATENCY
+        assert elapsed < sequential / 2
+        transport = orchestrator.client.transport
+        assert stub_server.connections <= transport.max_per_host
+        assert transport.stats.peak_in_flight["127.0.0.1"] <= transport.max_per_host
@@ -85,6 +85,7 @@ _modules_to_mock = [
     'core.client',
     'gh_client',
     'phase_config',
+    'services.client_pool',
     'services.pr_worktree_manager',
     'services.sdk_utils',
     'claude_agent_sdk',
@@ -0,0 +1,339 @@
+"""
+Tests for the Linear Sync Engine
+================================
+
+Runs the direct GraphQL sync engine against a local fake Linear endpoint
+that records every request, to verify outbox coalescing, batched
+mutations, retries and durability across failed flushes.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from integrations.linear.sync import (
+    LINEAR_OUTBOX_FILE,
+    MAX_REJECTIONS,
+    LinearGraphQLClient,
+    LinearOutbox,
+    LinearSyncEngine,
+    LinearSyncError,
+    build_sync_mutation,
+)
+from integrations.linear.updater import (
+    STATUS_IN_PROGRESS,
+    STATUS_IN_REVIEW,
+    LinearTaskState,
+    linear_qa_started,
+    linear_subtask_completed,
+    linear_task_started,
+)
+
+STATES = [
+    {"id": "state-todo", "name": "Todo"},
+    {"id": "state-progress", "name": "In Progress"},
+    {"id": "state-review", "name": "In Review"},
+]
+
+
+class FakeLinear(ThreadingHTTPServer):
+    """Fake Linear GraphQL endpoint that records requests."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.requests: list[dict] = []
+        self.auth_headers: list[str] = []
+        self.fail_next = 0
+        # Mutation aliases answered with null plus a GraphQL error
+        self.reject_aliases: set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/graphql"
+
+    @property
+    def mutations(self) -> list[dict]:
+        return [r for r in self.requests if r["query"].startswith("mutation")]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        server: FakeLinear = self.server
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length))
+        with server._lock:
+            server.requests.append(request)
+            server.auth_headers.append(self.headers.get("Authorization", ""))
+            failing = server.fail_next > 0
+            if failing:
+                server.fail_next -= 1
+        if failing:
+            self._send(503, {"error": "unavailable"}, {"Retry-After": "0"})
+            return
+
+        query = request["query"]
+        aliases = [
+            line.strip().split(":")[0]
+            for line in query.splitlines()[1:]
+            if ":" in line and not line.strip().startswith("}")
+        ]
+        if query.startswith("query"):
+            data = {alias: {"team": {"states": {"nodes": STATES}}} for alias in aliases}
+        else:
+            data = {alias: {"success": True} for alias in aliases}
+            rejected = [alias for alias in aliases if alias in server.reject_aliases]
+            if rejected:
+                for alias in rejected:
+                    data[alias] = None
+                errors = [{"message": "rejected", "path": [a]} for a in rejected]
+                self._send(200, {"data": data, "errors": errors})
+                return
+        self._send(200, {"data": data})
+
+
+@pytest.fixture
+def fake_linear():
+    server = FakeLinear()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def spec_dir(tmp_path: Path) -> Path:
+    LinearTaskState(task_id="VAL-1", task_title="Feature", team_id="team-1").save(
+        tmp_path
+    )
+    return tmp_path
+
+
+def _engine(spec_dir: Path, server: FakeLinear) -> LinearSyncEngine:
+    client = LinearGraphQLClient("lin_api_test", url=server.url, max_retries=2)
+    return LinearSyncEngine(spec_dir, "lin_api_test", client=client)
+
+
+class TestOutbox:
+    def test_latest_status_wins(self, tmp_path: Path):
+        outbox = LinearOutbox(tmp_path)
+        outbox.queue_status("VAL-1", "In Progress")
+        outbox.queue_comment("VAL-1", "first")
+        outbox.queue_status("VAL-1", "In Review")
+        outbox.queue_comment("VAL-1", "second")
+
+        assert outbox.pending() == {
+            "VAL-1": {"status": "In Review", "comments": ["first", "second"]}
+        }
+
+    def test_mutation_uses_variables(self):
+        document, variables = build_sync_mutation(
+            {"VAL-1": {"status": "Done", "comments": ['say "hi"']}},
+            {"VAL-1": {"Done": "state-done"}},
+        )
+
+        assert document.startswith("mutation LinearSync(")
+        assert "issueUpdate" in document and "commentCreate" in document
+        assert 'say "hi"' not in document
+        assert variables == {"i0": "VAL-1", "s0": "state-done", "b0_0": 'say "hi"'}
+
+
+class TestSyncEngine:
+    async def test_flush_sends_one_batched_mutation(self, spec_dir, fake_linear):
+        engine = _engine(spec_dir, fake_linear)
+        engine.queue_status("VAL-1", "In Progress")
+        engine.queue_comment("VAL-1", "one")
+        engine.queue_status("VAL-1", "In Review")
+        engine.queue_comment("VAL-1", "two")
+
+        assert await engine.flush()
+
+        # One state lookup plus one mutation for everything queued
+        assert len(fake_linear.requests) == 2
+        (mutation,) = fake_linear.mutations
+        assert mutation["query"].count("issueUpdate") == 1
+        assert mutation["query"].count("commentCreate") == 2
+        assert mutation["variables"]["s0"] == "state-review"
+        assert fake_linear.auth_headers == ["lin_api_test", "lin_api_test"]
+        assert engine.outbox.is_empty()
+
+    async def test_state_ids_are_cached(self, spec_dir, fake_linear):
+        engine = _engine(spec_dir, fake_linear)
+        engine.queue_status("VAL-1", "In Progress")
+        assert await engine.flush()
+        engine.queue_status("VAL-1", "In Review")
+        assert await engine.flush()
+
+        queries = [r for r in fake_linear.requests if r["query"].startswith("query")]
+        assert len(queries) == 1
+        assert len(fake_linear.mutations) == 2
+
+    async def test_retries_transient_errors(self, spec_dir, fake_linear):
+        fake_linear.fail_next = 1
+        engine = _engine(spec_dir, fake_linear)
+        engine.queue_comment("VAL-1", "hello")
+
+        assert await engine.flush()
+        assert len(fake_linear.requests) == 2
+
+    async def test_failed_flush_is_kept_for_next_flush(self, spec_dir, fake_linear):
+        fake_linear.fail_next = 2  # Exhausts both attempts
+        engine = _engine(spec_dir, fake_linear)
+        engine.queue_comment("VAL-1", "first")
+
+        assert not await engine.flush()
+        assert (spec_dir / LINEAR_OUTBOX_FILE).exists()
+
+        # A new engine (e.g. after restart) delivers the backlog together
+        engine = _engine(spec_dir, fake_linear)
+        engine.queue_comment("VAL-1", "second")
+        assert await engine.flush()
+
+        # Two failed attempts, then one mutation carrying both comments
+        assert len(fake_linear.mutations) == 3
+        mutation = fake_linear.mutations[-1]
+        assert mutation["variables"]["b0_0"] == "first"
+        assert mutation["variables"]["b0_1"] == "second"
+        assert engine.outbox.is_empty()
+
+    async def test_failed_operations_stay_queued(self, spec_dir, fake_linear):
+        fake_linear.reject_aliases = {"c0_1"}
+        engine = _engine(spec_dir, fake_linear)
+        engine.queue_status("VAL-1", "In Progress")
+        engine.queue_comment("VAL-1", "one")
+        engine.queue_comment("VAL-1", "two")
+
+        assert not await engine.flush()
+
+        # Only the rejected comment is retried; nothing is delivered twice
+        fake_linear.reject_aliases = set()
+        assert await engine.flush()
+        retry = fake_linear.mutations[-1]
+        assert "issueUpdate" not in retry["query"]
+        assert retry["query"].count("commentCreate") == 1
+        assert retry["variables"]["b0_0"] == "two"
+        assert engine.outbox.is_empty()
+
+    async def test_unknown_state_does_not_block_other_updates(
+        self, spec_dir, fake_linear, capsys
+    ):
+        engine = _engine(spec_dir, fake_linear)
+        engine.queue_status("VAL-1", "In Review")
+        engine.queue_status("VAL-2", "Nonexistent")
+        engine.queue_comment("VAL-2", "note")
+
+        assert await engine.flush()
+
+        # The bad status is dropped; everything else goes out in one mutation
+        (mutation,) = fake_linear.mutations
+        assert mutation["query"].count("issueUpdate") == 1
+        assert mutation["variables"]["s0"] == "state-review"
+        assert mutation["variables"]["b1_0"] == "note"
+        assert "Nonexistent" in capsys.readouterr().out
+        assert engine.outbox.is_empty()
+
+    async def test_rejected_operations_are_dropped_after_cap(
+        self, spec_dir, fake_linear
+    ):
+        fake_linear.reject_aliases = {"c0_0"}
+        engine = _engine(spec_dir, fake_linear)
+        engine.queue_comment("VAL-1", "rejected")
+
+        for _ in range(MAX_REJECTIONS - 1):
+            assert not await engine.flush()
+        assert await engine.flush()
+
+        assert len(fake_linear.mutations) == MAX_REJECTIONS
+        assert engine.outbox.is_empty()
+        # Nothing left to send, so no further requests
+        assert await engine.flush()
+        assert len(fake_linear.mutations) == MAX_REJECTIONS
+
+    async def test_updates_queued_during_flush_are_kept(self, spec_dir, fake_linear):
+        engine = _engine(spec_dir, fake_linear)
+        engine.queue_status("VAL-1", "In Progress")
+        engine.queue_comment("VAL-1", "one")
+        execute = engine.client.execute
+
+        async def queue_while_sending(*args, **kwargs):
+            if args[0].startswith("mutation"):
+                engine.queue_status("VAL-1", "In Review")
+                engine.queue_comment("VAL-1", "two")
+            return await execute(*args, **kwargs)
+
+        engine.client.execute = queue_while_sending
+        assert not await engine.flush()
+
+        engine.client.execute = execute
+        assert await engine.flush()
+        retry = fake_linear.mutations[-1]
+        assert retry["variables"]["s0"] == "state-review"
+        assert retry["variables"]["b0_0"] == "two"
+
+    async def test_partial_errors_return_data(self):
+        class _PartialClient(LinearGraphQLClient):
+            def _post(self, payload):
+                body = b'{"data": {"a": null, "b": {"success": true}}, "errors": [{"message": "bad id"}]}'
+                return 200, {}, body
+
+        data = await _PartialClient("key").execute("mutation { a b }", partial=True)
+
+        assert data == {"a": None, "b": {"success": True}}
+        with pytest.raises(LinearSyncError, match="bad id"):
+            await _PartialClient("key").execute("mutation { a b }")
+
+    async def test_graphql_errors_raise(self):
+        class _ErrorClient(LinearGraphQLClient):
+            def _post(self, payload):
+                return 200, {}, b'{"errors": [{"message": "bad id"}]}'
+
+        with pytest.raises(LinearSyncError, match="bad id"):
+            await _ErrorClient("key").execute("query { viewer { id } }")
+
+
+class TestUpdaterTransitions:
+    @pytest.fixture(autouse=True)
+    def _env(self, monkeypatch, fake_linear):
+        monkeypatch.setenv("LINEAR_API_KEY", "lin_api_test")
+        monkeypatch.setenv("LINEAR_API_URL", fake_linear.url)
+        monkeypatch.delenv("LINEAR_SYNC_MODE", raising=False)
+
+    async def test_transitions_use_direct_sync(self, spec_dir, fake_linear):
+        assert await linear_task_started(spec_dir)
+        assert await linear_subtask_completed(spec_dir, "1.1", 1, 3)
+        assert await linear_qa_started(spec_dir)
+
+        # Status + comment go out together: one mutation per transition
+        assert len(fake_linear.mutations) == 3
+        started = fake_linear.mutations[0]["query"]
+        assert "issueUpdate" in started and "commentCreate" in started
+        assert LinearTaskState.load(spec_dir).status == STATUS_IN_REVIEW
+
+    async def test_unchanged_status_only_sends_comment(self, spec_dir, fake_linear):
+        state = LinearTaskState.load(spec_dir)
+        state.status = STATUS_IN_PROGRESS
+        state.save(spec_dir)
+
+        assert await linear_task_started(spec_dir)
+
+        (mutation,) = fake_linear.mutations
+        assert "issueUpdate" not in mutation["query"]
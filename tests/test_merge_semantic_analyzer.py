@@ -23,7 +23,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
 # Add tests directory to path for test_fixtures
 sys.path.insert(0, str(Path(__file__).parent))
 
-from merge import ChangeType
+from merge import ChangeType, SemanticAnalyzer
+from merge.semantic_analysis import (
+    AnalysisCache,
+    ExtractedElement,
+    analyze_with_parser,
+    content_hash,
+    register_parser,
+)
+from merge.semantic_analysis import parser_analyzer
+from merge.semantic_analysis.regex_analyzer import analyze_with_regex
 from test_fixtures import (
     SAMPLE_PYTHON_MODULE,
     SAMPLE_PYTHON_WITH_NEW_IMPORT,
@@ -233,3 +242,138 @@ class TestEdgeCases:
         # Should complete without issues
         assert analysis is not None
         assert len(analysis.changes) > 0
+
+
+# Recorded (before, after) pairs with the changes a reviewer would name
+SEMANTIC_CORPUS = [
+    (
+        "import os\n\ndef load(path):\n    return open(path).read()\n",
+        "import os\nimport json\n\ndef load(path):\n"
+        "    return json.load(open(path))\n",
+        {
+            (ChangeType.ADD_IMPORT, "import json"),
+            (ChangeType.MODIFY_FUNCTION, "load"),
+        },
+    ),
+    (
+        "class Store:\n    def get(self, key):\n        return self.data[key]\n\n"
+        "    def put(self, key, value):\n        self.data[key] = value\n",
+        "class Store:\n    def get(self, key):\n"
+        "        return self.data.get(key)\n\n"
+        "    def put(self, key, value):\n        self.data[key] = value\n\n"
+        "    def delete(self, key):\n        del self.data[key]\n",
+        {
+            (ChangeType.MODIFY_METHOD, "Store.get"),
+            (ChangeType.ADD_METHOD, "Store.delete"),
+        },
+    ),
+    (
+        "def handler(event):\n    return event\n\nLIMIT = 10\n",
+        "@retry(times=3)\ndef handler(event):\n    return event\n\nLIMIT = 20\n",
+        {
+            (ChangeType.ADD_DECORATOR, "handler"),
+            (ChangeType.MODIFY_VARIABLE, "LIMIT"),
+        },
+    ),
+    (
+        "from typing import (\n    Any,\n    Optional,\n)\n\n"
+        "def f(x: Any) -> Optional[int]:\n    return x\n",
+        "from typing import Any, Optional\n\n"
+        "def f(x: Any) -> Optional[int]:\n    # identity\n    return x\n",
+        {
+            (ChangeType.FORMATTING_ONLY, "from typing import Any, Optional"),
+            (ChangeType.FORMATTING_ONLY, "f"),
+        },
+    ),
+    (
+        "class Old:\n    pass\n\ndef keep():\n    pass\n",
+        "def keep():\n    pass\n",
+        {(ChangeType.REMOVE_CLASS, "Old")},
+    ),
+]
+
+
+class TestParserBackedAnalysis:
+    """Tests for the ast-backed analyzer and its result cache."""
+
+    @staticmethod
+    def _found(analysis) -> set:
+        return {(c.change_type, c.target) for c in analysis.changes}
+
+    def test_corpus_matches_expected_changes(self):
+        """Parser-backed analysis reports exactly the expected changes."""
+        for before, after, expected in SEMANTIC_CORPUS:
+            analysis = analyze_with_parser("corpus.py", before, after, ".py")
+            assert self._found(analysis) == expected
+
+    def test_more_accurate_than_regex(self):
+        """The parser finds every change the regex analyzer finds, and more."""
+        parser_hits = regex_hits = total = 0
+        for before, after, expected in SEMANTIC_CORPUS:
+            total += len(expected)
+            parser_hits += len(
+                self._found(analyze_with_parser("c.py", before, after, ".py"))
+                & expected
+            )
+            regex_hits += len(
+                self._found(analyze_with_regex("c.py", before, after, ".py"))
+                & expected
+            )
+        assert parser_hits == total
+        assert regex_hits < parser_hits
+
+    def test_summary_fields(self):
+        """Summary sets reflect the symbol-level changes."""
+        before, after, _ = SEMANTIC_CORPUS[1]
+        analysis = analyze_with_parser("store.py", before, after, ".py")
+
+        assert analysis.functions_added == {"Store.delete"}
+        assert analysis.functions_modified == {"Store.get"}
+        assert analysis.classes_modified == {"Store"}
+        assert analysis.total_lines_changed == 5
+
+    def test_syntax_error_falls_back_to_regex(self):
+        """Unparsable Python is analyzed by the regex fallback."""
+        after = "import sys\ndef broken(:\n"
+        assert analyze_with_parser("x.py", "", after, ".py") is None
+
+        analysis = SemanticAnalyzer(cache=AnalysisCache()).analyze_diff(
+            "x.py", "", after
+        )
+        assert (ChangeType.ADD_IMPORT, "import sys") in self._found(analysis)
+
+    def test_cache_reuses_results(self):
+        """Repeated analysis of the same versions hits the cache."""
+        cache = AnalysisCache()
+        analyzer = SemanticAnalyzer(cache=cache)
+        before, after, expected = SEMANTIC_CORPUS[0]
+
+        first = analyzer.analyze_diff("a.py", before, after)
+        first.changes.clear()
+        second = analyzer.analyze_diff("b.py", before, after)
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert second.file_path == "b.py"
+        assert self._found(second) == expected
+
+    def test_content_hash_matches_git(self):
+        """Cache keys are git blob OIDs."""
+        assert content_hash("") == "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+
+    def test_register_parser(self, monkeypatch):
+        """Custom parsers plug in per extension."""
+        monkeypatch.setattr(parser_analyzer, "_PARSERS", dict(parser_analyzer._PARSERS))
+
+        def extract(source: str) -> dict:
+            return {
+                f"function:{name}": ExtractedElement("function", name, 1, 1, name)
+                for name in source.split()
+            }
+
+        register_parser([".words"], extract)
+        analysis = analyze_with_parser("f.words", "a b", "b c", ".words")
+
+        assert self._found(analysis) == {
+            (ChangeType.REMOVE_FUNCTION, "a"),
+            (ChangeType.ADD_FUNCTION, "c"),
+        }
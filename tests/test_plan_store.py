@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Tests for the Implementation Plan Store
+=======================================
+
+Tests core/plan_store.py:
+- mtime/size validated caching (no re-parse on unchanged files)
+- typed mutations with incrementally maintained aggregates
+- write coalescing and atomic writes
+- progress helpers reading through the store
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from core.plan_store import PLAN_FILE, PlanStore, build_subtask_graph
+from core.progress import count_subtasks, count_subtasks_detailed, get_next_subtask
+
+
+def make_plan(subtasks_per_phase: int = 2, phases: int = 2) -> dict:
+    return {
+        "feature": "Test",
+        "phases": [
+            {
+                "id": f"phase-{p}",
+                "name": f"Phase {p}",
+                "depends_on": [f"phase-{p - 1}"] if p > 1 else [],
+                "subtasks": [
+                    {
+                        "id": f"{p}.{s}",
+                        "description": f"Subtask {p}.{s}",
+                        "status": "pending",
+                    }
+                    for s in range(1, subtasks_per_phase + 1)
+                ],
+            }
+            for p in range(1, phases + 1)
+        ],
+    }
+
+
+def write_plan(spec_dir: Path, plan: dict) -> None:
+    (spec_dir / PLAN_FILE).write_text(json.dumps(plan, indent=2), encoding="utf-8")
+
+
+@pytest.fixture
+def spec_dir(temp_dir: Path) -> Path:
+    write_plan(temp_dir, make_plan())
+    yield temp_dir
+    PlanStore.clear_registry()
+
+
+class TestCaching:
+    """Tests for signature-validated caching."""
+
+    def test_shared_store_per_spec_dir(self, spec_dir: Path):
+        assert PlanStore.for_spec(spec_dir) is PlanStore.for_spec(spec_dir / ".")
+
+    def test_unchanged_file_is_parsed_once(self, spec_dir: Path):
+        store = PlanStore.for_spec(spec_dir)
+        for _ in range(20):
+            count_subtasks(spec_dir)
+            get_next_subtask(spec_dir)
+
+        assert store.stats["parses"] == 1
+
+    def test_external_edit_is_picked_up(self, spec_dir: Path):
+        assert count_subtasks(spec_dir) == (0, 4)
+
+        plan = make_plan()
+        plan["phases"][0]["subtasks"][0]["status"] = "completed"
+        write_plan(spec_dir, plan)
+
+        assert count_subtasks(spec_dir) == (1, 4)
+
+    def test_missing_and_invalid_plan(self, temp_dir: Path):
+        store = PlanStore.for_spec(temp_dir)
+        assert store.plan() is None
+        assert count_subtasks(temp_dir) == (0, 0)
+
+        (temp_dir / PLAN_FILE).write_text("{not json", encoding="utf-8")
+        assert store.plan() is None
+        with pytest.raises(json.JSONDecodeError):
+            store.plan(strict=True)
+        PlanStore.clear_registry()
+
+    def test_snapshot_is_private(self, spec_dir: Path):
+        store = PlanStore.for_spec(spec_dir)
+        snapshot = store.snapshot()
+        snapshot["phases"].clear()
+
+        assert len(store.plan()["phases"]) == 2
+
+
+class TestMutations:
+    """Tests for typed mutations and aggregates."""
+
+    def test_set_status_updates_counts_and_file(self, spec_dir: Path):
+        store = PlanStore.for_spec(spec_dir)
+        assert store.set_subtask_status("1.1", "completed", notes="done")
+        assert store.set_subtask_status("1.2", "failed")
+
+        assert count_subtasks_detailed(spec_dir) == {
+            "completed": 1,
+            "in_progress": 0,
+            "pending": 2,
+            "failed": 1,
+            "total": 4,
+        }
+        on_disk = json.loads((spec_dir / PLAN_FILE).read_text())
+        subtask = on_disk["phases"][0]["subtasks"][0]
+        assert subtask["status"] == "completed"
+        assert subtask["notes"] == "done"
+        assert "last_updated" in on_disk
+        # Our own writes do not trigger a re-parse
+        assert store.stats["parses"] == 1
+
+    def test_unknown_subtask(self, spec_dir: Path):
+        assert not PlanStore.for_spec(spec_dir).set_subtask_status("9.9", "completed")
+
+    def test_next_subtask_follows_dependencies(self, spec_dir: Path):
+        store = PlanStore.for_spec(spec_dir)
+        assert get_next_subtask(spec_dir)["id"] == "1.1"
+
+        store.set_subtask_status("1.1", "completed")
+        assert get_next_subtask(spec_dir)["id"] == "1.2"
+
+        store.set_subtask_status("1.2", "completed")
+        next_subtask = get_next_subtask(spec_dir)
+        assert next_subtask["id"] == "2.1"
+        assert next_subtask["phase_name"] == "Phase 2"
+
+    def test_batch_coalesces_writes(self, spec_dir: Path):
+        store = PlanStore.for_spec(spec_dir)
+        with store.batch():
+            store.set_subtask_status("1.1", "completed")
+            store.set_subtask_status("1.2", "in_progress")
+            store.update(lambda plan: plan.update(qa_signoff={"status": "pending"}))
+            # Reads inside the batch see unflushed changes
+            assert count_subtasks(spec_dir) == (1, 4)
+
+        assert store.stats["writes"] == 1
+        on_disk = json.loads((spec_dir / PLAN_FILE).read_text())
+        assert on_disk["qa_signoff"] == {"status": "pending"}
+        assert on_disk["phases"][0]["subtasks"][1]["status"] == "in_progress"
+
+    def test_update_recomputes_aggregates(self, spec_dir: Path):
+        store = PlanStore.for_spec(spec_dir)
+        store.update(lambda plan: plan["phases"].pop())
+
+        assert count_subtasks(spec_dir) == (0, 2)
+
+    def test_replace_writes_atomically(self, spec_dir: Path):
+        store = PlanStore.for_spec(spec_dir)
+        inode = os.stat(spec_dir / PLAN_FILE).st_ino
+
+        store.replace(make_plan(subtasks_per_phase=1, phases=1))
+
+        assert count_subtasks(spec_dir) == (0, 1)
+        # Written via temp file + os.replace
+        assert os.stat(spec_dir / PLAN_FILE).st_ino != inode
+
+    def test_replace_keeps_its_own_copy(self, spec_dir: Path):
+        store = PlanStore.for_spec(spec_dir)
+        plan = make_plan(subtasks_per_phase=1, phases=1)
+        store.replace(plan)
+
+        plan["phases"][0]["subtasks"][0]["status"] = "completed"
+
+        assert count_subtasks(spec_dir) == (0, 1)
+        assert store.snapshot()["phases"][0]["subtasks"][0]["status"] == "pending"
+
+    def test_legacy_chunks_are_counted(self, spec_dir: Path):
+        plan = make_plan(subtasks_per_phase=2, phases=1)
+        plan["phases"][0]["chunks"] = plan["phases"][0].pop("subtasks")
+        plan["phases"][0]["chunks"][0]["status"] = "completed"
+        write_plan(spec_dir, plan)
+
+        assert count_subtasks(spec_dir) == (1, 2)
+
+
+class TestSubtaskGraph:
+    """Tests for the subtask dependency graph."""
+
+    def test_phase_dependencies_and_serial_order(self):
+        plan = make_plan(subtasks_per_phase=2, phases=3)
+        plan["phases"][1]["parallel_safe"] = True
+
+        graph = build_subtask_graph(plan)
+
+        assert list(graph) == ["1.1", "1.2", "2.1", "2.2", "3.1", "3.2"]
+        # Phase 1 is not parallel_safe: its subtasks run in order
+        assert graph["1.1"].depends_on == set()
+        assert graph["1.2"].depends_on == {"1.1"}
+        # Parallel-safe phase 2 only waits for phase 1
+        assert graph["2.1"].depends_on == {"1.1", "1.2"}
+        assert graph["2.2"].depends_on == {"1.1", "1.2"}
+        assert graph["2.1"].parallel_safe
+        assert graph["3.2"].depends_on == {"2.1", "2.2", "3.1"}
+
+    def test_unknown_dependency_blocks_phase(self):
+        plan = make_plan(subtasks_per_phase=1, phases=2)
+        plan["phases"][1]["depends_on"] = "phase-9"
+
+        graph = build_subtask_graph(plan)
+
+        assert not graph["1.1"].blocked
+        assert graph["2.1"].blocked
+
+
+class TestReadCost:
+    """Cached reads must not scale with plan size."""
+
+    def _per_call(self, spec_dir: Path, subtasks: int) -> float:
+        write_plan(spec_dir, make_plan(subtasks_per_phase=subtasks // 5, phases=5))
+        count_subtasks(spec_dir)  # Warm the cache
+        calls = 300
+        start = time.perf_counter()
+        for _ in range(calls):
+            count_subtasks(spec_dir)
+            count_subtasks_detailed(spec_dir)
+        return (time.perf_counter() - start) / calls
+
+    def test_read_cost_independent_of_plan_size(self, temp_dir: Path):
+        small_dir = temp_dir / "small"
+        large_dir = temp_dir / "large"
+        small_dir.mkdir()
+        large_dir.mkdir()
+
+        small = self._per_call(small_dir, 10)
+        large = self._per_call(large_dir, 500)
+
+        # A full parse of the 500-subtask plan would be ~50x the small one
+        assert large < small * 5 + 1e-4
+        assert PlanStore.for_spec(large_dir).stats["parses"] == 1
+        PlanStore.clear_registry()
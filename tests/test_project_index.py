@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for the Project Index Service
+===================================
+
+Covers core/project_index.py: parsing once per file change, typed
+accessors and memoized views, the optional marshal side-cache, and
+load_project_index() on top of it.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from core.project_index import ProjectIndex
+from prompts_pkg.project_context import load_project_index
+
+INDEX = {
+    "project_type": "monorepo",
+    "services": {
+        "web": {
+            "language": "typescript",
+            "framework": "nextjs",
+            "dependencies": ["next", "react"],
+            "dev_dependencies": ["vitest"],
+        },
+        "api": {
+            "language": "python",
+            "framework": "fastapi",
+            "dependencies": ["fastapi", "sqlalchemy"],
+            "api": {"routes": ["/health"]},
+        },
+    },
+    "infrastructure": {"docker_compose": ["docker-compose.yml"]},
+}
+
+
+def write_index(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def index_file(temp_dir: Path) -> Path:
+    path = temp_dir / ".auto-claude" / "project_index.json"
+    write_index(path, INDEX)
+    yield path
+    ProjectIndex.invalidate()
+
+
+class TestProjectIndex:
+    def test_parses_once_until_file_changes(self, index_file: Path):
+        index = ProjectIndex(index_file, persist=False)
+
+        assert index.data() == INDEX
+        assert index.services()["web"]["framework"] == "nextjs"
+        assert index.stats["parses"] == 1
+
+        write_index(index_file, {**INDEX, "project_type": "single"})
+        bump_mtime(index_file)
+
+        assert index.section("project_type") == "single"
+        assert index.stats["parses"] == 2
+
+    def test_missing_and_corrupt_files_are_empty(self, temp_dir: Path):
+        index = ProjectIndex(temp_dir / "project_index.json", persist=False)
+        assert not index.exists()
+        assert index.data() == {}
+
+        (temp_dir / "project_index.json").write_text("{not json")
+        assert not index.exists()
+        assert index.services() == {}
+        assert index.capabilities()["is_nextjs"] is False
+
+    def test_accessors(self, index_file: Path):
+        index = ProjectIndex(index_file, persist=False)
+
+        assert index.service("api")["language"] == "python"
+        assert index.service("missing") is None
+        assert index.dependencies("web") == {"next", "react", "vitest"}
+        assert "fastapi" in index.dependencies()
+
+    def test_list_format_services(self, temp_dir: Path):
+        path = temp_dir / "project_index.json"
+        write_index(path, {"services": [{"name": "cli"}, {"language": "go"}, "x"]})
+
+        services = ProjectIndex(path, persist=False).services()
+
+        assert services == {"cli": {"name": "cli"}, "1": {"language": "go"}}
+
+    def test_derived_views_are_memoized_copies(self, index_file: Path, monkeypatch):
+        from prompts_pkg import project_context
+
+        calls = []
+        detect = project_context.detect_project_capabilities
+
+        def counting_detect(project_index):
+            calls.append(1)
+            return detect(project_index)
+
+        monkeypatch.setattr(
+            project_context, "detect_project_capabilities", counting_detect
+        )
+        index = ProjectIndex(index_file, persist=False)
+
+        capabilities = index.capabilities()
+        capabilities["is_electron"] = True
+        tools = index.mcp_tools()
+
+        assert calls == [1]
+        assert index.capabilities()["is_electron"] is False
+        assert capabilities["is_nextjs"] and capabilities["has_database"]
+        assert "mcp_tools/api_validation.md" in tools
+
+    def test_shared_instance_per_file(self, temp_dir: Path, index_file: Path):
+        index = ProjectIndex.for_project(temp_dir)
+
+        assert ProjectIndex.for_file(index_file) is index
+        ProjectIndex.invalidate(temp_dir)
+        assert ProjectIndex.for_project(temp_dir) is not index
+
+
+class TestSidecar:
+    def test_second_process_skips_json_and_decodes_lazily(self, index_file: Path):
+        ProjectIndex(index_file, persist=True).data()
+        assert (index_file.parent / ".project_index.cache").exists()
+
+        # A fresh instance stands in for a new process
+        index = ProjectIndex(index_file, persist=True)
+
+        assert index.services()["api"]["framework"] == "fastapi"
+        assert index.stats["parses"] == 0
+        assert index.stats["sidecar_hits"] == 1
+        assert index.stats["decodes"] == 1
+        assert index.data() == INDEX
+
+    def test_touched_file_reuses_sidecar_by_hash(self, index_file: Path):
+        ProjectIndex(index_file, persist=True).data()
+        bump_mtime(index_file)
+
+        index = ProjectIndex(index_file, persist=True)
+
+        assert index.data() == INDEX
+        assert index.stats["parses"] == 0
+
+    def test_changed_content_is_reparsed(self, index_file: Path):
+        ProjectIndex(index_file, persist=True).data()
+        write_index(index_file, {**INDEX, "project_type": "single"})
+        bump_mtime(index_file)
+
+        index = ProjectIndex(index_file, persist=True)
+
+        assert index.section("project_type") == "single"
+        assert index.stats["parses"] == 1
+
+    def test_corrupt_sidecar_is_ignored(self, index_file: Path):
+        (index_file.parent / ".project_index.cache").write_bytes(b"ACPI1\ngarbage")
+
+        index = ProjectIndex(index_file, persist=True)
+
+        assert index.data() == INDEX
+        assert index.stats["parses"] == 1
+
+    def test_disabled_by_default(self, index_file: Path, monkeypatch):
+        monkeypatch.delenv("AUTO_CLAUDE_INDEX_SIDECAR", raising=False)
+
+        ProjectIndex(index_file).data()
+
+        assert not (index_file.parent / ".project_index.cache").exists()
+
+
+class TestLoadProjectIndex:
+    def test_returns_shared_index(self, temp_dir: Path, index_file: Path):
+        first = load_project_index(temp_dir)
+
+        assert first == INDEX
+        assert load_project_index(temp_dir) is first
+
+    def test_missing_index(self, temp_dir: Path):
+        assert load_project_index(temp_dir) == {}
@@ -11,9 +11,11 @@ Tests cover:
 """
 
 import json
+import os
 import tempfile
+import time
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
@@ -442,53 +444,231 @@ class TestSASTIntegration:
         result = scanner._check_bandit_available()
         assert isinstance(result, bool)
 
-    @patch("subprocess.run")
-    def test_bandit_output_parsing(self, mock_run, scanner, python_project):
+    @patch("analysis.security_scanner.tool_available", return_value=True)
+    @patch.object(SecurityScanner, "_run_tool")
+    def test_bandit_output_parsing(self, mock_run, _, scanner, python_project):
         """Test parsing Bandit JSON output."""
-        mock_run.return_value = MagicMock(
-            stdout=json.dumps({
-                "results": [
-                    {
-                        "issue_severity": "HIGH",
-                        "issue_text": "Test issue",
-                        "filename": "app.py",
-                        "line_number": 10,
-                        "issue_cwe": {"id": "CWE-89"},
-                    }
-                ]
-            }),
-            returncode=0,
-        )
+        mock_run.return_value = json.dumps({
+            "results": [
+                {
+                    "issue_severity": "HIGH",
+                    "issue_text": "Test issue",
+                    "filename": "app.py",
+                    "line_number": 10,
+                    "issue_cwe": {"id": "CWE-89"},
+                }
+            ]
+        })
 
         result = SecurityScanResult()
-        scanner._bandit_available = True
 
         scanner._run_bandit(python_project, result)
 
-        # If bandit ran (may be skipped if not available)
-        # Check that parsing works
-        if result.vulnerabilities:
-            assert result.vulnerabilities[0].severity == "high"
-            assert result.vulnerabilities[0].source == "bandit"
+        assert result.vulnerabilities[0].severity == "high"
+        assert result.vulnerabilities[0].source == "bandit"
 
-    @patch("subprocess.run")
-    def test_npm_audit_output_parsing(self, mock_run, scanner, node_project):
+    @patch("analysis.security_scanner.tool_available", return_value=True)
+    @patch.object(SecurityScanner, "_run_tool")
+    def test_npm_audit_output_parsing(self, mock_run, _, node_project):
         """Test parsing npm audit JSON output."""
-        mock_run.return_value = MagicMock(
-            stdout=json.dumps({
-                "vulnerabilities": {
-                    "lodash": {
-                        "severity": "critical",
-                        "via": [{"title": "Prototype Pollution"}],
-                    }
+        scanner = SecurityScanner(use_cache=False)
+        mock_run.return_value = json.dumps({
+            "vulnerabilities": {
+                "lodash": {
+                    "severity": "critical",
+                    "via": [{"title": "Prototype Pollution"}],
                 }
-            }),
-            returncode=0,
-        )
+            }
+        })
 
         result = SecurityScanResult()
         scanner._run_npm_audit(node_project, result)
 
-        # Check parsing worked
-        if result.vulnerabilities:
-            assert any(v.source == "npm_audit" for v in result.vulnerabilities)
+        assert any(v.source == "npm_audit" for v in result.vulnerabilities)
+
+
+# =============================================================================
+# CONCURRENT TOOL EXECUTION TESTS
+# =============================================================================
+
+FAKE_TOOL = """#!{python}
+import json, os, sys, time
+with open({log!r}, "a") as f:
+    f.write(json.dumps([os.path.basename(sys.argv[0]), *sys.argv[1:]]) + "\\n")
+time.sleep({delay})
+print({output!r})
+"""
+
+BANDIT_OUTPUT = {
+    "results": [
+        {
+            "issue_severity": "HIGH",
+            "issue_text": "Use of exec",
+            "filename": "app.py",
+            "line_number": 1,
+            "issue_cwe": {"id": 78},
+        }
+    ]
+}
+NPM_OUTPUT = {"vulnerabilities": {"lodash": {"severity": "critical", "via": []}}}
+PIP_OUTPUT = [{"name": "flask", "fix_versions": ["2.3.2"], "description": "XSS"}]
+
+
+@pytest.fixture
+def fake_tools(temp_dir, monkeypatch):
+    """Install fake bandit/npm/pip-audit executables that log their calls."""
+    from analysis.security_scanner import clear_tool_probes
+
+    bin_dir = temp_dir / "bin"
+    bin_dir.mkdir()
+    log = temp_dir / "calls.jsonl"
+
+    def install(name, output, delay=0.0):
+        tool = bin_dir / name
+        tool.write_text(
+            FAKE_TOOL.format(
+                python=sys.executable,
+                log=str(log),
+                delay=delay,
+                output=json.dumps(output),
+            )
+        )
+        tool.chmod(0o755)
+
+    def calls():
+        if not log.exists():
+            return []
+        return [json.loads(line) for line in log.read_text().splitlines()]
+
+    install.calls = calls
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.delenv("AUTO_CLAUDE_NO_DISCOVERY_CACHE", raising=False)
+    clear_tool_probes()
+    yield install
+    clear_tool_probes()
+
+
+@pytest.fixture
+def mixed_project(temp_dir):
+    """A Python + Node project."""
+    project = temp_dir / "project"
+    project.mkdir()
+    (project / "requirements.txt").write_text("flask==2.0.0\n")
+    (project / "app.py").write_text("exec(input())\n")
+    (project / "package.json").write_text(json.dumps({"name": "demo"}))
+    (project / "package-lock.json").write_text("{}")
+    return project
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Fake tools are shell scripts")
+class TestConcurrentTools:
+    """Tests for concurrent tool execution, timeouts and result caching."""
+
+    def scan(self, project, **kwargs):
+        scanner = SecurityScanner(timeouts=kwargs.pop("timeouts", None))
+        return scanner.scan(project, run_secrets=False, **kwargs)
+
+    def test_tools_run_concurrently(self, fake_tools, mixed_project):
+        fake_tools("bandit", BANDIT_OUTPUT, delay=0.6)
+        fake_tools("npm", NPM_OUTPUT, delay=0.6)
+        fake_tools("pip-audit", PIP_OUTPUT, delay=0.6)
+
+        start = time.monotonic()
+        result = self.scan(mixed_project)
+        elapsed = time.monotonic() - start
+
+        assert [v.source for v in result.vulnerabilities] == [
+            "bandit",
+            "npm_audit",
+            "pip_audit",
+        ]
+        assert result.should_block_qa
+        assert elapsed < 1.5
+
+    def test_timed_out_tool_keeps_other_results(self, fake_tools, mixed_project):
+        fake_tools("bandit", BANDIT_OUTPUT)
+        fake_tools("npm", NPM_OUTPUT, delay=30)
+        fake_tools("pip-audit", PIP_OUTPUT)
+
+        start = time.monotonic()
+        result = self.scan(mixed_project, timeouts={"npm_audit": 0.5})
+
+        assert time.monotonic() - start < 10
+        assert "npm audit timed out" in result.scan_errors
+        assert {v.source for v in result.vulnerabilities} == {"bandit", "pip_audit"}
+
+    def test_scan_deadline_cancels_running_tools(self, fake_tools, mixed_project):
+        fake_tools("bandit", BANDIT_OUTPUT)
+        fake_tools("npm", NPM_OUTPUT)
+        fake_tools("pip-audit", PIP_OUTPUT, delay=30)
+
+        start = time.monotonic()
+        result = self.scan(mixed_project, timeout=1.0)
+
+        assert time.monotonic() - start < 10
+        assert "pip-audit cancelled after 1.0s" in result.scan_errors
+        assert {v.source for v in result.vulnerabilities} == {"bandit", "npm_audit"}
+
+    def test_audits_cached_by_lockfile(self, fake_tools, mixed_project):
+        fake_tools("npm", NPM_OUTPUT)
+        fake_tools("pip-audit", PIP_OUTPUT)
+
+        first = self.scan(mixed_project, run_sast=False)
+        (mixed_project / "app.py").write_text("print('unrelated change')\n")
+        second = self.scan(mixed_project, run_sast=False)
+
+        assert len(fake_tools.calls()) == 2
+        assert second.vulnerabilities == first.vulnerabilities
+
+        (mixed_project / "package-lock.json").write_text('{"lockfileVersion": 3}')
+        self.scan(mixed_project, run_sast=False)
+
+        tools = [call[0] for call in fake_tools.calls()]
+        # The first scan runs both audits concurrently, in either order
+        assert sorted(tools[:2]) == ["npm", "pip-audit"]
+        assert tools[2:] == ["npm"]
+
+    def test_bandit_scans_only_changed_python_files(self, fake_tools, temp_git_repo):
+        import subprocess
+
+        fake_tools("bandit", BANDIT_OUTPUT)
+        (temp_git_repo / "requirements.txt").write_text("flask\n")
+        (temp_git_repo / "old.py").write_text("x = 1\n")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, check=True)
+        subprocess.run(
+            ["git", "commit", "-qm", "base"], cwd=temp_git_repo, check=True
+        )
+        (temp_git_repo / "old.py").write_text("x = 2\n")
+        (temp_git_repo / "new.py").write_text("exec(input())\n")
+        (temp_git_repo / "notes.md").write_text("not python\n")
+
+        kwargs = {"run_dependency_audit": False, "base_ref": "HEAD"}
+        result = self.scan(temp_git_repo, **kwargs)
+        self.scan(temp_git_repo, **kwargs)
+
+        calls = fake_tools.calls()
+        assert len(calls) == 1
+        assert calls[0][1:3] == ["new.py", "old.py"]
+        assert result.vulnerabilities[0].source == "bandit"
+
+        (temp_git_repo / "new.py").write_text("eval(input())\n")
+        self.scan(temp_git_repo, **kwargs)
+
+        assert len(fake_tools.calls()) == 2
+
+    def test_availability_probed_once(self, fake_tools, mixed_project, monkeypatch):
+        import shutil
+
+        probes = []
+        which = shutil.which
+
+        def counting_which(name, *args, **kwargs):
+            probes.append(name)
+            return which(name, *args, **kwargs)
+
+        monkeypatch.setattr(shutil, "which", counting_which)
+
+        self.scan(mixed_project, run_dependency_audit=False)
+        self.scan(mixed_project, run_dependency_audit=False)
+
+        assert probes == ["bandit"]
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Tests for Service Health Probing
+================================
+
+Tests services/health.py and the orchestrator's health waiting against
+local sockets that start listening after configurable delays.
+"""
+
+import asyncio
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from services.health import (
+    HealthProbe,
+    ServiceTarget,
+    check_once,
+    wait_for_services,
+)
+from services.orchestrator import ServiceConfig, ServiceOrchestrator
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class DelayedListener:
+    """Starts listening on a port after a delay."""
+
+    def __init__(self, delay: float):
+        self.port = _free_port()
+        self.delay = delay
+        self.listening_at: float | None = None
+        self._sock: socket.socket | None = None
+        self._timer = threading.Timer(delay, self._listen)
+
+    def _listen(self) -> None:
+        sock = socket.socket()
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", self.port))
+        sock.listen(16)
+        self._sock = sock
+        self.listening_at = time.monotonic()
+
+    def start(self) -> "DelayedListener":
+        self._timer.start()
+        return self
+
+    def close(self) -> None:
+        self._timer.cancel()
+        if self._sock:
+            self._sock.close()
+
+
+@pytest.fixture
+def listeners():
+    created: list[DelayedListener] = []
+
+    def _make(delay: float) -> DelayedListener:
+        listener = DelayedListener(delay).start()
+        created.append(listener)
+        return listener
+
+    yield _make
+    for listener in created:
+        listener.close()
+
+
+def _tcp(listener: DelayedListener) -> HealthProbe:
+    return HealthProbe.tcp(listener.port, host="127.0.0.1")
+
+
+class TestProbes:
+    """Tests for single probe attempts."""
+
+    async def test_tcp_probe(self, listeners):
+        listener = listeners(0)
+        await asyncio.sleep(0.05)
+        assert await check_once(_tcp(listener))
+        assert not await check_once(HealthProbe.tcp(_free_port(), host="127.0.0.1"))
+
+    async def test_http_probe(self):
+        class _Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                self.send_response(200 if self.path == "/health" else 503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            assert await check_once(HealthProbe.http(f"{base}/health"))
+            assert not await check_once(HealthProbe.http(f"{base}/starting"))
+            assert await check_once(
+                HealthProbe.http(f"{base}/starting", expected_status=(503,))
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    async def test_command_probe(self):
+        assert await check_once(HealthProbe.cmd(f"{sys.executable} -c pass"))
+        assert not await check_once(
+            HealthProbe.cmd(f"{sys.executable} -c 'raise SystemExit(1)'")
+        )
+        assert not await check_once(HealthProbe.cmd("definitely-not-a-command-xyz"))
+
+
+class TestWaitForServices:
+    """Tests for concurrent, dependency-ordered waiting."""
+
+    async def test_probes_concurrently(self, listeners):
+        delays = [0.3, 0.3, 0.3, 0.3]
+        targets = [
+            ServiceTarget(f"svc{i}", _tcp(listeners(delay)))
+            for i, delay in enumerate(delays)
+        ]
+
+        start = time.monotonic()
+        results = await wait_for_services(targets, timeout=5)
+        elapsed = time.monotonic() - start
+
+        assert all(r.healthy for r in results.values())
+        # Serial 2s polling would take >= sum(delays); concurrent ~ max(delays)
+        assert elapsed < sum(delays)
+        for result in results.values():
+            assert 0.3 <= result.time_to_ready < 0.8
+            assert result.attempts > 1
+
+    async def test_dependents_wait_for_dependencies(self, listeners):
+        db = listeners(0.3)
+        api = listeners(0.0)
+        results = await wait_for_services(
+            [
+                ServiceTarget("api", _tcp(api), depends_on=["db"]),
+                ServiceTarget("db", _tcp(db)),
+            ],
+            timeout=5,
+        )
+
+        assert results["api"].healthy and results["db"].healthy
+        # api is already listening but only gets probed after db is up
+        assert results["api"].time_to_ready >= results["db"].time_to_ready
+        assert results["api"].waited_on_dependencies >= 0.3
+        assert results["api"].attempts == 1
+
+    async def test_failed_dependency_fails_dependents(self, listeners):
+        api = listeners(0.0)
+        never = HealthProbe.tcp(_free_port(), host="127.0.0.1")
+
+        results = await wait_for_services(
+            [
+                ServiceTarget("db", never),
+                ServiceTarget("api", _tcp(api), depends_on=["db"]),
+                ServiceTarget("worker", None, depends_on=["api"]),
+            ],
+            timeout=0.3,
+        )
+
+        assert not results["db"].healthy
+        assert "Not ready" in results["db"].error
+        assert not results["api"].healthy
+        assert results["api"].attempts == 0
+        assert "db" in results["api"].error
+        assert not results["worker"].healthy
+
+    async def test_cycle_and_unknown_dependencies(self, listeners):
+        ok = listeners(0.0)
+        results = await wait_for_services(
+            [
+                ServiceTarget("a", None, depends_on=["b"]),
+                ServiceTarget("b", None, depends_on=["a"]),
+                ServiceTarget("c", _tcp(ok), depends_on=["external"]),
+            ],
+            timeout=1,
+        )
+
+        assert results["a"].error == "Dependency cycle"
+        assert results["b"].error == "Dependency cycle"
+        assert results["c"].healthy
+
+    async def test_backoff_starts_small(self, listeners):
+        listener = listeners(0.1)
+        results = await wait_for_services([ServiceTarget("svc", _tcp(listener))], 5)
+
+        # 50ms first interval: ready well before a fixed 2s tick
+        assert results["svc"].time_to_ready < 0.5
+
+
+class TestOrchestratorHealth:
+    """Tests for ServiceOrchestrator health waiting."""
+
+    def test_wait_for_health_records_metrics(self, temp_dir: Path, listeners):
+        db, api = listeners(0.2), listeners(0.0)
+        orchestrator = ServiceOrchestrator(temp_dir)
+        orchestrator._services = [
+            ServiceConfig(name="api", port=api.port, depends_on=["db"]),
+            ServiceConfig(name="db", port=db.port),
+            ServiceConfig(name="docs", type="local"),
+        ]
+        # Probe the loopback listeners directly
+        orchestrator._health_probe = lambda s: (
+            HealthProbe.tcp(s.port, host="127.0.0.1") if s.port else None
+        )
+
+        assert orchestrator._wait_for_health(5)
+
+        health = orchestrator.last_health
+        assert set(health) == {"api", "db", "docs"}
+        assert health["api"].time_to_ready >= health["db"].time_to_ready >= 0.2
+        assert health["docs"].healthy
+
+    async def test_wait_for_health_inside_event_loop(self, temp_dir: Path):
+        orchestrator = ServiceOrchestrator(temp_dir)
+        orchestrator._services = [
+            ServiceConfig(name="check", health_check_command=f"{sys.executable} -c pass")
+        ]
+
+        assert orchestrator._wait_for_health(5)
+
+    def test_probe_selection(self, temp_dir: Path):
+        orchestrator = ServiceOrchestrator(temp_dir)
+
+        assert orchestrator._health_probe(ServiceConfig(name="x")) is None
+        assert orchestrator._health_probe(ServiceConfig(name="x", port=80)).kind == "tcp"
+        http = ServiceConfig(
+            name="x",
+            port=80,
+            health_check_type="http",
+            health_check_url="http://localhost:80/health",
+        )
+        assert orchestrator._health_probe(http).kind == "http"
+        cmd = ServiceConfig(name="x", port=80, health_check_command="true")
+        assert orchestrator._health_probe(cmd).kind == "command"
+
+    def test_parses_compose_depends_on(self, temp_dir: Path):
+        pytest.importorskip("yaml")
+        (temp_dir / "docker-compose.yml").write_text(
+            "services:\n"
+            "  db:\n    image: postgres\n"
+            "  cache:\n    image: redis\n"
+            "  api:\n    image: api\n    depends_on: [db]\n"
+            "  worker:\n    image: worker\n"
+            "    depends_on:\n      db:\n        condition: service_healthy\n"
+            "      cache:\n        condition: service_started\n"
+        )
+
+        services = {s.name: s for s in ServiceOrchestrator(temp_dir).get_services()}
+
+        assert services["api"].depends_on == ["db"]
+        assert services["worker"].depends_on == ["db", "cache"]
+        assert services["db"].depends_on == []
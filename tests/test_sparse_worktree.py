@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Tests for Sparse Spec Worktrees
+===============================
+
+Tests the core/sparse_worktree.py module and sparse worktree creation:
+- Seeding the sparse set from context.json and scoped services
+- Sparse creation through WorktreeManager
+- On-demand widening through the PreToolUse hook
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from core import sparse_worktree
+from core.sparse_worktree import (
+    collect_sparse_seed,
+    cone_directories,
+    get_cone_directories,
+    get_sparse_mode,
+    make_sparse_widening_hook,
+    widen_sparse_checkout,
+)
+from worktree import WorktreeManager
+
+
+@pytest.fixture
+def monorepo(temp_git_repo: Path) -> Path:
+    """A git repo with a few service directories."""
+    for path in (
+        "services/api/app.py",
+        "services/api/tests/test_app.py",
+        "services/web/index.ts",
+        "libs/shared/util.py",
+        "docs/guide.md",
+    ):
+        file_path = temp_git_repo / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(f"# {path}\n")
+    subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Add services"], cwd=temp_git_repo, capture_output=True
+    )
+    return temp_git_repo
+
+
+class TestSparseSeed:
+    """Tests for computing the initial sparse set."""
+
+    def test_cone_directories_collapses_nested(self):
+        dirs = cone_directories(
+            ["README.md", "services/api/app.py", "services/api/tests/test_app.py"],
+            ["libs/shared/"],
+        )
+        assert dirs == ["libs/shared", "services/api"]
+
+    def test_seed_from_context_and_scoped_services(self, monorepo: Path, temp_dir: Path):
+        spec_dir = temp_dir / "spec"
+        spec_dir.mkdir()
+        (spec_dir / "context.json").write_text(
+            json.dumps(
+                {
+                    "scoped_services": ["web"],
+                    "files_to_modify": [{"path": "services/api/app.py"}],
+                    "files_to_reference": ["libs/shared/util.py"],
+                }
+            )
+        )
+        (spec_dir / "project_index.json").write_text(
+            json.dumps(
+                {"services": {"web": {"path": str(monorepo / "services" / "web")}}}
+            )
+        )
+
+        files, directories = collect_sparse_seed(monorepo, spec_dir)
+
+        assert files == ["services/api/app.py", "libs/shared/util.py"]
+        assert directories == ["services/web"]
+
+    def test_missing_context_gives_empty_seed(self, monorepo: Path, temp_dir: Path):
+        assert collect_sparse_seed(monorepo, temp_dir) == ([], [])
+
+    def test_mode_defaults_to_off(self, monkeypatch):
+        monkeypatch.delenv("AUTO_CLAUDE_SPARSE_WORKTREES", raising=False)
+        assert get_sparse_mode() == "off"
+        monkeypatch.setenv("AUTO_CLAUDE_SPARSE_WORKTREES", "true")
+        assert get_sparse_mode() == "on"
+
+
+class TestSparseWorktreeCreation:
+    """Tests for sparse worktrees created by WorktreeManager."""
+
+    def test_creates_sparse_worktree(self, monorepo: Path):
+        manager = WorktreeManager(monorepo)
+        manager.setup()
+
+        info = manager.create_worktree(
+            "sparse-spec", sparse_paths=(["services/api/app.py"], [])
+        )
+
+        assert (info.path / "README.md").exists()
+        assert (info.path / "services" / "api" / "app.py").exists()
+        assert not (info.path / "services" / "web").exists()
+        assert not (info.path / "docs").exists()
+        assert get_cone_directories(info.path) == {"services/api"}
+
+    def test_empty_seed_gives_full_checkout(self, monorepo: Path):
+        manager = WorktreeManager(monorepo)
+        manager.setup()
+
+        info = manager.create_worktree("full-spec", sparse_paths=([], []))
+
+        assert (info.path / "docs" / "guide.md").exists()
+        assert get_cone_directories(info.path) is None
+
+    def test_full_checkout_is_looked_up_once(self, monorepo: Path, monkeypatch):
+        manager = WorktreeManager(monorepo)
+        manager.setup()
+        info = manager.create_worktree("full-once", sparse_paths=([], []))
+        calls = []
+        run_git = sparse_worktree.run_git
+
+        def counting(args, *rest, **kwargs):
+            calls.append(args)
+            return run_git(args, *rest, **kwargs)
+
+        monkeypatch.setattr(sparse_worktree, "run_git", counting)
+
+        assert get_cone_directories(info.path) is None
+        assert get_cone_directories(info.path) is None
+        assert len(calls) == 1
+
+    def test_commits_from_sparse_worktree_keep_other_files(self, monorepo: Path):
+        manager = WorktreeManager(monorepo)
+        manager.setup()
+        info = manager.create_worktree(
+            "sparse-commit", sparse_paths=(["services/api/app.py"], [])
+        )
+
+        (info.path / "services" / "api" / "app.py").write_text("changed\n")
+        assert manager.commit_in_worktree("sparse-commit", "Change api")
+
+        changed = [path for _, path in manager.get_changed_files("sparse-commit")]
+        assert changed == ["services/api/app.py"]
+
+
+class TestSparseWidening:
+    """Tests for widening a sparse worktree on demand."""
+
+    @pytest.fixture
+    def sparse_worktree(self, monorepo: Path) -> Path:
+        manager = WorktreeManager(monorepo)
+        manager.setup()
+        return manager.create_worktree(
+            "widen-spec", sparse_paths=(["services/api/app.py"], [])
+        ).path
+
+    def test_widen_adds_missing_directory(self, sparse_worktree: Path):
+        assert widen_sparse_checkout(sparse_worktree, ["docs/guide.md"]) == ["docs"]
+        assert (sparse_worktree / "docs" / "guide.md").exists()
+        assert widen_sparse_checkout(sparse_worktree, ["services/api/x.py"]) == []
+
+    async def test_hook_widens_before_read(self, sparse_worktree: Path):
+        hook = make_sparse_widening_hook(sparse_worktree)
+
+        result = await hook(
+            {
+                "tool_name": "Read",
+                "tool_input": {"file_path": "./libs/shared/util.py"},
+                "cwd": str(sparse_worktree),
+            }
+        )
+
+        assert result == {}
+        assert (sparse_worktree / "libs" / "shared" / "util.py").exists()
+
+    async def test_hook_widens_search_directory(self, sparse_worktree: Path):
+        hook = make_sparse_widening_hook(sparse_worktree)
+
+        await hook(
+            {
+                "tool_name": "Grep",
+                "tool_input": {"pattern": "x", "path": str(sparse_worktree / "services")},
+            }
+        )
+
+        assert (sparse_worktree / "services" / "web" / "index.ts").exists()
+
+    async def test_hook_ignores_paths_outside_worktree(self, sparse_worktree: Path):
+        hook = make_sparse_widening_hook(sparse_worktree)
+
+        await hook({"tool_name": "Read", "tool_input": {"file_path": "/etc/hosts"}})
+        await hook({"tool_name": "Bash", "tool_input": {"command": "ls ../docs"}})
+
+        assert not (sparse_worktree / "docs").exists()
+
+    async def test_hook_widens_paths_in_bash_commands(self, sparse_worktree: Path):
+        hook = make_sparse_widening_hook(sparse_worktree)
+        command = (
+            "cat docs/guide.md && sed -i 's/a/b/' libs/shared/util.py; "
+            "pytest services/web/*.ts --tb=short install"
+        )
+
+        await hook(
+            {
+                "tool_name": "Bash",
+                "tool_input": {"command": command},
+                "cwd": str(sparse_worktree),
+            }
+        )
+
+        assert (sparse_worktree / "docs" / "guide.md").exists()
+        assert (sparse_worktree / "libs" / "shared" / "util.py").exists()
+        assert (sparse_worktree / "services" / "web" / "index.ts").exists()
+        # Words that are not tracked paths never widen the cone
+        assert get_cone_directories(sparse_worktree) == {
+            "docs",
+            "libs/shared",
+            "services/api",
+            "services/web",
+        }
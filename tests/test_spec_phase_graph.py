@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Tests for the Spec Phase Graph
+==============================
+
+Covers spec/pipeline/graph.py (phase dependencies, the concurrent phase
+scheduler and the completion journal) and the orchestrator's background
+phase summaries. Phases are stubs that sleep and record their start/end
+times.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+from spec.phases import PhaseResult
+from spec.pipeline import orchestrator as orchestrator_module
+from spec.pipeline.graph import (
+    PhaseJournal,
+    phase_ancestors,
+    phase_dependencies,
+    run_phase_graph,
+)
+from spec.pipeline.orchestrator import SpecOrchestrator
+
+PHASE_SECONDS = 0.1
+
+COMPLEX_PHASES = [
+    "historical_context",
+    "research",
+    "context",
+    "spec_writing",
+    "self_critique",
+    "planning",
+    "validation",
+]
+
+
+class StubPhases:
+    """Records (start, end) per phase; phases in `failing` fail."""
+
+    def __init__(self, failing: set[str] | None = None):
+        self.failing = failing or set()
+        self.times: dict[str, tuple[float, float]] = {}
+
+    async def __call__(self, name: str) -> PhaseResult:
+        start = time.perf_counter()
+        await asyncio.sleep(PHASE_SECONDS)
+        self.times[name] = (start, time.perf_counter())
+        success = name not in self.failing
+        return PhaseResult(name, success, [], [] if success else ["boom"], 0)
+
+    def overlap(self, a: str, b: str) -> bool:
+        (start_a, end_a), (start_b, end_b) = self.times[a], self.times[b]
+        return start_a < end_b and start_b < end_a
+
+
+class TestPhaseDependencies:
+    def test_independent_phases_have_no_edges(self):
+        deps = phase_dependencies(COMPLEX_PHASES)
+
+        assert deps["historical_context"] == set()
+        assert deps["research"] == set()
+        assert deps["context"] == set()
+        assert deps["spec_writing"] == {"historical_context", "research", "context"}
+        assert "spec_writing" in deps["self_critique"]
+        assert deps["validation"] >= {"planning", "self_critique"}
+
+    def test_ancestors_are_transitive(self):
+        deps = phase_dependencies(COMPLEX_PHASES)
+
+        assert phase_ancestors(deps, "research") == set()
+        assert phase_ancestors(deps, "planning") == {
+            "historical_context",
+            "research",
+            "context",
+            "spec_writing",
+            "self_critique",
+        }
+
+    def test_undeclared_phase_is_a_barrier(self):
+        deps = phase_dependencies(["research", "custom", "context"])
+
+        assert deps["custom"] == {"research"}
+        assert "custom" in deps["context"]
+
+
+class TestRunPhaseGraph:
+    async def test_independent_phases_overlap(self):
+        stub = StubPhases()
+
+        start = time.perf_counter()
+        results = await run_phase_graph(COMPLEX_PHASES, stub)
+        elapsed = time.perf_counter() - start
+
+        assert all(r.success for r in results)
+        assert stub.overlap("historical_context", "research")
+        assert stub.overlap("research", "context")
+        # spec_writing starts only after all three have finished
+        writing_start = stub.times["spec_writing"][0]
+        for name in ("historical_context", "research", "context"):
+            assert stub.times[name][1] <= writing_start
+        assert not stub.overlap("spec_writing", "self_critique")
+        # Five levels instead of seven phases in a row
+        assert elapsed < PHASE_SECONDS * len(COMPLEX_PHASES)
+
+    async def test_failure_stops_dependents(self):
+        stub = StubPhases(failing={"context"})
+
+        results = await run_phase_graph(COMPLEX_PHASES, stub)
+
+        # The concurrently running siblings finish; nothing after them starts
+        assert sorted(r.phase for r in results) == [
+            "context",
+            "historical_context",
+            "research",
+        ]
+        assert [r.phase for r in results if not r.success] == ["context"]
+        assert "spec_writing" not in stub.times
+
+    async def test_running_phases_are_cancelled_and_awaited(self):
+        cleaned_up = []
+
+        async def run_phase(name: str) -> PhaseResult:
+            if name == "research":
+                raise RuntimeError("boom")
+            try:
+                await asyncio.sleep(10)
+            finally:
+                await asyncio.sleep(0)
+                cleaned_up.append(name)
+            return PhaseResult(name, True, [], [], 0)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await run_phase_graph(["historical_context", "research"], run_phase)
+
+        # The sibling finished its cleanup before run_phase_graph returned
+        assert cleaned_up == ["historical_context"]
+
+
+class TestPhaseJournal:
+    def test_records_and_resumes(self, temp_dir: Path):
+        (temp_dir / "research.json").write_text("{}")
+        journal = PhaseJournal(temp_dir)
+        journal.record(
+            PhaseResult("research", True, [str(temp_dir / "research.json")], [], 1)
+        )
+        journal.record_summary("research", "- use the v2 API")
+
+        reloaded = PhaseJournal(temp_dir)
+
+        assert reloaded.completed(COMPLEX_PHASES) == {"research"}
+        assert reloaded.result("research").output_files == [
+            str(temp_dir / "research.json")
+        ]
+        assert reloaded.summaries() == {"research": "- use the v2 API"}
+
+    def test_missing_outputs_or_no_outputs_rerun(self, temp_dir: Path):
+        (temp_dir / "context.json").write_text("{}")
+        journal = PhaseJournal(temp_dir)
+        journal.record(
+            PhaseResult("context", True, [str(temp_dir / "context.json")], [], 0)
+        )
+        journal.record(PhaseResult("validation", True, [], [], 0))
+        journal.record(PhaseResult("planning", False, [], ["failed"], 3))
+
+        (temp_dir / "context.json").unlink()
+        reloaded = PhaseJournal(temp_dir)
+
+        assert not reloaded.is_completed("context")
+        assert not reloaded.is_completed("validation")
+        assert not reloaded.is_completed("planning")
+
+    def test_corrupt_journal_starts_over(self, temp_dir: Path):
+        (temp_dir / "pipeline_journal.json").write_text("{not json")
+        assert PhaseJournal(temp_dir).completed(COMPLEX_PHASES) == set()
+
+
+@pytest.fixture
+def orchestrator(temp_dir: Path, monkeypatch):
+    calls: list[str] = []
+
+    async def slow_summary(phase_name, phase_output, **kwargs):
+        calls.append(phase_name)
+        await asyncio.sleep(PHASE_SECONDS)
+        return f"summary of {phase_name}"
+
+    monkeypatch.setattr(orchestrator_module, "summarize_phase_output", slow_summary)
+    spec_dir = temp_dir / ".auto-claude" / "specs" / "001-demo"
+    orch = SpecOrchestrator(temp_dir, "demo task", spec_dir=spec_dir)
+    orch.summary_calls = calls
+    return orch
+
+
+class TestBackgroundSummaries:
+    async def test_only_dependents_wait_for_summary(self, orchestrator):
+        (orchestrator.spec_dir / "requirements.json").write_text('{"a": 1}')
+        orchestrator._phase_ancestors = {
+            "research": set(),
+            "spec_writing": {"requirements"},
+        }
+
+        start = time.perf_counter()
+        orchestrator._start_phase_summary("requirements")
+        assert await orchestrator._summaries_for("research") == {}
+        assert time.perf_counter() - start < PHASE_SECONDS
+
+        summaries = await orchestrator._summaries_for("spec_writing")
+        assert summaries == {"requirements": "summary of requirements"}
+        assert time.perf_counter() - start >= PHASE_SECONDS
+
+    async def test_unknown_phase_waits_for_all(self, orchestrator):
+        (orchestrator.spec_dir / "requirements.json").write_text('{"a": 1}')
+        (orchestrator.spec_dir / "research.json").write_text('{"b": 2}')
+        orchestrator._start_phase_summary("requirements")
+        orchestrator._start_phase_summary("research")
+
+        summaries = await orchestrator._summaries_for(None)
+
+        assert set(summaries) == {"requirements", "research"}
+
+    async def test_summaries_are_journaled(self, orchestrator):
+        (orchestrator.spec_dir / "requirements.json").write_text('{"a": 1}')
+        orchestrator._start_phase_summary("requirements")
+        await orchestrator._drain_phase_summaries()
+
+        journal = PhaseJournal(orchestrator.spec_dir)
+        assert journal.summaries() == {"requirements": "summary of requirements"}
+
+    async def test_phase_without_outputs_is_not_summarized(self, orchestrator):
+        orchestrator._start_phase_summary("validation")
+        await orchestrator._drain_phase_summaries()
+
+        assert orchestrator.summary_calls == []
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Tests for the Incremental Spec Sync
+===================================
+
+Covers core.spec_sync.sync_tree() and the sync_spec_to_source() wrapper
+that mirrors a worktree's spec directory into the main project.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from agents.utils import sync_spec_to_source
+from core.spec_sync import MANIFEST_FILE, clear_manifest_cache, sync_tree
+
+
+@pytest.fixture
+def dirs(temp_dir: Path):
+    """(worktree spec dir, main project spec dir) with a few spec files."""
+    source = temp_dir / "worktree" / "spec"
+    target = temp_dir / "main" / "spec"
+    (source / "memory").mkdir(parents=True)
+    (source / "spec.md").write_text("# Spec\n")
+    (source / "build-progress.txt").write_text("Session 1\n" * 2000)
+    (source / "memory" / "patterns.md").write_text("- use dataclasses\n")
+    yield source, target
+    clear_manifest_cache()
+
+
+def tree(root: Path) -> dict[str, bytes]:
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in root.rglob("*")
+        if path.is_file() and path.name != MANIFEST_FILE
+    }
+
+
+def bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestSyncTree:
+    def test_first_sync_copies_everything(self, dirs):
+        source, target = dirs
+
+        result = sync_tree(source, target)
+
+        assert sorted(result.copied) == [
+            "build-progress.txt",
+            "memory/patterns.md",
+            "spec.md",
+        ]
+        assert tree(target) == tree(source)
+        # Timestamps are preserved like shutil.copy2
+        assert (target / "spec.md").stat().st_mtime_ns == (
+            source / "spec.md"
+        ).stat().st_mtime_ns
+
+    def test_unchanged_files_are_not_rewritten(self, dirs):
+        source, target = dirs
+        sync_tree(source, target)
+        inode = (target / "build-progress.txt").stat().st_ino
+
+        result = sync_tree(source, target)
+
+        assert not result.changed
+        assert result.unchanged == 3
+        assert result.bytes_written == 0
+        assert (target / "build-progress.txt").stat().st_ino == inode
+
+    def test_appended_file_copies_only_the_tail(self, dirs):
+        source, target = dirs
+        sync_tree(source, target)
+        inode = (target / "build-progress.txt").stat().st_ino
+
+        with open(source / "build-progress.txt", "a") as f:
+            f.write("Session 2\n")
+        result = sync_tree(source, target)
+
+        assert result.appended == ["build-progress.txt"]
+        assert result.copied == []
+        assert result.bytes_written == len("Session 2\n")
+        # Appended in place rather than replaced
+        assert (target / "build-progress.txt").stat().st_ino == inode
+        assert tree(target) == tree(source)
+
+    def test_rewritten_prefix_is_copied_in_full(self, dirs):
+        source, target = dirs
+        sync_tree(source, target)
+
+        log = source / "build-progress.txt"
+        log.write_text("Session 0\n" + log.read_text() + "Session 2\n")
+        result = sync_tree(source, target)
+
+        assert result.appended == []
+        assert result.copied == ["build-progress.txt"]
+        assert tree(target) == tree(source)
+
+    def test_mid_file_edit_with_growth_is_copied_in_full(self, dirs):
+        source, target = dirs
+        sync_tree(source, target)
+
+        # Same-length edit far from both ends, then an append
+        log = source / "build-progress.txt"
+        content = log.read_text()
+        middle = len(content) // 2
+        log.write_text(
+            content[:middle] + "Session X\n" + content[middle + 10 :] + "Session 2\n"
+        )
+        result = sync_tree(source, target)
+
+        assert result.appended == []
+        assert result.copied == ["build-progress.txt"]
+        assert tree(target) == tree(source)
+
+    def test_identical_rewrite_keeps_target(self, dirs):
+        source, target = dirs
+        sync_tree(source, target)
+        inode = (target / "spec.md").stat().st_ino
+
+        bump_mtime(source / "spec.md")
+        result = sync_tree(source, target)
+
+        assert not result.changed
+        assert (target / "spec.md").stat().st_ino == inode
+        # The new source stat is remembered
+        assert sync_tree(source, target).unchanged == 3
+
+    def test_externally_modified_target_is_resynced(self, dirs):
+        source, target = dirs
+        sync_tree(source, target)
+
+        (target / "spec.md").write_text("edited in main project\n")
+        result = sync_tree(source, target)
+
+        assert result.copied == ["spec.md"]
+        assert (target / "spec.md").read_text() == "# Spec\n"
+
+    def test_new_and_changed_memory_files(self, dirs):
+        source, target = dirs
+        sync_tree(source, target)
+
+        (source / "memory" / "gotchas.md").write_text("- none yet\n")
+        (source / "memory" / "patterns.md").write_text("- use pathlib\n")
+        result = sync_tree(source, target)
+
+        assert sorted(result.copied) == ["memory/gotchas.md", "memory/patterns.md"]
+        assert tree(target) == tree(source)
+
+
+class TestDeletion:
+    def test_deletes_only_files_it_created(self, dirs):
+        source, target = dirs
+        target.mkdir(parents=True)
+        (target / "spec.md").write_text("main project copy\n")
+        (target / "notes.txt").write_text("only in main project\n")
+        sync_tree(source, target)
+
+        (source / "spec.md").unlink()
+        (source / "memory" / "patterns.md").unlink()
+        result = sync_tree(source, target)
+
+        assert result.deleted == ["memory/patterns.md"]
+        # Existed before the first sync: never deleted
+        assert (target / "spec.md").read_text() == "# Spec\n"
+        assert (target / "notes.txt").exists()
+
+    def test_keeps_created_file_modified_in_target(self, dirs):
+        source, target = dirs
+        sync_tree(source, target)
+
+        (target / "memory" / "patterns.md").write_text("edited\n")
+        (source / "memory" / "patterns.md").unlink()
+        result = sync_tree(source, target)
+
+        assert result.deleted == []
+        assert (target / "memory" / "patterns.md").read_text() == "edited\n"
+
+
+class TestSkippedEntries:
+    def test_skips_symlinks_and_temp_files(self, dirs, temp_dir):
+        source, target = dirs
+        outside = temp_dir / "secret.txt"
+        outside.write_text("secret\n")
+        (source / "link.txt").symlink_to(outside)
+        (source / ".task_logs_abc123.tmp").write_text("{")
+        (source / ".implementation_plan.json.tmp.xyz").write_text("{")
+
+        sync_tree(source, target)
+
+        assert sorted(tree(target)) == [
+            "build-progress.txt",
+            "memory/patterns.md",
+            "spec.md",
+        ]
+
+
+class TestManifest:
+    def test_manifest_survives_restart(self, dirs):
+        source, target = dirs
+        sync_tree(source, target)
+        assert (target / MANIFEST_FILE).exists()
+
+        clear_manifest_cache()
+        result = sync_tree(source, target)
+
+        assert not result.changed
+        assert result.unchanged == 3
+
+    def test_corrupt_manifest_resyncs(self, dirs):
+        source, target = dirs
+        sync_tree(source, target)
+
+        (target / MANIFEST_FILE).write_text("{not json")
+        clear_manifest_cache()
+        result = sync_tree(source, target)
+
+        assert len(result.copied) == 3
+        assert tree(target) == tree(source)
+
+    def test_sync_cost_follows_change_size(self, dirs):
+        source, target = dirs
+        with open(source / "task.log", "wb") as f:
+            f.write(os.urandom(4 * 1024 * 1024))
+        for i in range(200):
+            (source / "memory" / f"insight_{i:03d}.md").write_text(f"insight {i}\n")
+        sync_tree(source, target)
+
+        with open(source / "task.log", "ab") as f:
+            f.write(b"x" * 10_000)
+        (source / "memory" / "insight_007.md").write_text("updated\n")
+        result = sync_tree(source, target)
+
+        assert result.appended == ["task.log"]
+        assert result.copied == ["memory/insight_007.md"]
+        assert result.bytes_written == 10_000 + len("updated\n")
+        assert tree(target) == tree(source)
+
+
+class TestSyncSpecToSource:
+    def test_reports_whether_anything_changed(self, dirs):
+        source, target = dirs
+
+        assert sync_spec_to_source(source, target) is True
+        assert sync_spec_to_source(source, target) is False
+
+        (source / "qa_report.md").write_text("# QA\n")
+        assert sync_spec_to_source(source, target) is True
+        assert (target / "qa_report.md").read_text() == "# QA\n"
+
+    def test_same_directory_is_a_no_op(self, dirs):
+        source, _ = dirs
+        assert sync_spec_to_source(source, source) is False
+        assert sync_spec_to_source(source, None) is False
+        assert not (source / MANIFEST_FILE).exists()
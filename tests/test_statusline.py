@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Tests for the Status Line
+=========================
+
+Covers the pre-rendered status written by StatusManager and the fast path of
+ui/statusline.py that prints it without importing the UI package, including
+its import count and end-to-end latency as a separate process.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+# Some test modules replace "ui" with a mock while they are collected
+_mocked_ui = sys.modules.get("ui")
+if _mocked_ui is not None and not isinstance(_mocked_ui, ModuleType):
+    del sys.modules["ui"]
+from ui import statusline  # noqa: E402
+from ui.status import (  # noqa: E402
+    RENDERED_DIR,
+    BuildState,
+    StatusManager,
+    render_all,
+)
+
+if _mocked_ui is not None and not isinstance(_mocked_ui, ModuleType):
+    sys.modules["ui"] = _mocked_ui
+
+STATUSLINE = Path(__file__).parent.parent / "apps" / "backend" / "ui" / "statusline.py"
+
+
+@pytest.fixture
+def project(temp_dir: Path):
+    """A project with an active build's status written."""
+    manager = StatusManager(temp_dir)
+    manager.set_active("001-demo", BuildState.BUILDING)
+    manager.update_subtasks(completed=3, total=12)
+    manager.update_phase("Setup", 1, 3)
+    manager.flush()
+    yield temp_dir, manager
+    manager.clear()
+
+
+def run_main(capsys, *argv: str) -> str:
+    statusline.main(list(argv))
+    return capsys.readouterr().out
+
+
+def run_slow(capsys, *argv: str) -> str:
+    statusline._main_slow(list(argv))
+    return capsys.readouterr().out
+
+
+class TestPrerenderedStatus:
+    def test_write_renders_every_format(self, project):
+        project_dir, manager = project
+
+        rendered = render_all(manager.read())
+        for fmt, text in rendered.items():
+            content = (project_dir / RENDERED_DIR / fmt).read_text(encoding="utf-8")
+            assert content == f"001-demo\n{text}"
+        assert rendered["compact"] == "▣ 3/12 │ ◆ Setup → │ 25%"
+        assert rendered["compact.ascii"] == "# 3/12 | * Setup -> | 25%"
+
+    @pytest.mark.parametrize("fmt", ["compact", "full"])
+    def test_fast_path_matches_slow_path(self, project, capsys, fmt):
+        project_dir, _ = project
+        args = ("--format", fmt, "--project-dir", str(project_dir))
+
+        assert statusline.read_prerendered(fmt, None, str(project_dir)) is not None
+        assert run_main(capsys, *args) == run_slow(capsys, *args)
+
+    def test_json_is_the_status_file(self, project, capsys):
+        project_dir, _ = project
+
+        output = run_main(capsys, "-f", "json", "-p", str(project_dir))
+
+        assert output == (project_dir / ".auto-claude-status").read_text() + "\n"
+
+    def test_spec_filter(self, project, capsys):
+        project_dir, _ = project
+
+        assert run_main(capsys, "-s", "002-other", "-p", str(project_dir)) == ""
+        assert run_main(capsys, "-s", "001", "-p", str(project_dir)).startswith("▣")
+
+    def test_stale_rendered_file_falls_back(self, project):
+        project_dir, _ = project
+        rendered = project_dir / RENDERED_DIR / "compact"
+        st = rendered.stat()
+        os.utime(rendered, ns=(st.st_atime_ns, st.st_mtime_ns - 10**9))
+
+        assert statusline.read_prerendered("compact", None, str(project_dir)) is None
+
+    def test_no_status_file_is_inactive(self, temp_dir: Path, capsys):
+        assert run_main(capsys, "-p", str(temp_dir)) == ""
+        assert run_main(capsys, "-f", "full", "-p", str(temp_dir)) == (
+            "No active build\n"
+        )
+
+    def test_clear_removes_rendered_files(self, project):
+        project_dir, manager = project
+
+        manager.clear()
+
+        assert not list((project_dir / RENDERED_DIR).iterdir())
+
+    def test_unsupported_arguments_use_slow_path(self):
+        assert statusline._parse_fast_args(["--help"]) is None
+        assert statusline._parse_fast_args(["--format", "xml"]) is None
+        assert statusline._parse_fast_args(["-f=full", "--spec", "001"]) == (
+            "full",
+            "001",
+            None,
+        )
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Unix domain sockets only")
+class TestStatusSocket:
+    def test_serves_current_status(self, project):
+        project_dir, manager = project
+        assert manager.start_socket_server(force=True)
+        for fmt in ("compact", "compact.ascii", "full", "json"):
+            (project_dir / RENDERED_DIR / fmt).unlink()
+
+        manager.update_subtasks(completed=6)
+        manager.flush()
+        for fmt in ("compact", "compact.ascii", "full", "json"):
+            (project_dir / RENDERED_DIR / fmt).unlink()
+
+        output = statusline.read_prerendered("full", None, str(project_dir))
+        assert "Progress: 6/12 subtasks (50%)" in output
+
+        manager.stop_socket_server()
+        assert not (project_dir / RENDERED_DIR / "status.sock").exists()
+        assert statusline.read_prerendered("full", None, str(project_dir)) is None
+
+    def test_disabled_without_environment(self, project, monkeypatch):
+        _, manager = project
+        monkeypatch.delenv("AUTO_CLAUDE_STATUS_SOCKET", raising=False)
+        assert not manager.start_socket_server()
+
+
+class TestEntryPoint:
+    """The status line as shell prompts and tmux run it: a new process."""
+
+    def _run(self, cwd: Path, *args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONIOENCODING": "utf-8"},
+        )
+
+    def _imports(self, cwd: Path, *args: str) -> set[str]:
+        stderr = self._run(cwd, "-X", "importtime", *args).stderr
+        return {
+            line.split("|")[-1].strip()
+            for line in stderr.splitlines()
+            if line.startswith("import time:") and "imported package" not in line
+        }
+
+    def test_fast_path_imports_nothing_extra(self, project):
+        project_dir, _ = project
+        baseline = self._imports(project_dir, "-c", "pass")
+
+        imports = self._imports(project_dir, str(STATUSLINE))
+
+        assert imports - baseline == set()
+        slow = self._imports(
+            project_dir, str(STATUSLINE), "--format", "json", "-s", "x"
+        )
+        assert {"ui", "json", "argparse"} <= slow - baseline
+
+    def test_end_to_end_latency(self, project):
+        project_dir, _ = project
+        nested = project_dir / "src" / "pkg"
+        nested.mkdir(parents=True)
+
+        def median_seconds(*args: str) -> float:
+            times = []
+            for _ in range(5):
+                start = time.perf_counter()
+                result = self._run(nested, str(STATUSLINE), *args)
+                times.append(time.perf_counter() - start)
+                assert result.returncode == 0
+            return statistics.median(times)
+
+        fast = median_seconds()
+        slow = median_seconds("--format", "json", "--spec", "x")
+
+        assert self._run(nested, str(STATUSLINE)).stdout.startswith("▣ 3/12")
+        assert fast < slow
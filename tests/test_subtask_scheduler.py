@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Tests for the Subtask Scheduler
+===============================
+
+Runs the scheduler against a real git repository with a fake agent session
+that sleeps, writes deterministic files, commits them in its child worktree
+and marks its subtask completed through the PlanStore.
+"""
+
+import asyncio
+import json
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+from agents.scheduler import SubtaskScheduler, get_subtask_workers
+from core.plan_store import PLAN_FILE, PlanStore
+
+SESSION_SECONDS = 0.3
+
+
+def _git(args: list[str], cwd: Path) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def make_plan(*phases: dict) -> dict:
+    return {
+        "feature": "demo",
+        "workflow_type": "feature",
+        "phases": [
+            {
+                "id": phase["id"],
+                "name": phase["id"],
+                "depends_on": phase.get("depends_on", []),
+                "parallel_safe": phase.get("parallel_safe", True),
+                "subtasks": [
+                    {"id": subtask_id, "description": subtask_id, "status": "pending"}
+                    for subtask_id in phase["subtasks"]
+                ],
+            }
+            for phase in phases
+        ],
+    }
+
+
+class FakeSession:
+    """Writes one file per subtask, commits it and completes the subtask."""
+
+    def __init__(self, spec_dir: Path, files: dict[str, str] | None = None):
+        self.spec_dir = spec_dir
+        self.files = files or {}
+        self.incomplete: set[str] = set()
+        self.workdirs: dict[str, Path] = {}
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, subtask: dict, workdir: Path, session_num: int) -> str:
+        subtask_id = subtask["id"]
+        self.workdirs[subtask_id] = workdir
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(SESSION_SECONDS)
+            if subtask_id in self.incomplete:
+                PlanStore.for_spec(self.spec_dir).set_subtask_status(
+                    subtask_id, "in_progress"
+                )
+                return "continue"
+            name = self.files.get(subtask_id, f"{subtask_id}.txt")
+            (workdir / name).write_text(f"{subtask_id}\n")
+            _git(["add", name], workdir)
+            _git(["commit", "-q", "-m", f"Implement {subtask_id}"], workdir)
+            PlanStore.for_spec(self.spec_dir).set_subtask_status(
+                subtask_id, "completed"
+            )
+            return "continue"
+        finally:
+            self.active -= 1
+
+
+class FakeStatusManager:
+    def __init__(self):
+        self.workers: list[tuple[int, int]] = []
+
+    def update_workers(self, active: int, max_workers: int | None = None) -> None:
+        self.workers.append((active, max_workers))
+
+    def update_subtasks(self, **kwargs) -> None:
+        pass
+
+
+@pytest.fixture
+def build(temp_git_repo: Path):
+    """A spec build in temp_git_repo; returns (project_dir, spec_dir)."""
+    (temp_git_repo / ".gitignore").write_text(".auto-claude/\n")
+    _git(["add", ".gitignore"], temp_git_repo)
+    _git(["commit", "-q", "-m", "Ignore .auto-claude"], temp_git_repo)
+    spec_dir = temp_git_repo / ".auto-claude" / "specs" / "001-demo"
+    spec_dir.mkdir(parents=True)
+    yield temp_git_repo, spec_dir
+    PlanStore.clear_registry()
+
+
+def write_plan(spec_dir: Path, plan: dict) -> None:
+    (spec_dir / PLAN_FILE).write_text(json.dumps(plan, indent=2))
+
+
+def statuses(spec_dir: Path) -> dict[str, str]:
+    plan = json.loads((spec_dir / PLAN_FILE).read_text())
+    return {s["id"]: s["status"] for p in plan["phases"] for s in p["subtasks"]}
+
+
+class TestParallelExecution:
+    async def test_runs_ready_subtasks_concurrently(self, build):
+        project_dir, spec_dir = build
+        write_plan(
+            spec_dir,
+            make_plan(
+                {"id": "phase-1", "subtasks": ["a", "b", "c"]},
+                {"id": "phase-2", "subtasks": ["d", "e"], "depends_on": ["phase-1"]},
+            ),
+        )
+        session = FakeSession(spec_dir)
+        scheduler = SubtaskScheduler(project_dir, spec_dir, session, workers=3)
+
+        start = time.perf_counter()
+        sessions = await scheduler.run()
+        elapsed = time.perf_counter() - start
+
+        assert sessions == 5
+        assert session.max_active == 3
+        # Two rounds of sessions instead of five in a row
+        assert elapsed < SESSION_SECONDS * 5
+        assert set(statuses(spec_dir).values()) == {"completed"}
+        for name in "abcde":
+            assert (project_dir / f"{name}.txt").read_text() == f"{name}\n"
+
+    async def test_children_use_separate_worktrees(self, build):
+        project_dir, spec_dir = build
+        write_plan(spec_dir, make_plan({"id": "phase-1", "subtasks": ["a", "b"]}))
+        session = FakeSession(spec_dir)
+
+        await SubtaskScheduler(project_dir, spec_dir, session, workers=2).run()
+
+        workdirs = set(session.workdirs.values())
+        assert len(workdirs) == 2
+        assert project_dir not in workdirs
+        for workdir in workdirs:
+            assert "subtasks" in workdir.parts
+            assert not workdir.exists()
+        # Child worktrees and branches are cleaned up
+        assert _git(["worktree", "list"], project_dir).count("\n") == 1
+        assert "--" not in _git(["branch", "--list"], project_dir)
+
+    async def test_dependents_start_after_dependencies_merge(self, build):
+        project_dir, spec_dir = build
+        write_plan(
+            spec_dir,
+            make_plan(
+                {"id": "phase-1", "subtasks": ["a", "b"]},
+                {"id": "phase-2", "subtasks": ["c", "d"], "depends_on": ["phase-1"]},
+            ),
+        )
+        scheduler = SubtaskScheduler(
+            project_dir, spec_dir, FakeSession(spec_dir), workers=4
+        )
+
+        await scheduler.run()
+
+        assert set(scheduler.merged[:2]) == {"a", "b"}
+        assert set(scheduler.merged[2:]) == {"c", "d"}
+
+    async def test_reports_worker_counts(self, build):
+        project_dir, spec_dir = build
+        write_plan(spec_dir, make_plan({"id": "phase-1", "subtasks": ["a", "b", "c"]}))
+        status_manager = FakeStatusManager()
+
+        await SubtaskScheduler(
+            project_dir,
+            spec_dir,
+            FakeSession(spec_dir),
+            workers=2,
+            status_manager=status_manager,
+        ).run()
+
+        assert max(active for active, _ in status_manager.workers) == 2
+        assert {max_workers for _, max_workers in status_manager.workers} == {2}
+        assert status_manager.workers[-1] == (0, 2)
+
+
+class TestFallbacks:
+    async def test_merge_conflict_requeues_subtask_for_serial_run(self, build):
+        project_dir, spec_dir = build
+        write_plan(spec_dir, make_plan({"id": "phase-1", "subtasks": ["a", "b"]}))
+        session = FakeSession(spec_dir, files={"a": "shared.txt", "b": "shared.txt"})
+        post_processed = []
+
+        async def post_process(subtask_id, child, session_num):
+            post_processed.append(subtask_id)
+
+        scheduler = SubtaskScheduler(
+            project_dir, spec_dir, session, workers=2, post_process=post_process
+        )
+        await scheduler.run()
+
+        assert len(scheduler.merged) == 1
+        winner = scheduler.merged[0]
+        loser = "b" if winner == "a" else "a"
+        assert (project_dir / "shared.txt").read_text() == f"{winner}\n"
+        assert statuses(spec_dir) == {winner: "completed", loser: "pending"}
+        assert scheduler.serial_only == {loser}
+        assert post_processed == [winner]
+        # No merge left in progress
+        assert _git(["status", "--porcelain"], project_dir) == ""
+
+    async def test_incomplete_subtask_goes_back_to_pending(self, build):
+        project_dir, spec_dir = build
+        write_plan(spec_dir, make_plan({"id": "phase-1", "subtasks": ["a", "b"]}))
+        session = FakeSession(spec_dir)
+        session.incomplete = {"b"}
+
+        scheduler = SubtaskScheduler(project_dir, spec_dir, session, workers=2)
+        await scheduler.run()
+
+        assert statuses(spec_dir) == {"a": "completed", "b": "pending"}
+        assert scheduler.serial_only == {"b"}
+        assert not scheduler.has_parallel_work()
+
+    async def test_single_worker_does_not_schedule(self, build):
+        project_dir, spec_dir = build
+        write_plan(spec_dir, make_plan({"id": "phase-1", "subtasks": ["a", "b"]}))
+        session = FakeSession(spec_dir)
+
+        scheduler = SubtaskScheduler(project_dir, spec_dir, session, workers=1)
+        assert await scheduler.run() == 0
+        assert session.workdirs == {}
+
+    async def test_serial_phases_are_left_to_the_coder_loop(self, build):
+        project_dir, spec_dir = build
+        write_plan(
+            spec_dir,
+            make_plan(
+                {"id": "phase-1", "subtasks": ["a", "b"], "parallel_safe": False}
+            ),
+        )
+        scheduler = SubtaskScheduler(
+            project_dir, spec_dir, FakeSession(spec_dir), workers=4
+        )
+
+        assert scheduler.ready_subtasks() == []
+        assert await scheduler.run() == 0
+
+    async def test_uncommitted_changes_keep_build_serial(self, build):
+        project_dir, spec_dir = build
+        write_plan(spec_dir, make_plan({"id": "phase-1", "subtasks": ["a", "b"]}))
+        (project_dir / "README.md").write_text("local edit\n")
+        session = FakeSession(spec_dir)
+
+        scheduler = SubtaskScheduler(project_dir, spec_dir, session, workers=2)
+        assert await scheduler.run() == 0
+        assert session.workdirs == {}
+
+
+def test_worker_count_from_environment(monkeypatch):
+    monkeypatch.setenv("AUTO_CLAUDE_SUBTASK_WORKERS", "3")
+    assert get_subtask_workers() == 3
+    monkeypatch.setenv("AUTO_CLAUDE_SUBTASK_WORKERS", "zero")
+    assert get_subtask_workers() == 1
+    monkeypatch.delenv("AUTO_CLAUDE_SUBTASK_WORKERS")
+    assert get_subtask_workers() == 1
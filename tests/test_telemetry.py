@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Tests for Session Telemetry
+===========================
+
+Tests core/telemetry.py and the instrumentation in run_agent_session by
+feeding a scripted fake message stream through the session loop.
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from agents import session as session_module
+from agents.session import run_agent_session
+from core import telemetry
+from core.telemetry import (
+    TRACE_FILE,
+    TelemetryRecorder,
+    build_profile,
+    format_profile,
+    get_recorder,
+    load_trace,
+    traced_hook,
+)
+
+# Stand-ins for LogPhase members (other tests replace the task_logger module)
+CODING = SimpleNamespace(value="coding")
+VALIDATION = SimpleNamespace(value="validation")
+
+# Message types are dispatched on class name, like the SDK's own classes
+class TextBlock:
+    def __init__(self, text):
+        self.text = text
+
+
+class ToolUseBlock:
+    def __init__(self, id, name, input):
+        self.id = id
+        self.name = name
+        self.input = input
+
+
+class ToolResultBlock:
+    def __init__(self, tool_use_id, content, is_error=False):
+        self.tool_use_id = tool_use_id
+        self.content = content
+        self.is_error = is_error
+
+
+class AssistantMessage:
+    def __init__(self, *content):
+        self.content = list(content)
+
+
+class UserMessage:
+    def __init__(self, *content):
+        self.content = list(content)
+
+
+class ResultMessage:
+    def __init__(self, usage, total_cost_usd, num_turns):
+        self.usage = usage
+        self.total_cost_usd = total_cost_usd
+        self.num_turns = num_turns
+
+
+class FakeClient:
+    """Replays a scripted message stream."""
+
+    def __init__(self, messages, fail_after: int | None = None):
+        self.messages = messages
+        self.fail_after = fail_after
+        self.queries: list[str] = []
+
+    async def query(self, message: str) -> None:
+        self.queries.append(message)
+
+    async def receive_response(self):
+        for i, msg in enumerate(self.messages):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("stream dropped")
+            yield msg
+
+
+class RecordingLogger:
+    def __init__(self):
+        self.texts: list[str] = []
+
+    def log(self, text, entry_type, phase, print_to_console=True):
+        self.texts.append(text)
+
+    def tool_start(self, *args, **kwargs):
+        pass
+
+    def tool_end(self, *args, **kwargs):
+        pass
+
+    def log_error(self, *args, **kwargs):
+        pass
+
+
+SCRIPT = [
+    AssistantMessage(TextBlock("Reading "), TextBlock("the file.")),
+    AssistantMessage(ToolUseBlock("t1", "Read", {"file_path": "app.py"})),
+    UserMessage(ToolResultBlock("t1", "print('hi')")),
+    AssistantMessage(
+        TextBlock("Running tests."),
+        ToolUseBlock("t2", "Bash", {"command": "pytest"}),
+    ),
+    UserMessage(ToolResultBlock("t2", "failed", is_error=True)),
+    AssistantMessage(TextBlock("Done.")),
+    ResultMessage(
+        usage={"input_tokens": 1200, "output_tokens": 300},
+        total_cost_usd=0.042,
+        num_turns=3,
+    ),
+]
+
+
+@pytest.fixture
+def task_logger(monkeypatch) -> RecordingLogger:
+    logger = RecordingLogger()
+    monkeypatch.setattr(session_module, "get_task_logger", lambda _: logger)
+    return logger
+
+
+@pytest.fixture
+def spec_dir(temp_dir: Path, task_logger, monkeypatch) -> Path:
+    monkeypatch.setattr(session_module, "is_build_complete", lambda _: False)
+    monkeypatch.setattr(telemetry, "_recorders", {})
+    return temp_dir
+
+
+def read_records(spec_dir: Path) -> list[dict]:
+    lines = (spec_dir / TRACE_FILE).read_text().splitlines()
+    return [json.loads(line) for line in lines]
+
+
+class TestSessionInstrumentation:
+    """Tests for spans recorded by run_agent_session."""
+
+    async def test_scripted_session(self, spec_dir: Path, task_logger):
+        status, text = await run_agent_session(
+            FakeClient(SCRIPT), "go", spec_dir, phase=CODING
+        )
+
+        assert status == "continue"
+        assert text == "Reading the file.Running tests.Done."
+        # One task log entry per assistant message, not per text block
+        assert task_logger.texts == ["Reading the file.", "Running tests.", "Done."]
+
+        spans, counters = load_trace(spec_dir)
+        session = next(s for s in spans if s["kind"] == "session")
+        tools = {s["name"]: s for s in spans if s["kind"] == "tool"}
+
+        assert set(tools) == {"Read", "Bash"}
+        assert all(t["parent"] == session["id"] for t in tools.values())
+        assert tools["Bash"]["attrs"]["error"] is True
+        assert session["attrs"]["messages"] == len(SCRIPT)
+        assert session["attrs"]["tools"] == 2
+        assert session["attrs"]["first_token_ms"] is not None
+        assert session["attrs"]["input_tokens"] == 1200
+        assert counters["tokens.input"] == 1200
+        assert counters["tokens.output"] == 300
+        assert counters["cost_usd"] == pytest.approx(0.042)
+        assert counters["tools.errors"] == 1
+
+    async def test_phases_group_sessions(self, spec_dir: Path):
+        await run_agent_session(FakeClient(SCRIPT), "go", spec_dir, phase=CODING)
+        await run_agent_session(FakeClient(SCRIPT), "go", spec_dir, phase=CODING)
+        await run_agent_session(
+            FakeClient(SCRIPT), "go", spec_dir, phase=VALIDATION
+        )
+        get_recorder(spec_dir).close()
+
+        spans, counters = load_trace(spec_dir)
+        phases = {s["name"]: s for s in spans if s["kind"] == "phase"}
+        sessions = [s for s in spans if s["kind"] == "session"]
+
+        assert set(phases) == {"coding", "validation"}
+        assert [s["parent"] for s in sessions] == [
+            phases["coding"]["id"],
+            phases["coding"]["id"],
+            phases["validation"]["id"],
+        ]
+        assert counters["sessions"] == 3
+
+    async def test_stream_error_closes_open_spans(self, spec_dir: Path):
+        status, _ = await run_agent_session(
+            FakeClient(SCRIPT, fail_after=2), "go", spec_dir
+        )
+
+        assert status == "error"
+        spans, _ = load_trace(spec_dir)
+        session = next(s for s in spans if s["kind"] == "session")
+        read = next(s for s in spans if s["name"] == "Read")
+        assert session["attrs"]["error"] == "RuntimeError"
+        assert read["attrs"]["unfinished"] is True
+
+    async def test_hook_spans(self, spec_dir: Path):
+        recorder = get_recorder(spec_dir)
+
+        async def deny(input_data, tool_use_id=None, context=None):
+            return {"hookSpecificOutput": {"permissionDecision": "deny"}}
+
+        hook = traced_hook(recorder, "bash_security_hook", deny)
+        with recorder.span("session", kind="session"):
+            await hook({"tool_name": "Bash"}, "t1", None)
+        recorder.flush()
+
+        spans, _ = load_trace(spec_dir)
+        hook_span = next(s for s in spans if s["kind"] == "hook")
+        assert hook_span["attrs"] == {
+            "tool": "Bash",
+            "tool_use_id": "t1",
+            "decision": "deny",
+        }
+        assert hook_span["parent"] == next(
+            s["id"] for s in spans if s["kind"] == "session"
+        )
+
+
+class TestRecorder:
+    """Tests for buffering and the profile view."""
+
+    def test_buffers_until_flush(self, temp_dir: Path):
+        recorder = TelemetryRecorder(temp_dir, buffer_size=3, enabled=True)
+        for _ in range(2):
+            with recorder.span("x"):
+                pass
+        recorder.count("calls", 2)
+        assert not (temp_dir / TRACE_FILE).exists()
+
+        with recorder.span("x"):
+            pass  # Buffer full: written without an explicit flush
+        records = read_records(temp_dir)
+        assert [r["type"] for r in records] == ["span"] * 3 + ["counters"]
+        assert records[-1]["values"] == {"calls": 2}
+
+        recorder.flush()  # Nothing left to write
+        assert len(read_records(temp_dir)) == 4
+
+    def test_disabled(self, temp_dir: Path, monkeypatch):
+        monkeypatch.setenv("AUTO_CLAUDE_TELEMETRY", "0")
+        recorder = TelemetryRecorder(temp_dir)
+        with recorder.span("x"):
+            recorder.count("calls")
+        recorder.flush()
+        assert not (temp_dir / TRACE_FILE).exists()
+
+    async def test_profile_view(self, spec_dir: Path):
+        await run_agent_session(FakeClient(SCRIPT), "go", spec_dir, phase=CODING)
+        get_recorder(spec_dir).close()
+
+        spans, counters = load_trace(spec_dir)
+        tree = build_profile(spans)
+
+        assert [n["name"] for n in tree] == ["coding"]
+        session = tree[0]["children"][0]
+        assert session["name"] == "session"
+        assert {c["name"] for c in session["children"]} == {"tool:Read", "tool:Bash"}
+        assert session["self_ms"] <= session["total_ms"]
+
+        output = format_profile(tree, counters)
+        assert "  session" in output
+        assert "tool:Bash" in output
+        assert "tokens.input" in output
+
+    def test_profile_without_phase_span(self, temp_dir: Path):
+        recorder = TelemetryRecorder(temp_dir, enabled=True)
+        with recorder.span("session", kind="session", phase="planning"):
+            pass
+        recorder.flush()
+
+        tree = build_profile(load_trace(temp_dir)[0])
+        assert tree[0]["name"] == "planning"
+        assert tree[0]["children"][0]["name"] == "session"
@@ -15,9 +15,12 @@ Tests the worktree.py module functionality including:
 import subprocess
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from core import worktree_inventory
+from core.worktree_inventory import clear_stats_cache
 from worktree import WorktreeManager
 
 
@@ -825,6 +828,86 @@ class TestWorktreeUtilities:
         assert any("npm" in cmd for cmd in commands)
 
 
+class TestBatchedWorktreeInventory:
+    """Tests for the batched list_all_worktrees statistics."""
+
+    @staticmethod
+    def _commit(path: Path, name: str, content: str) -> None:
+        (path / name).write_text(content)
+        subprocess.run(["git", "add", "."], cwd=path, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", f"update {name}"], cwd=path, capture_output=True
+        )
+
+    def test_matches_per_worktree_stats(self, temp_git_repo: Path):
+        """Batched stats equal the per-worktree git queries."""
+        clear_stats_cache()
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        manager.create_worktree("spec-empty")
+        two = manager.create_worktree("spec-two")
+        self._commit(two.path, "a.txt", "one\ntwo\n")
+        self._commit(two.path, "README.md", "# Changed\n")
+        behind = manager.create_worktree("spec-behind")
+        self._commit(behind.path, "b.txt", "b\n")
+        merged = manager.create_worktree("spec-merged")
+        self._commit(merged.path, "c.txt", "c\n")
+
+        # Advance main, then merge it into one spec branch (two merge base
+        # candidates in the commit graph)
+        self._commit(temp_git_repo, "main.txt", "main\n")
+        subprocess.run(
+            ["git", "merge", "--no-edit", "main"],
+            cwd=merged.path,
+            capture_output=True,
+        )
+
+        worktrees = {w.spec_name: w for w in manager.list_all_worktrees()}
+
+        assert set(worktrees) == {
+            "spec-empty",
+            "spec-two",
+            "spec-behind",
+            "spec-merged",
+        }
+        for spec_name, info in worktrees.items():
+            expected = manager._get_worktree_stats(spec_name)
+            actual = {key: getattr(info, key) for key in expected}
+            assert actual == expected, spec_name
+            assert info.branch == f"auto-claude/{spec_name}"
+        assert worktrees["spec-two"].commit_count == 2
+        assert worktrees["spec-two"].files_changed == 2
+        assert worktrees["spec-merged"].commit_count == 2
+
+    def test_relist_uses_cache(self, temp_git_repo: Path):
+        """Unchanged worktrees need no git calls beyond the inventory."""
+        clear_stats_cache()
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        for i in range(3):
+            info = manager.create_worktree(f"spec-{i}")
+            self._commit(info.path, f"f{i}.txt", "x\n")
+        manager.list_all_worktrees()
+
+        calls = []
+        real_run_git = worktree_inventory.run_git
+
+        def counting_run_git(args, *a, **kw):
+            calls.append(args[0])
+            return real_run_git(args, *a, **kw)
+
+        with patch.object(worktree_inventory, "run_git", counting_run_git):
+            assert len(manager.list_all_worktrees()) == 3
+            assert calls == ["worktree", "rev-parse"]
+
+            calls.clear()
+            self._commit(manager.get_worktree_path("spec-1"), "g.txt", "y\n")
+            worktrees = {w.spec_name: w for w in manager.list_all_worktrees()}
+
+        assert worktrees["spec-1"].commit_count == 2
+        assert calls == ["worktree", "rev-parse", "rev-list", "log", "diff-tree"]
+
+
 class TestWorktreeCleanup:
     """Tests for worktree cleanup and age detection functionality."""
 